@@ -1,7 +1,15 @@
 import streamlit as st
+import pandas as pd
 from src.ui.inicio_page import render_inicio_page
 from src.ui.main_page import render_acciones_page
 from src.ui.bonos_page import render_bonos_page
+from src.utils.profiling import (
+    iniciar_ejecucion,
+    finalizar_ejecucion,
+    medir_etapa,
+    perfilado_por_entorno
+)
+from config.constants import ARCHIVO_PERFIL
 
 st.set_page_config(
     page_title="Calculadora Financiera",
@@ -10,6 +18,43 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+def diagnostico_habilitado() -> bool:
+    """
+    El panel de diagnóstico está oculto salvo con ?diagnostico=1 o FINCALC_PERFIL=1.
+    """
+    return st.query_params.get("diagnostico") == "1" or perfilado_por_entorno()
+
+
+def render_panel_diagnostico(resumen: dict):
+    """
+    Muestra en el sidebar el desglose de tiempos del último rerun.
+    
+    Args:
+        resumen: Resumen devuelto por finalizar_ejecucion (None si no hubo perfilado)
+    """
+    st.sidebar.markdown("---")
+    with st.sidebar.expander("🩺 Diagnóstico", expanded=False):
+        st.checkbox(
+            "Perfilar ejecuciones",
+            key="perfilado_activo",
+            value=perfilado_por_entorno(),
+            help="Registra tiempo, llamadas y memoria retenida por etapa en cada rerun"
+        )
+        
+        if resumen is None:
+            st.caption("Activa el perfilado para ver los tiempos del siguiente rerun.")
+            return
+        
+        st.metric("Duración del rerun", f"{resumen['duracion_s'] * 1000:,.1f} ms")
+        st.caption(f"Memoria pico: {resumen['memoria_pico_kb']:,.1f} KB | Página: {resumen['pagina']}")
+        
+        if resumen['etapas']:
+            df_etapas = pd.DataFrame(resumen['etapas'])
+            df_etapas['tiempo_ms'] = (df_etapas.pop('tiempo_s') * 1000).round(2)
+            st.dataframe(df_etapas, use_container_width=True, hide_index=True)
+            st.caption(f"Tiempos inclusivos. Exportado a `{ARCHIVO_PERFIL}`")
+
+
 def main():
     # Sidebar para navegación
     st.sidebar.title("🧭 Navegación")
@@ -55,13 +100,25 @@ def main():
     - Exportación a PDF
     """)
     
+    # Perfilado opcional del rerun completo
+    diagnostico = diagnostico_habilitado()
+    perfilado = diagnostico and st.session_state.get("perfilado_activo", perfilado_por_entorno())
+    iniciar_ejecucion(perfilado, pagina)
+    
     # Renderizar la página seleccionada
-    if pagina == "🏠 Inicio":
-        render_inicio_page()
-    elif pagina == "📈 Acciones":
-        render_acciones_page()
-    elif pagina == "📊 Bonos":
-        render_bonos_page()
+    try:
+        with medir_etapa(f"pagina.{pagina}"):
+            if pagina == "🏠 Inicio":
+                render_inicio_page()
+            elif pagina == "📈 Acciones":
+                render_acciones_page()
+            elif pagina == "📊 Bonos":
+                render_bonos_page()
+    finally:
+        resumen = finalizar_ejecucion()
+    
+    if diagnostico:
+        render_panel_diagnostico(resumen)
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,11 @@
 IMPUESTO_BOLSA_NACIONAL = 0.05
 IMPUESTO_BOLSA_EXTRANJERA = 0.295
 
+# Impuesto mensual sobre los intereses generados durante la fase de retiros
+IMPUESTO_RETIRO_MENSUAL = 0.05
+
 FRECUENCIAS = {
+    "Diaria": 365,
     "Mensual": 12,
     "Trimestral": 4,
     "Semestral": 2,
@@ -18,3 +22,128 @@ FRECUENCIAS_BONOS = {
 }
 
 MONEDA = "USD"
+
+# Archivo JSONL donde se exportan los tiempos por rerun (perfilado)
+ARCHIVO_PERFIL = "perfil_ejecuciones.jsonl"
+
+# Caché opcional de resultados en disco (activar con FINCALC_CACHE=1)
+ARCHIVO_CACHE = ".fincalc_cache.sqlite3"
+CACHE_MAX_MB = 256
+CACHE_VERSION = 2
+# Segundos mínimos entre dos actualizaciones del último acceso de un resultado (cada
+# actualización toma el bloqueo de escritura; para la expulsión LRU basta esta precisión)
+CACHE_INTERVALO_ACCESO = 60
+
+# PDFs en segundo plano: hilos compartidos por todas las sesiones y trabajos simultáneos
+# por sesión (los demás esperan en cola sin ocupar un hilo)
+PDF_MAX_HILOS = 2
+PDF_MAX_TRABAJOS_SESION = 1
+
+# Aportes irregulares: filas máximas del editor por periodo; con más periodos se edita un
+# aporte por año (o se carga un CSV con un monto por periodo)
+APORTES_EDITOR_MAX_FILAS = 600
+
+# Máximo de filas/puntos que se envían al navegador antes de agregar por mes o año
+MAX_FILAS_VISTA = 1200
+
+# Gráficos de series largas: puntos máximos por traza (se reducen conservando la forma)
+# y total de puntos de una figura a partir del cual se dibuja con WebGL (Scattergl)
+GRAFICO_MAX_PUNTOS = 2000
+GRAFICO_UMBRAL_WEBGL = 5000
+
+# Plantilla de Plotly de todos los gráficos y figuras ya construidas que se guardan en memoria
+PLANTILLA_GRAFICOS = "plotly_white"
+FIGURAS_CACHE_MAX = 64
+
+# Cronogramas canónicos: clave fija de cada columna → etiqueta que se muestra ({moneda} se completa al mostrar)
+ETIQUETAS_COLUMNAS = {
+    'periodo': 'Periodo',
+    'mes': 'Mes',
+    'saldo_inicial': 'Saldo Inicial ({moneda})',
+    'aporte': 'Aporte ({moneda})',
+    'interes': 'Interés Ganado ({moneda})',
+    'saldo_final': 'Saldo Final ({moneda})',
+    'aporte_real': 'Aporte Real ({moneda})',
+    'saldo_final_real': 'Saldo Final Real ({moneda})',
+    'impuesto': 'Impuesto 5% ({moneda})',
+    'retiro_bruto': 'Retiro Bruto ({moneda})',
+    'retiro_neto': 'Retiro Neto ({moneda})',
+    'retiro_neto_real': 'Retiro Neto Real ({moneda})',
+    'edad': 'Edad',
+    'fase': 'Fase',
+    'saldo': 'Saldo ({moneda})',
+    'aportado': 'Aportado ({moneda})',
+    'saldo_real': 'Saldo Real ({moneda})'
+}
+
+# Tablas paginadas: filas por página (la primera opción es la predeterminada)
+OPCIONES_FILAS_POR_PAGINA = (20, 50, 100, 500)
+
+# Exportación de tablas: formato → (extensión, tipo MIME); Parquet y Arrow requieren pyarrow
+FORMATOS_EXPORTACION = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Arrow": ("arrow", "application/vnd.apache.arrow.file")
+}
+# Filas que se convierten a texto por vez al escribir un CSV grande
+CSV_FILAS_POR_BLOQUE = 50000
+
+# Columnas de conteo que se muestran como enteros (sin formato de moneda)
+COLUMNAS_ENTERAS = ('Periodo', 'Mes')
+
+# Backtest histórico: remuestreos por bloques (bootstrap) y largo de cada bloque en meses
+BACKTEST_MUESTRAS = 1000
+BACKTEST_BLOQUE_MESES = 12
+
+# Tablas precalculadas de factores financieros: TEA de 0% a 50% en pasos de 0.5%, hasta 600 periodos
+TABLA_TEA_MAXIMA = 0.50
+TABLA_TEA_PASO = 0.005
+TABLA_PERIODOS_MAXIMOS = 600
+
+# Tipos de bono: etiqueta en la interfaz → código usado por el motor de flujos
+TIPOS_BONO = {
+    "Bullet (cupón fijo)": "bullet",
+    "Cupón cero": "cupon_cero",
+    "Amortizable": "amortizable",
+    "Fondo de amortización": "fondo_amortizacion"
+}
+
+# Sensibilidad de bonos: choques a la tasa de descuento (puntos básicos) y puntos de la curva precio-rendimiento
+CHOQUES_PB = (-200, -100, -50, -25, 25, 50, 100, 200)
+CURVA_PRECIO_PUNTOS = 1000
+CURVA_PRECIO_RANGO_PB = 500
+
+# Árbol de tasas Ho-Lee para bonos con opciones: volatilidad anual (absoluta) de la tasa corta
+VOLATILIDAD_TASA_DEFECTO = 0.01
+
+# Monte Carlo de tasas cortas para bonos: modelos, trayectorias, tamaño de bloque y parámetros por defecto
+MODELOS_TASA = {
+    "Vasicek": "vasicek",
+    "CIR": "cir"
+}
+MC_TRAYECTORIAS = 10000
+MC_BLOQUE = 2000
+MC_REVERSION = 0.15
+MC_VOLATILIDAD = {
+    "vasicek": 0.01,
+    "cir": 0.05
+}
+
+# Curva cero de referencia (TEA por plazo en años) y parámetros del cálculo de Z-spread
+CURVA_REFERENCIA_DEFECTO = {
+    'plazos': (0.5, 1, 2, 3, 5, 7, 10, 20, 30),
+    'tasas': (0.045, 0.046, 0.047, 0.048, 0.050, 0.051, 0.052, 0.054, 0.055)
+}
+ZSPREAD_TOLERANCIA = 1e-10
+ZSPREAD_MAX_ITERACIONES = 50
+ZSPREAD_BLOQUE = 5000
+
+# Curvas construidas por bootstrapping que se guardan en memoria (por hash del archivo)
+CURVAS_MAXIMAS_CACHE = 32
+
+# Convenciones de conteo de días para el cupón corrido y el descuento a fecha de liquidación
+CONVENCIONES_DIAS = {
+    "ACT/ACT": "act/act",
+    "30/360": "30/360",
+    "ACT/365": "act/365"
+}
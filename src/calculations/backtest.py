@@ -0,0 +1,208 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from config.constants import BACKTEST_MUESTRAS, BACKTEST_BLOQUE_MESES
+from src.calculations.financial_calcs import calcular_vf_trayectorias, generar_vector_aportes
+from src.calculations.tax_calcs import calcular_retiro_mensual_con_impuestos
+from src.utils.profiling import perfilar
+
+
+def generar_ventanas_moviles(retornos, num_meses: int) -> np.ndarray:
+    """
+    Arma todas las ventanas históricas de num_meses meses consecutivos.
+    
+    Args:
+        retornos: Serie de retornos mensuales (en decimal)
+        num_meses: Largo de cada ventana en meses
+    
+    Returns:
+        Array (num_ventanas, num_meses); cada fila empieza un mes después que la anterior
+    """
+    retornos = np.asarray(retornos, dtype=float)
+    if len(retornos) < num_meses:
+        return np.empty((0, num_meses))
+    return sliding_window_view(retornos, num_meses)
+
+
+def generar_remuestreo_bloques(
+    retornos,
+    num_meses: int,
+    num_muestras: int = BACKTEST_MUESTRAS,
+    tamaño_bloque: int = BACKTEST_BLOQUE_MESES,
+    semilla: int = None
+) -> np.ndarray:
+    """
+    Genera trayectorias sintéticas concatenando bloques de meses consecutivos de la serie.
+    
+    Es un bootstrap por bloques circular: cada bloque empieza en un mes al azar y
+    continúa desde el inicio de la serie si llega al final. Los bloques conservan
+    la autocorrelación de corto plazo de los retornos.
+    
+    Args:
+        retornos: Serie de retornos mensuales (en decimal)
+        num_meses: Largo de cada trayectoria en meses
+        num_muestras: Número de trayectorias
+        tamaño_bloque: Meses por bloque
+        semilla: Semilla del generador aleatorio (para resultados reproducibles)
+    
+    Returns:
+        Array (num_muestras, num_meses)
+    """
+    retornos = np.asarray(retornos, dtype=float)
+    bloques = -(-num_meses // tamaño_bloque)
+    
+    generador = np.random.default_rng(semilla)
+    inicios = generador.integers(0, len(retornos), size=(num_muestras, bloques))
+    indices = (inicios[:, :, None] + np.arange(tamaño_bloque)) % len(retornos)
+    
+    return retornos[indices.reshape(num_muestras, -1)[:, :num_meses]]
+
+
+def convertir_a_retornos_periodo(retornos_mensuales, frecuencia_anual: int) -> np.ndarray:
+    """
+    Compone los retornos mensuales en retornos del periodo de aporte.
+    
+    Args:
+        retornos_mensuales: Array (..., num_meses) de retornos mensuales
+        frecuencia_anual: Número de periodos por año (debe dividir a 12)
+    
+    Returns:
+        Array (..., num_periodos) de retornos por periodo
+    
+    Raises:
+        ValueError: Si la frecuencia no agrupa meses completos (ej. diaria)
+    """
+    if 12 % frecuencia_anual != 0:
+        raise ValueError("El backtest usa retornos mensuales: la frecuencia de aportes debe agrupar meses completos.")
+    
+    retornos_mensuales = np.asarray(retornos_mensuales, dtype=float)
+    meses_por_periodo = 12 // frecuencia_anual
+    if meses_por_periodo == 1:
+        return retornos_mensuales
+    
+    forma = retornos_mensuales.shape[:-1] + (-1, meses_por_periodo)
+    return np.prod(1 + retornos_mensuales.reshape(forma), axis=-1) - 1
+
+
+def calcular_retiros_backtest(vf, tasa_mensual_retiro: float, meses: int, tipo_bolsa: str) -> dict:
+    """
+    Calcula los retiros mensuales de muchos valores futuros a la vez.
+    
+    calcular_retiro_mensual_con_impuestos es lineal en el VF, así que se evalúa una
+    sola vez con VF = 1 y el resultado se escala por cada VF.
+    
+    Args:
+        vf: Array de valores futuros
+        tasa_mensual_retiro: Tasa mensual de retiro
+        meses: Número de meses de retiro
+        tipo_bolsa: "Nacional" o "Extranjera"
+    
+    Returns:
+        Diccionario con las mismas claves que calcular_retiro_mensual_con_impuestos,
+        cada una como array con un valor por VF
+    """
+    unitario = calcular_retiro_mensual_con_impuestos(1.0, 0.0, tasa_mensual_retiro, meses, tipo_bolsa)
+    vf = np.asarray(vf, dtype=float)
+    return {clave: valor * vf for clave, valor in unitario.items()}
+
+
+def resumir_distribucion(valores) -> dict:
+    """
+    Resume una distribución de resultados con sus percentiles.
+    
+    Args:
+        valores: Array de resultados
+    
+    Returns:
+        Diccionario con media, mínimo, máximo y percentiles p5, p25, p50, p75, p95
+    """
+    valores = np.asarray(valores, dtype=float)
+    if len(valores) == 0:
+        return {}
+    
+    p5, p25, p50, p75, p95 = np.percentile(valores, [5, 25, 50, 75, 95])
+    return {
+        'media': float(valores.mean()),
+        'minimo': float(valores.min()),
+        'p5': float(p5),
+        'p25': float(p25),
+        'p50': float(p50),
+        'p75': float(p75),
+        'p95': float(p95),
+        'maximo': float(valores.max())
+    }
+
+
+@perfilar
+def ejecutar_backtest(
+    vp: float,
+    aporte,
+    retornos,
+    frecuencia_anual: int,
+    plazo_años: int,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True,
+    tasa_mensual_retiro: float = 0.0,
+    meses_retiro: int = 240,
+    tipo_bolsa: str = "Nacional",
+    num_muestras: int = BACKTEST_MUESTRAS,
+    tamaño_bloque: int = BACKTEST_BLOQUE_MESES,
+    semilla: int = None
+) -> dict:
+    """
+    Ejecuta el plan de acumulación sobre todas las ventanas históricas y sobre remuestreos por bloques.
+    
+    Cada ventana o remuestreo es una fila de una matriz de retornos; el VF de todas
+    las filas se calcula en una sola operación con productos acumulados. La fase de
+    retiro usa la tasa de retiro indicada, igual que el cálculo principal.
+    
+    Args:
+        vp: Valor Presente inicial
+        aporte: Aporte periódico (float) o array de aportes por periodo
+        retornos: Serie de retornos mensuales del índice (en decimal)
+        frecuencia_anual: Número de periodos por año (debe dividir a 12)
+        plazo_años: Plazo de acumulación en años
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año
+        tasa_mensual_retiro: Tasa mensual de retiro
+        meses_retiro: Número de meses de retiro
+        tipo_bolsa: "Nacional" o "Extranjera"
+        num_muestras: Número de remuestreos por bloques
+        tamaño_bloque: Meses por bloque
+        semilla: Semilla del generador aleatorio
+    
+    Returns:
+        Diccionario con 'historico' y 'bootstrap'; cada uno con los arrays 'vf',
+        'retiro_mensual_neto' y 'total_retirado' y sus resúmenes 'resumen_vf' y
+        'resumen_retiro'. 'num_ventanas' indica cuántas ventanas históricas hubo.
+    """
+    num_meses = plazo_años * 12
+    num_periodos = plazo_años * frecuencia_anual
+    aportes = generar_vector_aportes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, crecimiento_anual)
+    
+    muestras = {
+        'historico': generar_ventanas_moviles(retornos, num_meses),
+        'bootstrap': generar_remuestreo_bloques(retornos, num_meses, num_muestras, tamaño_bloque, semilla)
+    }
+    
+    resultado = {'num_ventanas': len(muestras['historico'])}
+    for nombre, retornos_mensuales in muestras.items():
+        tasas_periodo = convertir_a_retornos_periodo(retornos_mensuales, frecuencia_anual)
+        if len(tasas_periodo):
+            vf = calcular_vf_trayectorias(vp, aportes, tasas_periodo, aporte_al_inicio, capitalizacion_continua)
+        else:
+            vf = np.empty(0)
+        retiros = calcular_retiros_backtest(vf, tasa_mensual_retiro, meses_retiro, tipo_bolsa)
+        
+        resultado[nombre] = {
+            'vf': vf,
+            'retiro_mensual_neto': retiros['retiro_mensual_neto'],
+            'total_retirado': retiros['total_retirado'],
+            'resumen_vf': resumir_distribucion(vf),
+            'resumen_retiro': resumir_distribucion(retiros['retiro_mensual_neto'])
+        }
+    
+    return resultado
@@ -1,3 +1,9 @@
+import numpy as np
+from config.constants import ZSPREAD_TOLERANCIA, ZSPREAD_MAX_ITERACIONES, ZSPREAD_BLOQUE
+from src.calculations.factor_tables import factor_descuento
+from src.utils.profiling import perfilar
+
+
 def calcular_tasa_cupon_periodo(tasa_cupon_anual: float, frecuencia_anual: int) -> float:
     """
     Calcula la tasa de cupón por periodo.
@@ -66,7 +72,7 @@ def calcular_valor_presente_cupon(cupon: float, tasa_descuento: float, periodo:
     Returns:
         Valor presente del cupón
     """
-    return cupon / ((1 + tasa_descuento) ** periodo)
+    return cupon * factor_descuento(tasa_descuento, periodo)
 
 
 def calcular_valor_presente_nominal(valor_nominal: float, tasa_descuento: float, num_periodos: int) -> float:
@@ -81,66 +87,392 @@ def calcular_valor_presente_nominal(valor_nominal: float, tasa_descuento: float,
     Returns:
         Valor presente del valor nominal
     """
-    return valor_nominal / ((1 + tasa_descuento) ** num_periodos)
+    return valor_nominal * factor_descuento(tasa_descuento, num_periodos)
+
+
+def generar_calendario_principal(
+    tipo_bono: str,
+    valor_nominal: float,
+    num_periodos: int,
+    periodos_gracia: int = 0
+) -> np.ndarray:
+    """
+    Genera el principal que se devuelve en cada periodo según el tipo de bono.
+    
+    - bullet y cupon_cero: todo el principal al vencimiento
+    - amortizable: cuotas iguales de principal desde el primer periodo
+    - fondo_amortizacion: cuotas iguales de principal después de los periodos de gracia
+    
+    Args:
+        tipo_bono: Código del tipo de bono (valores de TIPOS_BONO)
+        valor_nominal: Valor nominal del bono
+        num_periodos: Número total de periodos
+        periodos_gracia: Periodos sin amortización (solo fondo_amortizacion)
+    
+    Returns:
+        Array de principal por periodo (suma el valor nominal)
+    
+    Raises:
+        ValueError: Si el tipo de bono no existe
+    """
+    if tipo_bono in ("bullet", "cupon_cero"):
+        principal = np.zeros(num_periodos)
+        principal[-1] = valor_nominal
+        return principal
+    
+    if tipo_bono == "amortizable":
+        periodos_gracia = 0
+    elif tipo_bono != "fondo_amortizacion":
+        raise ValueError(f"Tipo de bono desconocido: {tipo_bono}")
+    
+    periodos_gracia = min(max(int(periodos_gracia), 0), num_periodos - 1)
+    principal = np.zeros(num_periodos)
+    principal[periodos_gracia:] = valor_nominal / (num_periodos - periodos_gracia)
+    return principal
+
+
+def generar_flujos_bono(
+    tipo_bono: str,
+    valor_nominal: float,
+    tasa_cupon_periodo: float,
+    num_periodos: int,
+    periodos_gracia: int = 0
+) -> dict:
+    """
+    Genera los vectores de flujos de un bono: principal, cupón y flujo total por periodo.
+    
+    El cupón de cada periodo se paga sobre el saldo de principal vigente al inicio
+    del periodo; un bono cupón cero no paga cupones.
+    
+    Args:
+        tipo_bono: Código del tipo de bono (valores de TIPOS_BONO)
+        valor_nominal: Valor nominal del bono
+        tasa_cupon_periodo: Tasa de cupón por periodo
+        num_periodos: Número total de periodos
+        periodos_gracia: Periodos sin amortización (solo fondo_amortizacion)
+    
+    Returns:
+        Diccionario de arrays: periodo, saldo_inicial, cupon, principal, flujo
+    """
+    principal = generar_calendario_principal(tipo_bono, valor_nominal, num_periodos, periodos_gracia)
+    saldo_inicial = valor_nominal - np.concatenate([[0.0], np.cumsum(principal)[:-1]])
+    cupon = np.zeros(num_periodos) if tipo_bono == "cupon_cero" else saldo_inicial * tasa_cupon_periodo
+    
+    return {
+        'periodo': np.arange(1, num_periodos + 1),
+        'saldo_inicial': saldo_inicial,
+        'cupon': cupon,
+        'principal': principal,
+        'flujo': cupon + principal
+    }
 
 
+@perfilar
 def calcular_valor_presente_bono(
     valor_nominal: float,
     tasa_cupon_anual: float,
     frecuencia_anual: int,
     años: int,
-    tea_descuento: float
+    tea_descuento: float,
+    tipo_bono: str = "bullet",
+    años_gracia: float = 0,
+    curva: dict = None
 ) -> dict:
     """
     Calcula el valor presente de un bono y genera el detalle de flujos.
     
+    El VP es el producto punto del vector de flujos con los factores de descuento:
+    los de la TEA de descuento o, si se indica una curva cero, los de la curva.
+    
     Args:
         valor_nominal: Valor nominal del bono
         tasa_cupon_anual: Tasa cupón anual (TEA) en decimal
         frecuencia_anual: Número de pagos por año
         años: Años al vencimiento
         tea_descuento: Tasa efectiva anual de descuento en decimal
+        tipo_bono: Código del tipo de bono (valores de TIPOS_BONO)
+        años_gracia: Años sin amortización (solo fondo_amortizacion)
+        curva: Diccionario con 'plazos' (años) y 'tasas' (TEA cero) (opcional)
     
     Returns:
-        Diccionario con el valor presente y detalle de flujos
+        Diccionario con el valor presente, su composición y detalle de flujos
     """
     # Calcular tasas por periodo
     tasa_cupon_periodo = calcular_tasa_cupon_periodo(tasa_cupon_anual, frecuencia_anual)
     tasa_descuento_periodo = calcular_tasa_descuento_periodo(tea_descuento, frecuencia_anual)
     
-    # Calcular cupón y número de periodos
-    cupon = calcular_cupon(valor_nominal, tasa_cupon_periodo)
+    # Vectores de flujos del bono
     num_periodos = calcular_numero_periodos(años, frecuencia_anual)
+    calendario = generar_flujos_bono(
+        tipo_bono, valor_nominal, tasa_cupon_periodo, num_periodos, round(años_gracia * frecuencia_anual)
+    )
     
-    # Calcular flujos y valores presentes
-    flujos = []
-    vp_total_cupones = 0
+    # Valor presente: un producto punto con los factores de descuento de la tabla precalculada o de la curva
+    if curva is None:
+        descuento = factor_descuento(tasa_descuento_periodo, calendario['periodo'])
+    else:
+        descuento = calcular_descuentos_curva(curva, calendario['periodo'] / frecuencia_anual)
+    vp_flujos = calendario['flujo'] * descuento
+    vp_cupones = float(calendario['cupon'] @ descuento)
+    vp_principal = float(calendario['principal'] @ descuento)
     
-    for periodo in range(1, num_periodos + 1):
-        # Flujo del periodo (cupón)
-        flujo = cupon
-        
-        # En el último periodo, agregar el valor nominal
-        if periodo == num_periodos:
-            flujo += valor_nominal
-        
-        # Valor presente de este flujo
-        vp_flujo = flujo / ((1 + tasa_descuento_periodo) ** periodo)
-        
-        flujos.append({
-            'periodo': periodo,
-            'flujo': flujo,
-            'vp_flujo': vp_flujo,
-            'es_ultimo': periodo == num_periodos
-        })
-        
-        vp_total_cupones += vp_flujo
+    flujos = [
+        {
+            'periodo': int(periodo),
+            'flujo': float(flujo),
+            'cupon': float(cupon),
+            'principal': float(principal),
+            'saldo_inicial': float(saldo),
+            'vp_flujo': float(vp_flujo),
+            'es_ultimo': bool(periodo == num_periodos)
+        }
+        for periodo, flujo, cupon, principal, saldo, vp_flujo in zip(
+            calendario['periodo'], calendario['flujo'], calendario['cupon'],
+            calendario['principal'], calendario['saldo_inicial'], vp_flujos
+        )
+    ]
     
     return {
-        'valor_presente_total': vp_total_cupones,
-        'cupon_periodico': cupon,
+        'valor_presente_total': vp_cupones + vp_principal,
+        'vp_cupones': vp_cupones,
+        'vp_principal': vp_principal,
+        'tipo_bono': tipo_bono,
+        'cupon_periodico': float(calendario['cupon'][0]),
+        'total_cupones': float(calendario['cupon'].sum()),
         'num_periodos': num_periodos,
         'tasa_cupon_periodo': tasa_cupon_periodo,
         'tasa_descuento_periodo': tasa_descuento_periodo,
+        'calendario': calendario,
         'flujos': flujos
     }
+
+
+def interpolar_curva(curva: dict, plazos) -> np.ndarray:
+    """
+    Interpola la tasa cero de la curva en los plazos indicados.
+    
+    Interpolación lineal en la TEA cero; fuera del rango de la curva se extiende
+    plana con la primera o la última tasa.
+    
+    Args:
+        curva: Diccionario con 'plazos' (años) y 'tasas' (TEA cero en decimal)
+        plazos: Plazos en años (escalar o array de cualquier forma)
+    
+    Returns:
+        Array de TEA cero con la forma de plazos
+    """
+    return np.interp(plazos, np.asarray(curva['plazos'], dtype=float), np.asarray(curva['tasas'], dtype=float))
+
+
+def calcular_descuentos_curva(curva: dict, plazos) -> np.ndarray:
+    """
+    Calcula los factores de descuento de la curva cero: (1 + z(t))^(-t).
+    
+    Args:
+        curva: Diccionario con 'plazos' (años) y 'tasas' (TEA cero en decimal)
+        plazos: Plazos en años (escalar o array de cualquier forma)
+    
+    Returns:
+        Array de factores de descuento con la forma de plazos
+    """
+    plazos = np.asarray(plazos, dtype=float)
+    return np.exp(-plazos * np.log1p(interpolar_curva(curva, plazos)))
+
+
+def generar_flujos_cartera(
+    valores_nominales,
+    tasas_cupon_anual,
+    frecuencias,
+    años,
+    tipos_bono=None,
+    años_gracia=None
+) -> dict:
+    """
+    Arma las matrices de flujos y plazos de muchos bonos, rellenadas con ceros.
+    
+    Los bonos que comparten tipo, número de periodos y gracia tienen el mismo
+    calendario unitario de principal y saldo; se genera una vez por grupo y se
+    escala por el valor nominal y la tasa cupón de cada bono.
+    
+    Args:
+        valores_nominales: Array de valores nominales
+        tasas_cupon_anual: Array de tasas cupón anuales (TEA) en decimal
+        frecuencias: Array de pagos por año
+        años: Array de años al vencimiento
+        tipos_bono: Array de códigos de tipo de bono (por defecto todos bullet)
+        años_gracia: Array de años sin amortización (solo fondo_amortizacion)
+    
+    Returns:
+        Diccionario con 'flujo' y 'plazo' (matrices bonos × periodos; el plazo en
+        años, cero en el relleno) y 'num_periodos' (array por bono)
+    """
+    valores_nominales = np.asarray(valores_nominales, dtype=float)
+    num_bonos = len(valores_nominales)
+    frecuencias = np.asarray(frecuencias, dtype=int)
+    tipos_bono = np.full(num_bonos, "bullet") if tipos_bono is None else np.asarray(tipos_bono, dtype=str)
+    años_gracia = np.zeros(num_bonos) if años_gracia is None else np.asarray(años_gracia, dtype=float)
+    
+    num_periodos = np.maximum(np.rint(np.asarray(años, dtype=float) * frecuencias).astype(int), 1)
+    periodos_gracia = np.rint(años_gracia * frecuencias).astype(int)
+    tasas_periodo = calcular_tasa_cupon_periodo(np.asarray(tasas_cupon_anual, dtype=float), frecuencias)
+    tasas_periodo = np.where(tipos_bono == "cupon_cero", 0.0, tasas_periodo)
+    
+    max_periodos = int(num_periodos.max()) if num_bonos else 0
+    flujo = np.zeros((num_bonos, max_periodos))
+    plazo = np.zeros((num_bonos, max_periodos))
+    
+    claves = np.rec.fromarrays([tipos_bono, num_periodos, periodos_gracia], names='tipo,n,gracia')
+    grupos, grupo_de_bono = np.unique(claves, return_inverse=True)
+    
+    for grupo, (tipo_bono, n, gracia) in enumerate(grupos.tolist()):
+        indices = np.flatnonzero(grupo_de_bono == grupo)
+        unitario = generar_flujos_bono(tipo_bono, 1.0, 0.0, n, gracia)
+        flujo[indices, :n] = valores_nominales[indices, None] * (
+            unitario['principal'] + tasas_periodo[indices, None] * unitario['saldo_inicial']
+        )
+        plazo[indices, :n] = unitario['periodo'] / frecuencias[indices, None]
+    
+    return {
+        'flujo': flujo,
+        'plazo': plazo,
+        'num_periodos': num_periodos
+    }
+
+
+def resolver_z_spread(
+    precios_mercado,
+    flujo: np.ndarray,
+    plazo: np.ndarray,
+    descuento_curva: np.ndarray,
+    tolerancia: float = ZSPREAD_TOLERANCIA,
+    max_iteraciones: int = ZSPREAD_MAX_ITERACIONES
+) -> dict:
+    """
+    Resuelve el Z-spread de muchos bonos a la vez con Newton simultáneo.
+    
+    El precio con spread s es P(s) = Σ F_t × D(t) × e^(-s t), decreciente y convexo
+    en s, con derivada -Σ t × F_t × D(t) × e^(-s t). Cada iteración evalúa en bloque
+    solo los bonos que aún no convergen (máscara por elemento).
+    
+    Args:
+        precios_mercado: Array de precios de mercado, uno por bono
+        flujo: Matriz bonos × periodos de flujos (ceros como relleno)
+        plazo: Matriz bonos × periodos de plazos en años
+        descuento_curva: Matriz bonos × periodos de factores de descuento de la curva
+        tolerancia: Cambio del spread por debajo del cual un bono se da por resuelto
+        max_iteraciones: Máximo de iteraciones de Newton
+    
+    Returns:
+        Diccionario de arrays por bono: 'z_spread' (continuo, anual, en decimal;
+        NaN si el precio no es válido), 'convergido' e 'iteraciones'
+    """
+    precios_mercado = np.asarray(precios_mercado, dtype=float)
+    num_bonos = len(precios_mercado)
+    base = flujo * descuento_curva
+    
+    spread = np.zeros(num_bonos)
+    convergido = np.zeros(num_bonos, dtype=bool)
+    iteraciones = np.zeros(num_bonos, dtype=int)
+    
+    validos = (precios_mercado > 0) & (base.sum(axis=1) > 0)
+    spread[~validos] = np.nan
+    activos = np.flatnonzero(validos)
+    
+    for iteracion in range(1, max_iteraciones + 1):
+        if not activos.size:
+            break
+        
+        plazo_activo = plazo[activos]
+        vp = base[activos] * np.exp(-spread[activos, None] * plazo_activo)
+        derivada = -(vp * plazo_activo).sum(axis=1)
+        paso = (vp.sum(axis=1) - precios_mercado[activos]) / derivada
+        
+        spread[activos] -= paso
+        iteraciones[activos] = iteracion
+        
+        listos = np.abs(paso) < tolerancia
+        convergido[activos[listos]] = True
+        activos = activos[~listos]
+    
+    return {
+        'z_spread': spread,
+        'convergido': convergido,
+        'iteraciones': iteraciones
+    }
+
+
+def calcular_z_spread_bono(calendario: dict, frecuencia_anual: int, precio_mercado: float, curva: dict) -> float:
+    """
+    Calcula el Z-spread de un bono: el spread continuo sobre la curva cero que
+    iguala el valor presente de sus flujos al precio de mercado.
+    
+    Args:
+        calendario: Vectores de flujos del bono (resultado de generar_flujos_bono)
+        frecuencia_anual: Número de pagos por año
+        precio_mercado: Precio de mercado del bono
+        curva: Diccionario con 'plazos' (años) y 'tasas' (TEA cero en decimal)
+    
+    Returns:
+        Z-spread continuo anual en decimal (NaN si no converge)
+    """
+    plazo = (calendario['periodo'] / frecuencia_anual)[None, :]
+    resultado = resolver_z_spread(
+        [precio_mercado], calendario['flujo'][None, :], plazo, calcular_descuentos_curva(curva, plazo)
+    )
+    return float(resultado['z_spread'][0]) if resultado['convergido'][0] else float('nan')
+
+
+@perfilar
+def calcular_z_spread_cartera(cartera, curva: dict, tamaño_bloque: int = ZSPREAD_BLOQUE) -> dict:
+    """
+    Calcula el Z-spread de toda una cartera de bonos en una sola llamada.
+    
+    Los bonos se ordenan por número de periodos y se resuelven por bloques: cada
+    bloque se rellena solo hasta su bono más largo y la memoria queda acotada a
+    tamaño_bloque × periodos.
+    
+    Args:
+        cartera: DataFrame o diccionario con las columnas 'valor_nominal',
+                 'tasa_cupon' (TEA en decimal), 'frecuencia', 'plazo_años' y
+                 'precio'; opcionales 'tipo_bono' y 'años_gracia'
+        curva: Diccionario con 'plazos' (años) y 'tasas' (TEA cero en decimal)
+        tamaño_bloque: Bonos por bloque
+    
+    Returns:
+        Diccionario de arrays en el orden de la cartera: 'z_spread' (NaN si no
+        converge), 'convergido', 'iteraciones' y 'precio_curva' (precio descontando
+        solo con la curva)
+    """
+    precios = np.asarray(cartera['precio'], dtype=float)
+    num_bonos = len(precios)
+    frecuencias = np.asarray(cartera['frecuencia'], dtype=int)
+    plazos = np.asarray(cartera['plazo_años'], dtype=float)
+    tipos_bono = np.asarray(cartera['tipo_bono'], dtype=str) if 'tipo_bono' in cartera else np.full(num_bonos, "bullet")
+    años_gracia = np.asarray(cartera['años_gracia'], dtype=float) if 'años_gracia' in cartera else np.zeros(num_bonos)
+    valores_nominales = np.asarray(cartera['valor_nominal'], dtype=float)
+    tasas_cupon = np.asarray(cartera['tasa_cupon'], dtype=float)
+    
+    resultado = {
+        'z_spread': np.full(num_bonos, np.nan),
+        'convergido': np.zeros(num_bonos, dtype=bool),
+        'iteraciones': np.zeros(num_bonos, dtype=int),
+        'precio_curva': np.zeros(num_bonos)
+    }
+    
+    orden = np.argsort(np.rint(plazos * frecuencias), kind='stable')
+    for inicio in range(0, num_bonos, tamaño_bloque):
+        indices = orden[inicio:inicio + tamaño_bloque]
+        flujos = generar_flujos_cartera(
+            valores_nominales[indices], tasas_cupon[indices], frecuencias[indices],
+            plazos[indices], tipos_bono[indices], años_gracia[indices]
+        )
+        descuento_curva = calcular_descuentos_curva(curva, flujos['plazo'])
+        bloque = resolver_z_spread(precios[indices], flujos['flujo'], flujos['plazo'], descuento_curva)
+        
+        # Igual que calcular_z_spread_bono: sin convergencia el último iterado no es un spread
+        resultado['z_spread'][indices] = np.where(bloque['convergido'], bloque['z_spread'], np.nan)
+        for clave in ('convergido', 'iteraciones'):
+            resultado[clave][indices] = bloque[clave]
+        resultado['precio_curva'][indices] = (flujos['flujo'] * descuento_curva).sum(axis=1)
+    
+    return resultado
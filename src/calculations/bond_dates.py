@@ -0,0 +1,238 @@
+import numpy as np
+from src.calculations.bond_calcs import (
+    calcular_tasa_cupon_periodo,
+    calcular_numero_periodos,
+    calcular_descuentos_curva,
+    generar_flujos_bono
+)
+from src.utils.profiling import perfilar
+
+
+def sumar_meses(fecha, meses) -> np.ndarray:
+    """
+    Suma meses a una fecha, ajustando el día al último del mes si no existe (31 → 30, 28 o 29).
+    
+    Args:
+        fecha: Fecha base (datetime64, date o string ISO)
+        meses: Entero o array de meses a sumar
+    
+    Returns:
+        Array datetime64[D] con una fecha por elemento de meses
+    """
+    fecha = np.datetime64(fecha, 'D')
+    mes = np.datetime64(fecha, 'M') + np.asarray(meses)
+    dia = (fecha - np.datetime64(fecha, 'M').astype('datetime64[D]')).astype(int)
+    dias_mes = ((mes + 1).astype('datetime64[D]') - mes.astype('datetime64[D]')).astype(int)
+    return mes.astype('datetime64[D]') + np.minimum(dia, dias_mes - 1)
+
+
+def generar_fechas_cupon(fecha_emision, frecuencia_anual: int, num_periodos: int) -> np.ndarray:
+    """
+    Genera las fechas de pago de un bono desde su emisión.
+    
+    Args:
+        fecha_emision: Fecha de emisión del bono
+        frecuencia_anual: Número de pagos por año (debe dividir a 12)
+        num_periodos: Número total de periodos
+    
+    Returns:
+        Array datetime64[D] con las fechas de pago 1 .. num_periodos
+    """
+    return sumar_meses(fecha_emision, np.arange(1, num_periodos + 1) * (12 // frecuencia_anual))
+
+
+def fraccion_año(inicio, fin, convencion: str) -> np.ndarray:
+    """
+    Calcula la fracción de año entre dos fechas según la convención de días.
+    
+    - 30/360: meses de 30 días (regla US: los días 31 y el último día de febrero
+      al inicio cuentan como 30; febrero al final también si el inicio lo fue)
+    - act/365: días reales / 365
+    
+    ACT/ACT depende del periodo de cupón y se resuelve en generar_calendario_fechas.
+    
+    Args:
+        inicio: Fecha o array datetime64 de inicio
+        fin: Fecha o array datetime64 de fin
+        convencion: "30/360" o "act/365"
+    
+    Returns:
+        Array de fracciones de año
+    
+    Raises:
+        ValueError: Si la convención no existe
+    """
+    inicio = np.asarray(inicio, dtype='datetime64[D]')
+    fin = np.asarray(fin, dtype='datetime64[D]')
+    
+    if convencion == "act/365":
+        return (fin - inicio).astype(int) / 365
+    
+    if convencion != "30/360":
+        raise ValueError(f"Convención de días desconocida: {convencion}")
+    
+    def separar(fechas):
+        meses = fechas.astype('datetime64[M]')
+        dias = (fechas - meses.astype('datetime64[D]')).astype(int) + 1
+        fin_febrero = (meses.astype(int) % 12 == 1) & (fechas + 1 == (meses + 1).astype('datetime64[D]'))
+        return meses.astype(int), dias, fin_febrero
+    
+    meses_inicio, dia_inicio, febrero_inicio = separar(inicio)
+    meses_fin, dia_fin, febrero_fin = separar(fin)
+    # Un calendario de fin de mes paga el 28/29 de febrero: ese periodo también mide 30 días
+    dia_fin = np.where(febrero_inicio & febrero_fin, 30, dia_fin)
+    dia_inicio = np.where(febrero_inicio, 30, np.minimum(dia_inicio, 30))
+    dia_fin = np.where((dia_inicio == 30) & (dia_fin == 31), 30, dia_fin)
+    
+    return (30 * (meses_fin - meses_inicio) + (dia_fin - dia_inicio)) / 360
+
+
+def generar_calendario_fechas(
+    calendario: dict,
+    fecha_emision,
+    frecuencia_anual: int,
+    fecha_liquidacion,
+    convencion: str = "act/act"
+) -> dict:
+    """
+    Ubica la fecha de liquidación en el calendario del bono y precalcula los plazos.
+    
+    La fracción devengada del periodo en curso es la proporción de días reales del
+    periodo (ACT/ACT, estilo ICMA) o la fracción de año × frecuencia (30/360, ACT/365).
+    Los plazos en años desde la liquidación hasta cada pago pendiente se calculan una
+    sola vez y se reutilizan en cada revaloración (otra TEA, otra curva).
+    
+    Args:
+        calendario: Vectores de flujos del bono (resultado de generar_flujos_bono)
+        fecha_emision: Fecha de emisión del bono
+        frecuencia_anual: Número de pagos por año
+        fecha_liquidacion: Fecha de liquidación (compra)
+        convencion: "act/act", "30/360" o "act/365" (valores de CONVENCIONES_DIAS)
+    
+    Returns:
+        Diccionario con 'fechas', 'flujo', 'cupon', 'principal' y 'plazos' de los pagos
+        pendientes, 'fecha_cupon_anterior', 'fecha_cupon_siguiente',
+        'dias_devengados', 'fraccion_devengada' y 'cupon_corrido'
+    
+    Raises:
+        ValueError: Si la liquidación no está entre la emisión y el vencimiento
+    """
+    fecha_emision = np.datetime64(fecha_emision, 'D')
+    fecha_liquidacion = np.datetime64(fecha_liquidacion, 'D')
+    fechas = generar_fechas_cupon(fecha_emision, frecuencia_anual, len(calendario['flujo']))
+    
+    if not fecha_emision <= fecha_liquidacion < fechas[-1]:
+        raise ValueError("La fecha de liquidación debe estar entre la emisión y el vencimiento del bono.")
+    
+    # Primer pago pendiente: la liquidación en una fecha de pago ya no cobra ese cupón
+    siguiente = int(np.searchsorted(fechas, fecha_liquidacion, side='right'))
+    fecha_anterior = fechas[siguiente - 1] if siguiente > 0 else fecha_emision
+    fecha_siguiente = fechas[siguiente]
+    pendientes = fechas[siguiente:]
+    
+    if convencion == "act/act":
+        fraccion_devengada = (fecha_liquidacion - fecha_anterior) / (fecha_siguiente - fecha_anterior)
+        plazos = (1 - fraccion_devengada + np.arange(len(pendientes))) / frecuencia_anual
+    else:
+        fraccion_devengada = fraccion_año(fecha_anterior, fecha_liquidacion, convencion) * frecuencia_anual
+        plazos = fraccion_año(fecha_liquidacion, pendientes, convencion)
+    
+    # Con días de 30/360 o 365 el periodo no siempre mide 1/frecuencia: el corrido no pasa de un cupón
+    fraccion_devengada = min(max(float(fraccion_devengada), 0.0), 1.0)
+    plazos = np.maximum(plazos, 0.0)
+    
+    return {
+        'fechas': pendientes,
+        'flujo': calendario['flujo'][siguiente:],
+        'cupon': calendario['cupon'][siguiente:],
+        'principal': calendario['principal'][siguiente:],
+        'plazos': plazos,
+        'fecha_cupon_anterior': fecha_anterior,
+        'fecha_cupon_siguiente': fecha_siguiente,
+        'dias_devengados': int((fecha_liquidacion - fecha_anterior).astype(int)),
+        'fraccion_devengada': fraccion_devengada,
+        'cupon_corrido': float(calendario['cupon'][siguiente] * fraccion_devengada)
+    }
+
+
+def calcular_precio_sucio(calendario_fechas: dict, tea_descuento=None, curva: dict = None):
+    """
+    Calcula el precio sucio (valor presente de los pagos pendientes) a la fecha de liquidación.
+    
+    Args:
+        calendario_fechas: Resultado de generar_calendario_fechas
+        tea_descuento: TEA de descuento en decimal (float o array para varias tasas)
+        curva: Curva cero a usar en lugar de la TEA (opcional)
+    
+    Returns:
+        Precio sucio (float) o array de precios, uno por tasa
+    """
+    plazos = calendario_fechas['plazos']
+    if curva is not None:
+        return float(calendario_fechas['flujo'] @ calcular_descuentos_curva(curva, plazos))
+    
+    teas = np.asarray(tea_descuento, dtype=float)
+    descuentos = np.exp(-np.log1p(teas)[..., None] * plazos)
+    return (descuentos @ calendario_fechas['flujo'])[()]
+
+
+@perfilar
+def valorar_bono_en_fecha(
+    valor_nominal: float,
+    tasa_cupon_anual: float,
+    frecuencia_anual: int,
+    años: int,
+    tea_descuento: float,
+    fecha_emision,
+    fecha_liquidacion,
+    convencion: str = "act/act",
+    tipo_bono: str = "bullet",
+    años_gracia: float = 0,
+    curva: dict = None
+) -> dict:
+    """
+    Valora un bono a una fecha de liquidación entre fechas de cupón.
+    
+    Precio sucio = VP de los pagos pendientes; cupón corrido = cupón en curso ×
+    fracción devengada; precio limpio = precio sucio - cupón corrido.
+    
+    Args:
+        valor_nominal: Valor nominal del bono
+        tasa_cupon_anual: Tasa cupón anual (TEA) en decimal
+        frecuencia_anual: Número de pagos por año
+        años: Años al vencimiento desde la emisión
+        tea_descuento: Tasa efectiva anual de descuento en decimal
+        fecha_emision: Fecha de emisión del bono
+        fecha_liquidacion: Fecha de liquidación (compra)
+        convencion: "act/act", "30/360" o "act/365" (valores de CONVENCIONES_DIAS)
+        tipo_bono: Código del tipo de bono (valores de TIPOS_BONO)
+        años_gracia: Años sin amortización (solo fondo_amortizacion)
+        curva: Curva cero a usar en lugar de la TEA (opcional)
+    
+    Returns:
+        Diccionario con 'precio_sucio', 'cupon_corrido', 'precio_limpio',
+        'fecha_cupon_anterior', 'fecha_cupon_siguiente', 'dias_devengados',
+        'pagos_pendientes' y 'calendario_fechas'
+    """
+    calendario = generar_flujos_bono(
+        tipo_bono,
+        valor_nominal,
+        calcular_tasa_cupon_periodo(tasa_cupon_anual, frecuencia_anual),
+        calcular_numero_periodos(años, frecuencia_anual),
+        round(años_gracia * frecuencia_anual)
+    )
+    calendario_fechas = generar_calendario_fechas(calendario, fecha_emision, frecuencia_anual, fecha_liquidacion, convencion)
+    
+    precio_sucio = float(calcular_precio_sucio(calendario_fechas, tea_descuento, curva))
+    cupon_corrido = calendario_fechas['cupon_corrido']
+    
+    return {
+        'precio_sucio': precio_sucio,
+        'cupon_corrido': cupon_corrido,
+        'precio_limpio': precio_sucio - cupon_corrido,
+        'fecha_cupon_anterior': calendario_fechas['fecha_cupon_anterior'],
+        'fecha_cupon_siguiente': calendario_fechas['fecha_cupon_siguiente'],
+        'dias_devengados': calendario_fechas['dias_devengados'],
+        'pagos_pendientes': len(calendario_fechas['fechas']),
+        'calendario_fechas': calendario_fechas
+    }
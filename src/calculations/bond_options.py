@@ -0,0 +1,235 @@
+import numpy as np
+from config.constants import VOLATILIDAD_TASA_DEFECTO, ZSPREAD_TOLERANCIA, ZSPREAD_MAX_ITERACIONES
+from src.calculations.bond_calcs import calcular_descuentos_curva
+from src.utils.profiling import perfilar
+
+
+def calibrar_ho_lee(
+    tea_descuento: float,
+    frecuencia_anual: int,
+    num_periodos: int,
+    volatilidad: float = VOLATILIDAD_TASA_DEFECTO,
+    curva: dict = None
+) -> dict:
+    """
+    Calibra un árbol binomial Ho-Lee a la curva plana de tea_descuento o a una curva cero.
+    
+    La tasa corta (continua, anual) del nodo j en el paso t es
+    r(t, j) = θ_t + σ√Δ × (2j - t), con probabilidad 1/2 en cada rama.
+    La deriva que reproduce exactamente los factores de descuento de la curva
+    tiene forma cerrada: θ_t = f_t + ln cosh(σ√Δ × Δ × t) / Δ,
+    donde f_t es la tasa forward continua del paso t: ln(1 + TEA) con curva plana,
+    ln(D(t) / D(t + 1)) / Δ con una curva cero.
+    
+    Args:
+        tea_descuento: Tasa efectiva anual de descuento en decimal (si no hay curva)
+        frecuencia_anual: Número de pasos por año (igual a la frecuencia de pago)
+        num_periodos: Número de pasos del árbol
+        volatilidad: Volatilidad anual absoluta de la tasa corta (ej: 0.01 = 1%)
+        curva: Diccionario con 'plazos' (años) y 'tasas' (TEA cero) (opcional)
+    
+    Returns:
+        Diccionario con 'theta' (array por paso), 'paso' (σ√Δ) y 'dt' (Δ en años)
+    """
+    dt = 1 / frecuencia_anual
+    paso = volatilidad * np.sqrt(dt)
+    
+    if curva is None:
+        forwards = np.log1p(tea_descuento)
+    else:
+        log_descuentos = np.log(calcular_descuentos_curva(curva, np.arange(num_periodos + 1) * dt))
+        forwards = -np.diff(log_descuentos) / dt
+    
+    # ln cosh(x) estable para x grande: logaddexp(x, -x) - ln 2
+    x = paso * dt * np.arange(num_periodos)
+    ajuste_convexidad = (np.logaddexp(x, -x) - np.log(2)) / dt
+    
+    return {
+        'theta': forwards + ajuste_convexidad,
+        'paso': paso,
+        'dt': dt
+    }
+
+
+def generar_precios_ejercicio(tramos: list, calendario: dict, frecuencia_anual: int) -> np.ndarray:
+    """
+    Convierte un calendario de opción por tramos en el precio de ejercicio de cada periodo.
+    
+    Cada tramo (año_desde, precio_pct) rige desde ese año hasta el siguiente tramo.
+    El precio se aplica sobre el saldo de principal vigente tras el pago del periodo.
+    
+    Args:
+        tramos: Lista de tuplas (año_desde, precio_pct), ej: [(5, 102), (8, 100)]
+        calendario: Vectores de flujos del bono (resultado de generar_flujos_bono)
+        frecuencia_anual: Número de pagos por año
+    
+    Returns:
+        Array de longitud num_periodos - 1 (periodos 1 .. n-1) con el precio de
+        ejercicio, NaN donde la opción no se puede ejercer
+    """
+    num_periodos = len(calendario['periodo'])
+    periodos = np.arange(1, num_periodos)
+    porcentaje = np.full(num_periodos - 1, np.nan)
+    
+    for año_desde, precio_pct in sorted(tramos):
+        porcentaje[periodos >= round(año_desde * frecuencia_anual)] = precio_pct
+    
+    # Saldo vigente tras el pago del periodo t = saldo inicial del periodo t + 1
+    return porcentaje / 100 * calendario['saldo_inicial'][1:]
+
+
+@perfilar
+def valorar_en_arbol(
+    calendario: dict,
+    arbol: dict,
+    precios_call: np.ndarray = None,
+    precios_put: np.ndarray = None,
+    spread=0.0
+):
+    """
+    Valora los flujos del bono en el árbol por inducción hacia atrás, con opciones.
+    
+    Cada paso procesa una rebanada completa del árbol con operaciones de NumPy.
+    En cada fecha de ejercicio el emisor rescata si el precio call es menor al valor
+    de continuar, y el tenedor vende si el precio put es mayor.
+    
+    Args:
+        calendario: Vectores de flujos del bono (resultado de generar_flujos_bono)
+        arbol: Resultado de calibrar_ho_lee
+        precios_call: Precio de rescate por periodo 1 .. n-1 (NaN = sin opción)
+        precios_put: Precio de venta por periodo 1 .. n-1 (NaN = sin opción)
+        spread: Diferencial (continuo, anual) sumado a todas las tasas; float o
+                array para valorar varios diferenciales a la vez
+    
+    Returns:
+        Precio (float) o array de precios, uno por spread
+    """
+    flujos = calendario['flujo']
+    num_periodos = len(flujos)
+    theta, paso, dt = arbol['theta'], arbol['paso'], arbol['dt']
+    
+    # Descuento del nodo (t, j): exp(-(θ_t - σ√Δ t) Δ) × q^j con q = exp(-2σ√Δ Δ);
+    # las potencias q^j y el factor del spread se calculan una sola vez
+    descuento_paso = np.exp(-(theta - paso * np.arange(num_periodos)) * dt)
+    potencias = np.exp(-2 * paso * dt * np.arange(num_periodos + 1))
+    descuento_spread = np.exp(-np.asarray(spread, dtype=float) * dt)[..., None]
+    
+    # Valor tras el último flujo: cero en todos los nodos
+    valor = np.zeros(descuento_spread.shape[:-1] + (num_periodos + 1,))
+    
+    for t in range(num_periodos - 1, -1, -1):
+        continuacion = 0.5 * (valor[..., 1:] + valor[..., :-1]) + flujos[t]
+        valor = (descuento_paso[t] * potencias[:t + 1]) * descuento_spread * continuacion
+        
+        if t > 0:
+            if precios_call is not None and not np.isnan(precios_call[t - 1]):
+                valor = np.minimum(valor, precios_call[t - 1])
+            if precios_put is not None and not np.isnan(precios_put[t - 1]):
+                valor = np.maximum(valor, precios_put[t - 1])
+    
+    return valor[..., 0][()]
+
+
+@perfilar
+def calcular_bono_con_opciones(
+    calendario: dict,
+    tea_descuento: float,
+    frecuencia_anual: int,
+    tramos_call: list = None,
+    tramos_put: list = None,
+    volatilidad: float = VOLATILIDAD_TASA_DEFECTO,
+    curva: dict = None
+) -> dict:
+    """
+    Calcula el precio de un bono con opciones de rescate (call) y de venta (put).
+    
+    Args:
+        calendario: Vectores de flujos del bono (resultado de generar_flujos_bono)
+        tea_descuento: Tasa efectiva anual de descuento en decimal
+        frecuencia_anual: Número de pagos por año
+        tramos_call: Calendario de rescate [(año_desde, precio_pct), ...] (opcional)
+        tramos_put: Calendario de venta [(año_desde, precio_pct), ...] (opcional)
+        volatilidad: Volatilidad anual absoluta de la tasa corta
+        curva: Curva cero a la que se calibra el árbol (opcional, por defecto plana)
+    
+    Returns:
+        Diccionario con:
+        - 'precio_sin_opciones': precio en el árbol sin opciones (igual al VP del bono)
+        - 'precio_con_opciones': precio ajustado por opciones
+        - 'valor_opciones': precio_sin_opciones - precio_con_opciones (positivo si
+          domina el call del emisor, negativo si domina el put del tenedor)
+        - 'precios_call' y 'precios_put': precios de ejercicio por periodo
+    """
+    arbol = calibrar_ho_lee(tea_descuento, frecuencia_anual, len(calendario['flujo']), volatilidad, curva)
+    precios_call = generar_precios_ejercicio(tramos_call, calendario, frecuencia_anual) if tramos_call else None
+    precios_put = generar_precios_ejercicio(tramos_put, calendario, frecuencia_anual) if tramos_put else None
+    
+    precio_sin_opciones = float(valorar_en_arbol(calendario, arbol))
+    precio_con_opciones = float(valorar_en_arbol(calendario, arbol, precios_call, precios_put))
+    
+    return {
+        'precio_sin_opciones': precio_sin_opciones,
+        'precio_con_opciones': precio_con_opciones,
+        'valor_opciones': precio_sin_opciones - precio_con_opciones,
+        'precios_call': precios_call,
+        'precios_put': precios_put
+    }
+
+
+@perfilar
+def calcular_oas(
+    calendario: dict,
+    tea_descuento: float,
+    frecuencia_anual: int,
+    precio_mercado: float,
+    tramos_call: list = None,
+    tramos_put: list = None,
+    volatilidad: float = VOLATILIDAD_TASA_DEFECTO,
+    curva: dict = None,
+    tolerancia: float = ZSPREAD_TOLERANCIA,
+    max_iteraciones: int = ZSPREAD_MAX_ITERACIONES
+) -> dict:
+    """
+    Calcula el OAS: el spread sobre las tasas del árbol que iguala el precio con
+    opciones al precio de mercado.
+    
+    Es una iteración de Newton con derivada numérica: cada iteración valora el
+    spread actual y el desplazado en una sola pasada del árbol (spread como array).
+    Sin opciones, el OAS coincide con el Z-spread contra la misma curva.
+    
+    Args:
+        calendario: Vectores de flujos del bono (resultado de generar_flujos_bono)
+        tea_descuento: Tasa efectiva anual de descuento en decimal (si no hay curva)
+        frecuencia_anual: Número de pagos por año
+        precio_mercado: Precio de mercado del bono
+        tramos_call: Calendario de rescate [(año_desde, precio_pct), ...] (opcional)
+        tramos_put: Calendario de venta [(año_desde, precio_pct), ...] (opcional)
+        volatilidad: Volatilidad anual absoluta de la tasa corta
+        curva: Curva cero a la que se calibra el árbol (opcional, por defecto plana)
+        tolerancia: Cambio del spread por debajo del cual se da por resuelto
+        max_iteraciones: Máximo de iteraciones de Newton
+    
+    Returns:
+        Diccionario con 'oas' (continuo, anual, en decimal), 'convergido' e 'iteraciones'
+    """
+    arbol = calibrar_ho_lee(tea_descuento, frecuencia_anual, len(calendario['flujo']), volatilidad, curva)
+    precios_call = generar_precios_ejercicio(tramos_call, calendario, frecuencia_anual) if tramos_call else None
+    precios_put = generar_precios_ejercicio(tramos_put, calendario, frecuencia_anual) if tramos_put else None
+    
+    desplazamiento = 1e-6
+    spread = 0.0
+    
+    for iteracion in range(1, max_iteraciones + 1):
+        precio, precio_desplazado = valorar_en_arbol(
+            calendario, arbol, precios_call, precios_put, np.array([spread, spread + desplazamiento])
+        )
+        derivada = (precio_desplazado - precio) / desplazamiento
+        if derivada >= 0:
+            break
+        
+        paso = (precio - precio_mercado) / derivada
+        spread -= paso
+        if abs(paso) < tolerancia:
+            return {'oas': float(spread), 'convergido': True, 'iteraciones': iteracion}
+    
+    return {'oas': float('nan'), 'convergido': False, 'iteraciones': iteracion}
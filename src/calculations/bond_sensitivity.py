@@ -0,0 +1,82 @@
+import numpy as np
+from config.constants import CHOQUES_PB, CURVA_PRECIO_PUNTOS, CURVA_PRECIO_RANGO_PB
+from src.calculations.bond_calcs import calcular_tasa_descuento_periodo
+from src.calculations.factor_tables import factor_descuento
+from src.utils.profiling import perfilar
+
+
+def calcular_precios_bono(calendario: dict, teas, frecuencia_anual: int) -> np.ndarray:
+    """
+    Valora el mismo bono con muchas tasas de descuento en una sola operación.
+    
+    Arma la matriz (tasas × periodos) de factores de descuento y la multiplica
+    por el vector de flujos: cada fila del resultado es un precio.
+    
+    Args:
+        calendario: Vectores de flujos del bono (resultado de generar_flujos_bono)
+        teas: Array de tasas efectivas anuales de descuento (en decimal)
+        frecuencia_anual: Número de pagos por año
+    
+    Returns:
+        Array de precios, uno por tasa
+    """
+    tasas_periodo = calcular_tasa_descuento_periodo(np.asarray(teas, dtype=float), frecuencia_anual)
+    descuentos = factor_descuento(tasas_periodo[:, None], calendario['periodo'][None, :])
+    return descuentos @ calendario['flujo']
+
+
+@perfilar
+def calcular_sensibilidad_bono(
+    calendario: dict,
+    tea_descuento: float,
+    frecuencia_anual: int,
+    choques_pb=CHOQUES_PB,
+    num_puntos: int = CURVA_PRECIO_PUNTOS,
+    rango_pb: float = CURVA_PRECIO_RANGO_PB
+) -> dict:
+    """
+    Calcula el precio del bono ante choques de tasa y la curva precio-rendimiento.
+    
+    Los choques y todos los puntos de la curva se valoran juntos con calcular_precios_bono.
+    La curva cubre la TEA ± rango_pb (sin bajar de 0%).
+    
+    Args:
+        calendario: Vectores de flujos del bono (resultado de generar_flujos_bono)
+        tea_descuento: TEA de descuento base (en decimal)
+        frecuencia_anual: Número de pagos por año
+        choques_pb: Choques a la TEA en puntos básicos
+        num_puntos: Número de puntos de la curva
+        rango_pb: Amplitud de la curva a cada lado de la TEA base, en puntos básicos
+    
+    Returns:
+        Diccionario con:
+        - 'precio_base'
+        - 'choques': lista de diccionarios con choque_pb, tea, precio, cambio y cambio_pct
+        - 'curva': diccionario con los arrays 'tea' y 'precio'
+    """
+    choques_pb = np.asarray(choques_pb, dtype=float)
+    teas_choque = tea_descuento + choques_pb / 10000
+    teas_curva = np.linspace(max(tea_descuento - rango_pb / 10000, 0.0), tea_descuento + rango_pb / 10000, num_puntos)
+    
+    precios = calcular_precios_bono(
+        calendario, np.concatenate([[tea_descuento], teas_choque, teas_curva]), frecuencia_anual
+    )
+    precio_base = float(precios[0])
+    precios_choque = precios[1:len(choques_pb) + 1]
+    
+    choques = [
+        {
+            'choque_pb': int(choque),
+            'tea': float(tea),
+            'precio': float(precio),
+            'cambio': float(precio - precio_base),
+            'cambio_pct': float((precio / precio_base - 1) * 100) if precio_base else 0.0
+        }
+        for choque, tea, precio in zip(choques_pb, teas_choque, precios_choque)
+    ]
+    
+    return {
+        'precio_base': precio_base,
+        'choques': choques,
+        'curva': {'tea': teas_curva, 'precio': precios[len(choques_pb) + 1:]}
+    }
@@ -0,0 +1,163 @@
+import numpy as np
+from config.constants import MC_TRAYECTORIAS, MC_BLOQUE, MC_REVERSION, MC_VOLATILIDAD
+from src.calculations.backtest import resumir_distribucion
+from src.utils.profiling import perfilar
+
+
+def simular_tasas_cortas(
+    modelo: str,
+    tasa_inicial: float,
+    media_largo_plazo: float,
+    reversion: float,
+    volatilidad: float,
+    num_pasos: int,
+    dt: float,
+    choques: np.ndarray
+) -> np.ndarray:
+    """
+    Simula trayectorias de la tasa corta (continua, anual) con Vasicek o CIR.
+    
+    - Vasicek: discretización exacta del proceso de Ornstein-Uhlenbeck
+      r' = r e^(-κΔ) + θ (1 - e^(-κΔ)) + σ √[(1 - e^(-2κΔ)) / 2κ] × Z
+    - CIR: Euler con truncamiento total, r' = r + κ (θ - r⁺) Δ + σ √(r⁺ Δ) × Z
+    
+    Args:
+        modelo: "vasicek" o "cir"
+        tasa_inicial: Tasa corta de hoy
+        media_largo_plazo: Nivel al que revierte la tasa (θ)
+        reversion: Velocidad de reversión (κ)
+        volatilidad: Volatilidad de la tasa (σ)
+        num_pasos: Número de pasos de la simulación
+        dt: Largo de cada paso en años
+        choques: Matriz (trayectorias, num_pasos) de normales estándar
+    
+    Returns:
+        Matriz (trayectorias, num_pasos) con la tasa vigente al inicio de cada paso
+    
+    Raises:
+        ValueError: Si el modelo no existe
+    """
+    tasas = np.empty_like(choques)
+    tasa = np.full(choques.shape[0], float(tasa_inicial))
+    
+    if modelo == "vasicek":
+        persistencia = np.exp(-reversion * dt)
+        desvio = volatilidad * np.sqrt(-np.expm1(-2 * reversion * dt) / (2 * reversion)) if reversion > 0 else volatilidad * np.sqrt(dt)
+        for paso in range(num_pasos):
+            tasas[:, paso] = tasa
+            tasa = tasa * persistencia + media_largo_plazo * (1 - persistencia) + desvio * choques[:, paso]
+    elif modelo == "cir":
+        for paso in range(num_pasos):
+            tasas[:, paso] = tasa
+            positiva = np.maximum(tasa, 0.0)
+            tasa = tasa + reversion * (media_largo_plazo - positiva) * dt + volatilidad * np.sqrt(positiva * dt) * choques[:, paso]
+        np.maximum(tasas, 0.0, out=tasas)
+    else:
+        raise ValueError(f"Modelo de tasas desconocido: {modelo}")
+    
+    return tasas
+
+
+def descontar_trayectorias(tasas: np.ndarray, flujos: np.ndarray, pasos_por_periodo: int, dt: float) -> np.ndarray:
+    """
+    Descuenta los flujos del bono a lo largo de cada trayectoria de tasas.
+    
+    El factor de descuento hasta el pago k es exp(-Δ × Σ r) sobre los pasos previos;
+    todos los precios salen de un producto matriz-vector.
+    
+    Args:
+        tasas: Matriz (trayectorias, pasos) de tasas cortas
+        flujos: Flujo del bono en cada periodo de pago
+        pasos_por_periodo: Pasos de simulación entre pagos
+        dt: Largo de cada paso en años
+    
+    Returns:
+        Array de precios, uno por trayectoria
+    """
+    acumulado = np.cumsum(tasas, axis=1)[:, pasos_por_periodo - 1::pasos_por_periodo]
+    return np.exp(-dt * acumulado) @ flujos
+
+
+@perfilar
+def simular_precios_bono(
+    calendario: dict,
+    tea_descuento: float,
+    frecuencia_anual: int,
+    modelo: str = "vasicek",
+    num_trayectorias: int = MC_TRAYECTORIAS,
+    reversion: float = MC_REVERSION,
+    volatilidad: float = None,
+    media_largo_plazo: float = None,
+    semilla: int = None,
+    tamaño_bloque: int = MC_BLOQUE
+) -> dict:
+    """
+    Valora el bono por Monte Carlo sobre trayectorias de la tasa corta.
+    
+    Las trayectorias se generan por bloques (memoria acotada a tamaño_bloque × pasos)
+    y en pares antitéticos (Z, -Z), que reducen la varianza del precio esperado.
+    La tasa parte de ln(1 + tea_descuento) y, salvo que se indique otra media,
+    revierte a ese mismo nivel. Entre pagos se simula como máximo un mes por paso.
+    
+    Args:
+        calendario: Vectores de flujos del bono (resultado de generar_flujos_bono)
+        tea_descuento: Tasa efectiva anual de descuento en decimal
+        frecuencia_anual: Número de pagos por año
+        modelo: "vasicek" o "cir"
+        num_trayectorias: Número de trayectorias (se redondea a un número par)
+        reversion: Velocidad de reversión a la media (κ)
+        volatilidad: Volatilidad de la tasa (σ); por defecto la de MC_VOLATILIDAD
+        media_largo_plazo: Nivel de largo plazo (θ); por defecto la tasa inicial
+        semilla: Semilla del generador aleatorio (para resultados reproducibles)
+        tamaño_bloque: Trayectorias por bloque
+    
+    Returns:
+        Diccionario con 'precios' (array), 'precio_esperado', 'error_estandar',
+        'resumen' (percentiles) y 'muestra_tasas' (hasta 50 trayectorias anuales
+        de la tasa, para graficar)
+    """
+    flujos = calendario['flujo']
+    num_periodos = len(flujos)
+    pasos_por_periodo = int(np.ceil(12 / frecuencia_anual))
+    num_pasos = num_periodos * pasos_por_periodo
+    dt = 1 / (frecuencia_anual * pasos_por_periodo)
+    
+    tasa_inicial = np.log1p(tea_descuento)
+    media_largo_plazo = tasa_inicial if media_largo_plazo is None else media_largo_plazo
+    volatilidad = MC_VOLATILIDAD[modelo] if volatilidad is None else volatilidad
+    
+    generador = np.random.default_rng(semilla)
+    num_pares = max(num_trayectorias // 2, 1)
+    pares_por_bloque = max(tamaño_bloque // 2, 1)
+    
+    precios = np.empty(2 * num_pares)
+    muestra_tasas = None
+    
+    for inicio in range(0, num_pares, pares_por_bloque):
+        pares = min(pares_por_bloque, num_pares - inicio)
+        choques = generador.standard_normal((pares, num_pasos))
+        tasas = simular_tasas_cortas(
+            modelo, tasa_inicial, media_largo_plazo, reversion, volatilidad,
+            num_pasos, dt, np.concatenate([choques, -choques])
+        )
+        bloque = descontar_trayectorias(tasas, flujos, pasos_por_periodo, dt)
+        
+        # Cada par antitético queda en posiciones (i, i + num_pares)
+        precios[inicio:inicio + pares] = bloque[:pares]
+        precios[num_pares + inicio:num_pares + inicio + pares] = bloque[pares:]
+        
+        if muestra_tasas is None:
+            pasos_por_año = pasos_por_periodo * frecuencia_anual
+            muestra_tasas = tasas[:50, ::pasos_por_año]
+    
+    # Error estándar con pares antitéticos: sobre el promedio de cada par
+    promedio_pares = 0.5 * (precios[:num_pares] + precios[num_pares:])
+    error_estandar = float(promedio_pares.std(ddof=1) / np.sqrt(num_pares)) if num_pares > 1 else 0.0
+    
+    return {
+        'precios': precios,
+        'precio_esperado': float(precios.mean()),
+        'error_estandar': error_estandar,
+        'resumen': resumir_distribucion(precios),
+        'muestra_tasas': muestra_tasas
+    }
@@ -0,0 +1,180 @@
+import hashlib
+import io
+import threading
+import numpy as np
+from config.constants import CURVAS_MAXIMAS_CACHE
+from src.calculations.bond_calcs import calcular_tasa_cupon_periodo
+from src.utils.helpers import cargar_cotizaciones_curva_csv
+from src.utils.profiling import perfilar
+
+
+# Curvas ya construidas, por (hash del archivo, frecuencia)
+_curvas = {}
+_candado = threading.Lock()
+
+
+def convertir_plazos_a_periodos(plazos, frecuencia_anual: int) -> np.ndarray:
+    """
+    Convierte plazos en años al número de periodos de la frecuencia de pago.
+    
+    Args:
+        plazos: Array de plazos en años
+        frecuencia_anual: Número de pagos por año (valores de FRECUENCIAS_BONOS)
+    
+    Returns:
+        Array de periodos enteros
+    
+    Raises:
+        ValueError: Si algún plazo no cae en una fecha de pago de la frecuencia
+    """
+    periodos = np.asarray(plazos, dtype=float) * frecuencia_anual
+    enteros = np.rint(periodos).astype(int)
+    
+    invalidos = (np.abs(periodos - enteros) > 1e-6) | (enteros < 1)
+    if invalidos.any():
+        raise ValueError(
+            f"Plazos que no coinciden con la frecuencia de {frecuencia_anual} pagos/año: "
+            f"{', '.join(f'{p:g}' for p in np.asarray(plazos, dtype=float)[invalidos])}."
+        )
+    
+    return enteros
+
+
+def armar_curva(descuentos: np.ndarray, frecuencia_anual: int) -> dict:
+    """
+    Arma el diccionario de curva a partir de los factores de descuento de cada periodo.
+    
+    Args:
+        descuentos: Factor de descuento de los periodos 1 .. n
+        frecuencia_anual: Número de pagos por año
+    
+    Returns:
+        Diccionario con 'plazos' (años), 'tasas' (TEA cero), 'descuentos' y 'frecuencia_anual'
+    
+    Raises:
+        ValueError: Si algún factor de descuento no es positivo
+    """
+    if (descuentos <= 0).any():
+        raise ValueError("Las cotizaciones generan factores de descuento no positivos; revisa las tasas o precios.")
+    
+    plazos = np.arange(1, len(descuentos) + 1) / frecuencia_anual
+    return {
+        'plazos': plazos,
+        'tasas': np.power(descuentos, -1 / plazos) - 1,
+        'descuentos': descuentos,
+        'frecuencia_anual': frecuencia_anual
+    }
+
+
+def bootstrap_tasas_par(plazos, tasas_par, frecuencia_anual: int) -> dict:
+    """
+    Construye la curva cero a partir de rendimientos par.
+    
+    Los rendimientos par se interpolan linealmente a cada fecha de pago. Un bono a
+    la par con cupón c por periodo cumple 1 = c × S(n-1) + (1 + c) × D(n), donde
+    S(n-1) es la suma de los factores de descuento anteriores; con esa suma parcial
+    acumulada cada periodo se resuelve en O(1).
+    
+    Args:
+        plazos: Array de plazos en años (en fechas de pago de la frecuencia)
+        tasas_par: Array de rendimientos par (TEA en decimal)
+        frecuencia_anual: Número de pagos por año
+    
+    Returns:
+        Diccionario de curva (ver armar_curva)
+    """
+    periodos = convertir_plazos_a_periodos(plazos, frecuencia_anual)
+    orden = np.argsort(periodos)
+    grilla = np.arange(1, periodos.max() + 1)
+    
+    tasas_grilla = np.interp(grilla, periodos[orden], np.asarray(tasas_par, dtype=float)[orden])
+    cupones = calcular_tasa_cupon_periodo(tasas_grilla, frecuencia_anual)
+    
+    descuentos = np.empty(len(grilla))
+    suma_parcial = 0.0
+    for n, cupon in enumerate(cupones):
+        descuentos[n] = (1 - cupon * suma_parcial) / (1 + cupon)
+        suma_parcial += descuentos[n]
+    
+    return armar_curva(descuentos, frecuencia_anual)
+
+
+def bootstrap_precios(plazos, precios, tasas_cupon, frecuencia_anual: int) -> dict:
+    """
+    Construye la curva cero a partir de precios de bonos bullet.
+    
+    Se necesita un bono por cada fecha de pago hasta el plazo más largo. Con precio
+    P (por 100 de nominal) y cupón c por periodo: D(n) = (P / 100 - c × S(n-1)) / (1 + c).
+    
+    Args:
+        plazos: Array de plazos en años (en fechas de pago de la frecuencia)
+        precios: Array de precios por 100 de valor nominal
+        tasas_cupon: Array de tasas cupón (TEA en decimal)
+        frecuencia_anual: Número de pagos por año
+    
+    Returns:
+        Diccionario de curva (ver armar_curva)
+    
+    Raises:
+        ValueError: Si falta un bono en alguna fecha de pago
+    """
+    periodos = convertir_plazos_a_periodos(plazos, frecuencia_anual)
+    faltantes = np.setdiff1d(np.arange(1, periodos.max() + 1), periodos)
+    if len(faltantes):
+        raise ValueError(
+            f"Con precios se necesita un bono en cada fecha de pago; faltan los plazos: "
+            f"{', '.join(f'{p / frecuencia_anual:g}' for p in faltantes)}."
+        )
+    
+    _, primeros = np.unique(periodos, return_index=True)
+    precios = np.asarray(precios, dtype=float)[primeros] / 100
+    cupones = calcular_tasa_cupon_periodo(np.asarray(tasas_cupon, dtype=float)[primeros], frecuencia_anual)
+    
+    descuentos = np.empty(len(primeros))
+    suma_parcial = 0.0
+    for n, (precio, cupon) in enumerate(zip(precios, cupones)):
+        descuentos[n] = (precio - cupon * suma_parcial) / (1 + cupon)
+        suma_parcial += descuentos[n]
+    
+    return armar_curva(descuentos, frecuencia_anual)
+
+
+@perfilar
+def obtener_curva_csv(contenido: bytes, frecuencia_anual: int) -> dict:
+    """
+    Construye (o recupera de la memoria) la curva cero de un CSV de cotizaciones.
+    
+    La curva se guarda por hash SHA-256 del contenido y frecuencia: volver a cargar
+    el mismo archivo no repite el bootstrapping. Ver cargar_cotizaciones_curva_csv
+    para el formato del archivo.
+    
+    Args:
+        contenido: Bytes del archivo CSV (ej. archivo.getvalue())
+        frecuencia_anual: Número de pagos por año
+    
+    Returns:
+        Diccionario de curva (ver armar_curva)
+    
+    Raises:
+        ValueError: Si el archivo o las cotizaciones no son válidos
+    """
+    clave = (hashlib.sha256(contenido).hexdigest(), frecuencia_anual)
+    
+    with _candado:
+        if clave in _curvas:
+            return _curvas[clave]
+    
+    cotizaciones = cargar_cotizaciones_curva_csv(io.BytesIO(contenido))
+    if 'tasa_par' in cotizaciones:
+        curva = bootstrap_tasas_par(cotizaciones['plazo_años'], cotizaciones['tasa_par'], frecuencia_anual)
+    else:
+        curva = bootstrap_precios(
+            cotizaciones['plazo_años'], cotizaciones['precio'], cotizaciones['tasa_cupon'], frecuencia_anual
+        )
+    
+    with _candado:
+        if len(_curvas) >= CURVAS_MAXIMAS_CACHE:
+            _curvas.pop(next(iter(_curvas)))
+        _curvas[clave] = curva
+    
+    return curva
@@ -0,0 +1,192 @@
+import threading
+import numpy as np
+from config.constants import (
+    FRECUENCIAS,
+    FRECUENCIAS_BONOS,
+    TABLA_TEA_MAXIMA,
+    TABLA_TEA_PASO,
+    TABLA_PERIODOS_MAXIMOS
+)
+
+
+# Tolerancia para reconocer una tasa de la grilla (las tasas por periodo se obtienen
+# con potencias fraccionarias y pueden diferir en el último bit)
+TOLERANCIA_TASA = 1e-13
+
+_tabla = None
+_candado = threading.Lock()
+
+
+def generar_tasas_grilla() -> np.ndarray:
+    """
+    Genera todas las tasas por periodo que la interfaz puede producir.
+    
+    Incluye la tasa equivalente de cada TEA de la grilla para cada frecuencia de
+    aportes y de bonos, y la tasa mensual de retiro (50% de la TEA). La frecuencia
+    diaria se omite: sus plazos superan casi siempre el máximo de periodos.
+    
+    Returns:
+        Array ordenado de tasas por periodo sin repetidos
+    """
+    teas = np.arange(round(TABLA_TEA_MAXIMA / TABLA_TEA_PASO) + 1) * TABLA_TEA_PASO
+    frecuencias = {*FRECUENCIAS.values(), *FRECUENCIAS_BONOS.values()} - {FRECUENCIAS["Diaria"]}
+    
+    tasas = [np.power(1 + teas, 1 / f) - 1 for f in frecuencias]
+    tasas.append(teas / 2)
+    return np.unique(np.concatenate(tasas))
+
+
+def construir_tabla() -> dict:
+    """
+    Construye las tablas de factores para todas las tasas de la grilla y n = 0..máximo.
+    
+    Returns:
+        Diccionario con 'tasas' (filas) y las matrices (tasas, periodos + 1):
+        - 'capitalizacion': (1 + i)^n
+        - 'descuento': (1 + i)^-n
+        - 'anualidad': ((1 + i)^n - 1) / i  (VF de una anualidad vencida)
+        - 'anualidad_vp': (1 - (1 + i)^-n) / i  (VP de una anualidad vencida)
+    """
+    tasas = generar_tasas_grilla()
+    n = np.arange(TABLA_PERIODOS_MAXIMOS + 1)
+    
+    i = tasas[:, None]
+    capitalizacion = np.power(1 + i, n)
+    descuento = 1 / capitalizacion
+    with np.errstate(divide='ignore', invalid='ignore'):
+        anualidad = np.where(i == 0, n, np.expm1(n * np.log1p(i)) / i)
+        anualidad_vp = np.where(i == 0, n, -np.expm1(-n * np.log1p(i)) / i)
+    
+    return {
+        'tasas': tasas,
+        'capitalizacion': capitalizacion,
+        'descuento': descuento,
+        'anualidad': anualidad,
+        'anualidad_vp': anualidad_vp
+    }
+
+
+def obtener_tabla() -> dict:
+    """
+    Devuelve las tablas de factores, construyéndolas en el primer uso.
+    
+    Returns:
+        Diccionario de construir_tabla (compartido entre sesiones)
+    """
+    global _tabla
+    if _tabla is None:
+        with _candado:
+            if _tabla is None:
+                _tabla = construir_tabla()
+    return _tabla
+
+
+def _calcular_exacto(nombre: str, tasa: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """
+    Calcula un factor con su fórmula, para tasas o periodos fuera de la grilla.
+    """
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if nombre == 'capitalizacion':
+            return np.power(1 + tasa, n)
+        if nombre == 'descuento':
+            return np.power(1 + tasa, -n)
+        if nombre == 'anualidad':
+            return np.where(tasa == 0, n, np.expm1(n * np.log1p(tasa)) / tasa)
+        return np.where(tasa == 0, n, -np.expm1(-n * np.log1p(tasa)) / tasa)
+
+
+def _consultar(nombre: str, tasa, n):
+    """
+    Busca un factor en la tabla; las entradas fuera de la grilla se calculan exactas.
+    
+    Args:
+        nombre: 'capitalizacion', 'descuento', 'anualidad' o 'anualidad_vp'
+        tasa: Tasa por periodo (float o array)
+        n: Número de periodos (int o array)
+    
+    Returns:
+        Factor con la forma de tasa y n combinados (float si ambos son escalares)
+    """
+    tasa = np.asarray(tasa, dtype=float)
+    n = np.asarray(n, dtype=float)
+    tabla = obtener_tabla()
+    tasas = tabla['tasas']
+    
+    # Tasa de la grilla más cercana, buscada antes de combinar con n (una búsqueda por tasa)
+    fila = np.clip(np.searchsorted(tasas, tasa), 1, len(tasas) - 1)
+    fila = np.where(np.abs(tasas[fila - 1] - tasa) <= np.abs(tasas[fila] - tasa), fila - 1, fila)
+    tasa_en_grilla = np.abs(tasas[fila] - tasa) <= TOLERANCIA_TASA
+    
+    columna = n.astype(int)
+    periodo_en_tabla = (columna == n) & (columna >= 0) & (columna <= TABLA_PERIODOS_MAXIMOS)
+    
+    # Consulta sobre la matriz aplanada: índice = fila × (periodos + 1) + columna
+    valores = tabla[nombre].ravel()
+    if tasa_en_grilla.all() and periodo_en_tabla.all():
+        return valores[fila * (TABLA_PERIODOS_MAXIMOS + 1) + columna][()]
+    
+    tasa, n, fila, columna, en_tabla = np.broadcast_arrays(
+        tasa, n, fila, columna, tasa_en_grilla & periodo_en_tabla
+    )
+    resultado = np.empty(tasa.shape)
+    resultado[en_tabla] = valores[fila[en_tabla] * (TABLA_PERIODOS_MAXIMOS + 1) + columna[en_tabla]]
+    fuera = ~en_tabla
+    resultado[fuera] = _calcular_exacto(nombre, tasa[fuera], n[fuera])
+    
+    return resultado[()]
+
+
+def factor_capitalizacion(tasa, n):
+    """
+    Factor de capitalización (1 + i)^n.
+    
+    Args:
+        tasa: Tasa por periodo (float o array)
+        n: Número de periodos (int o array)
+    
+    Returns:
+        Factor (float o array)
+    """
+    return _consultar('capitalizacion', tasa, n)
+
+
+def factor_descuento(tasa, n):
+    """
+    Factor de descuento (1 + i)^-n.
+    
+    Args:
+        tasa: Tasa por periodo (float o array)
+        n: Número de periodos (int o array)
+    
+    Returns:
+        Factor (float o array)
+    """
+    return _consultar('descuento', tasa, n)
+
+
+def factor_anualidad(tasa, n):
+    """
+    Factor de valor futuro de una anualidad vencida: ((1 + i)^n - 1) / i, o n si i = 0.
+    
+    Args:
+        tasa: Tasa por periodo (float o array)
+        n: Número de periodos (int o array)
+    
+    Returns:
+        Factor (float o array)
+    """
+    return _consultar('anualidad', tasa, n)
+
+
+def factor_anualidad_vp(tasa, n):
+    """
+    Factor de valor presente de una anualidad vencida: (1 - (1 + i)^-n) / i, o n si i = 0.
+    
+    Args:
+        tasa: Tasa por periodo (float o array)
+        n: Número de periodos (int o array)
+    
+    Returns:
+        Factor (float o array)
+    """
+    return _consultar('anualidad_vp', tasa, n)
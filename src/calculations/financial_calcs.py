@@ -1,10 +1,15 @@
+import numpy as np
+from src.calculations.factor_tables import factor_anualidad
+from src.utils.profiling import perfilar
+
+
 def calcular_tasa_periodo(tea: float, frecuencia_anual: int) -> float:
     """
     Convierte la TEA a tasa efectiva del periodo según la frecuencia.
     
     Args:
         tea: Tasa Efectiva Anual (en decimal, ej: 0.10 para 10%)
-        frecuencia_anual: Número de periodos por año (12=mensual, 4=trimestral, 2=semestral, 1=anual)
+        frecuencia_anual: Número de periodos por año (365=diaria, 12=mensual, 4=trimestral, 2=semestral, 1=anual)
     
     Returns:
         Tasa efectiva del periodo
@@ -12,6 +17,19 @@ def calcular_tasa_periodo(tea: float, frecuencia_anual: int) -> float:
     return (1 + tea) ** (1 / frecuencia_anual) - 1
 
 
+def calcular_fuerza_interes(tea: float) -> float:
+    """
+    Calcula la fuerza de interés (tasa de capitalización continua) equivalente a la TEA.
+    
+    Args:
+        tea: Tasa Efectiva Anual (en decimal)
+    
+    Returns:
+        Tasa continua δ = ln(1 + TEA)
+    """
+    return float(np.log1p(tea))
+
+
 def calcular_vf_valor_presente(vp: float, tea: float, periodos: int) -> float:
     """
     Calcula el valor futuro a partir de un valor presente.
@@ -41,11 +59,8 @@ def calcular_vf_aportes_periodicos(aporte: float, tasa_periodo: float, num_perio
     Returns:
         Valor Futuro acumulado
     """
-    if tasa_periodo == 0:
-        return aporte * num_periodos
-    
-    # Anualidad vencida (aporte al final del periodo)
-    vf_vencida = aporte * (((1 + tasa_periodo) ** num_periodos - 1) / tasa_periodo)
+    # Anualidad vencida (aporte al final del periodo); el factor sale de la tabla precalculada
+    vf_vencida = aporte * factor_anualidad(tasa_periodo, num_periodos)
     
     # Si es anualidad anticipada (aporte al inicio), multiplicar por (1 + tasa_periodo)
     if aporte_al_inicio:
@@ -54,31 +69,579 @@ def calcular_vf_aportes_periodicos(aporte: float, tasa_periodo: float, num_perio
     return vf_vencida
 
 
-def calcular_vf_combinado(vp: float, aporte: float, tea: float, frecuencia_anual: int, plazo_años: int, aporte_al_inicio: bool = False) -> float:
+def calcular_vf_aportes_continuos(aporte_anual: float, tea: float, plazo_años: float) -> float:
+    """
+    Calcula el valor futuro de aportes que ingresan como un flujo continuo.
+    
+    Cada unidad aportada capitaliza desde el instante en que ingresa:
+    VF = A × [((1 + TEA)^t - 1) / δ], con δ = ln(1 + TEA).
+    
+    Args:
+        aporte_anual: Monto total aportado por año
+        tea: Tasa Efectiva Anual (en decimal)
+        plazo_años: Plazo en años
+    
+    Returns:
+        Valor Futuro acumulado
+    """
+    if tea == 0:
+        return aporte_anual * plazo_años
+    
+    return aporte_anual * (((1 + tea) ** plazo_años - 1) / calcular_fuerza_interes(tea))
+
+
+def calcular_factor_aporte_efectivo(
+    tasa_periodo: float,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False
+) -> float:
+    """
+    Factor que lleva un aporte del periodo a su valor al cierre del mismo periodo.
+    
+    Args:
+        tasa_periodo: Tasa efectiva del periodo (float o array de tasas por periodo)
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si el aporte ingresa como flujo continuo
+                                 durante el periodo (tiene prioridad sobre aporte_al_inicio)
+    
+    Returns:
+        Factor multiplicativo (1 para anualidad vencida)
+    """
+    if capitalizacion_continua:
+        if np.ndim(tasa_periodo) > 0:
+            tasas = np.asarray(tasa_periodo, dtype=float)
+            logaritmo = np.log1p(tasas)
+            return np.divide(tasas, logaritmo, out=np.ones_like(tasas), where=logaritmo != 0)
+        return tasa_periodo / np.log1p(tasa_periodo) if tasa_periodo != 0 else 1.0
+    if aporte_al_inicio:
+        return 1 + tasa_periodo
+    return 1.0
+
+
+def generar_aportes_crecientes(
+    aporte: float,
+    num_periodos: int,
+    tasa_crecimiento: float,
+    frecuencia_anual: int = 1,
+    crecimiento_anual: bool = True
+) -> np.ndarray:
+    """
+    Genera el vector de aportes que crecen a una tasa fija.
+    
+    Args:
+        aporte: Aporte del primer periodo
+        num_periodos: Número total de periodos
+        tasa_crecimiento: Tasa de crecimiento (en decimal)
+        frecuencia_anual: Número de periodos por año
+        crecimiento_anual: True si el aporte sube una vez por año,
+                           False si sube cada periodo
+    
+    Returns:
+        Array con el aporte de cada periodo
+    """
+    periodos_por_escalon = frecuencia_anual if crecimiento_anual else 1
+    escalones = np.arange(num_periodos) // periodos_por_escalon
+    return aporte * np.power(1 + tasa_crecimiento, escalones, dtype=float)
+
+
+def _anualidad(tasa: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """
+    Factor de valor futuro de una anualidad vencida constante: [(1 + i)^n - 1] / i.
+    """
+    tasa_segura = np.where(tasa == 0, 1.0, tasa)
+    return np.where(tasa == 0, n, np.expm1(n * np.log1p(tasa)) / tasa_segura)
+
+
+def _anualidad_creciente(tasa: np.ndarray, g: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """
+    Factor de valor futuro de una anualidad vencida creciente (primer pago = 1).
+    
+    [(1 + i)^n - (1 + g)^n] / (i - g), escrito como (1 + i)^(n - 1) × [(1 + d)^n - 1] / d
+    con d = (g - i) / (1 + i). La forma con expm1/log1p no pierde precisión cuando i y g
+    son casi iguales, y tiende a n × (1 + i)^(n - 1) cuando d = 0.
+    """
+    d = (g - tasa) / (1 + tasa)
+    d_seguro = np.where(d == 0, 1.0, d)
+    suma_geometrica = np.where(d == 0, n, np.expm1(n * np.log1p(d)) / d_seguro)
+    return np.power(1 + tasa, n - 1.0) * suma_geometrica
+
+
+def calcular_vf_aportes_crecientes(
+    aporte,
+    tasa_periodo,
+    num_periodos,
+    tasa_crecimiento,
+    frecuencia_anual: int = 1,
+    crecimiento_anual: bool = True,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False
+):
+    """
+    Calcula en O(1) el valor futuro de aportes que crecen a una tasa fija.
+    
+    Crecimiento por periodo: VF = a × [(1 + i)^n - (1 + g)^n] / (i - g).
+    Crecimiento anual: cada año es una anualidad de f aportes iguales, y los años
+    forman una anualidad creciente con tasa anual j = (1 + i)^f - 1.
+    En ambos casos i ≈ g se evalúa sin cancelación (límite n × (1 + i)^(n - 1) si i = g).
+    
+    Todos los argumentos numéricos aceptan arrays (se evalúan por broadcasting).
+    
+    Args:
+        aporte: Aporte del primer periodo
+        tasa_periodo: Tasa efectiva del periodo
+        num_periodos: Número total de periodos
+        tasa_crecimiento: Tasa de crecimiento del aporte (anual o por periodo)
+        frecuencia_anual: Número de periodos por año
+        crecimiento_anual: True si el aporte sube una vez por año
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+    
+    Returns:
+        Valor Futuro (float o array)
+    """
+    aporte = np.asarray(aporte, dtype=float)
+    tasa = np.asarray(tasa_periodo, dtype=float)
+    n = np.asarray(num_periodos)
+    g = np.asarray(tasa_crecimiento, dtype=float)
+    
+    if crecimiento_anual:
+        f = frecuencia_anual
+        años_completos = n // f
+        resto = n % f
+        tasa_anual = np.expm1(f * np.log1p(tasa))
+        # Años completos: cada año vale s_f(i) al cierre; el año parcial final suma s_resto(i)
+        vf = aporte * (
+            _anualidad(tasa, f) * _anualidad_creciente(tasa_anual, g, años_completos) * np.power(1 + tasa, resto)
+            + np.power(1 + g, años_completos) * _anualidad(tasa, resto)
+        )
+    else:
+        vf = aporte * _anualidad_creciente(tasa, g, n)
+    
+    if capitalizacion_continua:
+        vf = vf * np.where(tasa == 0, 1.0, tasa / np.where(tasa == 0, 1.0, np.log1p(tasa)))
+    elif aporte_al_inicio:
+        vf = vf * (1 + tasa)
+    
+    return float(vf) if np.ndim(vf) == 0 else vf
+
+
+def calcular_total_aportes(
+    aporte: float,
+    num_periodos: int,
+    tasa_crecimiento: float = 0.0,
+    frecuencia_anual: int = 1,
+    crecimiento_anual: bool = True
+) -> float:
+    """
+    Suma nominal de los aportes (sin intereses), con o sin crecimiento.
+    
+    Args:
+        aporte: Aporte del primer periodo
+        num_periodos: Número total de periodos
+        tasa_crecimiento: Tasa de crecimiento del aporte
+        frecuencia_anual: Número de periodos por año
+        crecimiento_anual: True si el aporte sube una vez por año
+    
+    Returns:
+        Total aportado
+    """
+    if tasa_crecimiento == 0:
+        return aporte * num_periodos
+    
+    periodos_por_escalon = frecuencia_anual if crecimiento_anual else 1
+    escalones, resto = divmod(num_periodos, periodos_por_escalon)
+    g = tasa_crecimiento
+    completos = periodos_por_escalon * ((1 + g) ** escalones - 1) / g
+    return aporte * (completos + resto * (1 + g) ** escalones)
+
+
+def ajustar_aportes(aportes, num_periodos: int) -> np.ndarray:
+    """
+    Ajusta un historial de aportes al número de periodos del plazo.
+    
+    Si el historial es más corto se completa con ceros; si es más largo se trunca.
+    
+    Args:
+        aportes: Aportes por periodo (lista o array)
+        num_periodos: Número total de periodos del plazo
+    
+    Returns:
+        Array de longitud num_periodos
+    """
+    aportes = np.asarray(aportes, dtype=float)
+    if aportes.shape[-1] >= num_periodos:
+        return aportes[..., :num_periodos]
+    
+    relleno = [(0, 0)] * (aportes.ndim - 1) + [(0, num_periodos - aportes.shape[-1])]
+    return np.pad(aportes, relleno)
+
+
+def generar_vector_aportes(
+    aporte,
+    num_periodos: int,
+    tasa_crecimiento: float = 0.0,
+    frecuencia_anual: int = 1,
+    crecimiento_anual: bool = True
+) -> np.ndarray:
+    """
+    Expresa cualquier forma de aporte (constante, creciente o irregular) como un array por periodo.
+    
+    Args:
+        aporte: Aporte periódico (float) o array de aportes por periodo
+        num_periodos: Número total de periodos
+        tasa_crecimiento: Tasa a la que crece el aporte (solo si aporte es un float)
+        frecuencia_anual: Número de periodos por año
+        crecimiento_anual: True si el aporte sube una vez por año
+    
+    Returns:
+        Array de aportes de longitud num_periodos
+    """
+    if np.ndim(aporte) > 0:
+        return ajustar_aportes(aporte, num_periodos)
+    if tasa_crecimiento != 0:
+        return generar_aportes_crecientes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, crecimiento_anual)
+    return np.full(num_periodos, float(aporte))
+
+
+def calcular_vf_aportes_irregulares(
+    aportes,
+    tasa_periodo: float,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False
+):
+    """
+    Calcula el valor futuro de aportes distintos en cada periodo.
+    
+    VF = Σ a_k × (1 + i)^(n - k), evaluado como producto punto entre los aportes
+    y el vector de factores de capitalización.
+    
+    Args:
+        aportes: Array de aportes por periodo; si es 2-D, cada fila es un cliente
+        tasa_periodo: Tasa efectiva del periodo
+        aporte_al_inicio: True si los aportes son al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+    
+    Returns:
+        Valor Futuro (float, o array con un valor por fila si aportes es 2-D)
+    """
+    aportes = np.asarray(aportes, dtype=float)
+    num_periodos = aportes.shape[-1]
+    
+    exponentes = np.arange(num_periodos - 1, -1, -1)
+    factores = np.power(1 + tasa_periodo, exponentes, dtype=float)
+    factores *= calcular_factor_aporte_efectivo(tasa_periodo, aporte_al_inicio, capitalizacion_continua)
+    
+    vf = aportes @ factores
+    return float(vf) if np.ndim(vf) == 0 else vf
+
+
+def expandir_tasas(tasas, num_periodos: int, periodos_por_tramo: int) -> np.ndarray:
+    """
+    Expande una trayectoria de tasas a una tasa por periodo.
+    
+    La trayectoria puede traer una tasa por periodo o una por tramo (ej. una por año
+    que se repite en cada uno de sus periodos).
+    
+    Args:
+        tasas: Array 1-D con una trayectoria, o 2-D con una trayectoria por fila
+        num_periodos: Número total de periodos
+        periodos_por_tramo: Periodos que cubre cada tasa cuando hay una por tramo
+    
+    Returns:
+        Array con forma (..., num_periodos)
+    
+    Raises:
+        ValueError: Si la longitud no corresponde ni a tramos ni a periodos
+    """
+    tasas = np.asarray(tasas, dtype=float)
+    longitud = tasas.shape[-1]
+    if longitud == num_periodos:
+        return tasas
+    
+    tramos = -(-num_periodos // periodos_por_tramo)
+    if longitud == tramos:
+        return np.repeat(tasas, periodos_por_tramo, axis=-1)[..., :num_periodos]
+    
+    raise ValueError(
+        f"La trayectoria tiene {longitud} tasas; se esperaban {tramos} (una por tramo) "
+        f"o {num_periodos} (una por periodo)"
+    )
+
+
+def calcular_vf_trayectorias(
+    vp: float,
+    aportes,
+    tasas_periodo,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False
+):
+    """
+    Calcula el valor futuro con una tasa distinta en cada periodo.
+    
+    Con C_k = Π_{j>k} (1 + i_j), el crecimiento desde el cierre del periodo k hasta el final:
+    VF = VP × C_0 + Σ a_k × ef_k × C_k
+    Los productos acumulados se calculan a la vez para todas las trayectorias.
+    
+    Args:
+        vp: Valor Presente inicial
+        aportes: Array de aportes por periodo (común a todas las trayectorias)
+        tasas_periodo: Array (num_periodos,) o (trayectorias, num_periodos) de tasas por periodo
+        aporte_al_inicio: True si los aportes son al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+    
+    Returns:
+        Valor Futuro (float, o array con un valor por trayectoria)
+    """
+    tasas = np.asarray(tasas_periodo, dtype=float)
+    
+    # Π_{j≥k} (1 + i_j): producto acumulado desde el final hacia atrás
+    crecimiento = np.cumprod((1 + tasas)[..., ::-1], axis=-1)[..., ::-1]
+    posterior = np.concatenate([crecimiento[..., 1:], np.ones(tasas.shape[:-1] + (1,))], axis=-1)
+    factores = posterior * calcular_factor_aporte_efectivo(tasas, aporte_al_inicio, capitalizacion_continua)
+    
+    vf = vp * crecimiento[..., 0] + np.sum(aportes * factores, axis=-1)
+    return float(vf) if np.ndim(vf) == 0 else vf
+
+
+def generar_trayectorias_estres(tea: float, tea_estres: float, años_estres: int, plazo_años: int) -> dict:
+    """
+    Arma trayectorias anuales de TEA con años malos al inicio o al final del plazo.
+    
+    Args:
+        tea: TEA base (en decimal)
+        tea_estres: TEA de los años de estrés (en decimal, puede ser negativa)
+        años_estres: Número de años malos consecutivos
+        plazo_años: Plazo en años
+    
+    Returns:
+        Diccionario con 'nombres' y 'trayectorias' (array de forma (3, plazo_años))
+    """
+    años_estres = min(años_estres, plazo_años)
+    trayectorias = np.full((3, plazo_años), float(tea))
+    trayectorias[1, :años_estres] = tea_estres
+    trayectorias[2, plazo_años - años_estres:] = tea_estres
+    
+    return {
+        'nombres': ["TEA constante", f"{años_estres} años malos al inicio", f"{años_estres} años malos al final"],
+        'trayectorias': trayectorias
+    }
+
+
+def calcular_saldos_periodicos(
+    vp: float,
+    aporte,
+    tasa_periodo: float,
+    num_periodos: int,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False
+) -> dict:
+    """
+    Calcula de forma vectorizada los saldos de todos los periodos de acumulación.
+    
+    Con aporte constante usa la forma cerrada del saldo al cierre del periodo k:
+    S_k = VP × (1 + i)^k + a_ef × [((1 + i)^k - 1) / i]
+    Con aportes o tasas por periodo, siendo F_k = Π_{j≤k} (1 + i_j):
+    S_k = F_k × [VP + Σ_{j≤k} a_ef_j / F_j]
+    
+    Args:
+        vp: Valor Presente inicial
+        aporte: Aporte periódico (float) o array de aportes por periodo
+        tasa_periodo: Tasa efectiva del periodo, o array de tasas por periodo
+                      (2-D: una trayectoria por fila)
+        num_periodos: Número total de periodos
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+    
+    Returns:
+        Diccionario de arrays de NumPy: periodo, saldo_inicial, aporte, interes, saldo_final
+    """
+    periodos = np.arange(1, num_periodos + 1)
+    if np.ndim(tasa_periodo) > 0:
+        factor = np.cumprod(1 + np.asarray(tasa_periodo, dtype=float), axis=-1)
+    else:
+        factor = np.power(1 + tasa_periodo, periodos, dtype=float)
+    factor_aporte = calcular_factor_aporte_efectivo(
+        tasa_periodo, aporte_al_inicio, capitalizacion_continua
+    )
+    
+    if np.ndim(aporte) == 0 and np.ndim(tasa_periodo) == 0:
+        if tasa_periodo == 0:
+            anualidad = periodos.astype(float)
+        else:
+            anualidad = np.expm1(periodos * np.log1p(tasa_periodo)) / tasa_periodo
+        
+        saldo_final = vp * factor + aporte * factor_aporte * anualidad
+        aportes = np.full(num_periodos, float(aporte))
+    else:
+        if np.ndim(aporte) == 0:
+            aportes = np.full(num_periodos, float(aporte))
+        else:
+            aportes = ajustar_aportes(aporte, num_periodos)
+        saldo_final = factor * (vp + np.cumsum(aportes * factor_aporte / factor, axis=-1))
+        aportes = np.broadcast_to(aportes, saldo_final.shape)
+    
+    saldo_inicial = np.concatenate(
+        [np.full(saldo_final.shape[:-1] + (1,), float(vp)), saldo_final[..., :-1]], axis=-1
+    )
+    
+    return {
+        'periodo': periodos,
+        'saldo_inicial': saldo_inicial,
+        'aporte': aportes,
+        'interes': saldo_final - saldo_inicial - aportes,
+        'saldo_final': saldo_final
+    }
+
+
+def calcular_saldos_en_periodos(
+    vp: float,
+    aporte: float,
+    tasa_periodo: float,
+    periodos,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    frecuencia_anual: int = 1,
+    crecimiento_anual: bool = True
+) -> np.ndarray:
+    """
+    Calcula el saldo al cierre de periodos puntuales sin recorrer los anteriores.
+    
+    S_k = VP × (1 + i)^k + VF de los aportes a k (anualidad constante o creciente),
+    así que el costo depende de cuántos periodos se piden y no del plazo.
+    
+    Args:
+        vp: Valor Presente inicial
+        aporte: Aporte del primer periodo (constante o creciente)
+        tasa_periodo: Tasa efectiva del periodo (constante)
+        periodos: Array de periodos k (0 = saldo inicial)
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        frecuencia_anual: Número de periodos por año
+        crecimiento_anual: True si el aporte sube una vez por año
+    
+    Returns:
+        Array con el saldo al cierre de cada periodo pedido
+    """
+    periodos = np.asarray(periodos)
+    factor = np.power(1 + tasa_periodo, periodos, dtype=float)
+    
+    if tasa_crecimiento == 0:
+        factor_aporte = calcular_factor_aporte_efectivo(tasa_periodo, aporte_al_inicio, capitalizacion_continua)
+        return vp * factor + aporte * factor_aporte * _anualidad(np.float64(tasa_periodo), periodos)
+    
+    return vp * factor + calcular_vf_aportes_crecientes(
+        aporte, tasa_periodo, periodos, tasa_crecimiento, frecuencia_anual,
+        crecimiento_anual, aporte_al_inicio, capitalizacion_continua
+    )
+
+
+@perfilar
+def calcular_vf_combinado(
+    vp: float,
+    aporte,
+    tea: float,
+    frecuencia_anual: int,
+    plazo_años: int,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True
+) -> float:
     """
     Calcula el valor futuro combinando un valor presente inicial y aportes periódicos.
     
     Args:
         vp: Valor Presente inicial
-        aporte: Monto del aporte periódico
-        tea: Tasa Efectiva Anual (en decimal)
+        aporte: Monto del aporte periódico, o array con el aporte de cada periodo
+        tea: Tasa Efectiva Anual (en decimal), o trayectoria de TEA con una tasa por año
+             o por periodo (2-D: una trayectoria por fila)
         frecuencia_anual: Número de periodos por año
         plazo_años: Plazo en años
         aporte_al_inicio: True si el aporte es al inicio del periodo (anualidad anticipada),
                           False si es al final (anualidad vencida)
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+                                 (aporte × frecuencia_anual por año)
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año, False si sube cada periodo
     
     Returns:
-        Valor Futuro total
+        Valor Futuro total (array con un valor por trayectoria si tea es 2-D)
     """
     tasa_periodo = calcular_tasa_periodo(tea, frecuencia_anual)
     num_periodos = plazo_años * frecuencia_anual
     
+    if np.ndim(tea) > 0:
+        # Trayectoria de TEA: una por año o una por periodo, 2-D para varias trayectorias
+        tasas_periodo = calcular_tasa_periodo(expandir_tasas(tea, num_periodos, frecuencia_anual), frecuencia_anual)
+        aportes = generar_vector_aportes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, crecimiento_anual)
+        return calcular_vf_trayectorias(vp, aportes, tasas_periodo, aporte_al_inicio, capitalizacion_continua)
+    
     vf_presente = calcular_vf_valor_presente(vp, tea, plazo_años) if vp > 0 else 0
-    vf_aportes = calcular_vf_aportes_periodicos(aporte, tasa_periodo, num_periodos, aporte_al_inicio) if aporte > 0 else 0
+    
+    if np.ndim(aporte) > 0:
+        vf_aportes = calcular_vf_aportes_irregulares(
+            ajustar_aportes(aporte, num_periodos), tasa_periodo, aporte_al_inicio, capitalizacion_continua
+        )
+    elif aporte <= 0:
+        vf_aportes = 0
+    elif tasa_crecimiento != 0:
+        vf_aportes = calcular_vf_aportes_crecientes(
+            aporte, tasa_periodo, num_periodos, tasa_crecimiento, frecuencia_anual,
+            crecimiento_anual, aporte_al_inicio, capitalizacion_continua
+        )
+    elif capitalizacion_continua:
+        vf_aportes = calcular_vf_aportes_continuos(aporte * frecuencia_anual, tea, plazo_años)
+    else:
+        vf_aportes = calcular_vf_aportes_periodicos(aporte, tasa_periodo, num_periodos, aporte_al_inicio)
     
     return vf_presente + vf_aportes
 
 
+def calcular_deflactores(
+    inflacion: float,
+    num_periodos: int,
+    frecuencia_anual: int,
+    desfase_años: float = 0.0,
+    primer_periodo: int = 1
+) -> np.ndarray:
+    """
+    Calcula los factores para expresar montos de cada periodo en valores de hoy.
+    
+    El factor del periodo k es (1 + π)^-(desfase + k / frecuencia_anual). Se calcula
+    una sola vez por cronograma y se aplica a todas sus columnas.
+    
+    Args:
+        inflacion: Inflación anual (en decimal)
+        num_periodos: Número de periodos del cronograma
+        frecuencia_anual: Número de periodos por año
+        desfase_años: Años transcurridos antes del primer periodo (ej. el plazo de
+                      acumulación para un cronograma de retiros)
+        primer_periodo: Periodo de la primera fila (para ventanas de un cronograma)
+    
+    Returns:
+        Array de factores de longitud num_periodos
+    """
+    años = desfase_años + np.arange(primer_periodo, primer_periodo + num_periodos) / frecuencia_anual
+    return np.power(1 + inflacion, -años)
+
+
+def deflactar(monto: float, inflacion: float, años: float) -> float:
+    """
+    Expresa un monto futuro en valores de hoy.
+    
+    Args:
+        monto: Monto nominal
+        inflacion: Inflación anual (en decimal)
+        años: Años hasta que se recibe el monto
+    
+    Returns:
+        Monto real
+    """
+    return monto / (1 + inflacion) ** años
+
+
 def calcular_beneficio_bruto(vf: float, inversion_total: float) -> float:
     """
     Calcula el beneficio bruto (ganancia antes de impuestos).
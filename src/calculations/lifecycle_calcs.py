@@ -0,0 +1,290 @@
+import numpy as np
+from config.constants import IMPUESTO_RETIRO_MENSUAL
+from src.calculations.financial_calcs import (
+    calcular_tasa_periodo,
+    calcular_saldos_periodicos,
+    generar_vector_aportes,
+    calcular_deflactores
+)
+from src.calculations.tax_calcs import (
+    calcular_tasa_mensual_retiro,
+    calcular_impuesto_retiro_total,
+    calcular_monto_neto_retiro_total
+)
+from src.utils.profiling import perfilar
+
+
+def _saldos_retiro(vf: np.ndarray, tasa: np.ndarray, meses: np.ndarray, transcurridos: np.ndarray) -> np.ndarray:
+    """
+    Saldo tras j meses de retiros nivelados que agotan el VF en n meses.
+    
+    B_j = VF × [(1 + r)^n - (1 + r)^j] / [(1 + r)^n - 1], o VF × (1 - j/n) si r = 0.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor_n = np.power(1 + tasa, meses)
+        saldo = vf * (factor_n - np.power(1 + tasa, transcurridos)) / (factor_n - 1)
+    return np.where(tasa == 0, vf * (1 - transcurridos / meses), saldo)
+
+
+def calcular_retiro_nivelado(vf, tasa_retiro, meses) -> dict:
+    """
+    Calcula el retiro mensual constante que agota el VF y su impuesto sobre intereses.
+    
+    Equivale a calcular_retiro_mensual_con_impuestos sin simular mes a mes: los
+    intereses de todo el retiro suman n × C - VF, y el impuesto es el 5% de ellos.
+    
+    Args:
+        vf: Valor Futuro (float o array)
+        tasa_retiro: Tasa mensual de retiro (float o array)
+        meses: Número de meses de retiro (int o array)
+    
+    Returns:
+        Diccionario con 'retiro_mensual_bruto', 'retiro_mensual_neto', 'impuesto_retiro'
+        y 'total_retirado' (arrays con la forma de los argumentos combinados)
+    """
+    vf, tasa_retiro, meses = np.broadcast_arrays(
+        np.asarray(vf, dtype=float), np.asarray(tasa_retiro, dtype=float), np.asarray(meses, dtype=float)
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        retiro_bruto = np.where(
+            tasa_retiro == 0,
+            vf / meses,
+            vf * tasa_retiro / (1 - np.power(1 + tasa_retiro, -meses))
+        )
+    impuesto_retiro = IMPUESTO_RETIRO_MENSUAL * (retiro_bruto * meses - vf)
+    
+    return {
+        'retiro_mensual_bruto': retiro_bruto,
+        'retiro_mensual_neto': retiro_bruto - impuesto_retiro / meses,
+        'impuesto_retiro': impuesto_retiro,
+        'total_retirado': retiro_bruto * meses - impuesto_retiro
+    }
+
+
+@perfilar
+def calcular_ciclo_vida(
+    vp: float,
+    aporte,
+    tea,
+    frecuencia_anual: int,
+    plazo_años,
+    meses_retiro,
+    edad_actual: int,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True,
+    inflacion: float = 0.0
+) -> dict:
+    """
+    Calcula el saldo mes a mes desde la edad actual hasta el último retiro.
+    
+    La acumulación usa la frecuencia de aportes y se lee al cierre de cada mes; la
+    fase de retiro usa un retiro mensual bruto constante que agota el VF con la
+    tasa mensual de retiro (50% de la TEA) y un impuesto del 5% sobre los intereses.
+    TEA, plazo y meses de retiro pueden ser arrays (un valor por escenario): todos
+    los escenarios se calculan juntos y los caminos más cortos se completan con NaN.
+    
+    Args:
+        vp: Valor Presente inicial
+        aporte: Aporte periódico (float) o array de aportes por periodo (común a los escenarios)
+        tea: Tasa Efectiva Anual (en decimal), o array con una TEA por escenario
+        frecuencia_anual: Número de periodos de aporte por año
+        plazo_años: Años de acumulación, o array con uno por escenario
+        meses_retiro: Meses de retiro, o array con uno por escenario
+        edad_actual: Edad al inicio del plan
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año
+        inflacion: Inflación anual (en decimal); si es mayor a 0 se agrega 'saldo_real'
+    
+    Returns:
+        Diccionario con:
+        - 'mes' y 'edad': ejes del camino (meses desde hoy y edad correspondiente)
+        - 'saldo', 'aportado', 'retiro_bruto', 'impuesto', 'retiro_neto' (y 'saldo_real'):
+          arrays (escenarios, meses + 1) completados con NaN
+        - 'deflactor' (si hay inflación): (1 + inflación)^(-mes / 12) para cada mes
+        - 'total_aportes_real' (si hay inflación): aportes en valores de hoy, uno por escenario
+        - 'meses_acumulacion', 'meses_retiro', 'vf', 'total_aportes', 'tasa_retiro',
+          'retiro_mensual_bruto', 'retiro_mensual_neto', 'impuesto_retiro',
+          'total_retirado': un valor por escenario
+    """
+    tea, plazo_años, meses_retiro = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(tea, dtype=float)),
+        np.atleast_1d(np.asarray(plazo_años, dtype=int)),
+        np.atleast_1d(np.asarray(meses_retiro, dtype=int))
+    )
+    num_escenarios = len(tea)
+    
+    # Acumulación: una fila por escenario, periodos fuera del plazo sin aportes
+    num_periodos = plazo_años * frecuencia_anual
+    max_periodos = int(num_periodos.max())
+    indice_periodo = np.arange(max_periodos)
+    en_plazo = indice_periodo < num_periodos[:, None]
+    
+    aportes = generar_vector_aportes(aporte, max_periodos, tasa_crecimiento, frecuencia_anual, crecimiento_anual)
+    aportes = np.where(en_plazo, aportes, 0.0)
+    tasas_periodo = np.broadcast_to(calcular_tasa_periodo(tea, frecuencia_anual)[:, None], aportes.shape)
+    
+    saldos = calcular_saldos_periodicos(
+        vp, aportes, tasas_periodo, max_periodos, aporte_al_inicio, capitalizacion_continua
+    )
+    saldo_periodo = np.concatenate([np.full((num_escenarios, 1), float(vp)), saldos['saldo_final']], axis=1)
+    aportado_periodo = vp + np.concatenate([np.zeros((num_escenarios, 1)), np.cumsum(aportes, axis=1)], axis=1)
+    
+    filas = np.arange(num_escenarios)
+    vf = saldo_periodo[filas, num_periodos]
+    total_aportes = aportado_periodo[filas, num_periodos] - vp
+    
+    # Retiro nivelado y totales
+    tasa_retiro = calcular_tasa_mensual_retiro(tea)
+    retiros = calcular_retiro_nivelado(vf, tasa_retiro, meses_retiro)
+    retiro_bruto = retiros['retiro_mensual_bruto']
+    
+    # Camino mensual completo
+    meses_acumulacion = plazo_años * 12
+    meses_totales = meses_acumulacion + meses_retiro
+    mes = np.arange(int(meses_totales.max()) + 1)
+    m = mes[None, :]
+    
+    # Durante la acumulación: saldo del último periodo cerrado, capitalizado hasta fin de mes
+    cerrados = np.minimum(np.floor(mes * frecuencia_anual / 12 + 1e-9).astype(int), max_periodos)
+    fraccion_año = mes / 12 - cerrados / frecuencia_anual
+    saldo_acumulacion = saldo_periodo[:, cerrados] * np.power(1 + tea[:, None], fraccion_año)
+    
+    # Durante el retiro: saldo tras j meses de retiros
+    transcurridos = np.clip(m - meses_acumulacion[:, None], 0, None)
+    saldo_retiro = _saldos_retiro(vf[:, None], tasa_retiro[:, None], meses_retiro[:, None], transcurridos)
+    
+    en_acumulacion = m <= meses_acumulacion[:, None]
+    en_retiro = (m > meses_acumulacion[:, None]) & (m <= meses_totales[:, None])
+    fuera = ~(en_acumulacion | en_retiro)
+    
+    saldo = np.where(en_acumulacion, saldo_acumulacion, saldo_retiro)
+    saldo = np.where(np.isclose(saldo, 0, atol=1e-6), 0.0, saldo)
+    saldo[fuera] = np.nan
+    
+    aportado = np.where(en_acumulacion, aportado_periodo[:, cerrados], (vp + total_aportes)[:, None])
+    aportado[fuera] = np.nan
+    
+    saldo_previo = _saldos_retiro(vf[:, None], tasa_retiro[:, None], meses_retiro[:, None], np.clip(transcurridos - 1, 0, None))
+    impuesto = np.where(en_retiro, IMPUESTO_RETIRO_MENSUAL * saldo_previo * tasa_retiro[:, None], 0.0)
+    retiro = np.where(en_retiro, retiro_bruto[:, None], 0.0)
+    impuesto[fuera] = np.nan
+    retiro[fuera] = np.nan
+    
+    ciclo = {
+        'mes': mes,
+        'edad': edad_actual + mes / 12,
+        'saldo': saldo,
+        'aportado': aportado,
+        'retiro_bruto': retiro,
+        'impuesto': impuesto,
+        'retiro_neto': retiro - impuesto,
+        'meses_acumulacion': meses_acumulacion,
+        'meses_retiro': meses_retiro,
+        'vf': vf,
+        'total_aportes': total_aportes,
+        'tasa_retiro': tasa_retiro,
+        **retiros
+    }
+    
+    if inflacion > 0:
+        ciclo['deflactor'] = np.power(1 + inflacion, -mes / 12)
+        ciclo['saldo_real'] = saldo * ciclo['deflactor']
+        ciclo['total_aportes_real'] = aportes @ calcular_deflactores(inflacion, max_periodos, frecuencia_anual)
+    
+    return ciclo
+
+
+def resumir_retiro_ciclo(ciclo: dict, indice: int = 0) -> dict:
+    """
+    Extrae los resultados de retiro de un escenario con el formato de calcular_retiro_mensual_con_impuestos.
+    
+    Args:
+        ciclo: Resultado de calcular_ciclo_vida
+        indice: Escenario a extraer
+    
+    Returns:
+        Diccionario con impuesto, capital_neto, retiro_mensual, retiro_mensual_bruto,
+        retiro_mensual_neto y total_retirado
+    """
+    return {
+        'impuesto': float(ciclo['impuesto_retiro'][indice]),
+        'capital_neto': float(ciclo['vf'][indice]),
+        'retiro_mensual': float(ciclo['retiro_mensual_neto'][indice]),
+        'retiro_mensual_bruto': float(ciclo['retiro_mensual_bruto'][indice]),
+        'retiro_mensual_neto': float(ciclo['retiro_mensual_neto'][indice]),
+        'total_retirado': float(ciclo['total_retirado'][indice])
+    }
+
+
+@perfilar
+def calcular_barrido_edades(
+    vp: float,
+    aporte,
+    tea: float,
+    frecuencia_anual: int,
+    edad_actual: int,
+    tipo_bolsa: str,
+    meses_retiro: int = 240,
+    edad_maxima: int = 100,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True
+) -> dict:
+    """
+    Calcula el retiro total neto y el retiro mensual neto para cada edad de jubilación posible.
+    
+    Se calcula un solo cronograma de acumulación hasta la edad máxima y se toma el
+    saldo al cierre de cada año: el saldo acumulado hasta una edad es el VF de
+    jubilarse a esa edad, así que todas las edades se resuelven en una pasada.
+    
+    Args:
+        vp: Valor Presente inicial
+        aporte: Aporte periódico (float) o array de aportes por periodo
+        tea: Tasa Efectiva Anual (en decimal)
+        frecuencia_anual: Número de periodos de aporte por año
+        edad_actual: Edad al inicio del plan
+        tipo_bolsa: "Nacional" o "Extranjera" (impuesto del retiro total)
+        meses_retiro: Meses de retiro para el retiro mensual
+        edad_maxima: Última edad de jubilación a evaluar
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año
+    
+    Returns:
+        Diccionario de arrays con un valor por edad: 'edad', 'plazo_años', 'vf',
+        'inversion_total', 'monto_neto_total', 'retiro_mensual_bruto',
+        'retiro_mensual_neto' y 'total_retirado'
+    """
+    plazo_maximo = edad_maxima - edad_actual
+    num_periodos = plazo_maximo * frecuencia_anual
+    
+    aportes = generar_vector_aportes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, crecimiento_anual)
+    saldos = calcular_saldos_periodicos(
+        vp, aportes, calcular_tasa_periodo(tea, frecuencia_anual), num_periodos,
+        aporte_al_inicio, capitalizacion_continua
+    )
+    
+    # Cierre de cada año: periodos f, 2f, ..., plazo_maximo × f
+    cierres = np.arange(1, plazo_maximo + 1) * frecuencia_anual - 1
+    vf = saldos['saldo_final'][cierres]
+    inversion_total = vp + np.cumsum(aportes)[cierres]
+    
+    impuesto_total = calcular_impuesto_retiro_total(vf - inversion_total, tipo_bolsa)
+    retiros = calcular_retiro_nivelado(vf, calcular_tasa_mensual_retiro(tea), meses_retiro)
+    
+    return {
+        'edad': edad_actual + np.arange(1, plazo_maximo + 1),
+        'plazo_años': np.arange(1, plazo_maximo + 1),
+        'vf': vf,
+        'inversion_total': inversion_total,
+        'monto_neto_total': calcular_monto_neto_retiro_total(vf, impuesto_total),
+        'retiro_mensual_bruto': retiros['retiro_mensual_bruto'],
+        'retiro_mensual_neto': retiros['retiro_mensual_neto'],
+        'total_retirado': retiros['total_retirado']
+    }
@@ -1,4 +1,7 @@
-from config.constants import IMPUESTO_BOLSA_NACIONAL, IMPUESTO_BOLSA_EXTRANJERA
+import numpy as np
+from config.constants import IMPUESTO_BOLSA_NACIONAL, IMPUESTO_BOLSA_EXTRANJERA, IMPUESTO_RETIRO_MENSUAL
+from src.calculations.factor_tables import factor_anualidad_vp
+from src.utils.profiling import perfilar
 
 
 def calcular_impuesto_retiro_total(beneficio_bruto: float, tipo_bolsa: str) -> float:
@@ -6,16 +9,19 @@ def calcular_impuesto_retiro_total(beneficio_bruto: float, tipo_bolsa: str) -> f
     Calcula el impuesto sobre el beneficio bruto en un retiro total.
     
     Args:
-        beneficio_bruto: Ganancia antes de impuestos (VF - Inversión Total)
+        beneficio_bruto: Ganancia antes de impuestos (VF - Inversión Total), o array de ganancias
         tipo_bolsa: "Nacional" o "Extranjera"
     
     Returns:
-        Monto de impuesto a pagar
+        Monto de impuesto a pagar (array si beneficio_bruto es un array)
     """
+    tasa_impuesto = IMPUESTO_BOLSA_NACIONAL if tipo_bolsa == "Nacional" else IMPUESTO_BOLSA_EXTRANJERA
+    if np.ndim(beneficio_bruto) > 0:
+        return np.maximum(np.asarray(beneficio_bruto, dtype=float), 0.0) * tasa_impuesto
+    
     if beneficio_bruto <= 0:
         return 0
     
-    tasa_impuesto = IMPUESTO_BOLSA_NACIONAL if tipo_bolsa == "Nacional" else IMPUESTO_BOLSA_EXTRANJERA
     return beneficio_bruto * tasa_impuesto
 
 
@@ -63,10 +69,11 @@ def calcular_retiro_mensual(vf: float, tasa_mensual_retiro: float, meses: int) -
         return vf / meses if meses > 0 else 0
     
     # Fórmula de anualidad: VP = C * [(1 - (1 + i)^-n) / i]
-    # Despejando C: C = VP * [i / (1 - (1 + i)^-n)]
-    return vf * (tasa_mensual_retiro / (1 - (1 + tasa_mensual_retiro) ** -meses))
+    # Despejando C: C = VP / [(1 - (1 + i)^-n) / i], con el factor de la tabla precalculada
+    return vf / factor_anualidad_vp(tasa_mensual_retiro, meses)
 
 
+@perfilar
 def calcular_retiro_mensual_con_impuestos(
     vf: float,
     beneficio_bruto: float,
@@ -93,9 +100,6 @@ def calcular_retiro_mensual_con_impuestos(
     Returns:
         Diccionario con cálculos detallados de retiro mensual
     """
-    # Impuesto fijo del 5% para retiros mensuales
-    IMPUESTO_RETIRO_MENSUAL = 0.05
-    
     # Simular retiros mes a mes para calcular impuestos sobre intereses
     saldo = vf
     total_retiro_bruto = 0
@@ -107,7 +111,7 @@ def calcular_retiro_mensual_con_impuestos(
         retiro_mensual_bruto = vf / meses if meses > 0 else 0
     else:
         # Fórmula de anualidad: C = VP * [i / (1 - (1 + i)^-n)]
-        retiro_mensual_bruto = vf * (tasa_mensual_retiro / (1 - (1 + tasa_mensual_retiro) ** -meses))
+        retiro_mensual_bruto = vf / factor_anualidad_vp(tasa_mensual_retiro, meses)
     
     # Simular cada mes para calcular intereses e impuestos
     for mes in range(meses):
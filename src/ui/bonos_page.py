@@ -1,13 +1,40 @@
 import streamlit as st
-from config.constants import FRECUENCIAS_BONOS, MONEDA
-from src.calculations.bond_calcs import calcular_valor_presente_bono
+import numpy as np
+from datetime import date, timedelta
+import pandas as pd
+from config.constants import (
+    FRECUENCIAS_BONOS,
+    MONEDA,
+    TIPOS_BONO,
+    VOLATILIDAD_TASA_DEFECTO,
+    MODELOS_TASA,
+    MC_TRAYECTORIAS,
+    MC_REVERSION,
+    MC_VOLATILIDAD,
+    CURVA_REFERENCIA_DEFECTO,
+    CONVENCIONES_DIAS
+)
+from src.calculations.bond_calcs import calcular_valor_presente_bono, calcular_z_spread_bono, calcular_z_spread_cartera
+from src.calculations.bond_sensitivity import calcular_sensibilidad_bono
+from src.calculations.bond_options import calcular_bono_con_opciones, calcular_oas
+from src.calculations.bond_simulation import simular_precios_bono
+from src.calculations.curve_bootstrap import obtener_curva_csv
+from src.calculations.bond_dates import valorar_bono_en_fecha
 from src.visualization.bond_charts import (
     crear_grafico_flujos_bono,
     crear_grafico_valor_presente,
     crear_tabla_flujos,
-    crear_grafico_composicion_bono
+    crear_grafico_composicion_bono,
+    crear_grafico_precio_rendimiento,
+    crear_tabla_choques,
+    crear_grafico_distribucion_precios,
+    crear_grafico_trayectorias_tasas,
+    crear_grafico_curva_cero
 )
 from src.utils.pdf_generator import crear_pdf_bonos
+from src.ui.display import mostrar_descarga_pdf, configurar_columnas_numericas, mostrar_descargas
+from src.utils.tables import declarar_formatos
+from src.utils.helpers import cargar_cartera_bonos_csv
 
 
 def render_bonos_page():
@@ -17,7 +44,8 @@ def render_bonos_page():
     st.title("📊 Calculadora de Bonos")
     st.markdown("""
     Calcula el valor presente de un bono considerando sus flujos de caja periódicos, 
-    tasa cupón y tasa de retorno esperada.
+    tasa cupón y tasa de retorno esperada. Soporta bonos bullet, cupón cero,
+    amortizables y con fondo de amortización.
     """)
     
     st.divider()
@@ -30,6 +58,14 @@ def render_bonos_page():
     with col1:
         st.subheader("Características del Bono")
         
+        tipo_bono_etiqueta = st.selectbox(
+            "Tipo de Bono",
+            options=list(TIPOS_BONO.keys()),
+            help="Bullet: principal al vencimiento | Cupón cero: sin cupones | "
+                 "Amortizable: principal en cuotas iguales | Fondo de amortización: cuotas iguales tras un periodo de gracia"
+        )
+        tipo_bono = TIPOS_BONO[tipo_bono_etiqueta]
+        
         valor_nominal = st.number_input(
             f"Valor Nominal ({MONEDA})",
             min_value=100.0,
@@ -46,6 +82,7 @@ def render_bonos_page():
             value=5.0,
             step=0.5,
             format="%.2f",
+            disabled=tipo_bono == "cupon_cero",
             help="Tasa de interés anual que paga el bono"
         )
         
@@ -78,8 +115,171 @@ def render_bonos_page():
             help="Tasa de descuento para calcular el valor presente"
         )
         
+        años_gracia = 0
+        if tipo_bono == "fondo_amortizacion":
+            años_gracia = st.number_input(
+                "Años de gracia",
+                min_value=0,
+                max_value=plazo_años - 1,
+                value=min(plazo_años // 2, plazo_años - 1),
+                step=1,
+                help="Años en que solo se pagan cupones antes de empezar a amortizar el principal"
+            )
+        
         st.info(f"💡 Frecuencia seleccionada: **{FRECUENCIAS_BONOS[frecuencia_pago]} pagos/año**")
     
+    with st.expander("🎯 Opciones Embebidas (call / put)"):
+        st.markdown("Precios en % del saldo de principal vigente; cada opción se puede ejercer en cada fecha de pago desde el año indicado.")
+        
+        col_call, col_put = st.columns(2)
+        
+        with col_call:
+            con_call = st.checkbox("Rescatable por el emisor (call)", value=False)
+            año_call = st.number_input(
+                "Rescatable desde el año",
+                min_value=1,
+                max_value=max(plazo_años - 1, 1),
+                value=min(5, max(plazo_años - 1, 1)),
+                step=1,
+                disabled=not con_call
+            )
+            precio_call_pct = st.number_input(
+                "Precio de rescate (%)",
+                min_value=50.0,
+                max_value=150.0,
+                value=100.0,
+                step=0.5,
+                format="%.2f",
+                disabled=not con_call
+            )
+        
+        with col_put:
+            con_put = st.checkbox("Vendible por el tenedor (put)", value=False)
+            año_put = st.number_input(
+                "Vendible desde el año",
+                min_value=1,
+                max_value=max(plazo_años - 1, 1),
+                value=min(5, max(plazo_años - 1, 1)),
+                step=1,
+                disabled=not con_put
+            )
+            precio_put_pct = st.number_input(
+                "Precio de venta (%)",
+                min_value=50.0,
+                max_value=150.0,
+                value=100.0,
+                step=0.5,
+                format="%.2f",
+                disabled=not con_put
+            )
+        
+        volatilidad_pct = st.number_input(
+            "Volatilidad de la tasa corta (% anual)",
+            min_value=0.0,
+            max_value=10.0,
+            value=VOLATILIDAD_TASA_DEFECTO * 100,
+            step=0.25,
+            format="%.2f",
+            help="Volatilidad absoluta del árbol Ho-Lee (ej: 1% = la tasa sube o baja ~1 punto por año)"
+        )
+    
+    with st.expander("🎲 Simulación de Tasas (Monte Carlo)"):
+        st.markdown("La tasa corta parte de la tasa de descuento y revierte a ese nivel; cada trayectoria da un precio del bono.")
+        
+        col_mc1, col_mc2 = st.columns(2)
+        
+        with col_mc1:
+            modelo_tasa_etiqueta = st.selectbox(
+                "Modelo de tasa corta",
+                options=list(MODELOS_TASA.keys()),
+                help="Vasicek: la tasa puede volverse negativa | CIR: la volatilidad escala con √tasa y la tasa no baja de 0"
+            )
+            modelo_tasa = MODELOS_TASA[modelo_tasa_etiqueta]
+            
+            num_trayectorias = st.number_input(
+                "Número de trayectorias",
+                min_value=1000,
+                max_value=100000,
+                value=MC_TRAYECTORIAS,
+                step=1000,
+                help="Se simulan en pares antitéticos y por bloques"
+            )
+        
+        with col_mc2:
+            reversion = st.number_input(
+                "Velocidad de reversión (κ)",
+                min_value=0.0,
+                max_value=2.0,
+                value=MC_REVERSION,
+                step=0.05,
+                format="%.2f",
+                help="Qué tan rápido vuelve la tasa a su nivel de largo plazo"
+            )
+            
+            volatilidad_mc_pct = st.number_input(
+                "Volatilidad del modelo (σ, %)",
+                min_value=0.0,
+                max_value=50.0,
+                value=MC_VOLATILIDAD[modelo_tasa] * 100,
+                step=0.25,
+                format="%.2f",
+                help="Vasicek: puntos de tasa por año (1% ≈ 100 pb) | CIR: se multiplica por √tasa"
+            )
+    
+    with st.expander("📅 Fecha de Liquidación (precio limpio / sucio)"):
+        st.markdown("Valora el bono entre fechas de cupón: las fechas de pago se cuentan desde la emisión.")
+        
+        valorar_en_fecha = st.checkbox("Valorar a una fecha de liquidación", value=False)
+        
+        col_emision, col_liquidacion, col_convencion = st.columns(3)
+        
+        with col_emision:
+            fecha_emision = st.date_input(
+                "Fecha de emisión",
+                value=date.today() - timedelta(days=100),
+                disabled=not valorar_en_fecha
+            )
+        
+        with col_liquidacion:
+            fecha_liquidacion = st.date_input(
+                "Fecha de liquidación",
+                value=date.today(),
+                disabled=not valorar_en_fecha
+            )
+        
+        with col_convencion:
+            convencion_etiqueta = st.selectbox(
+                "Conteo de días",
+                options=list(CONVENCIONES_DIAS.keys()),
+                disabled=not valorar_en_fecha,
+                help="ACT/ACT: días reales del periodo de cupón | 30/360: meses de 30 días | ACT/365: días reales / 365"
+            )
+    
+    with st.expander("📐 Curva Cero y Spreads (Z-spread / OAS)"):
+        st.markdown("Curva cero de referencia (TEA por plazo). Con un precio de mercado se calcula el spread que lo reproduce.")
+        
+        col_curva, col_precio = st.columns(2)
+        
+        with col_curva:
+            curva = render_curva_referencia()
+        
+        with col_precio:
+            usar_curva = st.checkbox(
+                "Valorar el bono con la curva",
+                value=False,
+                disabled=curva is None,
+                help="Descuenta cada flujo con la tasa cero de su plazo en lugar de la TEA de descuento"
+            ) and curva is not None
+            
+            precio_mercado = st.number_input(
+                f"Precio de mercado ({MONEDA})",
+                min_value=0.0,
+                value=0.0,
+                step=10.0,
+                format="%.2f",
+                help="0 = sin precio de mercado (no se calculan spreads)"
+            )
+    
     st.divider()
     
     # Botón de cálculo
@@ -96,7 +296,10 @@ def render_bonos_page():
             tasa_cupon_anual=tasa_cupon_anual,
             frecuencia_anual=frecuencia_anual,
             años=plazo_años,
-            tea_descuento=tea_descuento
+            tea_descuento=tea_descuento,
+            tipo_bono=tipo_bono,
+            años_gracia=años_gracia,
+            curva=curva if usar_curva else None
         )
         
         st.divider()
@@ -117,9 +320,9 @@ def render_bonos_page():
         
         with col2:
             st.metric(
-                label="Cupón Periódico",
+                label="Cupón Periódico" if tipo_bono == "bullet" else "Primer Cupón",
                 value=f"{MONEDA} {resultado['cupon_periodico']:,.2f}",
-                help="Monto de cada pago de cupón"
+                help="Monto del cupón; en bonos que amortizan baja junto con el saldo"
             )
         
         with col3:
@@ -130,13 +333,143 @@ def render_bonos_page():
             )
         
         with col4:
-            total_cupones = resultado['cupon_periodico'] * resultado['num_periodos']
             st.metric(
                 label="Total en Cupones",
-                value=f"{MONEDA} {total_cupones:,.2f}",
+                value=f"{MONEDA} {resultado['total_cupones']:,.2f}",
                 help="Suma de todos los cupones"
             )
         
+        # Valoración ajustada por opciones en el árbol Ho-Lee
+        if (con_call or con_put) and plazo_años > 1:
+            resultado['opciones'] = calcular_bono_con_opciones(
+                resultado['calendario'],
+                tea_descuento,
+                frecuencia_anual,
+                tramos_call=[(año_call, precio_call_pct)] if con_call else None,
+                tramos_put=[(año_put, precio_put_pct)] if con_put else None,
+                volatilidad=volatilidad_pct / 100,
+                curva=curva if usar_curva else None
+            )
+            
+            st.subheader("🎯 Valor Ajustado por Opciones")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric(
+                    label="Precio sin Opciones",
+                    value=f"{MONEDA} {resultado['valor_presente_total']:,.2f}",
+                    help="Valor presente de los flujos del bono (sin call ni put)"
+                )
+            
+            with col2:
+                st.metric(
+                    label="Precio con Opciones",
+                    value=f"{MONEDA} {resultado['opciones']['precio_con_opciones']:,.2f}",
+                    delta=f"{-resultado['opciones']['valor_opciones']:,.2f}",
+                    help="Precio en el árbol de tasas considerando el ejercicio óptimo de las opciones"
+                )
+            
+            with col3:
+                st.metric(
+                    label="Valor de las Opciones",
+                    value=f"{MONEDA} {resultado['opciones']['valor_opciones']:,.2f}",
+                    help="Positivo: el call del emisor resta valor | Negativo: el put del tenedor suma valor"
+                )
+        
+        # Precio limpio y sucio a la fecha de liquidación
+        if valorar_en_fecha:
+            try:
+                resultado['liquidacion'] = valorar_bono_en_fecha(
+                    valor_nominal,
+                    tasa_cupon_anual,
+                    frecuencia_anual,
+                    plazo_años,
+                    tea_descuento,
+                    fecha_emision,
+                    fecha_liquidacion,
+                    convencion=CONVENCIONES_DIAS[convencion_etiqueta],
+                    tipo_bono=tipo_bono,
+                    años_gracia=años_gracia,
+                    curva=curva if usar_curva else None
+                )
+                resultado['liquidacion']['convencion'] = convencion_etiqueta
+            except ValueError as error:
+                st.error(f"⚠️ {error}")
+        
+        if resultado.get('liquidacion'):
+            liquidacion = resultado['liquidacion']
+            
+            st.subheader(f"📅 Precio al {fecha_liquidacion.strftime('%d/%m/%Y')} ({convencion_etiqueta})")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric(
+                    label="Precio Sucio",
+                    value=f"{MONEDA} {liquidacion['precio_sucio']:,.2f}",
+                    help="Valor presente de los pagos pendientes a la fecha de liquidación (lo que paga el comprador)"
+                )
+            
+            with col2:
+                st.metric(
+                    label="Cupón Corrido",
+                    value=f"{MONEDA} {liquidacion['cupon_corrido']:,.2f}",
+                    help=f"{liquidacion['dias_devengados']} días devengados del cupón en curso"
+                )
+            
+            with col3:
+                st.metric(
+                    label="Precio Limpio",
+                    value=f"{MONEDA} {liquidacion['precio_limpio']:,.2f}",
+                    help="Precio sucio - cupón corrido (precio de cotización)"
+                )
+            
+            st.caption(
+                f"Cupón anterior: {liquidacion['fecha_cupon_anterior']} | "
+                f"Próximo cupón: {liquidacion['fecha_cupon_siguiente']} | "
+                f"Pagos pendientes: {liquidacion['pagos_pendientes']}"
+            )
+        
+        # Spreads contra la curva de referencia
+        if precio_mercado > 0 and curva is not None:
+            z_spread = calcular_z_spread_bono(resultado['calendario'], frecuencia_anual, precio_mercado, curva)
+            oas = calcular_oas(
+                resultado['calendario'],
+                tea_descuento,
+                frecuencia_anual,
+                precio_mercado,
+                tramos_call=[(año_call, precio_call_pct)] if con_call and plazo_años > 1 else None,
+                tramos_put=[(año_put, precio_put_pct)] if con_put and plazo_años > 1 else None,
+                volatilidad=volatilidad_pct / 100,
+                curva=curva
+            )
+            resultado['spreads'] = {'precio_mercado': precio_mercado, 'z_spread': z_spread, 'oas': oas['oas']}
+            
+            st.subheader("📐 Spreads contra la Curva")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric(
+                    label="Precio de Mercado",
+                    value=f"{MONEDA} {precio_mercado:,.2f}"
+                )
+            
+            with col2:
+                st.metric(
+                    label="Z-spread",
+                    value="No converge" if np.isnan(z_spread) else f"{z_spread * 10000:,.1f} pb",
+                    help="Spread continuo sobre toda la curva cero que iguala el VP de los flujos al precio de mercado"
+                )
+            
+            with col3:
+                st.metric(
+                    label="OAS",
+                    value="No converge" if np.isnan(oas['oas']) else f"{oas['oas'] * 10000:,.1f} pb",
+                    help="Spread sobre el árbol de tasas calibrado a la curva, descontando el valor de las opciones (sin opciones = Z-spread)"
+                )
+        
         st.divider()
         
         # Información adicional
@@ -148,6 +481,7 @@ def render_bonos_page():
             - **Tasa Cupón por periodo**: {resultado['tasa_cupon_periodo']*100:.4f}%
             - **Tasa Descuento por periodo**: {resultado['tasa_descuento_periodo']*100:.4f}%
             - **Frecuencia**: {frecuencia_pago} ({frecuencia_anual} veces/año)
+            - **Tipo de bono**: {tipo_bono_etiqueta}
             """)
         
         with col2:
@@ -181,7 +515,7 @@ def render_bonos_page():
         # Gráficos
         st.header("📈 Visualización de Flujos")
         
-        tab1, tab2, tab3 = st.tabs(["📊 Flujos de Caja", "💵 Comparativa VP", "🥧 Composición"])
+        tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Flujos de Caja", "💵 Comparativa VP", "🥧 Composición", "📉 Sensibilidad", "🎲 Monte Carlo"])
         
         with tab1:
             st.subheader("Flujos de Caja Periódicos")
@@ -189,7 +523,7 @@ def render_bonos_page():
             st.plotly_chart(fig_flujos, use_container_width=True)
             
             st.info("""
-            💡 **Nota**: El último flujo (en rojo) incluye el cupón final más el valor nominal del bono.
+            💡 **Nota**: La parte en rojo de cada barra es principal devuelto; la parte verde es cupón.
             """)
         
         with tab2:
@@ -202,19 +536,92 @@ def render_bonos_page():
             """)
         
         with tab3:
-            # Calcular VP de cupones sin el principal
-            vp_cupones = sum([f['vp_flujo'] for f in resultado['flujos'][:-1]])
-            vp_ultimo = resultado['flujos'][-1]['vp_flujo']
-            vp_principal_estimado = vp_ultimo - (resultado['cupon_periodico'] / ((1 + resultado['tasa_descuento_periodo']) ** resultado['num_periodos']))
-            
             st.subheader("Composición del Valor Presente")
             fig_comp = crear_grafico_composicion_bono(
-                vp_cupones + (resultado['cupon_periodico'] / ((1 + resultado['tasa_descuento_periodo']) ** resultado['num_periodos'])),
-                vp_principal_estimado,
+                resultado['vp_cupones'],
+                resultado['vp_principal'],
                 MONEDA
             )
             st.plotly_chart(fig_comp, use_container_width=True)
         
+        with tab4:
+            st.subheader("Sensibilidad del Precio a la Tasa de Descuento")
+            sensibilidad = calcular_sensibilidad_bono(resultado['calendario'], tea_descuento, frecuencia_anual)
+            
+            if usar_curva:
+                st.caption(
+                    f"Los choques se aplican a la TEA plana de {tea_descuento * 100:.2f}% "
+                    f"(precio base {MONEDA} {sensibilidad['precio_base']:,.2f}), no a la curva cero "
+                    f"con la que se valoró el bono arriba ({MONEDA} {resultado['valor_presente_total']:,.2f})."
+                )
+            
+            st.dataframe(crear_tabla_choques(sensibilidad, MONEDA), use_container_width=True, hide_index=True)
+            
+            fig_sensibilidad = crear_grafico_precio_rendimiento(sensibilidad, tea_descuento, MONEDA)
+            st.plotly_chart(fig_sensibilidad, use_container_width=True)
+            
+            st.info("""
+            💡 **Nota**: El precio baja cuando sube la tasa, y la curva es convexa: una baja de tasa
+            sube el precio más de lo que lo baja una subida del mismo tamaño.
+            """)
+        
+        with tab5:
+            st.subheader(f"Precio bajo Incertidumbre de Tasas ({modelo_tasa_etiqueta})")
+            simulacion = simular_precios_bono(
+                resultado['calendario'],
+                tea_descuento,
+                frecuencia_anual,
+                modelo=modelo_tasa,
+                num_trayectorias=int(num_trayectorias),
+                reversion=reversion,
+                volatilidad=volatilidad_mc_pct / 100,
+                semilla=0
+            )
+            resumen_mc = simulacion['resumen']
+            # La tasa corta parte de la TEA plana: se compara con el precio a esa tasa, no con el de la curva
+            precio_tasa_fija = sensibilidad['precio_base']
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric(
+                    label="Precio Esperado",
+                    value=f"{MONEDA} {simulacion['precio_esperado']:,.2f}",
+                    delta=f"{simulacion['precio_esperado'] - precio_tasa_fija:+,.2f}",
+                    help="Promedio del precio sobre todas las trayectorias (vs. precio a tasa fija)"
+                )
+            
+            with col2:
+                st.metric(
+                    label="Error Estándar",
+                    value=f"{MONEDA} {simulacion['error_estandar']:,.4f}",
+                    help="Precisión del precio esperado (pares antitéticos)"
+                )
+            
+            with col3:
+                st.metric(
+                    label="Rango P5 – P95",
+                    value=f"{MONEDA} {resumen_mc['p5']:,.0f} – {resumen_mc['p95']:,.0f}",
+                    help="El 90% de las trayectorias da un precio dentro de este rango"
+                )
+            
+            fig_distribucion = crear_grafico_distribucion_precios(simulacion, precio_tasa_fija, MONEDA)
+            st.plotly_chart(fig_distribucion, use_container_width=True)
+            
+            if usar_curva:
+                st.caption(
+                    f"Las trayectorias parten de la TEA plana de {tea_descuento * 100:.2f}%: el precio esperado se "
+                    f"compara con el precio a tasa fija ({MONEDA} {precio_tasa_fija:,.2f}), no con el de la curva cero."
+                )
+            
+            fig_tasas = crear_grafico_trayectorias_tasas(simulacion)
+            st.plotly_chart(fig_tasas, use_container_width=True)
+            
+            st.info("""
+            💡 **Nota**: El precio esperado suele quedar algo por encima del precio a tasa fija:
+            por la convexidad, las bajas de tasa suben el precio más de lo que lo bajan las subidas.
+            """)
+        
         st.divider()
         
         # Tabla detallada de flujos
@@ -225,6 +632,7 @@ def render_bonos_page():
         # Mostrar tabla con opciones de paginación
         st.dataframe(
             df_flujos,
+            column_config=configurar_columnas_numericas(declarar_formatos(df_flujos)),
             use_container_width=True,
             hide_index=True,
             height=min(400, 35 * len(df_flujos) + 38)
@@ -263,19 +671,24 @@ def render_bonos_page():
         col1, col2 = st.columns(2)
         
         with col1:
-            # Descargar CSV
-            csv = df_flujos.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                label="📥 Descargar tabla de flujos (CSV)",
-                data=csv,
-                file_name=f"flujos_bono_{valor_nominal}_{tasa_cupon_pct}pct.csv",
-                mime="text/csv",
-                use_container_width=True
+            # Descargar tabla de flujos (se genera solo al hacer clic)
+            mostrar_descargas(
+                lambda: df_flujos,
+                nombre_archivo=f"flujos_bono_{valor_nominal}_{tasa_cupon_pct}pct",
+                clave="flujos_bono",
+                etiqueta="📥 Tabla de flujos",
+                horizontal=False
             )
         
         with col2:
             # Preparar datos para el PDF
             datos_entrada_pdf = {
+                'tipo_bono': tipo_bono_etiqueta,
+                'call': f"Desde el año {año_call} al {precio_call_pct:.2f}%" if con_call else None,
+                'put': f"Desde el año {año_put} al {precio_put_pct:.2f}%" if con_put else None,
+                'curva': f"Curva cero ({len(curva['plazos'])} plazos)" if usar_curva else None,
+                'liquidacion': f"{fecha_liquidacion.strftime('%d/%m/%Y')} (emisión {fecha_emision.strftime('%d/%m/%Y')}, {convencion_etiqueta})" if resultado.get('liquidacion') else None,
+                'años_gracia': años_gracia,
                 'valor_nominal': valor_nominal,
                 'tasa_cupon_pct': tasa_cupon_pct,
                 'frecuencia': frecuencia_pago,
@@ -283,20 +696,17 @@ def render_bonos_page():
                 'tea_descuento_pct': tea_descuento_pct
             }
             
-            # Generar PDF
-            pdf_buffer = crear_pdf_bonos(
-                datos_entrada=datos_entrada_pdf,
-                resultados=resultado,
-                df_flujos=df_flujos
-            )
-            
-            st.download_button(
-                label="📥 Descargar Reporte PDF",
-                data=pdf_buffer,
+            # Generar PDF en segundo plano
+            mostrar_descarga_pdf(
+                espacio="bonos",
+                funcion=crear_pdf_bonos,
+                parametros={
+                    'datos_entrada': datos_entrada_pdf,
+                    'resultados': resultado,
+                    'df_flujos': df_flujos
+                },
                 file_name=f"reporte_bono_{valor_nominal}_{tasa_cupon_pct}pct.pdf",
-                mime="application/pdf",
-                use_container_width=True,
-                type="primary"
+                label="📥 Descargar Reporte PDF"
             )
     
     else:
@@ -304,6 +714,10 @@ def render_bonos_page():
     
     st.divider()
     
+    render_cartera_bonos(curva)
+    
+    st.divider()
+    
     # Información adicional
     with st.expander("ℹ️ ¿Cómo se calcula el valor presente de un bono?"):
         st.markdown("""
@@ -312,13 +726,15 @@ def render_bonos_page():
         El valor presente (VP) de un bono se calcula como la suma de:
         
         1. **Valor presente de todos los cupones**:
-        $$VP_{cupones} = \\sum_{t=1}^{n} \\frac{C}{(1 + i)^t}$$
+        $$VP_{cupones} = \\sum_{t=1}^{n} \\frac{C_t}{(1 + i)^t}$$
         
-        2. **Valor presente del valor nominal**:
-        $$VP_{nominal} = \\frac{VN}{(1 + i)^n}$$
+        2. **Valor presente del principal** (todo al vencimiento en un bono bullet o cupón cero,
+        en cuotas en un bono amortizable o con fondo de amortización):
+        $$VP_{principal} = \\sum_{t=1}^{n} \\frac{P_t}{(1 + i)^t}$$
         
         Donde:
-        - **C**: Cupón periódico = VN × tasa_cupón_periodo
+        - **C_t**: Cupón del periodo = saldo de principal vigente × tasa_cupón_periodo
+        - **P_t**: Principal devuelto en el periodo t
         - **VN**: Valor Nominal del bono
         - **i**: Tasa de descuento por periodo
         - **n**: Número total de periodos
@@ -339,3 +755,127 @@ def render_bonos_page():
         - **A la Par**: VP = Valor Nominal (tasa cupón = tasa de mercado)
         """)
 
+
+
+def render_curva_referencia():
+    """
+    Renderiza la curva cero de referencia: editada a mano o construida por
+    bootstrapping desde un CSV de rendimientos par o precios de bonos.
+    
+    Returns:
+        Diccionario con 'plazos' (años) y 'tasas' (TEA cero en decimal), ordenado
+        por plazo; None si la curva queda vacía o el archivo no es válido
+    """
+    origen = st.radio(
+        "Origen de la curva",
+        options=["Editar puntos", "Cargar CSV (bootstrapping)"],
+        horizontal=True
+    )
+    
+    if origen == "Cargar CSV (bootstrapping)":
+        archivo = st.file_uploader(
+            "Cotizaciones de la curva (CSV)",
+            type=["csv"],
+            key="cotizaciones_curva",
+            help="Columna plazo_años y, o bien tasa_par (% TEA), o bien precio (por 100) y tasa_cupon (% TEA)"
+        )
+        frecuencia_curva = st.selectbox(
+            "Frecuencia de pago de los bonos de la curva",
+            options=list(FRECUENCIAS_BONOS.keys()),
+            index=list(FRECUENCIAS_BONOS.keys()).index("Semestral")
+        )
+        
+        if archivo is None:
+            st.caption("Carga un archivo para construir la curva.")
+            return None
+        
+        try:
+            curva = obtener_curva_csv(archivo.getvalue(), FRECUENCIAS_BONOS[frecuencia_curva])
+        except ValueError as error:
+            st.error(f"⚠️ {error}")
+            return None
+        
+        st.plotly_chart(crear_grafico_curva_cero(curva), use_container_width=True)
+        return curva
+    
+    df_curva = st.data_editor(
+        pd.DataFrame({
+            'Plazo (años)': CURVA_REFERENCIA_DEFECTO['plazos'],
+            'TEA cero (%)': [tasa * 100 for tasa in CURVA_REFERENCIA_DEFECTO['tasas']]
+        }),
+        key="editor_curva",
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True
+    ).dropna().sort_values('Plazo (años)')
+    
+    if df_curva.empty:
+        st.warning("⚠️ La curva no tiene puntos.")
+        return None
+    
+    return {
+        'plazos': df_curva['Plazo (años)'].to_numpy(dtype=float),
+        'tasas': df_curva['TEA cero (%)'].to_numpy(dtype=float) / 100
+    }
+
+
+def render_cartera_bonos(curva: dict):
+    """
+    Renderiza el cálculo de Z-spread de una cartera de bonos cargada desde un CSV.
+    
+    Args:
+        curva: Curva cero de referencia (resultado de render_curva_referencia)
+    """
+    st.header("📂 Cartera de Bonos: Z-spread")
+    
+    archivo = st.file_uploader(
+        "Cargar cartera de bonos (CSV)",
+        type=["csv"],
+        key="cartera_bonos",
+        help="Columnas: valor_nominal, tasa_cupon (% TEA), frecuencia, plazo_años, precio; "
+             "opcionales: id, tipo_bono, años_gracia. Se usa la curva de 'Curva Cero y Spreads'."
+    )
+    
+    if archivo is None or curva is None:
+        return
+    
+    try:
+        cartera = cargar_cartera_bonos_csv(archivo)
+    except ValueError as error:
+        st.error(f"⚠️ {error}")
+        return
+    
+    resultado = calcular_z_spread_cartera(cartera, curva)
+    z_spread_pb = resultado['z_spread'] * 10000
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(label="Bonos", value=f"{len(cartera):,}")
+    
+    with col2:
+        st.metric(label="Resueltos", value=f"{int(resultado['convergido'].sum()):,}")
+    
+    with col3:
+        st.metric(
+            label="Z-spread Promedio",
+            value=f"{np.nanmean(z_spread_pb):,.1f} pb" if resultado['convergido'].any() else "—"
+        )
+    
+    df_resultado = cartera.assign(
+        tasa_cupon=cartera['tasa_cupon'] * 100,
+        precio_curva=resultado['precio_curva'].round(4),
+        z_spread_pb=z_spread_pb.round(4),
+        convergido=resultado['convergido']
+    )
+    
+    st.dataframe(df_resultado.head(1000), use_container_width=True, hide_index=True)
+    if len(df_resultado) > 1000:
+        st.caption(f"Mostrando 1,000 de {len(df_resultado):,} bonos. Descarga el CSV para ver todos.")
+    
+    mostrar_descargas(
+        lambda: df_resultado,
+        nombre_archivo="z_spreads_cartera",
+        clave="z_spreads_cartera",
+        etiqueta="📥 Z-spreads"
+    )
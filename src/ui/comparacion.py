@@ -1,33 +1,154 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-from src.calculations.financial_calcs import calcular_vf_combinado, calcular_beneficio_bruto
+from src.calculations.financial_calcs import calcular_beneficio_bruto
 from src.calculations.tax_calcs import (
     calcular_impuesto_retiro_total,
-    calcular_monto_neto_retiro_total,
-    calcular_tasa_mensual_retiro,
-    calcular_retiro_mensual_con_impuestos
+    calcular_monto_neto_retiro_total
+)
+from src.calculations.lifecycle_calcs import (
+    calcular_ciclo_vida,
+    calcular_barrido_edades,
+    resumir_retiro_ciclo
+)
+from src.visualization.charts import (
+    crear_grafico_comparacion_vf,
+    crear_grafico_comparacion_retiro,
+    crear_grafico_comparacion_composicion,
+    crear_grafico_ciclo_vida,
+    crear_grafico_barrido_edades
 )
 from config.constants import MONEDA
+from src.ui.display import configurar_columnas_numericas, mostrar_descargas
+from src.utils.tables import declarar_formatos
+from src.utils.profiling import perfilar
+from src.utils.cache_sqlite import cache_en_disco
+
+
+@perfilar
+@cache_en_disco
+def calcular_escenarios(
+    vp: float,
+    aporte,
+    teas,
+    frecuencia_anual: int,
+    plazos_años,
+    tipo_bolsa: str,
+    edad_actual: int,
+    meses_retiro=240,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True,
+    inflacion: float = 0.0
+) -> dict:
+    """
+    Calcula varios escenarios completos de inversión en una sola pasada del ciclo de vida.
+    
+    Args:
+        vp: Valor presente
+        aporte: Aporte periódico, o array de aportes por periodo (se completa con
+                ceros o se trunca según el plazo de cada escenario)
+        teas: Tasa efectiva anual de cada escenario (o una sola para todos)
+        frecuencia_anual: Frecuencia de aportes
+        plazos_años: Plazo en años de cada escenario (o uno solo para todos)
+        tipo_bolsa: Nacional o Extranjera
+        edad_actual: Edad actual del inversionista
+        meses_retiro: Meses de retiro de cada escenario (default 240 = 20 años)
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año
+        inflacion: Inflación anual (en decimal); si es mayor a 0 cada escenario incluye
+                   sus montos en valores de hoy (claves terminadas en '_real')
+    
+    Returns:
+        Diccionario con 'escenarios' (lista de diccionarios con todos los cálculos
+        de cada escenario) y 'ciclo_vida' (resultado de calcular_ciclo_vida)
+    """
+    ciclo = calcular_ciclo_vida(
+        vp, aporte, teas, frecuencia_anual, plazos_años, meses_retiro, edad_actual,
+        aporte_al_inicio, capitalizacion_continua, tasa_crecimiento, crecimiento_anual, inflacion
+    )
+    
+    plazos = ciclo['meses_acumulacion'] // 12
+    teas = np.broadcast_to(np.asarray(teas, dtype=float), plazos.shape)
+    
+    escenarios = []
+    for i in range(len(plazos)):
+        vf = float(ciclo['vf'][i])
+        inversion_total = vp + float(ciclo['total_aportes'][i])
+        beneficio_bruto = calcular_beneficio_bruto(vf, inversion_total)
+        
+        # Retiro total
+        impuesto_total = calcular_impuesto_retiro_total(beneficio_bruto, tipo_bolsa)
+        monto_neto_total = calcular_monto_neto_retiro_total(vf, impuesto_total)
+        
+        # Retiro mensual, leído del ciclo de vida
+        retiro_mensual_info = resumir_retiro_ciclo(ciclo, i)
+        
+        escenario = {
+            'plazo_años': int(plazos[i]),
+            'edad_jubilacion': edad_actual + int(plazos[i]),
+            'tea': float(teas[i]),
+            'vf': vf,
+            'inversion_total': inversion_total,
+            'beneficio_bruto': beneficio_bruto,
+            # Retiro total
+            'impuesto_total': impuesto_total,
+            'monto_neto_total': monto_neto_total,
+            'ganancia_neta_total': monto_neto_total - inversion_total,
+            # Retiro mensual
+            'meses_retiro': int(ciclo['meses_retiro'][i]),
+            'retiro_mensual_bruto': retiro_mensual_info['retiro_mensual_bruto'],
+            'retiro_mensual_neto': retiro_mensual_info['retiro_mensual'],
+            'impuesto_mensual': retiro_mensual_info['impuesto'],
+            'total_retiro_mensual': retiro_mensual_info['total_retirado'],
+            'ganancia_neta_mensual': retiro_mensual_info['total_retirado'] - inversion_total,
+            'capital_neto_mensual': retiro_mensual_info['capital_neto']
+        }
+        
+        if inflacion > 0:
+            # Montos en valores de hoy: el VF y el retiro total al deflactor de la jubilación,
+            # los aportes y cada retiro mensual al deflactor de su propia fecha
+            meses_acumulacion = int(ciclo['meses_acumulacion'][i])
+            deflactor_jubilacion = float(ciclo['deflactor'][meses_acumulacion])
+            retiros_reales = ciclo['retiro_neto'][i, meses_acumulacion + 1:] * ciclo['deflactor'][meses_acumulacion + 1:]
+            escenario.update({
+                'vf_real': vf * deflactor_jubilacion,
+                'inversion_total_real': vp + float(ciclo['total_aportes_real'][i]),
+                'monto_neto_total_real': monto_neto_total * deflactor_jubilacion,
+                'retiro_mensual_neto_real': float(retiros_reales[0]),
+                'total_retiro_mensual_real': float(np.nansum(retiros_reales))
+            })
+        
+        escenarios.append(escenario)
+    
+    return {'escenarios': escenarios, 'ciclo_vida': ciclo}
 
 
 def calcular_escenario(
     vp: float,
-    aporte: float,
+    aporte,
     tea: float,
     frecuencia_anual: int,
     plazo_años: int,
     tipo_bolsa: str,
     edad_actual: int,
     meses_retiro: int = 240,
-    aporte_al_inicio: bool = False
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True,
+    inflacion: float = 0.0
 ) -> dict:
     """
     Calcula un escenario completo de inversión.
     
     Args:
         vp: Valor presente
-        aporte: Aporte periódico
+        aporte: Aporte periódico, o array de aportes por periodo (se completa con
+                ceros o se trunca según el plazo del escenario)
         tea: Tasa efectiva anual
         frecuencia_anual: Frecuencia de aportes
         plazo_años: Plazo en años
@@ -35,53 +156,18 @@ def calcular_escenario(
         edad_actual: Edad actual del inversionista
         meses_retiro: Meses de retiro (default 240 = 20 años)
         aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año
+        inflacion: Inflación anual (en decimal); si es mayor a 0 se agregan los montos reales
     
     Returns:
         Diccionario con todos los cálculos del escenario
     """
-    # Calcular VF
-    vf = calcular_vf_combinado(vp, aporte, tea, frecuencia_anual, plazo_años, aporte_al_inicio)
-    
-    # Calcular inversión total y beneficio
-    total_aportes = aporte * frecuencia_anual * plazo_años
-    inversion_total = vp + total_aportes
-    beneficio_bruto = calcular_beneficio_bruto(vf, inversion_total)
-    
-    # Retiro total
-    impuesto_total = calcular_impuesto_retiro_total(beneficio_bruto, tipo_bolsa)
-    monto_neto_total = calcular_monto_neto_retiro_total(vf, impuesto_total)
-    ganancia_neta_total = monto_neto_total - inversion_total
-    
-    # Retiro mensual con impuestos
-    tasa_mensual_retiro = calcular_tasa_mensual_retiro(tea)
-    retiro_mensual_info = calcular_retiro_mensual_con_impuestos(
-        vf, beneficio_bruto, tasa_mensual_retiro, meses_retiro, tipo_bolsa
-    )
-    ganancia_neta_mensual = retiro_mensual_info['total_retirado'] - inversion_total
-    
-    # Edad de jubilación
-    edad_jubilacion = edad_actual + plazo_años
-    
-    return {
-        'plazo_años': plazo_años,
-        'edad_jubilacion': edad_jubilacion,
-        'tea': tea,
-        'vf': vf,
-        'inversion_total': inversion_total,
-        'beneficio_bruto': beneficio_bruto,
-        # Retiro total
-        'impuesto_total': impuesto_total,
-        'monto_neto_total': monto_neto_total,
-        'ganancia_neta_total': ganancia_neta_total,
-        # Retiro mensual
-        'meses_retiro': meses_retiro,
-        'retiro_mensual_bruto': retiro_mensual_info.get('retiro_mensual_bruto', retiro_mensual_info['retiro_mensual']),
-        'retiro_mensual_neto': retiro_mensual_info['retiro_mensual'],
-        'impuesto_mensual': retiro_mensual_info['impuesto'],
-        'total_retiro_mensual': retiro_mensual_info['total_retirado'],
-        'ganancia_neta_mensual': ganancia_neta_mensual,
-        'capital_neto_mensual': retiro_mensual_info['capital_neto']
-    }
+    return calcular_escenarios(
+        vp, aporte, tea, frecuencia_anual, plazo_años, tipo_bolsa, edad_actual, meses_retiro,
+        aporte_al_inicio, capitalizacion_continua, tasa_crecimiento, crecimiento_anual, inflacion
+    )['escenarios'][0]
 
 
 def render_comparacion_escenarios(datos_base: dict):
@@ -124,9 +210,6 @@ def render_comparacion_escenarios(datos_base: dict):
     
     st.divider()
     
-    # Variables para comparación
-    escenarios = []
-    
     if tipo_comparacion == "Edades de Jubilación":
         st.subheader("📅 Comparar Edades de Jubilación")
         
@@ -189,21 +272,10 @@ def render_comparacion_escenarios(datos_base: dict):
         # Calcular escenarios
         meses_lista = [meses_1, meses_2, meses_3] if tipo_retiro_comparacion == "Retiro Mensual" else [240, 240, 240]
         
-        for i, (edad, meses) in enumerate(zip([edad_1, edad_2, edad_3], meses_lista), 1):
-            plazo = edad - datos_base["edad_actual"]
-            escenario = calcular_escenario(
-                vp=datos_base["valor_presente"],
-                aporte=datos_base["aporte_periodico"],
-                tea=datos_base["tea"],
-                frecuencia_anual=datos_base["frecuencia_anual"],
-                plazo_años=plazo,
-                tipo_bolsa=datos_base["tipo_bolsa"],
-                edad_actual=datos_base["edad_actual"],
-                meses_retiro=meses,
-                aporte_al_inicio=datos_base["aporte_al_inicio"]
-            )
-            escenario['nombre'] = f"Jubilación a los {edad} años"
-            escenarios.append(escenario)
+        configuraciones = [
+            (f"Jubilación a los {edad} años", edad - datos_base["edad_actual"], datos_base["tea"], meses)
+            for edad, meses in zip([edad_1, edad_2, edad_3], meses_lista)
+        ]
     
     elif tipo_comparacion == "Tasas de Retorno":
         st.subheader("📈 Comparar Tasas de Retorno")
@@ -270,20 +342,10 @@ def render_comparacion_escenarios(datos_base: dict):
         # Calcular escenarios
         meses_lista_tea = [meses_tea_1, meses_tea_2, meses_tea_3] if tipo_retiro_comparacion == "Retiro Mensual" else [240, 240, 240]
         
-        for i, (tea_pct, meses) in enumerate(zip([tea_1, tea_2, tea_3], meses_lista_tea), 1):
-            escenario = calcular_escenario(
-                vp=datos_base["valor_presente"],
-                aporte=datos_base["aporte_periodico"],
-                tea=tea_pct / 100,
-                frecuencia_anual=datos_base["frecuencia_anual"],
-                plazo_años=datos_base["plazo_años"],
-                tipo_bolsa=datos_base["tipo_bolsa"],
-                edad_actual=datos_base["edad_actual"],
-                meses_retiro=meses,
-                aporte_al_inicio=datos_base["aporte_al_inicio"]
-            )
-            escenario['nombre'] = f"TEA {tea_pct}%"
-            escenarios.append(escenario)
+        configuraciones = [
+            (f"TEA {tea_pct}%", datos_base["plazo_años"], tea_pct / 100, meses)
+            for tea_pct, meses in zip([tea_1, tea_2, tea_3], meses_lista_tea)
+        ]
     
     else:  # Ambos
         st.subheader("🔀 Comparar Múltiples Factores")
@@ -386,27 +448,36 @@ def render_comparacion_escenarios(datos_base: dict):
         
         # Calcular escenarios
         meses_lista_ambos = [meses_cons, meses_mod, meses_agr] if tipo_retiro_comparacion == "Retiro Mensual" else [240, 240, 240]
-        configs = [
-            ("Conservador", edad_cons, tea_cons, meses_lista_ambos[0]),
-            ("Moderado", edad_mod, tea_mod, meses_lista_ambos[1]),
-            ("Agresivo", edad_agr, tea_agr, meses_lista_ambos[2])
+        configuraciones = [
+            (nombre, edad - datos_base["edad_actual"], tea_pct / 100, meses)
+            for nombre, edad, tea_pct, meses in [
+                ("Conservador", edad_cons, tea_cons, meses_lista_ambos[0]),
+                ("Moderado", edad_mod, tea_mod, meses_lista_ambos[1]),
+                ("Agresivo", edad_agr, tea_agr, meses_lista_ambos[2])
+            ]
         ]
-        
-        for nombre, edad, tea_pct, meses in configs:
-            plazo = edad - datos_base["edad_actual"]
-            escenario = calcular_escenario(
-                vp=datos_base["valor_presente"],
-                aporte=datos_base["aporte_periodico"],
-                tea=tea_pct / 100,
-                frecuencia_anual=datos_base["frecuencia_anual"],
-                plazo_años=plazo,
-                tipo_bolsa=datos_base["tipo_bolsa"],
-                edad_actual=datos_base["edad_actual"],
-                meses_retiro=meses,
-                aporte_al_inicio=datos_base["aporte_al_inicio"]
-            )
-            escenario['nombre'] = nombre
-            escenarios.append(escenario)
+    
+    # Todos los escenarios se calculan juntos en un solo ciclo de vida
+    nombres, plazos, teas, meses_retiro = zip(*configuraciones)
+    resultado = calcular_escenarios(
+        vp=datos_base["valor_presente"],
+        aporte=datos_base["aportes"] if datos_base["aportes"] is not None else datos_base["aporte_periodico"],
+        teas=list(teas),
+        frecuencia_anual=datos_base["frecuencia_anual"],
+        plazos_años=list(plazos),
+        tipo_bolsa=datos_base["tipo_bolsa"],
+        edad_actual=datos_base["edad_actual"],
+        meses_retiro=list(meses_retiro),
+        aporte_al_inicio=datos_base["aporte_al_inicio"],
+        capitalizacion_continua=datos_base["capitalizacion_continua"],
+        tasa_crecimiento=datos_base["tasa_crecimiento_aportes"],
+        crecimiento_anual=datos_base["crecimiento_anual"],
+        inflacion=datos_base["inflacion"]
+    )
+    escenarios = resultado['escenarios']
+    hay_inflacion = datos_base["inflacion"] > 0
+    for escenario, nombre in zip(escenarios, nombres):
+        escenario['nombre'] = nombre
     
     st.divider()
     
@@ -422,13 +493,13 @@ def render_comparacion_escenarios(datos_base: dict):
                     'Escenario': e['nombre'],
                     'Plazo (años)': e['plazo_años'],
                     'Edad Jubilación': e['edad_jubilacion'],
-                    'TEA (%)': f"{e['tea']*100:.2f}%",
-                    f'Valor Futuro ({MONEDA})': f"{e['vf']:,.2f}",
-                    f'Inversión Total ({MONEDA})': f"{e['inversion_total']:,.2f}",
-                    f'Ganancia Bruta ({MONEDA})': f"{e['beneficio_bruto']:,.2f}",
-                    f'Impuesto ({MONEDA})': f"{e['impuesto_total']:,.2f}",
-                    f'Ganancia Neta ({MONEDA})': f"{e['ganancia_neta_total']:,.2f}",
-                    f'Monto Neto a Recibir ({MONEDA})': f"{e['monto_neto_total']:,.2f}"
+                    'TEA (%)': round(e['tea'] * 100, 2),
+                    f'Valor Futuro ({MONEDA})': round(e['vf'], 2),
+                    f'Inversión Total ({MONEDA})': round(e['inversion_total'], 2),
+                    f'Ganancia Bruta ({MONEDA})': round(e['beneficio_bruto'], 2),
+                    f'Impuesto ({MONEDA})': round(e['impuesto_total'], 2),
+                    f'Ganancia Neta ({MONEDA})': round(e['ganancia_neta_total'], 2),
+                    f'Monto Neto a Recibir ({MONEDA})': round(e['monto_neto_total'], 2)
                 }
                 for e in escenarios
             ])
@@ -438,21 +509,45 @@ def render_comparacion_escenarios(datos_base: dict):
                     'Escenario': e['nombre'],
                     'Plazo (años)': e['plazo_años'],
                     'Edad Jubilación': e['edad_jubilacion'],
-                    'TEA (%)': f"{e['tea']*100:.2f}%",
-                    f'Valor Futuro ({MONEDA})': f"{e['vf']:,.2f}",
-                    f'Inversión Total ({MONEDA})': f"{e['inversion_total']:,.2f}",
-                    f'Ganancia Bruta ({MONEDA})': f"{e['beneficio_bruto']:,.2f}",
-                    f'Impuesto Total 5% ({MONEDA})': f"{e['impuesto_mensual']:,.2f}",
-                    f'Ganancia Neta ({MONEDA})': f"{e['ganancia_neta_mensual']:,.2f}",
+                    'TEA (%)': round(e['tea'] * 100, 2),
+                    f'Valor Futuro ({MONEDA})': round(e['vf'], 2),
+                    f'Inversión Total ({MONEDA})': round(e['inversion_total'], 2),
+                    f'Ganancia Bruta ({MONEDA})': round(e['beneficio_bruto'], 2),
+                    f'Impuesto Total 5% ({MONEDA})': round(e['impuesto_mensual'], 2),
+                    f'Ganancia Neta ({MONEDA})': round(e['ganancia_neta_mensual'], 2),
                     'Meses de Retiro': e['meses_retiro'],
-                    f'Retiro Mensual Bruto ({MONEDA})': f"{e['retiro_mensual_bruto']:,.2f}",
-                    f'Retiro Mensual Neto ({MONEDA})': f"{e['retiro_mensual_neto']:,.2f}",
-                    f'Total Neto Retirado ({MONEDA})': f"{e['total_retiro_mensual']:,.2f}"
+                    f'Retiro Mensual Bruto ({MONEDA})': round(e['retiro_mensual_bruto'], 2),
+                    f'Retiro Mensual Neto ({MONEDA})': round(e['retiro_mensual_neto'], 2),
+                    f'Total Neto Retirado ({MONEDA})': round(e['total_retiro_mensual'], 2)
                 }
                 for e in escenarios
             ])
         
-        st.dataframe(df_comparacion, use_container_width=True, hide_index=True)
+        if hay_inflacion:
+            # Montos en valores de hoy
+            columnas_reales = {f'Valor Futuro Real ({MONEDA} de hoy)': 'vf_real'}
+            if tipo_retiro_comparacion == "Retiro Total":
+                columnas_reales[f'Monto Neto Real ({MONEDA} de hoy)'] = 'monto_neto_total_real'
+            else:
+                columnas_reales[f'Primer Retiro Neto Real ({MONEDA} de hoy)'] = 'retiro_mensual_neto_real'
+                columnas_reales[f'Total Neto Retirado Real ({MONEDA} de hoy)'] = 'total_retiro_mensual_real'
+            for columna, clave in columnas_reales.items():
+                df_comparacion[columna] = [round(e[clave], 2) for e in escenarios]
+        
+        st.dataframe(
+            df_comparacion,
+            column_config=configurar_columnas_numericas(
+                declarar_formatos(df_comparacion, columnas_enteras=('Plazo (años)', 'Edad Jubilación', 'Meses de Retiro'))
+            ),
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        if hay_inflacion:
+            st.caption(
+                f"Columnas reales con inflación de {datos_base['inflacion'] * 100:.2f}% anual: el VF y el monto neto "
+                "se deflactan a la fecha de jubilación y cada retiro mensual a su propio mes."
+            )
         
         st.divider()
         
@@ -460,127 +555,46 @@ def render_comparacion_escenarios(datos_base: dict):
         st.subheader("📊 Gráficos Comparativos")
         
         if tipo_retiro_comparacion == "Retiro Total":
-            tab1, tab2, tab3 = st.tabs(["💰 Valor Futuro", "💵 Monto Neto", "� Composición"])
+            tab1, tab2, tab3, tab4, tab5 = st.tabs(["💰 Valor Futuro", "💵 Monto Neto", "� Composición", "🧭 Ciclo de Vida", "🎯 Curva por Edad"])
         else:
-            tab1, tab2, tab3 = st.tabs(["💰 Valor Futuro", "�💳 Retiro Mensual", "📈 Composición"])
+            tab1, tab2, tab3, tab4, tab5 = st.tabs(["💰 Valor Futuro", "�💳 Retiro Mensual", "📈 Composición", "🧭 Ciclo de Vida", "🎯 Curva por Edad"])
         
         with tab1:
-            # Gráfico de barras de Valor Futuro
-            fig_vf = go.Figure()
-            
-            fig_vf.add_trace(go.Bar(
-                x=[e['nombre'] for e in escenarios],
-                y=[e['vf'] for e in escenarios],
-                text=[f"{MONEDA} {e['vf']:,.0f}" for e in escenarios],
-                textposition='outside',
-                marker_color='#4ECDC4',
-                hovertemplate='<b>%{x}</b><br>' + f'Valor Futuro: {MONEDA} %{{y:,.2f}}<extra></extra>'
-            ))
-            
-            fig_vf.update_layout(
-                title='Comparación de Valor Futuro',
-                xaxis_title='Escenario',
-                yaxis_title=f'Valor Futuro ({MONEDA})',
-                template='plotly_white',
-                height=500
-            )
-            
-            st.plotly_chart(fig_vf, use_container_width=True)
+            st.plotly_chart(crear_grafico_comparacion_vf(escenarios, MONEDA), use_container_width=True)
         
         with tab2:
-            if tipo_retiro_comparacion == "Retiro Total":
-                # Gráfico de barras de Monto Neto
-                fig_retiro = go.Figure()
-                
-                fig_retiro.add_trace(go.Bar(
-                    x=[e['nombre'] for e in escenarios],
-                    y=[e['monto_neto_total'] for e in escenarios],
-                    text=[f"{MONEDA} {e['monto_neto_total']:,.0f}" for e in escenarios],
-                    textposition='outside',
-                    marker_color='#FF6B6B',
-                    hovertemplate='<b>%{x}</b><br>' + f'Monto Neto: {MONEDA} %{{y:,.2f}}<extra></extra>'
-                ))
-                
-                fig_retiro.update_layout(
-                    title='Comparación de Monto Neto (Retiro Total)',
-                    xaxis_title='Escenario',
-                    yaxis_title=f'Monto Neto ({MONEDA})',
-                    template='plotly_white',
-                    height=500
-                )
-            else:
-                # Gráfico de barras de Retiro Mensual Bruto
-                fig_retiro = go.Figure()
-                
-                fig_retiro.add_trace(go.Bar(
-                    x=[e['nombre'] for e in escenarios],
-                    y=[e['retiro_mensual_bruto'] for e in escenarios],
-                    text=[f"{MONEDA} {e['retiro_mensual_bruto']:,.0f}" for e in escenarios],
-                    textposition='outside',
-                    marker_color='#FF6B6B',
-                    name='Retiro Bruto',
-                    hovertemplate='<b>%{x}</b><br>' + f'Retiro Mensual Bruto: {MONEDA} %{{y:,.2f}}<extra></extra>'
-                ))
-                
-                fig_retiro.add_trace(go.Bar(
-                    x=[e['nombre'] for e in escenarios],
-                    y=[e['retiro_mensual_neto'] for e in escenarios],
-                    text=[f"{MONEDA} {e['retiro_mensual_neto']:,.0f}" for e in escenarios],
-                    textposition='outside',
-                    marker_color='#95E1D3',
-                    name='Retiro Neto',
-                    hovertemplate='<b>%{x}</b><br>' + f'Retiro Mensual Neto: {MONEDA} %{{y:,.2f}}<extra></extra>'
-                ))
-                
-                fig_retiro.update_layout(
-                    title='Comparación de Retiro Mensual (Bruto vs Neto)',
-                    xaxis_title='Escenario',
-                    yaxis_title=f'Retiro Mensual ({MONEDA})',
-                    template='plotly_white',
-                    height=500,
-                    barmode='group'
-                )
-            
-            st.plotly_chart(fig_retiro, use_container_width=True)
+            st.plotly_chart(crear_grafico_comparacion_retiro(escenarios, tipo_retiro_comparacion, MONEDA), use_container_width=True)
         
         with tab3:
-            # Gráfico de barras apiladas
-            fig_comp = go.Figure()
-            
-            fig_comp.add_trace(go.Bar(
-                name='Inversión',
-                x=[e['nombre'] for e in escenarios],
-                y=[e['inversion_total'] for e in escenarios],
-                marker_color='#95E1D3',
-                hovertemplate=f'Inversión: {MONEDA} %{{y:,.2f}}<extra></extra>'
-            ))
-            
-            fig_comp.add_trace(go.Bar(
-                name='Ganancia Neta',
-                x=[e['nombre'] for e in escenarios],
-                y=[e['beneficio_bruto'] - e['impuesto_total'] for e in escenarios],
-                marker_color='#4ECDC4',
-                hovertemplate=f'Ganancia Neta: {MONEDA} %{{y:,.2f}}<extra></extra>'
-            ))
-            
-            fig_comp.add_trace(go.Bar(
-                name='Impuestos',
-                x=[e['nombre'] for e in escenarios],
-                y=[e['impuesto_total'] for e in escenarios],
-                marker_color='#FF6B6B',
-                hovertemplate=f'Impuestos: {MONEDA} %{{y:,.2f}}<extra></extra>'
-            ))
-            
-            fig_comp.update_layout(
-                title='Composición del Valor Final',
-                xaxis_title='Escenario',
-                yaxis_title=f'Monto ({MONEDA})',
-                barmode='stack',
-                template='plotly_white',
-                height=500
+            st.plotly_chart(crear_grafico_comparacion_composicion(escenarios, MONEDA), use_container_width=True)
+        
+        with tab4:
+            # Saldo de cada escenario desde hoy hasta el último retiro
+            fig_ciclo = crear_grafico_ciclo_vida(resultado['ciclo_vida'], list(nombres), MONEDA)
+            st.plotly_chart(fig_ciclo, use_container_width=True)
+        
+        with tab5:
+            # Todas las edades de jubilación posibles con la TEA base, en una sola pasada
+            meses_curva = meses_retiro[len(meses_retiro) // 2]
+            barrido = calcular_barrido_edades(
+                vp=datos_base["valor_presente"],
+                aporte=datos_base["aportes"] if datos_base["aportes"] is not None else datos_base["aporte_periodico"],
+                tea=datos_base["tea"],
+                frecuencia_anual=datos_base["frecuencia_anual"],
+                edad_actual=datos_base["edad_actual"],
+                tipo_bolsa=datos_base["tipo_bolsa"],
+                meses_retiro=meses_curva,
+                aporte_al_inicio=datos_base["aporte_al_inicio"],
+                capitalizacion_continua=datos_base["capitalizacion_continua"],
+                tasa_crecimiento=datos_base["tasa_crecimiento_aportes"],
+                crecimiento_anual=datos_base["crecimiento_anual"]
+            )
+            fig_barrido = crear_grafico_barrido_edades(barrido, escenarios, MONEDA)
+            st.plotly_chart(fig_barrido, use_container_width=True)
+            st.caption(
+                f"Curvas con TEA {datos_base['tea_pct']:.2f}% y {meses_curva} meses de retiro. "
+                "Los rombos marcan los escenarios comparados; los que usan otra TEA o plazo de retiro quedan fuera de la curva."
             )
-            
-            st.plotly_chart(fig_comp, use_container_width=True)
         
         st.divider()
         
@@ -627,11 +641,10 @@ def render_comparacion_escenarios(datos_base: dict):
                 - TEA: {mejor_retiro['tea']*100:.2f}%
                 """)
         
-        # Descargar comparación
-        csv = df_comparacion.to_csv(index=False).encode('utf-8')
-        st.download_button(
-            label="📥 Descargar comparación (CSV)",
-            data=csv,
-            file_name="comparacion_escenarios.csv",
-            mime="text/csv"
+        # Descargar comparación (el archivo se genera solo al hacer clic)
+        mostrar_descargas(
+            lambda: df_comparacion,
+            nombre_archivo="comparacion_escenarios",
+            clave="comparacion",
+            etiqueta="📥 Comparación"
         )
@@ -1,5 +1,151 @@
 import streamlit as st
-from config.constants import MONEDA
+import pandas as pd
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from config.constants import MONEDA, OPCIONES_FILAS_POR_PAGINA, FORMATOS_EXPORTACION
+from src.utils.cache_sqlite import generar_clave
+from src.utils.tables import calcular_rango_pagina, declarar_formatos
+from src.utils.exportacion import exportar_tabla, hay_soporte_columnar
+from src.utils.pdf_worker import (
+    iniciar_trabajo_pdf,
+    cancelar_trabajo_pdf,
+    estado_trabajo_pdf
+)
+
+
+def configurar_columnas_numericas(formatos: dict, separador_miles: bool = True) -> dict:
+    """
+    Arma la configuración de columnas de st.dataframe para mostrar números con formato.
+    
+    Los datos siguen siendo numéricos (se pueden ordenar y copiar como números);
+    solo cambia cómo se muestran.
+    
+    Args:
+        formatos: Diccionario {columna: decimales} (resultado de declarar_formatos)
+        separador_miles: True para separar miles con comas
+    
+    Returns:
+        Diccionario para el parámetro column_config de st.dataframe
+    """
+    patron = "%,.{}f" if separador_miles else "%.{}f"
+    return {col: st.column_config.NumberColumn(format=patron.format(decimales)) for col, decimales in formatos.items()}
+
+
+def mostrar_tabla_paginada(
+    obtener_filas,
+    total_filas: int,
+    clave: str,
+    separador_miles: bool = True,
+    filas_extremos: int = 0,
+    altura: int = 400
+):
+    """
+    Muestra una tabla larga por páginas, pidiendo solo las filas de la página visible.
+    
+    obtener_filas(inicio, fin) devuelve las filas [inicio, fin) (por ejemplo con
+    generar_ventana_crecimiento), así que el costo de mostrar una página no depende
+    del largo del cronograma. Cambiar de página solo refresca este bloque.
+    
+    Args:
+        obtener_filas: Función (inicio, fin) -> DataFrame con esas filas
+        total_filas: Número total de filas del cronograma
+        clave: Prefijo único para las claves de los controles
+        separador_miles: True para separar miles con comas
+        filas_extremos: Si es mayor a 0, ofrece ver solo las primeras y últimas filas
+        altura: Altura máxima de la tabla en píxeles
+    """
+    @st.fragment
+    def _tabla():
+        col1, col2, col3 = st.columns([2, 1, 1])
+        
+        solo_extremos = False
+        if filas_extremos and total_filas > 2 * filas_extremos:
+            with col1:
+                solo_extremos = st.checkbox(
+                    f"Solo las primeras y últimas {filas_extremos} filas",
+                    value=True,
+                    key=f"{clave}_extremos"
+                )
+        
+        with col3:
+            filas_por_pagina = st.selectbox(
+                "Filas por página",
+                options=OPCIONES_FILAS_POR_PAGINA,
+                key=f"{clave}_filas",
+                disabled=solo_extremos
+            )
+        
+        # La página guardada se limita al nuevo total si cambian las filas por página
+        num_paginas = max(1, -(-total_filas // filas_por_pagina))
+        st.session_state[f"{clave}_pagina"] = min(st.session_state.get(f"{clave}_pagina", 1), num_paginas)
+        
+        with col2:
+            pagina = st.number_input(
+                f"Página (de {num_paginas:,})",
+                min_value=1,
+                max_value=num_paginas,
+                step=1,
+                key=f"{clave}_pagina",
+                disabled=solo_extremos
+            )
+        
+        if solo_extremos:
+            df_pagina = pd.concat(
+                [obtener_filas(0, filas_extremos), obtener_filas(total_filas - filas_extremos, total_filas)],
+                ignore_index=True
+            )
+            st.caption(f"Filas 1–{filas_extremos} y {total_filas - filas_extremos + 1:,}–{total_filas:,} de {total_filas:,}")
+        else:
+            inicio, fin = calcular_rango_pagina(total_filas, pagina, filas_por_pagina)
+            df_pagina = obtener_filas(inicio, fin)
+            st.caption(f"Filas {inicio + 1:,}–{fin:,} de {total_filas:,}")
+        
+        st.dataframe(
+            df_pagina,
+            column_config=configurar_columnas_numericas(declarar_formatos(df_pagina), separador_miles),
+            use_container_width=True,
+            hide_index=True,
+            height=min(altura, 35 * len(df_pagina) + 38)
+        )
+    
+    _tabla()
+
+
+def mostrar_descargas(
+    obtener_tabla,
+    nombre_archivo: str,
+    clave: str,
+    etiqueta: str = "📥 Descargar",
+    horizontal: bool = True
+):
+    """
+    Muestra un botón de descarga por formato (CSV y, si hay pyarrow, Parquet y Arrow).
+    
+    El archivo se genera recién cuando se hace clic: cada botón recibe una función
+    y no los bytes, así que los reruns no vuelven a convertir la tabla. El clic
+    tampoco provoca un rerun.
+    
+    Args:
+        obtener_tabla: Función sin argumentos que devuelve el DataFrame a exportar
+        nombre_archivo: Nombre del archivo sin extensión
+        clave: Prefijo único para las claves de los botones
+        etiqueta: Texto de los botones (se le agrega el formato)
+        horizontal: True para poner los botones lado a lado
+    """
+    formatos = [formato for formato in FORMATOS_EXPORTACION if formato == "CSV" or hay_soporte_columnar()]
+    contenedores = st.columns(len(formatos)) if horizontal else [st.container() for _ in formatos]
+    
+    for contenedor, formato in zip(contenedores, formatos):
+        extension, mime = FORMATOS_EXPORTACION[formato]
+        with contenedor:
+            st.download_button(
+                label=f"{etiqueta} ({formato})",
+                data=lambda formato=formato: exportar_tabla(obtener_tabla(), formato),
+                file_name=f"{nombre_archivo}.{extension}",
+                mime=mime,
+                key=f"descarga_{clave}_{extension}",
+                on_click="ignore",
+                use_container_width=True
+            )
 
 
 def mostrar_resumen_inversion(datos: dict):
@@ -20,10 +166,18 @@ def mostrar_resumen_inversion(datos: dict):
         )
     
     with col2:
-        st.metric(
-            label=f"Aporte {datos['frecuencia']}",
-            value=f"{MONEDA} {datos['aporte_periodico']:,.2f}"
-        )
+        if datos.get('aportes') is not None:
+            st.metric(
+                label="Aportes Irregulares (total)",
+                value=f"{MONEDA} {datos['aportes'].sum():,.2f}"
+            )
+        else:
+            crecimiento = datos.get('tasa_crecimiento_aportes', 0)
+            st.metric(
+                label=f"Aporte {datos['frecuencia']}",
+                value=f"{MONEDA} {datos['aporte_periodico']:,.2f}",
+                delta=f"+{crecimiento * 100:.2f}% {'por año' if datos['crecimiento_anual'] else 'por periodo'}" if crecimiento > 0 else None
+            )
     
     with col3:
         st.metric(
@@ -38,7 +192,14 @@ def mostrar_resumen_inversion(datos: dict):
         )
 
 
-def mostrar_resultados_vf(vf: float, inversion_total: float, beneficio_bruto: float):
+def mostrar_resultados_vf(
+    vf: float,
+    inversion_total: float,
+    beneficio_bruto: float,
+    vf_real: float = None,
+    inflacion: float = None,
+    inversion_total_real: float = None
+):
     """
     Muestra los resultados del cálculo de valor futuro.
     
@@ -46,6 +207,9 @@ def mostrar_resultados_vf(vf: float, inversion_total: float, beneficio_bruto: fl
         vf: Valor Futuro
         inversion_total: Inversión total realizada
         beneficio_bruto: Beneficio bruto (sin impuestos)
+        vf_real: Valor Futuro en valores de hoy (opcional)
+        inflacion: Inflación anual usada para vf_real (opcional)
+        inversion_total_real: Inversión total con cada aporte deflactado a su fecha (opcional)
     """
     st.subheader("💰 Valor Futuro de la Inversión")
     
@@ -71,6 +235,34 @@ def mostrar_resultados_vf(vf: float, inversion_total: float, beneficio_bruto: fl
             label="Rentabilidad",
             value=f"{rentabilidad_pct:.2f}%"
         )
+    
+    if vf_real is not None:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric(
+                label="Valor Futuro Real (hoy)",
+                value=f"{MONEDA} {vf_real:,.2f}",
+                help=f"Poder de compra del VF en valores de hoy con inflación de {inflacion*100:.2f}% anual"
+            )
+        
+        with col2:
+            st.metric(
+                label="Pérdida por Inflación",
+                value=f"{MONEDA} {vf - vf_real:,.2f}",
+                delta=f"-{(1 - vf_real / vf) * 100:.1f}%" if vf > 0 else None,
+                delta_color="inverse"
+            )
+        
+        with col3:
+            if inversion_total_real is None:
+                inversion_total_real = inversion_total
+            rentabilidad_real_pct = ((vf_real - inversion_total_real) / inversion_total_real * 100) if inversion_total_real > 0 else 0
+            st.metric(
+                label="Rentabilidad Real",
+                value=f"{rentabilidad_real_pct:.2f}%",
+                help="Compara el VF real con la inversión en valores de hoy (cada aporte deflactado a su fecha)"
+            )
 
 
 def mostrar_resultados_retiro_total(
@@ -78,7 +270,8 @@ def mostrar_resultados_retiro_total(
     beneficio_bruto: float,
     impuesto: float,
     monto_neto: float,
-    tipo_bolsa: str
+    tipo_bolsa: str,
+    monto_neto_real: float = None
 ):
     """
     Muestra los resultados de un retiro total.
@@ -89,6 +282,7 @@ def mostrar_resultados_retiro_total(
         impuesto: Monto de impuesto
         monto_neto: Monto neto después de impuestos
         tipo_bolsa: Tipo de inversión (Nacional/Extranjera)
+        monto_neto_real: Monto neto en valores de hoy (opcional)
     """
     st.subheader("🏦 Retiro Total")
     
@@ -119,6 +313,13 @@ def mostrar_resultados_retiro_total(
         )
     
     st.info(f"💡 Se aplicó un impuesto del **{tasa_impuesto}** sobre la ganancia de {MONEDA} {beneficio_bruto:,.2f}")
+    
+    if monto_neto_real is not None:
+        st.metric(
+            label="Monto Neto Real (hoy)",
+            value=f"{MONEDA} {monto_neto_real:,.2f}",
+            help="Poder de compra del monto neto en valores de hoy"
+        )
 
 
 def mostrar_resultados_retiro_mensual(
@@ -128,7 +329,9 @@ def mostrar_resultados_retiro_mensual(
     capital_neto: float,
     impuesto: float = None,
     tipo_bolsa: str = None,
-    retiro_mensual_bruto: float = None
+    retiro_mensual_bruto: float = None,
+    retiro_real_inicial: float = None,
+    retiro_real_final: float = None
 ):
     """
     Muestra los resultados de retiros mensuales.
@@ -141,6 +344,8 @@ def mostrar_resultados_retiro_mensual(
         impuesto: Monto total de impuestos sobre intereses mensuales
         tipo_bolsa: Tipo de inversión (solo informativo)
         retiro_mensual_bruto: Retiro mensual antes de impuestos (opcional)
+        retiro_real_inicial: Retiro neto del primer mes en valores de hoy (opcional)
+        retiro_real_final: Retiro neto del último mes en valores de hoy (opcional)
     """
     st.subheader("💳 Retiros Mensuales")
     
@@ -203,3 +408,83 @@ def mostrar_resultados_retiro_mensual(
         st.info(f"💡 **Retiro Mensual**: Se aplica un impuesto del **5%** sobre los intereses generados cada mes (independiente del tipo de bolsa)")
     else:
         st.info(f"💡 Se utilizará el capital de {MONEDA} {capital_neto:,.2f} para generar estos retiros mensuales")
+    
+    if retiro_real_inicial is not None:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.metric(
+                label="Primer Retiro Neto Real (hoy)",
+                value=f"{MONEDA} {retiro_real_inicial:,.2f}",
+                help="Poder de compra del primer retiro en valores de hoy"
+            )
+        
+        with col2:
+            st.metric(
+                label="Último Retiro Neto Real (hoy)",
+                value=f"{MONEDA} {retiro_real_final:,.2f}",
+                delta=f"{(retiro_real_final / retiro_real_inicial - 1) * 100:.1f}%" if retiro_real_inicial > 0 else None,
+                help="El retiro nominal es fijo; la inflación reduce su poder de compra mes a mes"
+            )
+
+
+def mostrar_descarga_pdf(
+    espacio: str,
+    funcion,
+    parametros: dict,
+    file_name: str,
+    label: str = "📥 Descargar PDF"
+):
+    """
+    Genera un PDF en segundo plano y muestra su progreso hasta habilitar la descarga.
+    
+    Si las entradas cambian respecto al trabajo en curso, este se cancela y se
+    lanza uno nuevo. Solo este bloque se refresca mientras el PDF se genera; al
+    terminar se hace un rerun completo para que deje de refrescarse.
+    
+    Args:
+        espacio: Identificador del PDF en la sesión ("acciones" o "bonos")
+        funcion: Función generadora (crear_pdf_acciones o crear_pdf_bonos)
+        parametros: Argumentos para la función generadora
+        file_name: Nombre del archivo descargado
+        label: Texto del botón de descarga
+    """
+    trabajos = st.session_state.setdefault("trabajos_pdf", {})
+    clave = generar_clave(f"pdf.{espacio}", parametros)
+    trabajo = trabajos.get(espacio)
+    
+    if trabajo is None or trabajo['clave'] != clave:
+        cancelar_trabajo_pdf(trabajo)
+        contexto = get_script_run_ctx()
+        sesion = contexto.session_id if contexto is not None else None
+        trabajo = iniciar_trabajo_pdf(clave, funcion, sesion=sesion, **parametros)
+        trabajos[espacio] = trabajo
+    
+    en_curso = not estado_trabajo_pdf(trabajo)['listo']
+    
+    @st.fragment(run_every=0.5 if en_curso else None)
+    def _estado_pdf():
+        estado = estado_trabajo_pdf(trabajos[espacio])
+        
+        if en_curso and estado['listo']:
+            # El fragmento quedó registrado con run_every: se vuelve a registrar sin él
+            st.rerun()
+        
+        if estado['en_espera']:
+            st.progress(0.0, text="⏳ Esperando a que termine el otro PDF de la sesión...")
+        elif not estado['listo']:
+            st.progress(estado['progreso'], text=f"⏳ Generando PDF... {estado['progreso'] * 100:.0f}%")
+        elif estado['error']:
+            st.error(f"⚠️ No se pudo generar el PDF: {estado['error']}")
+        else:
+            st.download_button(
+                label=label,
+                data=estado['pdf'],
+                file_name=file_name,
+                mime="application/pdf",
+                on_click="ignore",
+                use_container_width=True,
+                type="primary"
+            )
+    
+    _estado_pdf()
@@ -1,5 +1,8 @@
 import streamlit as st
-from config.constants import FRECUENCIAS, MONEDA
+import pandas as pd
+from config.constants import FRECUENCIAS, MONEDA, APORTES_EDITOR_MAX_FILAS
+from src.utils.helpers import cargar_aportes_csv, expandir_aportes_anuales
+from src.calculations.financial_calcs import calcular_tasa_periodo
 
 
 def render_formulario_entrada():
@@ -36,6 +39,13 @@ def render_formulario_entrada():
     
     with col2:
         st.subheader("Aportes Periódicos")
+        tipo_aportes = st.radio(
+            "Tipo de aportes",
+            options=["Constantes", "Irregulares"],
+            horizontal=True,
+            help="Irregulares: un monto distinto por periodo (meses sin aporte, bonos, cambios de monto)"
+        )
+        
         aporte_periodico = st.number_input(
             f"Aporte periódico ({MONEDA})",
             min_value=0.0,
@@ -48,15 +58,46 @@ def render_formulario_entrada():
         frecuencia = st.selectbox(
             "Frecuencia de aportes",
             options=list(FRECUENCIAS.keys()),
-            index=0,
+            index=list(FRECUENCIAS.keys()).index("Mensual"),
             help="¿Con qué frecuencia realizarás los aportes?"
         )
         
+        tasa_crecimiento_pct = 0.0
+        crecimiento_anual = True
+        if tipo_aportes == "Constantes":
+            tasa_crecimiento_pct = st.number_input(
+                "Crecimiento del aporte (% anual)",
+                min_value=0.0,
+                max_value=30.0,
+                value=0.0,
+                step=0.5,
+                format="%.2f",
+                help="Porcentaje en que sube el aporte (ej. con el aumento de sueldo)"
+            )
+            if tasa_crecimiento_pct > 0:
+                crecimiento_anual = st.radio(
+                    "El aporte crece",
+                    options=["Cada año", "Cada periodo"],
+                    horizontal=True
+                ) == "Cada año"
+        
+        # Si el aporte sube cada periodo, se usa la tasa equivalente por periodo
+        tasa_crecimiento = tasa_crecimiento_pct / 100
+        if not crecimiento_anual:
+            tasa_crecimiento = calcular_tasa_periodo(tasa_crecimiento, FRECUENCIAS[frecuencia])
+        
+        capitalizacion_continua = st.checkbox(
+            "Capitalización continua de aportes",
+            value=False,
+            help="Los aportes ingresan como un flujo continuo y generan intereses desde el instante en que se invierten (δ = ln(1 + TEA))."
+        )
+        
         aporte_al_inicio = st.checkbox(
             "Aporte al inicio del periodo",
             value=False,
+            disabled=capitalizacion_continua,
             help="Si está marcado, el aporte se realiza al inicio del periodo (anualidad anticipada). Si no, se realiza al final (anualidad vencida)."
-        )
+        ) and not capitalizacion_continua
     
     st.divider()
     
@@ -105,6 +146,16 @@ def render_formulario_entrada():
             help="Tasa de retorno anual esperada (máximo 50%)"
         )
         
+        inflacion_pct = st.number_input(
+            "Inflación anual (%)",
+            min_value=0.0,
+            max_value=30.0,
+            value=0.0,
+            step=0.5,
+            format="%.2f",
+            help="Si es mayor a 0, los resultados también se muestran en valores de hoy"
+        )
+        
         tipo_bolsa = st.selectbox(
             "Tipo de inversión",
             options=["Nacional", "Extranjera"],
@@ -117,6 +168,10 @@ def render_formulario_entrada():
         else:
             st.warning("💛 Impuesto: 29.5%")
     
+    aportes = None
+    if tipo_aportes == "Irregulares":
+        aportes = render_aportes_irregulares(aporte_periodico, plazo_años, FRECUENCIAS[frecuencia])
+    
     return {
         "edad_actual": edad_actual,
         "valor_presente": valor_presente,
@@ -126,6 +181,82 @@ def render_formulario_entrada():
         "plazo_años": plazo_años,
         "tea": tea_pct / 100,  # Convertir a decimal
         "tea_pct": tea_pct,
+        "inflacion": inflacion_pct / 100,
         "tipo_bolsa": tipo_bolsa,
-        "aporte_al_inicio": aporte_al_inicio
+        "aporte_al_inicio": aporte_al_inicio,
+        "capitalizacion_continua": capitalizacion_continua,
+        "aportes": aportes,
+        "tasa_crecimiento_aportes": tasa_crecimiento,
+        "crecimiento_anual": crecimiento_anual
     }
+
+
+def render_aportes_irregulares(aporte_base: float, plazo_años: int, frecuencia_anual: int):
+    """
+    Renderiza la carga (CSV) o edición de aportes distintos por periodo.
+    
+    El editor tiene una fila por periodo hasta APORTES_EDITOR_MAX_FILAS periodos; con
+    más (ej. aportes diarios a largo plazo) se edita un aporte por periodo para cada
+    año, y los montos periodo a periodo se cargan por CSV.
+    
+    Args:
+        aporte_base: Aporte usado para prellenar el editor
+        plazo_años: Plazo en años
+        frecuencia_anual: Número de periodos por año
+    
+    Returns:
+        Array de aportes por periodo (ajustado al plazo más adelante)
+    """
+    st.divider()
+    st.subheader("Aportes Irregulares")
+    
+    num_periodos = plazo_años * frecuencia_anual
+    archivo = st.file_uploader(
+        "Cargar historial de aportes (CSV)",
+        type=["csv"],
+        help="Columna 'aporte' con un monto por periodo; opcionalmente una columna 'periodo'"
+    )
+    
+    if archivo is not None:
+        try:
+            aportes = cargar_aportes_csv(archivo)
+        except ValueError as error:
+            st.error(f"⚠️ {error}")
+            return None
+        st.info(f"📂 {len(aportes)} periodos cargados | Total: {MONEDA} {aportes.sum():,.2f}")
+        if len(aportes) != num_periodos:
+            st.warning(f"⚠️ El plazo tiene {num_periodos} periodos: los faltantes se consideran sin aporte y los sobrantes se ignoran.")
+        return aportes
+    
+    if num_periodos <= APORTES_EDITOR_MAX_FILAS:
+        df_aportes = st.data_editor(
+            pd.DataFrame({
+                'Periodo': range(1, num_periodos + 1),
+                f'Aporte ({MONEDA})': [aporte_base] * num_periodos
+            }),
+            key="editor_aportes",
+            hide_index=True,
+            disabled=['Periodo'],
+            use_container_width=True,
+            height=300
+        )
+        return df_aportes[f'Aporte ({MONEDA})'].fillna(0.0).to_numpy(dtype=float)
+    
+    st.caption(
+        f"📌 El plazo tiene {num_periodos:,} periodos: se edita el aporte de cada periodo año por año. "
+        "Para montos distintos en cada periodo, carga un CSV."
+    )
+    df_aportes = st.data_editor(
+        pd.DataFrame({
+            'Año': range(1, plazo_años + 1),
+            f'Aporte por Periodo ({MONEDA})': [aporte_base] * plazo_años
+        }),
+        key="editor_aportes_anuales",
+        hide_index=True,
+        disabled=['Año'],
+        use_container_width=True,
+        height=300
+    )
+    return expandir_aportes_anuales(
+        df_aportes[f'Aporte por Periodo ({MONEDA})'].fillna(0.0).to_numpy(dtype=float), frecuencia_anual
+    )
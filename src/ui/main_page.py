@@ -1,32 +1,55 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 from src.ui.input_form import render_formulario_entrada
 from src.ui.display import (
     mostrar_resumen_inversion,
     mostrar_resultados_vf,
     mostrar_resultados_retiro_total,
-    mostrar_resultados_retiro_mensual
+    mostrar_resultados_retiro_mensual,
+    mostrar_descarga_pdf,
+    mostrar_tabla_paginada,
+    mostrar_descargas,
+    configurar_columnas_numericas
 )
 from src.ui.comparacion import render_comparacion_escenarios
-from src.calculations.financial_calcs import calcular_vf_combinado, calcular_beneficio_bruto
+from src.calculations.financial_calcs import (
+    calcular_vf_combinado,
+    calcular_beneficio_bruto,
+    ajustar_aportes,
+    calcular_total_aportes,
+    generar_trayectorias_estres,
+    deflactar
+)
 from src.calculations.tax_calcs import (
     calcular_impuesto_retiro_total,
     calcular_monto_neto_retiro_total,
-    calcular_tasa_mensual_retiro,
-    calcular_retiro_mensual_con_impuestos
+    calcular_tasa_mensual_retiro
 )
+from src.calculations.lifecycle_calcs import calcular_ciclo_vida, resumir_retiro_ciclo
 from src.visualization.charts import (
-    generar_evolucion_inversion,
+    generar_evolucion_desde_tabla,
     crear_grafico_comparativo,
-    crear_grafico_composicion
+    crear_grafico_composicion,
+    crear_grafico_distribucion,
+    crear_grafico_ciclo_vida
 )
 from src.utils.tables import (
     generar_tabla_crecimiento,
-    formatear_tabla_crecimiento,
-    generar_resumen_tabla
+    generar_ventana_vista,
+    generar_resumen_crecimiento,
+    seleccionar_vista,
+    contar_filas_vista,
+    generar_cronograma_ciclo,
+    generar_resumen_cronograma_retiros,
+    generar_tabla_ciclo_vida,
+    etiquetar_tabla,
+    declarar_formatos
 )
 from src.utils.pdf_generator import crear_pdf_acciones
-from config.constants import MONEDA
+from src.utils.helpers import validar_datos_entrada, cargar_retornos_csv
+from src.calculations.backtest import ejecutar_backtest
+from config.constants import MONEDA, BACKTEST_MUESTRAS, BACKTEST_BLOQUE_MESES
 
 
 def render_acciones_page():
@@ -47,9 +70,17 @@ def render_acciones_page():
     # Formulario de entrada
     datos = render_formulario_entrada()
     
+    # Aporte constante o array de aportes por periodo
+    num_periodos = datos["frecuencia_anual"] * datos["plazo_años"]
+    if datos["aportes"] is not None:
+        aporte = ajustar_aportes(datos["aportes"], num_periodos)
+    else:
+        aporte = datos["aporte_periodico"]
+    
     # Validación de datos
-    if datos["valor_presente"] <= 0 and datos["aporte_periodico"] <= 0:
-        st.warning("⚠️ Debes ingresar al menos una inversión inicial o un aporte periódico.")
+    es_valido, mensaje_error = validar_datos_entrada(datos["valor_presente"], aporte)
+    if not es_valido:
+        st.warning(f"⚠️ {mensaje_error}")
         return
     
     st.divider()
@@ -62,31 +93,56 @@ def render_acciones_page():
     # Calcular Valor Futuro
     vf = calcular_vf_combinado(
         vp=datos["valor_presente"],
-        aporte=datos["aporte_periodico"],
+        aporte=aporte,
         tea=datos["tea"],
         frecuencia_anual=datos["frecuencia_anual"],
         plazo_años=datos["plazo_años"],
-        aporte_al_inicio=datos["aporte_al_inicio"]
+        aporte_al_inicio=datos["aporte_al_inicio"],
+        capitalizacion_continua=datos["capitalizacion_continua"],
+        tasa_crecimiento=datos["tasa_crecimiento_aportes"],
+        crecimiento_anual=datos["crecimiento_anual"]
     )
     
     # Calcular inversión total y beneficio
-    total_aportes = datos["aporte_periodico"] * datos["frecuencia_anual"] * datos["plazo_años"]
+    if datos["aportes"] is not None:
+        total_aportes = float(np.sum(aporte))
+    else:
+        total_aportes = calcular_total_aportes(
+            datos["aporte_periodico"], num_periodos, datos["tasa_crecimiento_aportes"],
+            datos["frecuencia_anual"], datos["crecimiento_anual"]
+        )
     inversion_total = datos["valor_presente"] + total_aportes
     beneficio_bruto = calcular_beneficio_bruto(vf, inversion_total)
     
-    # Generar tabla de crecimiento (se usará para PDF y visualización)
-    df_tabla_crecimiento = generar_tabla_crecimiento(
+    # Parámetros comunes de las tablas; la tabla completa solo se arma al descargarla
+    parametros_tabla = dict(
         vp=datos["valor_presente"],
-        aporte=datos["aporte_periodico"],
+        aporte=aporte,
         tea=datos["tea"],
         frecuencia_anual=datos["frecuencia_anual"],
         plazo_años=datos["plazo_años"],
-        moneda=MONEDA,
-        aporte_al_inicio=datos["aporte_al_inicio"]
+        aporte_al_inicio=datos["aporte_al_inicio"],
+        capitalizacion_continua=datos["capitalizacion_continua"],
+        tasa_crecimiento=datos["tasa_crecimiento_aportes"],
+        crecimiento_anual=datos["crecimiento_anual"],
+        inflacion=datos["inflacion"]
     )
     
+    # Vista agregada (mensual/anual) para horizontes con demasiados periodos; gráfico y PDF
+    # la reciben calculada en los cierres de cada grupo, sin recorrer todos los periodos
+    vista = seleccionar_vista(num_periodos, datos["frecuencia_anual"])
+    etiqueta_vista = {"Periodo": "Periodo", "Mensual": "Mes", "Anual": "Año"}
+    filas_vista = contar_filas_vista(num_periodos, datos["frecuencia_anual"], vista)
+    df_tabla_vista = generar_ventana_vista(vista=vista, inicio=0, fin=filas_vista, **parametros_tabla)
+    resumen = generar_resumen_crecimiento(**parametros_tabla)
+    
     # Mostrar resultados VF
-    mostrar_resultados_vf(vf, inversion_total, beneficio_bruto)
+    # Valores reales (poder de compra de hoy) si se indicó inflación
+    hay_inflacion = datos["inflacion"] > 0
+    vf_real = deflactar(vf, datos["inflacion"], datos["plazo_años"]) if hay_inflacion else None
+    inversion_total_real = datos["valor_presente"] + resumen['total_aportes_real'] if hay_inflacion else None
+    
+    mostrar_resultados_vf(vf, inversion_total, beneficio_bruto, vf_real, datos["inflacion"], inversion_total_real)
     
     st.divider()
     
@@ -94,29 +150,17 @@ def render_acciones_page():
     st.header("📈 Evolución de la Inversión")
     
     # Tabs para gráfico y tabla
-    tab1, tab2 = st.tabs(["📊 Gráfico", "📋 Tabla Detallada"])
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Gráfico", "📋 Tabla Detallada", "🧪 Estrés de Tasas", "📜 Backtest Histórico"])
     
     with tab1:
-        df_evolucion = generar_evolucion_inversion(
-            vp=datos["valor_presente"],
-            aporte=datos["aporte_periodico"],
-            tea=datos["tea"],
-            frecuencia_anual=datos["frecuencia_anual"],
-            plazo_años=datos["plazo_años"],
-            aporte_al_inicio=datos["aporte_al_inicio"]
-        )
-        fig_evolucion = crear_grafico_comparativo(df_evolucion, MONEDA)
+        df_evolucion = generar_evolucion_desde_tabla(df_tabla_vista, datos["valor_presente"])
+        fig_evolucion = crear_grafico_comparativo(df_evolucion, MONEDA, etiqueta_vista[vista])
         st.plotly_chart(fig_evolucion, use_container_width=True)
     
     with tab2:
         st.subheader("📋 Tabla de Crecimiento Detallada")
         
-        # Usar la tabla ya generada
-        df_tabla = df_tabla_crecimiento
-        
-        # Mostrar resumen de la tabla
-        resumen = generar_resumen_tabla(df_tabla, MONEDA)
-        
+        # Resumen con formas cerradas (VF y totales), sin generar la tabla
         st.markdown("#### 📊 Resumen General")
         col1, col2, col3, col4 = st.columns(4)
         
@@ -146,49 +190,115 @@ def render_acciones_page():
                 delta=f"+{((resumen['saldo_final']/resumen['saldo_inicial'] - 1) * 100):.1f}%" if resumen['saldo_inicial'] > 0 else "N/A"
             )
         
+        if 'saldo_final_real' in resumen:
+            st.caption(
+                f"En valores de hoy: aportes {MONEDA} {resumen['total_aportes_real']:,.2f} | "
+                f"saldo final {MONEDA} {resumen['saldo_final_real']:,.2f}"
+            )
+        
         st.divider()
         
         # Mostrar tabla con paginación
         st.markdown("#### 📋 Detalle por Periodo")
         
-        # Opciones de visualización
-        col1, col2 = st.columns([3, 1])
+        # Cualquier resolución se pagina: cada página se calcula con la forma cerrada
+        resoluciones = ["Periodo"]
+        if datos["frecuencia_anual"] > 12:
+            resoluciones.append("Mensual")
+        if datos["frecuencia_anual"] > 1:
+            resoluciones.append("Anual")
+        resolucion = st.radio(
+            "Resolución de la tabla",
+            options=resoluciones,
+            index=resoluciones.index(vista) if vista in resoluciones else 0,
+            horizontal=True,
+            key="resolucion_tabla_crecimiento"
+        )
+        filas_tabla = contar_filas_vista(num_periodos, datos["frecuencia_anual"], resolucion)
+        
+        if resolucion == "Periodo":
+            st.info(f"📌 Total de periodos: **{filas_tabla:,}** | Frecuencia: **{datos['frecuencia']}**")
+        else:
+            st.info(f"📌 {num_periodos:,} periodos agregados en vista **{resolucion}** ({filas_tabla:,} filas) | Frecuencia: **{datos['frecuencia']}**")
+        
+        def obtener_filas(inicio, fin):
+            return etiquetar_tabla(generar_ventana_vista(vista=resolucion, inicio=inicio, fin=fin, **parametros_tabla), MONEDA)
+        
+        mostrar_tabla_paginada(obtener_filas, filas_tabla, clave=f"tabla_crecimiento_{resolucion}", altura=600)
+        
+        # Botones de descarga (la tabla completa se genera solo al hacer clic)
+        st.caption(f"📥 Descargar tabla completa - {num_periodos:,} periodos")
+        mostrar_descargas(
+            lambda: etiquetar_tabla(generar_tabla_crecimiento(**parametros_tabla), MONEDA),
+            nombre_archivo=f"crecimiento_inversion_{datos['plazo_años']}años",
+            clave="tabla_crecimiento",
+            etiqueta="📥 Tabla completa"
+        )
+    
+    with tab3:
+        st.subheader("🧪 Prueba de Estrés de Tasas")
+        st.markdown("Compara tu resultado si algunos años rinden menos que la TEA, al inicio o al final del plazo.")
+        
+        col1, col2 = st.columns(2)
         
         with col1:
-            st.info(f"📌 Total de periodos: **{len(df_tabla)}** | Frecuencia: **{datos['frecuencia']}**")
+            tea_estres_pct = st.number_input(
+                "TEA en años malos (%)",
+                min_value=-50.0,
+                max_value=50.0,
+                value=-10.0,
+                step=1.0,
+                format="%.2f"
+            )
         
         with col2:
-            mostrar_todos = st.checkbox("Mostrar todos", value=False)
-        
-        if not mostrar_todos and len(df_tabla) > 20:
-            st.warning(f"⚠️ Mostrando primeros 20 periodos de {len(df_tabla)}. Activa 'Mostrar todos' para ver la tabla completa.")
-            df_mostrar = df_tabla.head(20)
-        else:
-            df_mostrar = df_tabla
+            años_estres = st.number_input(
+                "Años malos consecutivos",
+                min_value=1,
+                max_value=int(datos["plazo_años"]),
+                value=min(3, int(datos["plazo_años"])),
+                step=1
+            )
         
-        # Formatear y mostrar tabla
-        df_formatted = formatear_tabla_crecimiento(df_mostrar)
+        # Todas las trayectorias se evalúan en una sola llamada
+        estres = generar_trayectorias_estres(datos["tea"], tea_estres_pct / 100, años_estres, datos["plazo_años"])
+        vf_estres = calcular_vf_combinado(
+            vp=datos["valor_presente"],
+            aporte=aporte,
+            tea=estres['trayectorias'],
+            frecuencia_anual=datos["frecuencia_anual"],
+            plazo_años=datos["plazo_años"],
+            aporte_al_inicio=datos["aporte_al_inicio"],
+            capitalizacion_continua=datos["capitalizacion_continua"],
+            tasa_crecimiento=datos["tasa_crecimiento_aportes"],
+            crecimiento_anual=datos["crecimiento_anual"]
+        )
         
+        df_estres = pd.DataFrame({
+            'Trayectoria': estres['nombres'],
+            f'Valor Futuro ({MONEDA})': np.round(vf_estres, 2),
+            'Diferencia (%)': np.round((vf_estres / vf_estres[0] - 1) * 100, 1)
+        })
+        formatos_estres = declarar_formatos(df_estres)
+        formatos_estres['Diferencia (%)'] = 1
         st.dataframe(
-            df_formatted,
+            df_estres,
+            column_config=configurar_columnas_numericas(formatos_estres),
             use_container_width=True,
-            hide_index=True,
-            height=min(600, 35 * len(df_mostrar) + 38)
+            hide_index=True
         )
         
-        # Información adicional
-        if len(df_tabla) > 20 and not mostrar_todos:
-            st.info(f"💡 Se están ocultando {len(df_tabla) - 20} periodos. Descarga la tabla completa o activa 'Mostrar todos'.")
-        
-        # Botón de descarga
-        csv = df_tabla.to_csv(index=False).encode('utf-8')
-        st.download_button(
-            label=f"📥 Descargar tabla completa (CSV) - {len(df_tabla)} periodos",
-            data=csv,
-            file_name=f"crecimiento_inversion_{datos['plazo_años']}años.csv",
-            mime="text/csv",
-            use_container_width=True
-        )
+        # Sin aportes el orden de los años no cambia el VF; con aportes, los años al final pesan sobre más saldo
+        vf_inicio, vf_final = vf_estres[1], vf_estres[2]
+        if vf_final < vf_inicio - 0.005:
+            st.info("💡 Los años malos al final del plazo pesan más porque afectan al saldo ya acumulado.")
+        elif vf_inicio < vf_final - 0.005:
+            st.info("💡 Aquí los años al final del plazo suben más el resultado: con una TEA mayor que la base, el saldo ya acumulado rinde más.")
+        else:
+            st.info("💡 Aquí el orden de los años casi no cambia el valor futuro (sin aportes no lo cambia en absoluto).")
+    
+    with tab4:
+        render_backtest(datos, aporte)
     
     st.divider()
     
@@ -212,7 +322,8 @@ def render_acciones_page():
             beneficio_bruto=beneficio_bruto,
             impuesto=impuesto,
             monto_neto=monto_neto,
-            tipo_bolsa=datos["tipo_bolsa"]
+            tipo_bolsa=datos["tipo_bolsa"],
+            monto_neto_real=deflactar(monto_neto, datos["inflacion"], datos["plazo_años"]) if hay_inflacion else None
         )
         
         # Gráfico de composición
@@ -242,15 +353,30 @@ def render_acciones_page():
         with col2:
             st.info(f"📅 Equivale a **{meses_retiro/12:.1f} años** de retiros")
         
-        # Calcular retiro mensual con impuestos
+        # Ciclo de vida completo: acumulación y retiros en un solo camino mensual
         tasa_mensual_retiro = calcular_tasa_mensual_retiro(datos["tea"])
-        resultado_retiro = calcular_retiro_mensual_con_impuestos(
-            vf=vf,
-            beneficio_bruto=beneficio_bruto,
-            tasa_mensual_retiro=tasa_mensual_retiro,
-            meses=meses_retiro,
-            tipo_bolsa=datos["tipo_bolsa"]
+        ciclo = calcular_ciclo_vida(
+            vp=datos["valor_presente"],
+            aporte=aporte,
+            tea=datos["tea"],
+            frecuencia_anual=datos["frecuencia_anual"],
+            plazo_años=datos["plazo_años"],
+            meses_retiro=meses_retiro,
+            edad_actual=datos["edad_actual"],
+            aporte_al_inicio=datos["aporte_al_inicio"],
+            capitalizacion_continua=datos["capitalizacion_continua"],
+            tasa_crecimiento=datos["tasa_crecimiento_aportes"],
+            crecimiento_anual=datos["crecimiento_anual"],
+            inflacion=datos["inflacion"]
         )
+        resultado_retiro = resumir_retiro_ciclo(ciclo)
+        df_ciclo = generar_tabla_ciclo_vida(ciclo)
+        
+        # Cronograma de retiros tomado del mismo ciclo (incluye las columnas reales si hay inflación)
+        df_cronograma = generar_cronograma_ciclo(ciclo)
+        
+        # Resumen del cronograma
+        resumen_cronograma = generar_resumen_cronograma_retiros(df_cronograma)
         
         mostrar_resultados_retiro_mensual(
             retiro_mensual=resultado_retiro['retiro_mensual'],
@@ -259,12 +385,14 @@ def render_acciones_page():
             capital_neto=resultado_retiro['capital_neto'],
             impuesto=resultado_retiro['impuesto'],
             tipo_bolsa=datos["tipo_bolsa"],
-            retiro_mensual_bruto=resultado_retiro.get('retiro_mensual_bruto')
+            retiro_mensual_bruto=resultado_retiro.get('retiro_mensual_bruto'),
+            retiro_real_inicial=resumen_cronograma.get('retiro_real_inicial'),
+            retiro_real_final=resumen_cronograma.get('retiro_real_final')
         )
         
         st.info(f"""
         💡 **Nota sobre retiros mensuales:**
-        - Base de cálculo: Valor Futuro completo ({MONEDA} {vf:,.2f})
+        - Base de cálculo: Valor Futuro completo ({MONEDA} {resultado_retiro['capital_neto']:,.2f})
         - Tasa mensual de retiro: (1/2) × TEA = {tasa_mensual_retiro*100:.2f}%
         - Impuesto del **5%** aplicado mensualmente solo a los intereses generados
         - Retiro mensual bruto: {MONEDA} {resultado_retiro.get('retiro_mensual_bruto', 0):,.2f}
@@ -277,19 +405,6 @@ def render_acciones_page():
         # Cronograma de retiros
         st.subheader("📅 Cronograma de Retiros Mensuales")
         
-        from src.utils.tables import generar_cronograma_retiros, generar_resumen_cronograma_retiros
-        
-        # Generar cronograma
-        df_cronograma = generar_cronograma_retiros(
-            vf=vf,
-            tasa_mensual_retiro=tasa_mensual_retiro,
-            meses=meses_retiro,
-            moneda=MONEDA
-        )
-        
-        # Resumen del cronograma
-        resumen_cronograma = generar_resumen_cronograma_retiros(df_cronograma, MONEDA)
-        
         st.markdown("#### 📊 Resumen del Cronograma")
         col1, col2, col3, col4 = st.columns(4)
         
@@ -320,49 +435,46 @@ def render_acciones_page():
                 value=f"{MONEDA} {resumen_cronograma['total_retiro_neto']:,.2f}"
             )
         
+        if 'total_retiro_neto_real' in resumen_cronograma:
+            st.caption(f"Total neto retirado en valores de hoy: {MONEDA} {resumen_cronograma['total_retiro_neto_real']:,.2f}")
+        
         st.divider()
         
         # Mostrar tabla con opciones
         st.markdown("#### 📋 Detalle Mes a Mes")
         
-        # Opciones de visualización
-        col1, col2 = st.columns([2, 1])
+        formato_miles = st.checkbox(
+            "Formato con separador de miles",
+            value=True,
+            help="Mostrar números con comas como separadores"
+        )
         
-        with col1:
-            mostrar_todos_meses = st.checkbox(
-                "Mostrar todos los meses",
-                value=False,
-                help="Si está desmarcado, muestra solo los primeros 12 y últimos 12 meses"
-            )
+        def obtener_meses(inicio, fin):
+            return etiquetar_tabla(generar_cronograma_ciclo(ciclo, inicio, fin), MONEDA)
         
-        with col2:
-            formato_miles = st.checkbox(
-                "Formato con separador de miles",
-                value=True,
-                help="Mostrar números con comas como separadores"
-            )
+        mostrar_tabla_paginada(
+            obtener_meses,
+            meses_retiro,
+            clave="tabla_retiros",
+            separador_miles=formato_miles,
+            filas_extremos=12
+        )
         
-        # Preparar tabla para mostrar
-        if mostrar_todos_meses:
-            df_mostrar = df_cronograma.copy()
-        else:
-            if len(df_cronograma) > 24:
-                df_primeros = df_cronograma.head(12)
-                df_ultimos = df_cronograma.tail(12)
-                df_mostrar = pd.concat([df_primeros, df_ultimos])
-                st.info(f"📌 Mostrando los primeros 12 y últimos 12 meses de {meses_retiro} meses totales")
-            else:
-                df_mostrar = df_cronograma.copy()
-        
-        # Formatear para visualización
-        if formato_miles:
-            df_display = df_mostrar.copy()
-            for col in df_display.columns:
-                if col != 'Mes':
-                    df_display[col] = df_display[col].apply(lambda x: f"{x:,.2f}")
-            st.dataframe(df_display, use_container_width=True, height=400)
-        else:
-            st.dataframe(df_mostrar, use_container_width=True, height=400)
+        st.divider()
+        
+        # Camino completo desde hoy hasta el último retiro
+        st.subheader("🧭 Ciclo de Vida Completo")
+        
+        fig_ciclo = crear_grafico_ciclo_vida(ciclo, ["Tu plan"], MONEDA)
+        st.plotly_chart(fig_ciclo, use_container_width=True)
+        
+        st.caption(f"📥 Descargar ciclo de vida - {len(df_ciclo)} meses")
+        mostrar_descargas(
+            lambda: etiquetar_tabla(df_ciclo, MONEDA),
+            nombre_archivo=f"ciclo_vida_{datos['edad_actual']}_{datos['edad_actual'] + datos['plazo_años']}",
+            clave="ciclo_vida",
+            etiqueta="📥 Ciclo de vida"
+        )
     
     st.divider()
     
@@ -379,7 +491,8 @@ def render_acciones_page():
         resultados_vf_pdf = {
             'vf': vf,
             'inversion_total': inversion_total,
-            'beneficio_bruto': beneficio_bruto
+            'beneficio_bruto': beneficio_bruto,
+            'vf_real': vf_real
         }
         
         if tipo_retiro == "Retiro Total":
@@ -396,26 +509,24 @@ def render_acciones_page():
                 'capital_neto': resultado_retiro['capital_neto'],
                 'retiro_mensual': resultado_retiro['retiro_mensual'],
                 'meses': meses_retiro,
-                'total_retirado': resultado_retiro['total_retirado']
+                'total_retirado': resultado_retiro['total_retirado'],
+                'total_retirado_real': resumen_cronograma.get('total_retiro_neto_real')
             }
             tipo_retiro_pdf = "mensual"
         
-        # Generar PDF
-        pdf_buffer = crear_pdf_acciones(
-            datos_entrada=datos,
-            resultados_vf=resultados_vf_pdf,
-            resultados_retiro=resultados_retiro_pdf,
-            tipo_retiro=tipo_retiro_pdf,
-            df_tabla=df_tabla_crecimiento
-        )
-        
-        st.download_button(
-            label="📥 Descargar PDF",
-            data=pdf_buffer,
-            file_name=f"reporte_acciones_{datos['plazo_años']}años.pdf",
-            mime="application/pdf",
-            use_container_width=True,
-            type="primary"
+        # Generar PDF en segundo plano
+        mostrar_descarga_pdf(
+            espacio="acciones",
+            funcion=crear_pdf_acciones,
+            parametros={
+                'datos_entrada': datos,
+                'resultados_vf': resultados_vf_pdf,
+                'resultados_retiro': resultados_retiro_pdf,
+                'tipo_retiro': tipo_retiro_pdf,
+                'df_tabla': df_tabla_vista,
+                'df_ciclo_vida': df_ciclo if tipo_retiro == "Retiros Mensuales" else None
+            },
+            file_name=f"reporte_acciones_{datos['plazo_años']}años.pdf"
         )
     
     st.divider()
@@ -444,10 +555,99 @@ def render_acciones_page():
         **Capitalización:**
         - La TEA se convierte a tasa efectiva del periodo
         - Fórmula: tasa_periodo = (1 + TEA)^(1/n) - 1
-        - Donde n es la frecuencia anual (12=mensual, 4=trimestral, etc.)
+        - Donde n es la frecuencia anual (365=diaria, 12=mensual, 4=trimestral, etc.)
+        - Capitalización continua de aportes: VF = A × [((1 + TEA)^t - 1) / ln(1 + TEA)],
+          donde A es el total aportado por año
         """)
     
     st.divider()
     
     # Comparación de escenarios
     render_comparacion_escenarios(datos)
+
+
+def render_backtest(datos: dict, aporte):
+    """
+    Renderiza el backtest del plan sobre una serie histórica de retornos mensuales.
+    
+    Args:
+        datos: Datos ingresados en el formulario
+        aporte: Aporte periódico (float) o array de aportes por periodo
+    """
+    st.subheader("📜 Backtest Histórico")
+    st.markdown("""
+    Sube un CSV con los retornos mensuales de un índice (columna `retorno`, y opcionalmente `fecha`)
+    para ver cómo le habría ido a tu plan en cada periodo histórico y en remuestreos por bloques.
+    """)
+    
+    if 12 % datos["frecuencia_anual"] != 0:
+        st.warning("⚠️ El backtest usa retornos mensuales: elige una frecuencia de aportes mensual o menos frecuente (Mensual, Trimestral, Semestral o Anual).")
+        return
+    
+    archivo = st.file_uploader("CSV de retornos mensuales", type=["csv"], key="csv_retornos")
+    if archivo is None:
+        return
+    
+    try:
+        retornos = cargar_retornos_csv(archivo)
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        meses_retiro = st.number_input("Meses de retiro", min_value=1, max_value=600, value=240, step=12, key="meses_backtest")
+    
+    with col2:
+        tamaño_bloque = st.number_input("Meses por bloque", min_value=1, max_value=60, value=BACKTEST_BLOQUE_MESES, step=1)
+    
+    with col3:
+        semilla = st.number_input("Semilla", min_value=0, value=42, step=1)
+    
+    resultado = ejecutar_backtest(
+        vp=datos["valor_presente"],
+        aporte=aporte,
+        retornos=retornos,
+        frecuencia_anual=datos["frecuencia_anual"],
+        plazo_años=datos["plazo_años"],
+        aporte_al_inicio=datos["aporte_al_inicio"],
+        capitalizacion_continua=datos["capitalizacion_continua"],
+        tasa_crecimiento=datos["tasa_crecimiento_aportes"],
+        crecimiento_anual=datos["crecimiento_anual"],
+        tasa_mensual_retiro=calcular_tasa_mensual_retiro(datos["tea"]),
+        meses_retiro=meses_retiro,
+        tipo_bolsa=datos["tipo_bolsa"],
+        tamaño_bloque=tamaño_bloque,
+        semilla=semilla
+    )
+    
+    if resultado['num_ventanas'] == 0:
+        st.info(f"📌 La serie tiene {len(retornos)} meses, menos que el plazo ({datos['plazo_años'] * 12} meses): solo se muestran remuestreos.")
+    else:
+        st.info(f"📌 {len(retornos)} meses de historia | {resultado['num_ventanas']} ventanas de {datos['plazo_años']} años | {BACKTEST_MUESTRAS} remuestreos")
+    
+    filas = []
+    for nombre, clave in (("Ventanas históricas", 'historico'), ("Remuestreo por bloques", 'bootstrap')):
+        resumen_vf = resultado[clave]['resumen_vf']
+        resumen_retiro = resultado[clave]['resumen_retiro']
+        if not resumen_vf:
+            continue
+        for etiqueta, p in (("Peor 5%", 'p5'), ("Mediana", 'p50'), ("Mejor 5%", 'p95')):
+            filas.append({
+                'Muestra': nombre,
+                'Escenario': etiqueta,
+                f'Valor Futuro ({MONEDA})': round(resumen_vf[p], 2),
+                f'Retiro Mensual Neto ({MONEDA})': round(resumen_retiro[p], 2)
+            })
+    
+    df_backtest = pd.DataFrame(filas)
+    st.dataframe(
+        df_backtest,
+        column_config=configurar_columnas_numericas(declarar_formatos(df_backtest)),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    fig = crear_grafico_distribucion(resultado['historico']['vf'], resultado['bootstrap']['vf'], MONEDA)
+    st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,251 @@
+import functools
+import hashlib
+import inspect
+import json
+import math
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import pandas as pd
+from config.constants import ARCHIVO_CACHE, CACHE_MAX_MB, CACHE_VERSION, CACHE_INTERVALO_ACCESO
+
+
+# Una conexión por hilo; SQLite en modo WAL coordina los procesos del mismo host
+_conexiones = threading.local()
+
+
+def cache_habilitado() -> bool:
+    """
+    Indica si la caché en disco está activa (variable de entorno FINCALC_CACHE=1).
+    
+    Returns:
+        True si la caché está activa
+    """
+    return os.environ.get("FINCALC_CACHE", "0") == "1"
+
+
+def normalizar_valor(valor):
+    """
+    Convierte un argumento a una forma canónica y serializable en JSON.
+    
+    Los floats se redondean a 10 cifras significativas para que 0.1 + 0.2 y 0.3
+    generen la misma clave.
+    
+    Args:
+        valor: Valor a normalizar
+    
+    Returns:
+        Valor equivalente compuesto solo por tipos JSON
+    """
+    if isinstance(valor, bool) or valor is None or isinstance(valor, str):
+        return valor
+    if isinstance(valor, int):
+        return valor
+    if isinstance(valor, float):
+        if math.isnan(valor) or math.isinf(valor):
+            return repr(valor)
+        normalizado = float(f"{valor:.10g}")
+        return 0.0 if normalizado == 0 else normalizado
+    if isinstance(valor, dict):
+        return {str(k): normalizar_valor(v) for k, v in sorted(valor.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(valor, (list, tuple)):
+        return [normalizar_valor(v) for v in valor]
+    if isinstance(valor, pd.DataFrame):
+        huella = pd.util.hash_pandas_object(valor.round(10), index=True).to_numpy()
+        return {
+            'columnas': [str(c) for c in valor.columns],
+            'huella': hashlib.sha256(huella.tobytes()).hexdigest()
+        }
+    if hasattr(valor, 'tolist'):
+        # Arrays y escalares de NumPy
+        return normalizar_valor(valor.tolist())
+    return repr(valor)
+
+
+def generar_clave(espacio: str, parametros: dict) -> str:
+    """
+    Genera la clave de caché como hash SHA-256 de los parámetros normalizados.
+    
+    Args:
+        espacio: Nombre lógico del resultado (función cacheada)
+        parametros: Argumentos de la llamada
+    
+    Returns:
+        Clave hexadecimal
+    """
+    canonico = json.dumps(
+        {'espacio': espacio, 'version': CACHE_VERSION, 'parametros': normalizar_valor(parametros)},
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=True
+    )
+    return hashlib.sha256(canonico.encode('utf-8')).hexdigest()
+
+
+def _conexion(archivo: str) -> sqlite3.Connection:
+    """
+    Devuelve la conexión del hilo actual, creando el esquema si es necesario.
+    """
+    conexiones = getattr(_conexiones, 'por_archivo', None)
+    if conexiones is None:
+        conexiones = _conexiones.por_archivo = {}
+    
+    conexion = conexiones.get(archivo)
+    if conexion is None:
+        conexion = sqlite3.connect(archivo, timeout=30, isolation_level=None)
+        conexion.execute("PRAGMA journal_mode=WAL")
+        conexion.execute("PRAGMA synchronous=NORMAL")
+        conexion.execute("""
+            CREATE TABLE IF NOT EXISTS resultados (
+                clave TEXT PRIMARY KEY,
+                espacio TEXT NOT NULL,
+                valor BLOB NOT NULL,
+                tamaño INTEGER NOT NULL,
+                ultimo_acceso REAL NOT NULL
+            )
+        """)
+        conexion.execute("CREATE INDEX IF NOT EXISTS idx_ultimo_acceso ON resultados (ultimo_acceso)")
+        conexiones[archivo] = conexion
+    
+    return conexion
+
+
+def obtener(clave: str, archivo: str = ARCHIVO_CACHE, intervalo_acceso: float = CACHE_INTERVALO_ACCESO):
+    """
+    Busca un resultado en la caché y actualiza su marca de último acceso.
+    
+    La marca solo se reescribe si tiene más de intervalo_acceso segundos, así las
+    lecturas repetidas no compiten por el bloqueo de escritura. Un resultado que no
+    se puede deserializar (archivo dañado o clase que ya no existe) se elimina.
+    
+    Args:
+        clave: Clave generada con generar_clave
+        archivo: Ruta del archivo SQLite
+        intervalo_acceso: Segundos mínimos entre dos actualizaciones del último acceso
+    
+    Returns:
+        Tupla (encontrado, valor)
+    """
+    try:
+        conexion = _conexion(archivo)
+        fila = conexion.execute(
+            "SELECT valor, ultimo_acceso FROM resultados WHERE clave = ?", (clave,)
+        ).fetchone()
+        if fila is None:
+            return False, None
+        
+        try:
+            valor = pickle.loads(fila[0])
+        except Exception:
+            conexion.execute("DELETE FROM resultados WHERE clave = ?", (clave,))
+            return False, None
+        
+        ahora = time.time()
+        if ahora - fila[1] >= intervalo_acceso:
+            conexion.execute("UPDATE resultados SET ultimo_acceso = ? WHERE clave = ?", (ahora, clave))
+        return True, valor
+    except sqlite3.Error:
+        # Una caché dañada o bloqueada se trata como un fallo de caché
+        return False, None
+
+
+def guardar(
+    clave: str,
+    espacio: str,
+    valor,
+    archivo: str = ARCHIVO_CACHE,
+    max_mb: float = CACHE_MAX_MB
+) -> None:
+    """
+    Guarda un resultado y expulsa los menos usados recientemente si se supera el límite.
+    
+    Args:
+        clave: Clave generada con generar_clave
+        espacio: Nombre lógico del resultado
+        valor: Objeto a guardar (debe ser serializable con pickle)
+        archivo: Ruta del archivo SQLite
+        max_mb: Tamaño máximo de la caché en megabytes
+    """
+    try:
+        datos = pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL)
+        limite = int(max_mb * 1024 * 1024)
+        if len(datos) > limite:
+            return
+        
+        conexion = _conexion(archivo)
+        # BEGIN IMMEDIATE toma el bloqueo de escritura antes de leer el tamaño total,
+        # así dos procesos no pueden expulsar y escribir a la vez
+        conexion.execute("BEGIN IMMEDIATE")
+        try:
+            conexion.execute(
+                "INSERT OR REPLACE INTO resultados (clave, espacio, valor, tamaño, ultimo_acceso) VALUES (?, ?, ?, ?, ?)",
+                (clave, espacio, datos, len(datos), time.time())
+            )
+            conexion.execute("""
+                DELETE FROM resultados WHERE clave IN (
+                    SELECT clave FROM (
+                        SELECT clave, SUM(tamaño) OVER (ORDER BY ultimo_acceso DESC, clave) AS acumulado
+                        FROM resultados
+                    ) WHERE acumulado > ?
+                )
+            """, (limite,))
+            conexion.execute("COMMIT")
+        except sqlite3.Error:
+            conexion.execute("ROLLBACK")
+            raise
+    except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError):
+        # Si el resultado no se puede guardar, simplemente no se cachea
+        pass
+
+
+def limpiar_cache(archivo: str = ARCHIVO_CACHE) -> None:
+    """
+    Elimina todos los resultados guardados.
+    
+    Args:
+        archivo: Ruta del archivo SQLite
+    """
+    try:
+        _conexion(archivo).execute("DELETE FROM resultados")
+    except sqlite3.Error:
+        pass
+
+
+def cache_en_disco(func):
+    """
+    Decorador que guarda el resultado de la función en la caché SQLite.
+    
+    La clave incluye el nombre de la función y todos sus argumentos normalizados,
+    excepto los invocables (callbacks de progreso), que no afectan el resultado.
+    Si la caché no está habilitada, la función se llama directamente.
+    
+    Args:
+        func: Función pura cuyo resultado depende solo de sus argumentos
+    
+    Returns:
+        Función envuelta
+    """
+    espacio = f"{func.__module__}.{func.__qualname__}"
+    firma = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def envoltura(*args, **kwargs):
+        if not cache_habilitado():
+            return func(*args, **kwargs)
+        
+        argumentos = firma.bind(*args, **kwargs)
+        argumentos.apply_defaults()
+        parametros = {k: v for k, v in argumentos.arguments.items() if not callable(v)}
+        clave = generar_clave(espacio, parametros)
+        
+        encontrado, valor = obtener(clave)
+        if encontrado:
+            return valor
+        
+        valor = func(*args, **kwargs)
+        guardar(clave, espacio, valor)
+        return valor
+    
+    return envoltura
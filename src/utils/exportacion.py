@@ -0,0 +1,100 @@
+import io
+import importlib.util
+import pandas as pd
+from config.constants import CSV_FILAS_POR_BLOQUE, FORMATOS_EXPORTACION
+from src.utils.profiling import perfilar
+
+
+def hay_soporte_columnar() -> bool:
+    """
+    Indica si está instalado pyarrow (necesario para exportar a Parquet y Arrow).
+    
+    Returns:
+        True si se pueden generar archivos Parquet/Arrow
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def dividir_en_bloques(df: pd.DataFrame, filas_por_bloque: int = CSV_FILAS_POR_BLOQUE):
+    """
+    Recorre un DataFrame en bloques de filas consecutivas (vistas, sin copiar).
+    
+    Args:
+        df: DataFrame a recorrer
+        filas_por_bloque: Filas de cada bloque
+    
+    Yields:
+        DataFrames de hasta filas_por_bloque filas (al menos uno, aunque df esté vacío)
+    """
+    for inicio in range(0, max(len(df), 1), filas_por_bloque):
+        yield df.iloc[inicio:inicio + filas_por_bloque]
+
+
+def escribir_csv_por_bloques(bloques, destino) -> int:
+    """
+    Escribe un CSV bloque a bloque en un archivo binario.
+    
+    Solo un bloque se convierte a texto a la vez, así que la memoria no depende del
+    total de filas. Los bloques pueden venir de dividir_en_bloques o de un generador
+    que calcula cada tramo (ej. generar_ventana_crecimiento).
+    
+    Args:
+        bloques: Iterable de DataFrames con las mismas columnas
+        destino: Archivo binario abierto para escritura (o io.BytesIO)
+    
+    Returns:
+        Número de filas escritas
+    """
+    filas = 0
+    for numero, bloque in enumerate(bloques):
+        destino.write(bloque.to_csv(index=False, header=numero == 0).encode('utf-8'))
+        filas += len(bloque)
+    return filas
+
+
+@perfilar
+def exportar_tabla(df: pd.DataFrame, formato: str = "CSV") -> bytes:
+    """
+    Convierte una tabla al formato de descarga indicado.
+    
+    Args:
+        df: DataFrame a exportar (se exporta sin índice)
+        formato: Clave de FORMATOS_EXPORTACION ("CSV", "Parquet" o "Arrow")
+    
+    Returns:
+        Contenido del archivo
+    
+    Raises:
+        ValueError: Si el formato no existe
+        ImportError: Si el formato es columnar y pyarrow no está instalado
+    """
+    if formato not in FORMATOS_EXPORTACION:
+        raise ValueError(f"Formato de exportación desconocido: {formato}")
+    
+    buffer = io.BytesIO()
+    if formato == "CSV":
+        escribir_csv_por_bloques(dividir_en_bloques(df), buffer)
+    elif formato == "Parquet":
+        df.to_parquet(buffer, index=False)
+    else:
+        df.reset_index(drop=True).to_feather(buffer)
+    return buffer.getvalue()
+
+
+def leer_tabla_exportada(contenido: bytes, formato: str) -> pd.DataFrame:
+    """
+    Lee un archivo generado por exportar_tabla (para verificar exportaciones).
+    
+    Args:
+        contenido: Bytes del archivo
+        formato: Clave de FORMATOS_EXPORTACION
+    
+    Returns:
+        DataFrame leído
+    """
+    buffer = io.BytesIO(contenido)
+    if formato == "CSV":
+        return pd.read_csv(buffer)
+    if formato == "Parquet":
+        return pd.read_parquet(buffer)
+    return pd.read_feather(buffer)
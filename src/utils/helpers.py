@@ -1,3 +1,8 @@
+import numpy as np
+import pandas as pd
+from config.constants import FRECUENCIAS_BONOS, TIPOS_BONO
+
+
 def formatear_moneda(monto: float, moneda: str = "USD") -> str:
     """
     Formatea un monto como moneda.
@@ -12,6 +17,97 @@ def formatear_moneda(monto: float, moneda: str = "USD") -> str:
     return f"{moneda} {monto:,.2f}"
 
 
+def formatear_numeros(
+    valores,
+    decimales: int = 2,
+    separador_miles: bool = True,
+    prefijo: str = "",
+    sufijo: str = "",
+    con_signo: bool = False
+) -> np.ndarray:
+    """
+    Formatea muchos números a texto a la vez (equivale a f"{x:,.2f}" por elemento).
+    
+    Arma una matriz de caracteres (números × posiciones) con aritmética entera de
+    NumPy: dígitos, comas, punto decimal y signo, sin un llamado de Python por celda.
+    Los casos que la aritmética en float no resuelve igual que Python (valores casi
+    en la mitad entre dos redondeos, o |x|·10^decimales ≥ 1e15) se formatean con
+    f-string. La única diferencia con Python: los negativos que redondean a cero se
+    escriben sin "-". Los valores no finitos quedan como texto vacío.
+    
+    Args:
+        valores: Array de números
+        decimales: Cantidad de decimales
+        separador_miles: True para separar miles con comas
+        prefijo: Texto antes de cada número (ej. "USD ")
+        sufijo: Texto después de cada número (ej. "%")
+        con_signo: True para mostrar "+" en los positivos
+    
+    Returns:
+        Array de strings con la forma de valores
+    """
+    valores = np.asarray(valores, dtype=float)
+    forma = valores.shape
+    valores = valores.ravel()
+    finitos = np.isfinite(valores)
+    
+    escala = 10 ** decimales
+    escalados = np.abs(np.where(finitos, valores, 0.0)) * escala
+    # Python redondea el decimal exacto del float (mitad al par); cerca de la mitad el
+    # producto en float puede caer del otro lado, y por encima de 1e15 pierde precisión
+    dudosos = finitos & ((escalados >= 1e15) | (np.abs(escalados - np.floor(escalados) - 0.5) <= 4 * np.spacing(escalados)))
+    unidades = np.rint(np.where(dudosos, 0.0, escalados)).astype(np.int64)
+    enteros, fraccion = np.divmod(unidades, escala)
+    negativos = (valores < 0) & (unidades > 0)
+    
+    num_digitos = len(str(int(enteros.max()))) if enteros.size else 1
+    digitos = (enteros[:, None] // 10 ** np.arange(num_digitos - 1, -1, -1, dtype=np.int64)) % 10
+    
+    # Los ceros a la izquierda se vuelven espacios (siempre queda al menos un dígito)
+    significativo = np.cumsum(digitos, axis=1) > 0
+    significativo[:, -1] = True
+    caracteres = np.where(significativo, digitos + ord('0'), ord(' ')).astype(np.uint8)
+    
+    partes = []
+    inicio = 0
+    cortes = range(num_digitos % 3 or 3, num_digitos, 3) if separador_miles else []
+    for corte in cortes:
+        partes.append(caracteres[:, inicio:corte])
+        partes.append(np.where(significativo[:, corte - 1], ord(','), ord(' ')).astype(np.uint8)[:, None])
+        inicio = corte
+    partes.append(caracteres[:, inicio:])
+    
+    if decimales:
+        digitos_fraccion = (fraccion[:, None] // 10 ** np.arange(decimales - 1, -1, -1, dtype=np.int64)) % 10
+        partes.append(np.full((len(valores), 1), ord('.'), dtype=np.uint8))
+        partes.append((digitos_fraccion + ord('0')).astype(np.uint8))
+    
+    # Columna extra a la izquierda para el signo, pegado al primer dígito
+    matriz = np.concatenate([np.full((len(valores), 1), ord(' '), dtype=np.uint8)] + partes, axis=1)
+    primera = np.argmax(matriz != ord(' '), axis=1)
+    signos = np.where(negativos, ord('-'), np.where(con_signo, ord('+'), ord(' ')))
+    matriz[np.arange(len(valores)), primera - 1] = signos
+    
+    textos = np.strings.lstrip(np.ascontiguousarray(matriz).view(f'S{matriz.shape[1]}').ravel().astype(str))
+    
+    if dudosos.any():
+        formato = f"{',' if separador_miles else ''}.{decimales}f"
+        indices = np.flatnonzero(dudosos)
+        absolutos = [f"{abs(x):{formato}}" for x in valores[indices]]
+        con_digitos = [texto.strip("0.,") != "" for texto in absolutos]
+        alternativos = np.array([
+            ("-" if x < 0 and distinto_de_cero else "+" if con_signo else "") + texto
+            for x, texto, distinto_de_cero in zip(valores[indices], absolutos, con_digitos)
+        ])
+        textos = textos.astype(np.result_type(textos, alternativos))
+        textos[indices] = alternativos
+    
+    if prefijo or sufijo:
+        textos = np.strings.add(np.strings.add(prefijo, textos), sufijo)
+    
+    return np.where(finitos, textos, "").reshape(forma)
+
+
 def calcular_edad_jubilacion(edad_actual: int, plazo_años: int) -> int:
     """
     Calcula la edad de jubilación.
@@ -26,17 +122,196 @@ def calcular_edad_jubilacion(edad_actual: int, plazo_años: int) -> int:
     return edad_actual + plazo_años
 
 
-def validar_datos_entrada(vp: float, aporte: float) -> tuple[bool, str]:
+def validar_datos_entrada(vp: float, aporte) -> tuple[bool, str]:
     """
     Valida que al menos uno de los valores de entrada sea mayor a 0.
     
     Args:
         vp: Valor Presente
-        aporte: Aporte periódico
+        aporte: Aporte periódico o array de aportes por periodo
     
     Returns:
         Tupla (es_valido, mensaje_error)
     """
-    if vp <= 0 and aporte <= 0:
+    if vp <= 0 and np.sum(aporte) <= 0:
         return False, "Debes ingresar al menos una inversión inicial o un aporte periódico."
     return True, ""
+
+
+def cargar_aportes_csv(archivo) -> np.ndarray:
+    """
+    Carga un historial de aportes por periodo desde un CSV local.
+    
+    El CSV debe tener una columna 'aporte' (una fila por periodo, en orden). Si
+    además tiene una columna 'periodo', se usa para ordenar y los periodos
+    faltantes se consideran sin aporte.
+    
+    Args:
+        archivo: Ruta o archivo abierto (ej. el resultado de st.file_uploader)
+    
+    Returns:
+        Array de aportes por periodo
+    
+    Raises:
+        ValueError: Si el CSV no tiene una columna 'aporte'
+    """
+    df = pd.read_csv(archivo)
+    columnas = {str(c).strip().lower(): c for c in df.columns}
+    
+    if 'aporte' not in columnas:
+        encontradas = ", ".join(f"'{c}'" for c in df.columns) or "ninguna"
+        raise ValueError(f"El CSV debe tener una columna 'aporte' con los montos por periodo (columnas encontradas: {encontradas}).")
+    
+    montos = pd.to_numeric(df[columnas['aporte']], errors='coerce').fillna(0.0).to_numpy(dtype=float)
+    
+    if 'periodo' in columnas:
+        periodos = pd.to_numeric(df[columnas['periodo']], errors='coerce').fillna(0).to_numpy(dtype=int)
+        validos = periodos >= 1
+        aportes = np.zeros(periodos[validos].max() if validos.any() else 0)
+        np.add.at(aportes, periodos[validos] - 1, montos[validos])
+        return aportes
+    
+    return montos
+
+
+def expandir_aportes_anuales(aportes_por_año, frecuencia_anual: int) -> np.ndarray:
+    """
+    Convierte un aporte por periodo para cada año en el vector de aportes por periodo.
+    
+    Args:
+        aportes_por_año: Aporte de cada periodo del año k (un valor por año)
+        frecuencia_anual: Número de periodos por año
+    
+    Returns:
+        Array de longitud len(aportes_por_año) × frecuencia_anual
+    """
+    return np.repeat(np.asarray(aportes_por_año, dtype=float), frecuencia_anual)
+
+
+def cargar_retornos_csv(archivo) -> np.ndarray:
+    """
+    Carga una serie de retornos mensuales de un índice desde un CSV local.
+    
+    El CSV debe tener una columna 'retorno' (una fila por mes, en orden). Si además
+    tiene una columna 'fecha', se usa para ordenar. Los retornos pueden estar en
+    decimal (0.012) o en porcentaje (1.2): si algún valor supera 1 en valor absoluto
+    se interpretan como porcentaje.
+    
+    Args:
+        archivo: Ruta o archivo abierto (ej. el resultado de st.file_uploader)
+    
+    Returns:
+        Array de retornos mensuales en decimal
+    
+    Raises:
+        ValueError: Si el CSV no tiene una columna numérica de retornos
+    """
+    df = pd.read_csv(archivo)
+    columnas = {str(c).strip().lower(): c for c in df.columns}
+    
+    if 'fecha' in columnas:
+        df = df.assign(_fecha=pd.to_datetime(df[columnas['fecha']], errors='coerce')).sort_values('_fecha')
+    
+    if 'retorno' in columnas:
+        columna = columnas['retorno']
+    else:
+        numericas = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+        if not numericas:
+            raise ValueError("El CSV debe tener una columna 'retorno' con los retornos mensuales.")
+        columna = numericas[0]
+    
+    retornos = pd.to_numeric(df[columna], errors='coerce').dropna().to_numpy(dtype=float)
+    if len(retornos) and np.abs(retornos).max() > 1:
+        retornos = retornos / 100
+    
+    return retornos
+
+
+def cargar_cartera_bonos_csv(archivo) -> pd.DataFrame:
+    """
+    Carga una cartera de bonos desde un CSV local.
+    
+    Columnas obligatorias: 'valor_nominal', 'tasa_cupon' (% TEA), 'frecuencia'
+    (pagos por año o su nombre, ej. "Semestral"), 'plazo_años' y 'precio'.
+    Opcionales: 'tipo_bono' (código o nombre de TIPOS_BONO, por defecto bullet),
+    'años_gracia' e 'id'.
+    
+    Args:
+        archivo: Ruta o archivo abierto (ej. el resultado de st.file_uploader)
+    
+    Returns:
+        DataFrame con las columnas normalizadas y 'tasa_cupon' en decimal
+    
+    Raises:
+        ValueError: Si falta una columna obligatoria o hay tipos de bono desconocidos
+    """
+    df = pd.read_csv(archivo)
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    
+    obligatorias = ['valor_nominal', 'tasa_cupon', 'frecuencia', 'plazo_años', 'precio']
+    faltantes = [c for c in obligatorias if c not in df.columns]
+    if faltantes:
+        raise ValueError(f"Al CSV le faltan las columnas: {', '.join(faltantes)}.")
+    
+    frecuencias = df['frecuencia'].map(lambda f: FRECUENCIAS_BONOS.get(str(f).strip(), f))
+    
+    cartera = pd.DataFrame({
+        'id': df['id'].astype(str) if 'id' in df.columns else (df.index + 1).astype(str),
+        'valor_nominal': pd.to_numeric(df['valor_nominal'], errors='coerce'),
+        'tasa_cupon': pd.to_numeric(df['tasa_cupon'], errors='coerce') / 100,
+        'frecuencia': pd.to_numeric(frecuencias, errors='coerce'),
+        'plazo_años': pd.to_numeric(df['plazo_años'], errors='coerce'),
+        'precio': pd.to_numeric(df['precio'], errors='coerce'),
+        'tipo_bono': df['tipo_bono'].astype(str).str.strip().map(lambda t: TIPOS_BONO.get(t, t)) if 'tipo_bono' in df.columns else "bullet",
+        'años_gracia': pd.to_numeric(df['años_gracia'], errors='coerce').fillna(0.0) if 'años_gracia' in df.columns else 0.0
+    })
+    
+    desconocidos = set(cartera['tipo_bono']) - set(TIPOS_BONO.values())
+    if desconocidos:
+        raise ValueError(f"Tipos de bono desconocidos: {', '.join(sorted(desconocidos))}.")
+    
+    return cartera.dropna(subset=obligatorias).astype({'frecuencia': int}).reset_index(drop=True)
+
+
+def cargar_cotizaciones_curva_csv(archivo) -> pd.DataFrame:
+    """
+    Carga las cotizaciones para construir una curva cero desde un CSV local.
+    
+    El CSV debe tener una columna 'plazo_años' y, o bien 'tasa_par' (rendimiento
+    par en % TEA), o bien 'precio' (por 100 de nominal) y 'tasa_cupon' (% TEA).
+    
+    Args:
+        archivo: Ruta o archivo abierto (ej. el resultado de st.file_uploader)
+    
+    Returns:
+        DataFrame ordenado por plazo con 'plazo_años' y 'tasa_par', o 'plazo_años',
+        'precio' y 'tasa_cupon' (tasas en decimal)
+    
+    Raises:
+        ValueError: Si faltan columnas o no hay cotizaciones válidas
+    """
+    df = pd.read_csv(archivo)
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    
+    if 'plazo_años' not in df.columns:
+        raise ValueError("El CSV debe tener una columna 'plazo_años'.")
+    
+    if 'tasa_par' in df.columns:
+        cotizaciones = pd.DataFrame({
+            'plazo_años': pd.to_numeric(df['plazo_años'], errors='coerce'),
+            'tasa_par': pd.to_numeric(df['tasa_par'], errors='coerce') / 100
+        })
+    elif {'precio', 'tasa_cupon'} <= set(df.columns):
+        cotizaciones = pd.DataFrame({
+            'plazo_años': pd.to_numeric(df['plazo_años'], errors='coerce'),
+            'precio': pd.to_numeric(df['precio'], errors='coerce'),
+            'tasa_cupon': pd.to_numeric(df['tasa_cupon'], errors='coerce') / 100
+        })
+    else:
+        raise ValueError("El CSV debe tener una columna 'tasa_par' o las columnas 'precio' y 'tasa_cupon'.")
+    
+    cotizaciones = cotizaciones.dropna().sort_values('plazo_años').reset_index(drop=True)
+    if cotizaciones.empty:
+        raise ValueError("El CSV no tiene cotizaciones válidas.")
+    
+    return cotizaciones
@@ -6,17 +6,48 @@ from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from io import BytesIO
 from datetime import datetime
+import numpy as np
 import plotly.graph_objects as go
 import os
+from src.utils.profiling import perfilar
+from src.utils.cache_sqlite import cache_en_disco
+from src.utils.tables import formatear_tabla_texto
 
 
+def _adaptar_progreso(progreso):
+    """
+    Traduce los eventos de progreso de ReportLab a una fracción entre 0 y 1.
+    
+    Args:
+        progreso: Callback que recibe la fracción completada
+    
+    Returns:
+        Función compatible con SimpleDocTemplate.setProgressCallBack
+    """
+    total = {'flowables': 1}
+    
+    def callback(tipo: str, valor: int):
+        if tipo == 'SIZE_EST':
+            total['flowables'] = max(valor, 1)
+        elif tipo == 'PROGRESS':
+            progreso(valor / total['flowables'])
+        elif tipo == 'FINISHED':
+            progreso(1.0)
+    
+    return callback
+
+
+@perfilar
+@cache_en_disco
 def crear_pdf_acciones(
     datos_entrada: dict,
     resultados_vf: dict,
     resultados_retiro: dict,
     tipo_retiro: str,
     df_tabla: object = None,
-    fig_evolucion: go.Figure = None
+    fig_evolucion: go.Figure = None,
+    df_ciclo_vida: object = None,
+    progreso: callable = None
 ) -> BytesIO:
     """
     Genera un PDF con los resultados de la calculadora de acciones.
@@ -26,14 +57,18 @@ def crear_pdf_acciones(
         resultados_vf: Resultados del cálculo de valor futuro
         resultados_retiro: Resultados del cálculo de retiro
         tipo_retiro: "total" o "mensual"
-        df_tabla: DataFrame con tabla de crecimiento (opcional)
+        df_tabla: Tabla canónica de crecimiento (generar_tabla_crecimiento, opcional)
         fig_evolucion: Figura de Plotly con gráfico (opcional)
+        df_ciclo_vida: DataFrame mes a mes de generar_tabla_ciclo_vida (opcional)
+        progreso: Callback opcional que recibe la fracción completada (0 a 1)
     
     Returns:
         BytesIO con el PDF generado
     """
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    if progreso is not None:
+        doc.setProgressCallBack(_adaptar_progreso(progreso))
     story = []
     styles = getSampleStyleSheet()
     
@@ -72,13 +107,20 @@ def crear_pdf_acciones(
         ['Campo', 'Valor'],
         ['Edad actual', f"{datos_entrada['edad_actual']} años"],
         ['Inversión inicial', f"USD {datos_entrada['valor_presente']:,.2f}"],
-        ['Aporte periódico', f"USD {datos_entrada['aporte_periodico']:,.2f}"],
+        ['Aporte periódico', f"USD {datos_entrada['aporte_periodico']:,.2f}"]
+        if datos_entrada.get('aportes') is None
+        else ['Aportes irregulares (total)', f"USD {sum(datos_entrada['aportes']):,.2f}"],
         ['Frecuencia', datos_entrada['frecuencia']],
         ['Plazo', f"{datos_entrada['plazo_años']} años"],
         ['Edad de jubilación', f"{datos_entrada['edad_actual'] + datos_entrada['plazo_años']} años"],
         ['TEA', f"{datos_entrada['tea_pct']:.2f}%"],
         ['Tipo de inversión', datos_entrada['tipo_bolsa']],
     ]
+    if datos_entrada.get('tasa_crecimiento_aportes', 0) > 0:
+        modo = "cada año" if datos_entrada['crecimiento_anual'] else "cada periodo"
+        datos_tabla.insert(4, ['Crecimiento del aporte', f"{datos_entrada['tasa_crecimiento_aportes'] * 100:.2f}% {modo}"])
+    if datos_entrada.get('inflacion', 0) > 0:
+        datos_tabla.append(['Inflación anual', f"{datos_entrada['inflacion'] * 100:.2f}%"])
     
     tabla_datos = Table(datos_tabla, colWidths=[2.5*inch, 3*inch])
     tabla_datos.setStyle(TableStyle([
@@ -104,6 +146,8 @@ def crear_pdf_acciones(
         ['Beneficio Bruto', f"{resultados_vf['beneficio_bruto']:,.2f}"],
         ['Rentabilidad', f"{(resultados_vf['beneficio_bruto']/resultados_vf['inversion_total']*100):.2f}%"],
     ]
+    if resultados_vf.get('vf_real') is not None:
+        vf_tabla.append(['VF Real (valores de hoy)', f"{resultados_vf['vf_real']:,.2f}"])
     
     tabla_vf = Table(vf_tabla, colWidths=[2.5*inch, 3*inch])
     tabla_vf.setStyle(TableStyle([
@@ -159,6 +203,8 @@ def crear_pdf_acciones(
             ['Periodo de retiro', f"{resultados_retiro['meses']} meses ({resultados_retiro['meses']/12:.1f} años)"],
             ['Total Neto a Retirar', f"USD {resultados_retiro['total_retirado']:,.2f}"],
         ]
+        if resultados_retiro.get('total_retirado_real') is not None:
+            retiro_tabla.append(['Total Neto Real (valores de hoy)', f"USD {resultados_retiro['total_retirado_real']:,.2f}"])
         
         tabla_retiro = Table(retiro_tabla, colWidths=[2.5*inch, 3*inch])
         tabla_retiro.setStyle(TableStyle([
@@ -192,18 +238,17 @@ def crear_pdf_acciones(
         df_mostrar = df_tabla.head(30) if len(df_tabla) > 30 else df_tabla
         
         # Preparar datos para la tabla
-        tabla_data = [['Periodo', 'Saldo Inicial', 'Aporte', 'Interés', 'Saldo Final']]
+        con_real = 'saldo_final_real' in df_mostrar.columns
+        columnas = ['saldo_inicial', 'aporte', 'interes', 'saldo_final']
+        columnas += ['saldo_final_real'] if con_real else []
         
-        for _, row in df_mostrar.iterrows():
-            tabla_data.append([
-                str(int(row['Periodo'])),
-                f"{row['Saldo Inicial (USD)']:,.2f}",
-                f"{row['Aporte (USD)']:,.2f}",
-                f"{row['Interés Ganado (USD)']:,.2f}",
-                f"{row['Saldo Final (USD)']:,.2f}"
-            ])
+        tabla_data = [['Periodo', 'Saldo Inicial', 'Aporte', 'Interés', 'Saldo Final'] + (['Saldo Real'] if con_real else [])]
+        tabla_data += formatear_tabla_texto(
+            df_mostrar[columnas].reset_index(), dict.fromkeys(columnas, 2)
+        ).astype(str).to_numpy().tolist()
         
-        tabla_crecimiento = Table(tabla_data, colWidths=[0.8*inch, 1.3*inch, 1.3*inch, 1.3*inch, 1.3*inch])
+        anchos = [0.7*inch] + [1.1*inch] * 5 if con_real else [0.8*inch, 1.3*inch, 1.3*inch, 1.3*inch, 1.3*inch]
+        tabla_crecimiento = Table(tabla_data, colWidths=anchos)
         tabla_crecimiento.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -225,6 +270,32 @@ def crear_pdf_acciones(
                 styles['Normal']
             ))
     
+    # 5. Ciclo de vida (si está disponible): una fila por año cumplido
+    if df_ciclo_vida is not None and len(df_ciclo_vida) > 0:
+        story.append(PageBreak())
+        story.append(Paragraph("🧭 Ciclo de Vida de la Inversión", heading_style))
+        story.append(Spacer(1, 0.2*inch))
+        
+        df_anual = df_ciclo_vida[df_ciclo_vida.index % 12 == 0]
+        columnas = ['edad', 'fase', 'saldo', 'aportado', 'retiro_neto']
+        formatos = {'edad': 0, 'saldo': 2, 'aportado': 2, 'retiro_neto': 2}
+        tabla_data = [['Edad', 'Fase', 'Saldo', 'Aportado', 'Retiro Neto']]
+        tabla_data += formatear_tabla_texto(df_anual[columnas], formatos).to_numpy().tolist()
+        
+        tabla_ciclo = Table(tabla_data, colWidths=[0.7*inch, 1.1*inch, 1.5*inch, 1.5*inch, 1.3*inch], repeatRows=1)
+        tabla_ciclo.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.Color(0.95, 0.95, 0.95)]),
+        ]))
+        story.append(tabla_ciclo)
+    
     # Footer
     story.append(Spacer(1, 0.5*inch))
     story.append(Paragraph(
@@ -239,10 +310,13 @@ def crear_pdf_acciones(
     return buffer
 
 
+@perfilar
+@cache_en_disco
 def crear_pdf_bonos(
     datos_entrada: dict,
     resultados: dict,
-    df_flujos: object = None
+    df_flujos: object = None,
+    progreso: callable = None
 ) -> BytesIO:
     """
     Genera un PDF con los resultados de la calculadora de bonos.
@@ -251,12 +325,15 @@ def crear_pdf_bonos(
         datos_entrada: Datos ingresados por el usuario
         resultados: Resultados del cálculo de valoración
         df_flujos: DataFrame con flujos del bono (opcional)
+        progreso: Callback opcional que recibe la fracción completada (0 a 1)
     
     Returns:
         BytesIO con el PDF generado
     """
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    if progreso is not None:
+        doc.setProgressCallBack(_adaptar_progreso(progreso))
     story = []
     styles = getSampleStyleSheet()
     
@@ -293,14 +370,25 @@ def crear_pdf_bonos(
     
     datos_tabla = [
         ['Característica', 'Valor'],
+        ['Tipo de Bono', datos_entrada.get('tipo_bono', 'Bullet (cupón fijo)')],
         ['Valor Nominal', f"USD {datos_entrada['valor_nominal']:,.2f}"],
         ['Tasa Cupón (TEA)', f"{datos_entrada['tasa_cupon_pct']:.2f}%"],
         ['Frecuencia de Pago', datos_entrada['frecuencia']],
         ['Plazo', f"{datos_entrada['plazo_años']} años"],
         ['Tasa de Retorno Esperada (TEA)', f"{datos_entrada['tea_descuento_pct']:.2f}%"],
         ['Número de Pagos', f"{resultados['num_periodos']}"],
-        ['Cupón Periódico', f"USD {resultados['cupon_periodico']:,.2f}"],
+        ['Primer Cupón', f"USD {resultados['cupon_periodico']:,.2f}"],
     ]
+    if datos_entrada.get('años_gracia'):
+        datos_tabla.insert(6, ['Años de Gracia', f"{datos_entrada['años_gracia']} años"])
+    if datos_entrada.get('call'):
+        datos_tabla.append(['Opción Call (emisor)', datos_entrada['call']])
+    if datos_entrada.get('put'):
+        datos_tabla.append(['Opción Put (tenedor)', datos_entrada['put']])
+    if datos_entrada.get('curva'):
+        datos_tabla.append(['Descuento', datos_entrada['curva']])
+    if datos_entrada.get('liquidacion'):
+        datos_tabla.append(['Fecha de Liquidación', datos_entrada['liquidacion']])
     
     tabla_datos = Table(datos_tabla, colWidths=[2.5*inch, 3*inch])
     tabla_datos.setStyle(TableStyle([
@@ -337,8 +425,27 @@ def crear_pdf_bonos(
         ['Valor Nominal', f"USD {vp_nominal:,.2f}"],
         ['Diferencia', f"USD {diferencia:,.2f}"],
         ['Tipo de Cotización', tipo_cotizacion],
-        ['Total en Cupones', f"USD {resultados['cupon_periodico'] * resultados['num_periodos']:,.2f}"],
+        ['Total en Cupones', f"USD {resultados['total_cupones']:,.2f}"],
+        ['VP de Cupones', f"USD {resultados['vp_cupones']:,.2f}"],
+        ['VP del Principal', f"USD {resultados['vp_principal']:,.2f}"],
     ]
+    if resultados.get('opciones'):
+        valoracion_tabla += [
+            ['Precio con Opciones', f"USD {resultados['opciones']['precio_con_opciones']:,.2f}"],
+            ['Valor de las Opciones', f"USD {resultados['opciones']['valor_opciones']:,.2f}"],
+        ]
+    if resultados.get('liquidacion'):
+        valoracion_tabla += [
+            ['Precio Sucio', f"USD {resultados['liquidacion']['precio_sucio']:,.2f}"],
+            ['Cupón Corrido', f"USD {resultados['liquidacion']['cupon_corrido']:,.2f}"],
+            ['Precio Limpio', f"USD {resultados['liquidacion']['precio_limpio']:,.2f}"],
+        ]
+    if resultados.get('spreads'):
+        valoracion_tabla.append(['Precio de Mercado', f"USD {resultados['spreads']['precio_mercado']:,.2f}"])
+        # Un spread que no converge es NaN y no se reporta
+        for etiqueta, clave in (('Z-spread', 'z_spread'), ('OAS', 'oas')):
+            if not np.isnan(resultados['spreads'][clave]):
+                valoracion_tabla.append([etiqueta, f"{resultados['spreads'][clave] * 10000:,.1f} pb"])
     
     tabla_valoracion = Table(valoracion_tabla, colWidths=[2.5*inch, 3*inch])
     tabla_valoracion.setStyle(TableStyle([
@@ -388,26 +495,17 @@ def crear_pdf_bonos(
         df_mostrar = df_flujos.head(40) if len(df_flujos) > 40 else df_flujos
         
         # Preparar datos para la tabla
-        tabla_data = [['Periodo', 'Flujo (USD)', 'Valor Presente (USD)', 'Tipo']]
-        
-        for _, row in df_mostrar.iterrows():
-            flujo = row['Flujo (USD)'].replace(',', '') if isinstance(row['Flujo (USD)'], str) else row['Flujo (USD)']
-            vp_flujo = row['Valor Presente (USD)'].replace(',', '') if isinstance(row['Valor Presente (USD)'], str) else row['Valor Presente (USD)']
-            
-            tabla_data.append([
-                str(row['Periodo']),
-                flujo if isinstance(flujo, str) else f"{flujo:,.2f}",
-                vp_flujo if isinstance(vp_flujo, str) else f"{vp_flujo:,.2f}",
-                row['Tipo']
-            ])
+        columnas = ['Periodo', 'Cupón (USD)', 'Principal (USD)', 'Flujo (USD)', 'Valor Presente (USD)', 'Tipo']
+        tabla_data = [columnas]
+        tabla_data += formatear_tabla_texto(df_mostrar[columnas]).astype(str).to_numpy().tolist()
         
-        tabla_flujos = Table(tabla_data, colWidths=[1*inch, 1.5*inch, 1.5*inch, 2*inch])
+        tabla_flujos = Table(tabla_data, colWidths=[0.7*inch, 1.1*inch, 1.1*inch, 1.1*inch, 1.3*inch, 1.3*inch])
         tabla_flujos.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f77b4')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (1, 1), (2, -1), 'RIGHT'),
-            ('ALIGN', (3, 1), (3, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (4, -1), 'RIGHT'),
+            ('ALIGN', (5, 1), (5, -1), 'LEFT'),
             ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
             ('FONTSIZE', (0, 0), (-1, 0), 10),
             ('FONTSIZE', (0, 1), (-1, -1), 8),
@@ -0,0 +1,158 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config.constants import PDF_MAX_HILOS, PDF_MAX_TRABAJOS_SESION
+from src.utils.profiling import ejecucion_activa, iniciar_ejecucion, finalizar_ejecucion
+
+
+# ReportLab libera el script de Streamlit si el PDF se arma en otro hilo;
+# los hilos se comparten entre sesiones y cada sesión usa a lo sumo PDF_MAX_TRABAJOS_SESION
+_ejecutor = ThreadPoolExecutor(max_workers=PDF_MAX_HILOS, thread_name_prefix="pdf")
+
+# Trabajos lanzados (en cola del ejecutor o corriendo) por sesión
+_en_curso = {}
+_candado = threading.Lock()
+
+
+class PDFCancelado(Exception):
+    """Se lanza dentro del callback de progreso para abortar un PDF en curso."""
+
+
+def _liberar_sesion(sesion) -> None:
+    """
+    Descuenta un trabajo terminado (o cancelado antes de correr) de su sesión.
+    
+    Args:
+        sesion: Identificador de la sesión dueña del trabajo
+    """
+    with _candado:
+        _en_curso[sesion] -= 1
+        if _en_curso[sesion] == 0:
+            del _en_curso[sesion]
+
+
+def _lanzar_trabajo(trabajo: dict) -> bool:
+    """
+    Envía al ejecutor un trabajo en espera si su sesión tiene lugar.
+    
+    Args:
+        trabajo: Trabajo devuelto por iniciar_trabajo_pdf
+    
+    Returns:
+        True si el trabajo ya fue lanzado
+    """
+    sesion = trabajo['sesion']
+    with _candado:
+        if trabajo['futuro'] is not None:
+            return True
+        if 'ejecutar' not in trabajo:
+            return False
+        if sesion is not None and _en_curso.get(sesion, 0) >= PDF_MAX_TRABAJOS_SESION:
+            return False
+        _en_curso[sesion] = _en_curso.get(sesion, 0) + 1
+        trabajo['futuro'] = _ejecutor.submit(trabajo.pop('ejecutar'))
+    
+    trabajo['futuro'].add_done_callback(lambda _: _liberar_sesion(sesion))
+    return True
+
+
+def iniciar_trabajo_pdf(clave: str, funcion, sesion: str = None, **kwargs) -> dict:
+    """
+    Lanza la generación de un PDF en segundo plano.
+    
+    Si la sesión ya tiene PDF_MAX_TRABAJOS_SESION trabajos lanzados, el nuevo queda en
+    espera (sin ocupar un hilo) y se lanza cuando estado_trabajo_pdf encuentra lugar.
+    
+    Si el rerun que lanza el trabajo se está perfilando, el hilo del PDF abre su
+    propio registro (página "<página> (PDF)") y lo deja en trabajo['perfil'].
+    
+    Args:
+        clave: Huella de las entradas; identifica si el trabajo sigue vigente
+        funcion: crear_pdf_acciones o crear_pdf_bonos (deben aceptar `progreso`)
+        sesion: Identificador de la sesión que pide el PDF (None = sin límite por sesión)
+        **kwargs: Argumentos para la función generadora
+    
+    Returns:
+        Diccionario con el estado del trabajo (clave, sesion, progreso, futuro, cancelar, perfil)
+    """
+    trabajo = {
+        'clave': clave,
+        'sesion': sesion,
+        'progreso': 0.0,
+        'cancelar': threading.Event(),
+        'futuro': None,
+        'perfil': None
+    }
+    pagina = ejecucion_activa()
+    
+    def reportar(fraccion: float):
+        if trabajo['cancelar'].is_set():
+            raise PDFCancelado()
+        trabajo['progreso'] = min(max(fraccion, 0.0), 1.0)
+    
+    def ejecutar():
+        iniciar_ejecucion(pagina is not None, f"{pagina} (PDF)")
+        try:
+            reportar(0.0)
+            buffer = funcion(progreso=reportar, **kwargs)
+        finally:
+            trabajo['perfil'] = finalizar_ejecucion()
+        trabajo['progreso'] = 1.0
+        return buffer.getvalue()
+    
+    trabajo['ejecutar'] = ejecutar
+    _lanzar_trabajo(trabajo)
+    return trabajo
+
+
+def cancelar_trabajo_pdf(trabajo: dict) -> None:
+    """
+    Marca un trabajo como cancelado; se detiene en el siguiente aviso de progreso.
+    
+    Un trabajo en espera no llega a lanzarse.
+    
+    Args:
+        trabajo: Trabajo devuelto por iniciar_trabajo_pdf
+    """
+    if trabajo is None:
+        return
+    trabajo['cancelar'].set()
+    with _candado:
+        trabajo.pop('ejecutar', None)
+        futuro = trabajo['futuro']
+    if futuro is not None:
+        futuro.cancel()
+
+
+def estado_trabajo_pdf(trabajo: dict) -> dict:
+    """
+    Consulta el estado de un trabajo sin bloquear (y lanza el trabajo si estaba en espera).
+    
+    Args:
+        trabajo: Trabajo devuelto por iniciar_trabajo_pdf
+    
+    Returns:
+        Diccionario con 'listo', 'en_espera', 'progreso', 'pdf' (bytes o None) y 'error' (str o None)
+    """
+    cancelado = trabajo['cancelar'].is_set()
+    if trabajo['futuro'] is None and (cancelado or not _lanzar_trabajo(trabajo)):
+        return {
+            'listo': cancelado,
+            'en_espera': not cancelado,
+            'progreso': 0.0,
+            'pdf': None,
+            'error': "Generación cancelada" if cancelado else None
+        }
+    
+    futuro = trabajo['futuro']
+    if not futuro.done():
+        return {'listo': False, 'en_espera': False, 'progreso': trabajo['progreso'], 'pdf': None, 'error': None}
+    
+    if futuro.cancelled():
+        return {'listo': True, 'en_espera': False, 'progreso': trabajo['progreso'], 'pdf': None, 'error': "Generación cancelada"}
+    
+    error = futuro.exception()
+    if error is not None:
+        mensaje = "Generación cancelada" if isinstance(error, PDFCancelado) else str(error)
+        return {'listo': True, 'en_espera': False, 'progreso': trabajo['progreso'], 'pdf': None, 'error': mensaje}
+    
+    return {'listo': True, 'en_espera': False, 'progreso': 1.0, 'pdf': futuro.result(), 'error': None}
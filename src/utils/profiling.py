@@ -0,0 +1,189 @@
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from config.constants import ARCHIVO_PERFIL
+
+
+# Estado por hilo: Streamlit ejecuta cada rerun de una sesión en su propio hilo
+_estado = threading.local()
+
+# tracemalloc es global al proceso: se enciende con el primer rerun perfilado y se
+# apaga cuando termina el último, aunque varias sesiones se perfilen a la vez
+_trazado = {'usuarios': 0, 'propio': False}
+_candado_trazado = threading.Lock()
+
+
+def _adquirir_tracemalloc() -> None:
+    """
+    Registra un rerun que usa tracemalloc y lo enciende si nadie lo había hecho.
+    """
+    with _candado_trazado:
+        if _trazado['usuarios'] == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _trazado['propio'] = True
+        if _trazado['usuarios'] == 0:
+            tracemalloc.reset_peak()
+        _trazado['usuarios'] += 1
+
+
+def _liberar_tracemalloc() -> None:
+    """
+    Libera un rerun y apaga tracemalloc si era el último y lo encendió este módulo.
+    """
+    with _candado_trazado:
+        _trazado['usuarios'] = max(_trazado['usuarios'] - 1, 0)
+        if _trazado['usuarios'] == 0 and _trazado['propio']:
+            tracemalloc.stop()
+            _trazado['propio'] = False
+
+
+def perfilado_por_entorno() -> bool:
+    """
+    Indica si el perfilado fue activado mediante la variable de entorno FINCALC_PERFIL.
+
+    Returns:
+        True si FINCALC_PERFIL vale "1"
+    """
+    return os.environ.get("FINCALC_PERFIL", "0") == "1"
+
+
+def iniciar_ejecucion(activo: bool, pagina: str = "") -> None:
+    """
+    Inicia el registro de tiempos para un rerun completo de la aplicación.
+
+    Args:
+        activo: Si es False no se registra nada y los decoradores no tienen costo
+        pagina: Nombre de la página que se está renderizando
+    """
+    if not activo:
+        _estado.registro = None
+        return
+
+    _adquirir_tracemalloc()
+    _estado.registro = {
+        'pagina': pagina,
+        'inicio': time.perf_counter(),
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'memoria_base': tracemalloc.get_traced_memory()[0],
+        'etapas': {}
+    }
+
+
+def ejecucion_activa() -> str:
+    """
+    Indica si el hilo actual está perfilando un rerun (para propagarlo a otros hilos).
+
+    Returns:
+        Nombre de la página del rerun en curso, o None si no hay perfilado
+    """
+    registro = getattr(_estado, 'registro', None)
+    return None if registro is None else registro['pagina']
+
+
+def finalizar_ejecucion(archivo: str = ARCHIVO_PERFIL) -> dict:
+    """
+    Cierra el registro del rerun actual y lo exporta como una línea JSONL.
+
+    El pico de memoria es el de todo el proceso mientras duró el rerun: tracemalloc
+    no distingue hilos, así que con varias sesiones perfiladas a la vez incluye
+    también lo que reservaron las demás.
+
+    Args:
+        archivo: Ruta del archivo JSONL de salida
+
+    Returns:
+        Diccionario con el resumen del rerun, o None si el perfilado estaba inactivo
+    """
+    registro = getattr(_estado, 'registro', None)
+    if registro is None:
+        return None
+
+    _estado.registro = None
+    pico = tracemalloc.get_traced_memory()[1]
+    _liberar_tracemalloc()
+
+    etapas = sorted(
+        registro['etapas'].values(),
+        key=lambda e: e['tiempo_s'],
+        reverse=True
+    )
+    resumen = {
+        'fecha': registro['fecha'],
+        'pagina': registro['pagina'],
+        'duracion_s': round(time.perf_counter() - registro['inicio'], 6),
+        'memoria_pico_kb': round(max(pico - registro['memoria_base'], 0) / 1024, 1),
+        'etapas': etapas
+    }
+
+    try:
+        with open(archivo, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(resumen, ensure_ascii=False) + "\n")
+    except OSError:
+        # El perfilado nunca debe interrumpir la aplicación
+        pass
+
+    return resumen
+
+
+@contextmanager
+def medir_etapa(nombre: str):
+    """
+    Mide tiempo de pared, número de llamadas y memoria retenida de un bloque de código.
+
+    Los tiempos son inclusivos: una etapa anidada también cuenta en la etapa externa.
+    La memoria es lo que el bloque deja reservado al salir (no su pico): el pico de
+    tracemalloc es global y reiniciarlo por etapa interferiría con otras sesiones.
+
+    Args:
+        nombre: Nombre de la etapa en el reporte
+    """
+    registro = getattr(_estado, 'registro', None)
+    if registro is None:
+        yield
+        return
+
+    memoria_inicio = tracemalloc.get_traced_memory()[0]
+    inicio = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        duracion = time.perf_counter() - inicio
+        retenida = max(tracemalloc.get_traced_memory()[0] - memoria_inicio, 0)
+
+        etapa = registro['etapas'].setdefault(nombre, {
+            'etapa': nombre,
+            'llamadas': 0,
+            'tiempo_s': 0.0,
+            'memoria_retenida_kb': 0.0
+        })
+        etapa['llamadas'] += 1
+        etapa['tiempo_s'] = round(etapa['tiempo_s'] + duracion, 6)
+        etapa['memoria_retenida_kb'] = max(etapa['memoria_retenida_kb'], round(retenida / 1024, 1))
+
+
+def perfilar(func):
+    """
+    Decorador que registra cada llamada a la función como una etapa del rerun.
+
+    Args:
+        func: Función a instrumentar
+
+    Returns:
+        Función envuelta; sin perfilado activo solo agrega una consulta al estado
+    """
+    nombre = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    def envoltura(*args, **kwargs):
+        if getattr(_estado, 'registro', None) is None:
+            return func(*args, **kwargs)
+        with medir_etapa(nombre):
+            return func(*args, **kwargs)
+
+    return envoltura
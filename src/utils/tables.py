@@ -1,203 +1,695 @@
+import numpy as np
 import pandas as pd
-from src.calculations.financial_calcs import calcular_tasa_periodo
+from src.calculations.financial_calcs import (
+    calcular_tasa_periodo,
+    calcular_saldos_periodicos,
+    calcular_saldos_en_periodos,
+    generar_aportes_crecientes,
+    generar_vector_aportes,
+    ajustar_aportes,
+    expandir_tasas,
+    calcular_deflactores,
+    calcular_total_aportes,
+    calcular_vf_combinado
+)
+from config.constants import MAX_FILAS_VISTA, COLUMNAS_ENTERAS, IMPUESTO_RETIRO_MENSUAL, ETIQUETAS_COLUMNAS
+from src.utils.helpers import formatear_numeros
+from src.utils.profiling import perfilar
+from src.utils.cache_sqlite import cache_en_disco
 
 
+@perfilar
+@cache_en_disco
 def generar_tabla_crecimiento(
     vp: float,
-    aporte: float,
+    aporte,
     tea: float,
     frecuencia_anual: int,
     plazo_años: int,
-    moneda: str = "USD",
-    aporte_al_inicio: bool = False
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True,
+    inflacion: float = 0.0
 ) -> pd.DataFrame:
     """
     Genera una tabla detallada del crecimiento de la inversión periodo a periodo.
     
+    La tabla es canónica: columnas con claves fijas y sin moneda, de modo que un
+    mismo resultado (cacheado) sirve para cualquier vista; las etiquetas se ponen
+    al mostrarla con etiquetar_tabla.
+    
     Args:
         vp: Valor Presente inicial
-        aporte: Aporte periódico
-        tea: Tasa Efectiva Anual (en decimal)
+        aporte: Aporte periódico (float) o array de aportes por periodo
+        tea: Tasa Efectiva Anual (en decimal), o trayectoria 1-D con una TEA por año o por periodo
         frecuencia_anual: Número de periodos por año
         plazo_años: Plazo en años
-        moneda: Símbolo de la moneda
         aporte_al_inicio: True si el aporte es al inicio del periodo,
                           False si es al final del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año, False si sube cada periodo
+        inflacion: Inflación anual (en decimal); si es mayor a 0 se agregan columnas reales
     
     Returns:
-        DataFrame con columnas: Periodo, Saldo Inicial, Aporte, Interés, Saldo Final
+        DataFrame con índice entero 'periodo' y columnas numéricas: saldo_inicial,
+        aporte, interes, saldo_final (y aporte_real, saldo_final_real si hay inflación)
     """
+    num_periodos = plazo_años * frecuencia_anual
+    if np.ndim(tea) > 0:
+        tea = expandir_tasas(tea, num_periodos, frecuencia_anual)
     tasa_periodo = calcular_tasa_periodo(tea, frecuencia_anual)
+    
+    if tasa_crecimiento != 0 and np.ndim(aporte) == 0:
+        aporte = generar_aportes_crecientes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, crecimiento_anual)
+    
+    saldos = calcular_saldos_periodicos(
+        vp, aporte, tasa_periodo, num_periodos, aporte_al_inicio, capitalizacion_continua
+    )
+    
+    deflactores = calcular_deflactores(inflacion, num_periodos, frecuencia_anual) if inflacion > 0 else None
+    return _armar_tabla_crecimiento(saldos, deflactores)
+
+
+def _armar_tabla_crecimiento(saldos: dict, deflactores=None) -> pd.DataFrame:
+    """
+    Arma la tabla canónica de crecimiento a partir de los saldos por periodo.
+    """
+    df = pd.DataFrame(
+        {
+            'saldo_inicial': np.round(saldos['saldo_inicial'], 2),
+            'aporte': np.round(saldos['aporte'], 2),
+            'interes': np.round(saldos['interes'], 2),
+            'saldo_final': np.round(saldos['saldo_final'], 2)
+        },
+        index=pd.Index(saldos['periodo'], name='periodo')
+    )
+    
+    if deflactores is not None:
+        df['aporte_real'] = np.round(saldos['aporte'] * deflactores, 2)
+        df['saldo_final_real'] = np.round(saldos['saldo_final'] * deflactores, 2)
+    
+    return df
+
+
+def etiquetar_tabla(df: pd.DataFrame, moneda: str = "USD", etiquetas: dict = ETIQUETAS_COLUMNAS) -> pd.DataFrame:
+    """
+    Pone las etiquetas de pantalla a una tabla canónica (paso final antes de mostrarla).
+    
+    El índice (periodo o mes) pasa a ser la primera columna y cada clave canónica
+    se reemplaza por su etiqueta con la moneda, ej. 'saldo_final' → 'Saldo Final (USD)'.
+    Las columnas sin etiqueta se dejan igual.
+    
+    Args:
+        df: Tabla canónica (generar_tabla_crecimiento, generar_cronograma_retiros, ...)
+        moneda: Símbolo de la moneda
+        etiquetas: Diccionario {clave canónica: etiqueta con {moneda}}
+    
+    Returns:
+        Nuevo DataFrame con las columnas etiquetadas
+    """
+    return df.reset_index().rename(columns={
+        clave: etiqueta.format(moneda=moneda) for clave, etiqueta in etiquetas.items()
+    })
+
+
+def calcular_rango_pagina(total_filas: int, pagina: int, filas_por_pagina: int) -> tuple:
+    """
+    Convierte un número de página en el rango de filas [inicio, fin) que le corresponde.
+    
+    Args:
+        total_filas: Número total de filas del cronograma
+        pagina: Número de página (empezando en 1); se limita al rango válido
+        filas_por_pagina: Filas por página
+    
+    Returns:
+        Tupla (inicio, fin) con índices de fila (fin excluido)
+    """
+    num_paginas = max(1, -(-total_filas // filas_por_pagina))
+    pagina = min(max(int(pagina), 1), num_paginas)
+    inicio = (pagina - 1) * filas_por_pagina
+    return inicio, min(inicio + filas_por_pagina, total_filas)
+
+
+@perfilar
+def generar_ventana_crecimiento(
+    vp: float,
+    aporte,
+    tea: float,
+    frecuencia_anual: int,
+    plazo_años: int,
+    inicio: int,
+    fin: int,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True,
+    inflacion: float = 0.0
+) -> pd.DataFrame:
+    """
+    Genera solo las filas [inicio, fin) de la tabla de crecimiento.
+    
+    Con TEA y aporte base constantes (con o sin crecimiento) los saldos salen de la
+    forma cerrada en cada periodo pedido, así que el costo depende del tamaño de la
+    ventana y no del plazo. Con aportes irregulares o una trayectoria de TEA no hay
+    forma cerrada y se recorta la tabla completa.
+    
+    Args:
+        vp: Valor Presente inicial
+        aporte: Aporte periódico (float) o array de aportes por periodo
+        tea: Tasa Efectiva Anual (en decimal), o trayectoria 1-D con una TEA por año o por periodo
+        frecuencia_anual: Número de periodos por año
+        plazo_años: Plazo en años
+        inicio: Primera fila (índice desde 0)
+        fin: Fila final (excluida)
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año, False si sube cada periodo
+        inflacion: Inflación anual (en decimal); si es mayor a 0 se agregan columnas reales
+    
+    Returns:
+        DataFrame canónico con las mismas columnas que generar_tabla_crecimiento
+    """
     num_periodos = plazo_años * frecuencia_anual
+    inicio, fin = max(0, inicio), min(fin, num_periodos)
     
-    data = []
-    saldo = vp
+    if np.ndim(tea) > 0 or np.ndim(aporte) > 0:
+        df = generar_tabla_crecimiento(
+            vp, aporte, tea, frecuencia_anual, plazo_años, aporte_al_inicio,
+            capitalizacion_continua, tasa_crecimiento, crecimiento_anual, inflacion
+        )
+        return df.iloc[inicio:fin]
     
-    for periodo in range(1, num_periodos + 1):
-        saldo_inicial = saldo
-        aporte_periodo = aporte
-        
-        if aporte_al_inicio:
-            # Aporte al inicio: primero se aporta, luego se calcula interés
-            base_interes = saldo_inicial + aporte_periodo
-            interes_ganado = base_interes * tasa_periodo
-            saldo_final = base_interes + interes_ganado
-        else:
-            # Aporte al final: primero se calcula interés, luego se aporta
-            interes_ganado = saldo_inicial * tasa_periodo
-            saldo_final = saldo_inicial + interes_ganado + aporte_periodo
-        
-        data.append({
-            'Periodo': periodo,
-            f'Saldo Inicial ({moneda})': round(saldo_inicial, 2),
-            f'Aporte ({moneda})': round(aporte_periodo, 2),
-            f'Interés Ganado ({moneda})': round(interes_ganado, 2),
-            f'Saldo Final ({moneda})': round(saldo_final, 2)
-        })
-        
-        saldo = saldo_final
+    tasa_periodo = calcular_tasa_periodo(tea, frecuencia_anual)
+    periodos = np.arange(inicio + 1, max(fin, inicio) + 1)
+    saldos_cierre = calcular_saldos_en_periodos(
+        vp, aporte, tasa_periodo, np.arange(inicio, max(fin, inicio) + 1), aporte_al_inicio,
+        capitalizacion_continua, tasa_crecimiento, frecuencia_anual, crecimiento_anual
+    )
     
-    return pd.DataFrame(data)
+    periodos_por_escalon = frecuencia_anual if crecimiento_anual else 1
+    aportes = aporte * np.power(1 + tasa_crecimiento, (periodos - 1) // periodos_por_escalon, dtype=float)
+    saldo_inicial, saldo_final = saldos_cierre[:-1], saldos_cierre[1:]
+    saldos = {
+        'periodo': periodos,
+        'saldo_inicial': saldo_inicial,
+        'aporte': aportes,
+        'interes': saldo_final - saldo_inicial - aportes,
+        'saldo_final': saldo_final
+    }
+    
+    deflactores = None
+    if inflacion > 0:
+        deflactores = calcular_deflactores(inflacion, len(periodos), frecuencia_anual, primer_periodo=inicio + 1)
+    return _armar_tabla_crecimiento(saldos, deflactores)
 
 
-def formatear_tabla_crecimiento(df: pd.DataFrame) -> pd.DataFrame:
+def seleccionar_vista(num_periodos: int, frecuencia_anual: int, max_filas: int = MAX_FILAS_VISTA) -> str:
     """
-    Formatea la tabla de crecimiento para visualización.
+    Elige la resolución de visualización para que tablas y gráficos no superen max_filas.
     
     Args:
-        df: DataFrame con los datos de crecimiento
+        num_periodos: Número total de periodos del cronograma
+        frecuencia_anual: Número de periodos por año
+        max_filas: Número máximo de filas/puntos a enviar al navegador
     
     Returns:
-        DataFrame formateado para mostrar
+        "Periodo" (sin agregar), "Mensual" o "Anual"
+    """
+    if num_periodos <= max_filas:
+        return "Periodo"
+    if frecuencia_anual > 12 and num_periodos * 12 / frecuencia_anual <= max_filas:
+        return "Mensual"
+    return "Anual"
+
+
+def calcular_grupos_vista(periodos: np.ndarray, frecuencia_anual: int, vista: str) -> np.ndarray:
     """
-    df_formatted = df.copy()
+    Asigna a cada periodo (1..n) el número de mes o año al que pertenece.
     
-    # Formatear columnas numéricas
-    for col in df_formatted.columns:
-        if col != 'Periodo':
-            df_formatted[col] = df_formatted[col].apply(lambda x: f"{x:,.2f}")
+    Args:
+        periodos: Array de números de periodo (empezando en 1)
+        frecuencia_anual: Número de periodos por año
+        vista: "Mensual" o "Anual"
     
-    return df_formatted
+    Returns:
+        Array con el número de grupo (empezando en 1) de cada periodo
+    """
+    periodos_por_grupo = frecuencia_anual / 12 if vista == "Mensual" else frecuencia_anual
+    return np.floor((periodos - 1) / periodos_por_grupo + 1e-9).astype(int) + 1
 
 
-def generar_resumen_tabla(df: pd.DataFrame, moneda: str = "USD") -> dict:
+def agregar_tabla_crecimiento(df: pd.DataFrame, frecuencia_anual: int, vista: str) -> pd.DataFrame:
     """
-    Genera un resumen estadístico de la tabla de crecimiento.
+    Agrega la tabla de crecimiento por mes o por año.
+    
+    Los saldos toman el primer/último valor del grupo; aportes e intereses se suman.
     
     Args:
-        df: DataFrame con los datos de crecimiento
-        moneda: Símbolo de la moneda
+        df: DataFrame generado por generar_tabla_crecimiento
+        frecuencia_anual: Número de periodos por año
+        vista: "Periodo" (sin cambios), "Mensual" o "Anual"
     
     Returns:
-        Diccionario con estadísticas resumidas
+        DataFrame con las mismas columnas, donde el índice 'periodo' es el número de mes o año
+    """
+    if vista == "Periodo" or (vista == "Mensual" and frecuencia_anual <= 12):
+        return df
+    
+    grupos = calcular_grupos_vista(df.index.to_numpy(), frecuencia_anual, vista)
+    agrupado = df.groupby(grupos, sort=True)
+    
+    df_agregado = pd.DataFrame({
+        'saldo_inicial': agrupado['saldo_inicial'].first(),
+        'aporte': agrupado['aporte'].sum().round(2),
+        'interes': agrupado['interes'].sum().round(2),
+        'saldo_final': agrupado['saldo_final'].last()
+    })
+    if 'saldo_final_real' in df.columns:
+        df_agregado['aporte_real'] = agrupado['aporte_real'].sum().round(2)
+        df_agregado['saldo_final_real'] = agrupado['saldo_final_real'].last()
+    df_agregado.index.name = 'periodo'
+    
+    return df_agregado
+
+
+def contar_filas_vista(num_periodos: int, frecuencia_anual: int, vista: str) -> int:
+    """
+    Cuenta las filas de la tabla de crecimiento en la vista indicada, sin generarla.
+    
+    Args:
+        num_periodos: Número total de periodos del cronograma
+        frecuencia_anual: Número de periodos por año
+        vista: "Periodo", "Mensual" o "Anual"
+    
+    Returns:
+        Número de filas (periodos, meses o años)
+    """
+    if vista == "Periodo" or (vista == "Mensual" and frecuencia_anual <= 12) or num_periodos == 0:
+        return num_periodos
+    return int(calcular_grupos_vista(np.array([num_periodos]), frecuencia_anual, vista)[0])
+
+
+def calcular_cierres_vista(grupos: np.ndarray, frecuencia_anual: int, vista: str, num_periodos: int) -> np.ndarray:
+    """
+    Calcula el último periodo de cada mes o año (el inverso de calcular_grupos_vista).
+    
+    Args:
+        grupos: Array de números de grupo (0 = antes del primer periodo)
+        frecuencia_anual: Número de periodos por año
+        vista: "Mensual" o "Anual"
+        num_periodos: Número total de periodos (el último grupo cierra ahí)
+    
+    Returns:
+        Array con el periodo de cierre de cada grupo
+    """
+    periodos_por_grupo = frecuencia_anual / 12 if vista == "Mensual" else frecuencia_anual
+    cierres = np.ceil((np.asarray(grupos) - 1e-9) * periodos_por_grupo).astype(int)
+    return np.clip(cierres, 0, num_periodos)
+
+
+@perfilar
+def generar_ventana_vista(
+    vp: float,
+    aporte,
+    tea: float,
+    frecuencia_anual: int,
+    plazo_años: int,
+    vista: str,
+    inicio: int,
+    fin: int,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True,
+    inflacion: float = 0.0
+) -> pd.DataFrame:
+    """
+    Genera solo las filas [inicio, fin) de la tabla de crecimiento por periodo, mes o año.
+    
+    Equivale a agregar_tabla_crecimiento(generar_tabla_crecimiento(...)).iloc[inicio:fin],
+    pero con TEA y aporte base constantes los saldos salen de la forma cerrada en el
+    cierre de cada grupo y los aportes de su suma acumulada, así que el costo depende
+    del tamaño de la ventana y no del plazo.
+    
+    Args:
+        vp: Valor Presente inicial
+        aporte: Aporte periódico (float) o array de aportes por periodo
+        tea: Tasa Efectiva Anual (en decimal), o trayectoria 1-D con una TEA por año o por periodo
+        frecuencia_anual: Número de periodos por año
+        plazo_años: Plazo en años
+        vista: "Periodo", "Mensual" o "Anual"
+        inicio: Primera fila (índice desde 0)
+        fin: Fila final (excluida)
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año, False si sube cada periodo
+        inflacion: Inflación anual (en decimal); si es mayor a 0 se agregan columnas reales
+    
+    Returns:
+        DataFrame canónico con las columnas de generar_tabla_crecimiento; el índice
+        'periodo' es el número de periodo, mes o año
+    """
+    argumentos = dict(
+        aporte_al_inicio=aporte_al_inicio,
+        capitalizacion_continua=capitalizacion_continua,
+        tasa_crecimiento=tasa_crecimiento,
+        crecimiento_anual=crecimiento_anual,
+        inflacion=inflacion
+    )
+    if vista == "Periodo" or (vista == "Mensual" and frecuencia_anual <= 12):
+        return generar_ventana_crecimiento(vp, aporte, tea, frecuencia_anual, plazo_años, inicio, fin, **argumentos)
+    
+    if np.ndim(tea) > 0 or np.ndim(aporte) > 0:
+        df = generar_tabla_crecimiento(vp, aporte, tea, frecuencia_anual, plazo_años, **argumentos)
+        return agregar_tabla_crecimiento(df, frecuencia_anual, vista).iloc[max(0, inicio):fin]
+    
+    num_periodos = plazo_años * frecuencia_anual
+    inicio = max(0, inicio)
+    fin = max(min(fin, contar_filas_vista(num_periodos, frecuencia_anual, vista)), inicio)
+    grupos = np.arange(inicio, fin + 1)
+    cierres = calcular_cierres_vista(grupos, frecuencia_anual, vista, num_periodos)
+    
+    saldos_cierre = calcular_saldos_en_periodos(
+        vp, aporte, calcular_tasa_periodo(tea, frecuencia_anual), cierres, aporte_al_inicio,
+        capitalizacion_continua, tasa_crecimiento, frecuencia_anual, crecimiento_anual
+    )
+    aportes = np.diff(calcular_total_aportes(aporte, cierres, tasa_crecimiento, frecuencia_anual, crecimiento_anual))
+    saldo_inicial, saldo_final = saldos_cierre[:-1], saldos_cierre[1:]
+    df = _armar_tabla_crecimiento({
+        'periodo': grupos[1:],
+        'saldo_inicial': saldo_inicial,
+        'aporte': aportes,
+        'interes': saldo_final - saldo_inicial - aportes,
+        'saldo_final': saldo_final
+    })
+    
+    if inflacion > 0:
+        # Los aportes reales se deflactan periodo a periodo, solo dentro de la ventana
+        periodos = np.arange(cierres[0] + 1, cierres[-1] + 1)
+        periodos_por_escalon = frecuencia_anual if crecimiento_anual else 1
+        aportes_periodo = aporte * np.power(1 + tasa_crecimiento, (periodos - 1) // periodos_por_escalon, dtype=float)
+        aportes_reales = aportes_periodo * np.power(1 + inflacion, -periodos / frecuencia_anual)
+        df['aporte_real'] = np.round(np.add.reduceat(aportes_reales, cierres[:-1] - cierres[0]), 2) if len(df) else []
+        df['saldo_final_real'] = np.round(saldo_final * np.power(1 + inflacion, -cierres[1:] / frecuencia_anual), 2)
+    
+    return df
+
+
+@perfilar
+def generar_resumen_crecimiento(
+    vp: float,
+    aporte,
+    tea: float,
+    frecuencia_anual: int,
+    plazo_años: int,
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True,
+    inflacion: float = 0.0
+) -> dict:
+    """
+    Calcula el resumen de la tabla de crecimiento sin generarla.
+    
+    El saldo final sale de calcular_vf_combinado y los totales de la suma de aportes;
+    devuelve las mismas claves que generar_resumen_tabla.
+    
+    Args:
+        vp: Valor Presente inicial
+        aporte: Aporte periódico (float) o array de aportes por periodo
+        tea: Tasa Efectiva Anual (en decimal)
+        frecuencia_anual: Número de periodos por año
+        plazo_años: Plazo en años
+        aporte_al_inicio: True si el aporte es al inicio del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año, False si sube cada periodo
+        inflacion: Inflación anual (en decimal); si es mayor a 0 se agregan los totales reales
+    
+    Returns:
+        Diccionario con saldo_inicial, total_aportes, total_intereses, saldo_final y
+        ganancia_total (y total_aportes_real, saldo_final_real si hay inflación)
+    """
+    num_periodos = plazo_años * frecuencia_anual
+    saldo_final = calcular_vf_combinado(
+        vp, aporte, tea, frecuencia_anual, plazo_años, aporte_al_inicio,
+        capitalizacion_continua, tasa_crecimiento, crecimiento_anual
+    )
+    if np.ndim(aporte) > 0:
+        total_aportes = float(np.sum(ajustar_aportes(aporte, num_periodos)))
+    else:
+        total_aportes = calcular_total_aportes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, crecimiento_anual)
+    
+    resumen = {
+        'saldo_inicial': vp,
+        'total_aportes': total_aportes,
+        'total_intereses': saldo_final - vp - total_aportes,
+        'saldo_final': saldo_final,
+        'ganancia_total': saldo_final - vp - total_aportes
+    }
+    
+    if inflacion > 0:
+        deflactores = calcular_deflactores(inflacion, num_periodos, frecuencia_anual)
+        aportes = generar_vector_aportes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, crecimiento_anual)
+        resumen['total_aportes_real'] = float(aportes @ deflactores)
+        resumen['saldo_final_real'] = saldo_final * deflactores[-1] if num_periodos else vp
+    
+    return resumen
+
+
+def declarar_formatos(df: pd.DataFrame, decimales: int = 2, columnas_enteras=COLUMNAS_ENTERAS) -> dict:
     """
-    col_saldo_inicial = f'Saldo Inicial ({moneda})'
-    col_aporte = f'Aporte ({moneda})'
-    col_interes = f'Interés Ganado ({moneda})'
-    col_saldo_final = f'Saldo Final ({moneda})'
+    Declara el formato de cada columna numérica de una tabla.
+    
+    Las columnas de conteo (Periodo, Mes) no llevan formato y se muestran como enteros.
     
-    total_aportes = df[col_aporte].sum()
-    total_intereses = df[col_interes].sum()
-    saldo_inicial_total = df[col_saldo_inicial].iloc[0]
-    saldo_final_total = df[col_saldo_final].iloc[-1]
+    Args:
+        df: DataFrame a mostrar
+        decimales: Decimales de las columnas numéricas
+        columnas_enteras: Columnas que se dejan sin formato
     
+    Returns:
+        Diccionario {columna: decimales}
+    """
     return {
+        col: decimales
+        for col in df.columns
+        if col not in columnas_enteras and pd.api.types.is_numeric_dtype(df[col])
+    }
+
+
+@perfilar
+def formatear_tabla_texto(df: pd.DataFrame, formatos: dict = None, separador_miles: bool = True) -> pd.DataFrame:
+    """
+    Convierte las columnas numéricas a texto para salidas que lo necesitan (PDF).
+    
+    Cada columna se formatea completa con formatear_numeros, sin recorrer celda por celda.
+    
+    Args:
+        df: DataFrame con columnas numéricas
+        formatos: Diccionario {columna: decimales} (por defecto declarar_formatos(df))
+        separador_miles: True para separar miles con comas
+    
+    Returns:
+        Copia del DataFrame con las columnas de formatos como texto
+    """
+    formatos = declarar_formatos(df) if formatos is None else formatos
+    df_texto = df.copy()
+    for col, decimales in formatos.items():
+        df_texto[col] = formatear_numeros(df[col].to_numpy(dtype=float), decimales, separador_miles)
+    return df_texto
+
+
+def formatear_tabla_crecimiento(df: pd.DataFrame, moneda: str = "USD") -> pd.DataFrame:
+    """
+    Etiqueta y formatea la tabla de crecimiento como texto (para salidas que lo necesitan).
+    
+    En pantalla la tabla se muestra numérica con configurar_columnas_numericas.
+    
+    Args:
+        df: Tabla canónica de generar_tabla_crecimiento
+        moneda: Símbolo de la moneda
+    
+    Returns:
+        DataFrame etiquetado con los montos como texto ("1,234.56")
+    """
+    return formatear_tabla_texto(etiquetar_tabla(df, moneda))
+
+
+@perfilar
+def generar_resumen_tabla(df: pd.DataFrame) -> dict:
+    """
+    Genera un resumen estadístico de la tabla de crecimiento.
+    
+    Args:
+        df: Tabla canónica de generar_tabla_crecimiento (o agregada)
+    
+    Returns:
+        Diccionario con estadísticas resumidas
+    """
+    total_aportes = df['aporte'].sum()
+    total_intereses = df['interes'].sum()
+    saldo_inicial_total = df['saldo_inicial'].iloc[0]
+    saldo_final_total = df['saldo_final'].iloc[-1]
+    
+    resumen = {
         'saldo_inicial': saldo_inicial_total,
         'total_aportes': total_aportes,
         'total_intereses': total_intereses,
         'saldo_final': saldo_final_total,
         'ganancia_total': saldo_final_total - saldo_inicial_total - total_aportes
     }
+    
+    if 'saldo_final_real' in df.columns:
+        resumen['total_aportes_real'] = df['aporte_real'].sum()
+        resumen['saldo_final_real'] = df['saldo_final_real'].iloc[-1]
+    
+    return resumen
 
 
+@perfilar
+@cache_en_disco
 def generar_cronograma_retiros(
     vf: float,
     tasa_mensual_retiro: float,
     meses: int,
-    moneda: str = "USD"
+    inflacion: float = 0.0,
+    desfase_años: float = 0.0
 ) -> pd.DataFrame:
     """
-    Genera un cronograma detallado de retiros mensuales.
+    Genera un cronograma detallado de retiros mensuales (tabla canónica, sin moneda).
+    
+    El retiro bruto es constante y agota el saldo en el último mes. Con
+    D_m = Π_{k≤m} (1 + r_k)^-1, el retiro es C = VF / Σ D_m y el saldo al cierre
+    del mes m es (VF - C × Σ_{k≤m} D_k) / D_m, calculado con productos acumulados.
     
     Args:
         vf: Valor Futuro (saldo inicial para retiros)
-        tasa_mensual_retiro: Tasa mensual de retiro (50% de TEA)
+        tasa_mensual_retiro: Tasa mensual de retiro (50% de TEA), o trayectoria
+                             con una tasa mensual por año o por mes
         meses: Número de meses de retiro
-        moneda: Símbolo de la moneda
+        inflacion: Inflación anual (en decimal); si es mayor a 0 se agregan columnas reales
+        desfase_años: Años entre hoy y el inicio de los retiros (plazo de acumulación)
     
     Returns:
-        DataFrame con columnas: Mes, Saldo Inicial, Interés Generado, 
-                                Impuesto (5%), Retiro Bruto, Retiro Neto, Saldo Final
+        DataFrame con índice entero 'mes' y columnas numéricas: saldo_inicial, interes,
+        impuesto, retiro_bruto, retiro_neto, saldo_final
+        (y retiro_neto_real, saldo_final_real si hay inflación)
     """
-    IMPUESTO_RETIRO_MENSUAL = 0.05
-    
-    # Calcular retiro mensual bruto
-    if tasa_mensual_retiro == 0:
-        retiro_mensual_bruto = vf / meses if meses > 0 else 0
+    if np.ndim(tasa_mensual_retiro) > 0:
+        tasas = expandir_tasas(tasa_mensual_retiro, meses, 12)
     else:
-        retiro_mensual_bruto = vf * (tasa_mensual_retiro / (1 - (1 + tasa_mensual_retiro) ** -meses))
-    
-    data = []
-    saldo = vf
-    
-    for mes in range(1, meses + 1):
-        saldo_inicial = saldo
-        
-        # Interés generado este mes
-        interes_mes = saldo_inicial * tasa_mensual_retiro
-        
-        # Impuesto del 5% sobre el interés
-        impuesto_mes = interes_mes * IMPUESTO_RETIRO_MENSUAL
-        
-        # Retiro neto (retiro bruto - impuesto)
-        retiro_neto = retiro_mensual_bruto - impuesto_mes
-        
-        # Nuevo saldo después del retiro
-        saldo_final = saldo_inicial + interes_mes - retiro_mensual_bruto
-        
-        # Ajustar saldo si es el último mes (por redondeos)
-        if mes == meses and abs(saldo_final) < 1:
-            saldo_final = 0
-        
-        data.append({
-            'Mes': mes,
-            f'Saldo Inicial ({moneda})': round(saldo_inicial, 2),
-            f'Interés Generado ({moneda})': round(interes_mes, 2),
-            f'Impuesto 5% ({moneda})': round(impuesto_mes, 2),
-            f'Retiro Bruto ({moneda})': round(retiro_mensual_bruto, 2),
-            f'Retiro Neto ({moneda})': round(retiro_neto, 2),
-            f'Saldo Final ({moneda})': round(saldo_final, 2)
-        })
-        
-        saldo = saldo_final
-    
-    return pd.DataFrame(data)
-
-
-def generar_resumen_cronograma_retiros(df: pd.DataFrame, moneda: str = "USD") -> dict:
+        tasas = np.full(meses, float(tasa_mensual_retiro))
+    
+    # Factores de descuento acumulados y retiro mensual bruto constante
+    descuento = np.cumprod(1 / (1 + tasas))
+    retiro_mensual_bruto = vf / descuento.sum() if meses > 0 else 0
+    
+    saldo_final = (vf - retiro_mensual_bruto * np.cumsum(descuento)) / descuento
+    
+    # Ajustar saldo del último mes (por redondeos)
+    if meses > 0 and abs(saldo_final[-1]) < 1:
+        saldo_final[-1] = 0
+    
+    saldo_inicial = np.concatenate(([vf], saldo_final[:-1]))
+    deflactores = calcular_deflactores(inflacion, meses, 12, desfase_años) if inflacion > 0 else None
+    
+    return _armar_cronograma_retiros(
+        np.arange(1, meses + 1), saldo_inicial, saldo_final, tasas, retiro_mensual_bruto, deflactores
+    )
+
+
+def _armar_cronograma_retiros(
+    meses: np.ndarray,
+    saldo_inicial: np.ndarray,
+    saldo_final: np.ndarray,
+    tasas,
+    retiro_mensual_bruto: float,
+    deflactores=None
+) -> pd.DataFrame:
+    """
+    Arma el cronograma canónico de retiros a partir de los saldos de cada mes.
+    """
+    interes_mes = saldo_inicial * tasas
+    impuesto_mes = interes_mes * IMPUESTO_RETIRO_MENSUAL
+    retiro_bruto = np.full(len(meses), float(retiro_mensual_bruto))
+    
+    retiro_neto = retiro_bruto - impuesto_mes
+    
+    df = pd.DataFrame(
+        {
+            'saldo_inicial': np.round(saldo_inicial, 2),
+            'interes': np.round(interes_mes, 2),
+            'impuesto': np.round(impuesto_mes, 2),
+            'retiro_bruto': np.round(retiro_bruto, 2),
+            'retiro_neto': np.round(retiro_neto, 2),
+            'saldo_final': np.round(saldo_final, 2)
+        },
+        index=pd.Index(meses, name='mes')
+    )
+    
+    if deflactores is not None:
+        df['retiro_neto_real'] = np.round(retiro_neto * deflactores, 2)
+        df['saldo_final_real'] = np.round(saldo_final * deflactores, 2)
+    
+    return df
+
+
+@perfilar
+def generar_cronograma_ciclo(ciclo: dict, inicio: int = 0, fin: int = None, indice: int = 0) -> pd.DataFrame:
+    """
+    Genera las filas [inicio, fin) del cronograma de retiros a partir del ciclo de vida.
+    
+    Usa los saldos, retiros e impuestos ya calculados por calcular_ciclo_vida, así la
+    tabla coincide con las métricas del mismo ciclo (mismo VF y mismo retiro).
+    
+    Args:
+        ciclo: Resultado de calcular_ciclo_vida
+        inicio: Primera fila (índice desde 0)
+        fin: Fila final (excluida); None = hasta el último mes de retiro
+        indice: Escenario a convertir
+    
+    Returns:
+        DataFrame canónico con las mismas columnas que generar_cronograma_retiros
+    """
+    meses_acumulacion = int(ciclo['meses_acumulacion'][indice])
+    meses = int(ciclo['meses_retiro'][indice])
+    fin = meses if fin is None else min(fin, meses)
+    inicio = max(0, min(inicio, fin))
+    
+    # Mes j del retiro = mes meses_acumulacion + j del ciclo
+    cierres = meses_acumulacion + np.arange(inicio, fin + 1)
+    saldos = ciclo['saldo'][indice, cierres]
+    deflactores = ciclo['deflactor'][cierres[1:]] if 'deflactor' in ciclo else None
+    
+    return _armar_cronograma_retiros(
+        np.arange(inicio + 1, fin + 1), saldos[:-1], saldos[1:], ciclo['tasa_retiro'][indice],
+        ciclo['retiro_mensual_bruto'][indice], deflactores
+    )
+
+
+@perfilar
+def generar_resumen_cronograma_retiros(df: pd.DataFrame) -> dict:
     """
     Genera un resumen estadístico del cronograma de retiros.
     
     Args:
-        df: DataFrame con el cronograma de retiros
-        moneda: Símbolo de la moneda
+        df: Cronograma canónico de generar_cronograma_retiros
     
     Returns:
         Diccionario con estadísticas resumidas
     """
-    col_saldo_inicial = f'Saldo Inicial ({moneda})'
-    col_interes = f'Interés Generado ({moneda})'
-    col_impuesto = f'Impuesto 5% ({moneda})'
-    col_retiro_bruto = f'Retiro Bruto ({moneda})'
-    col_retiro_neto = f'Retiro Neto ({moneda})'
-    
-    total_intereses = df[col_interes].sum()
-    total_impuestos = df[col_impuesto].sum()
-    total_retiro_bruto = df[col_retiro_bruto].sum()
-    total_retiro_neto = df[col_retiro_neto].sum()
-    saldo_inicial_total = df[col_saldo_inicial].iloc[0]
+    total_intereses = df['interes'].sum()
+    total_impuestos = df['impuesto'].sum()
+    total_retiro_bruto = df['retiro_bruto'].sum()
+    total_retiro_neto = df['retiro_neto'].sum()
+    saldo_inicial_total = df['saldo_inicial'].iloc[0]
     
-    return {
+    resumen = {
         'saldo_inicial': saldo_inicial_total,
         'total_intereses': total_intereses,
         'total_impuestos': total_impuestos,
@@ -205,3 +697,45 @@ def generar_resumen_cronograma_retiros(df: pd.DataFrame, moneda: str = "USD") ->
         'total_retiro_neto': total_retiro_neto,
         'retiro_mensual_promedio': total_retiro_neto / len(df) if len(df) > 0 else 0
     }
+    
+    if 'retiro_neto_real' in df.columns:
+        resumen['total_retiro_neto_real'] = df['retiro_neto_real'].sum()
+        resumen['retiro_real_inicial'] = df['retiro_neto_real'].iloc[0]
+        resumen['retiro_real_final'] = df['retiro_neto_real'].iloc[-1]
+    
+    return resumen
+
+
+@perfilar
+def generar_tabla_ciclo_vida(ciclo: dict, indice: int = 0) -> pd.DataFrame:
+    """
+    Convierte el camino de un escenario del ciclo de vida en una tabla canónica mes a mes.
+    
+    Args:
+        ciclo: Resultado de calcular_ciclo_vida
+        indice: Escenario a convertir
+    
+    Returns:
+        DataFrame con índice entero 'mes' y columnas: edad, fase, saldo, aportado,
+        retiro_bruto, impuesto, retiro_neto (y saldo_real si hay inflación)
+    """
+    fin = int(ciclo['meses_acumulacion'][indice] + ciclo['meses_retiro'][indice]) + 1
+    mes = ciclo['mes'][:fin]
+    
+    df = pd.DataFrame(
+        {
+            'edad': np.round(ciclo['edad'][:fin], 2),
+            'fase': np.where(mes <= ciclo['meses_acumulacion'][indice], "Acumulación", "Retiro"),
+            'saldo': np.round(ciclo['saldo'][indice, :fin], 2),
+            'aportado': np.round(ciclo['aportado'][indice, :fin], 2),
+            'retiro_bruto': np.round(ciclo['retiro_bruto'][indice, :fin], 2),
+            'impuesto': np.round(ciclo['impuesto'][indice, :fin], 2),
+            'retiro_neto': np.round(ciclo['retiro_neto'][indice, :fin], 2)
+        },
+        index=pd.Index(mes, name='mes')
+    )
+    
+    if 'saldo_real' in ciclo:
+        df['saldo_real'] = np.round(ciclo['saldo_real'][indice, :fin], 2)
+    
+    return df
@@ -1,10 +1,16 @@
+import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
+from src.visualization.reduccion import clase_traza
+from src.visualization.figuras import cache_figura, LEYENDA_HORIZONTAL
+from src.utils.profiling import perfilar
 
 
+@perfilar
+@cache_figura
 def crear_grafico_flujos_bono(flujos: list, moneda: str = "USD") -> go.Figure:
     """
-    Crea un gráfico de barras mostrando los flujos de caja del bono.
+    Crea un gráfico de barras apiladas con el cupón y el principal de cada periodo.
     
     Args:
         flujos: Lista de diccionarios con información de flujos
@@ -15,32 +21,40 @@ def crear_grafico_flujos_bono(flujos: list, moneda: str = "USD") -> go.Figure:
     """
     df = pd.DataFrame(flujos)
     
-    # Colores diferentes para el último flujo (incluye principal)
-    colors = ['#4ECDC4' if not f['es_ultimo'] else '#FF6B6B' for f in flujos]
-    
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
         x=df['periodo'],
-        y=df['flujo'],
-        marker_color=colors,
+        y=df['cupon'],
+        name='Cupón',
+        marker_color='#4ECDC4',
+        hovertemplate=f'<b>Periodo:</b> %{{x}}<br><b>Cupón:</b> {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.add_trace(go.Bar(
+        x=df['periodo'],
+        y=df['principal'],
+        name='Principal',
+        marker_color='#FF6B6B',
         text=df['flujo'].apply(lambda x: f'{moneda} {x:,.2f}'),
         textposition='outside',
-        hovertemplate=f'<b>Periodo:</b> %{{x}}<br><b>Flujo:</b> {moneda} %{{y:,.2f}}<extra></extra>'
+        hovertemplate=f'<b>Periodo:</b> %{{x}}<br><b>Principal:</b> {moneda} %{{y:,.2f}}<extra></extra>'
     ))
     
     fig.update_layout(
         title='Flujos de Caja del Bono',
         xaxis_title='Periodo',
         yaxis_title=f'Flujo ({moneda})',
-        template='plotly_white',
-        height=500,
-        showlegend=False
+        barmode='stack',
+        legend=LEYENDA_HORIZONTAL,
+        height=500
     )
     
     return fig
 
 
+@perfilar
+@cache_figura
 def crear_grafico_valor_presente(flujos: list, moneda: str = "USD") -> go.Figure:
     """
     Crea un gráfico comparativo entre flujos nominales y valores presentes.
@@ -77,20 +91,14 @@ def crear_grafico_valor_presente(flujos: list, moneda: str = "USD") -> go.Figure
         xaxis_title='Periodo',
         yaxis_title=f'Monto ({moneda})',
         barmode='group',
-        template='plotly_white',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
+        legend=LEYENDA_HORIZONTAL,
         height=500
     )
     
     return fig
 
 
+@perfilar
 def crear_tabla_flujos(flujos: list, moneda: str = "USD") -> pd.DataFrame:
     """
     Crea un DataFrame con el detalle de flujos para mostrar en tabla.
@@ -100,20 +108,28 @@ def crear_tabla_flujos(flujos: list, moneda: str = "USD") -> pd.DataFrame:
         moneda: Símbolo de la moneda
     
     Returns:
-        DataFrame con los flujos formateados
+        DataFrame con los flujos (montos numéricos; el formato se aplica al mostrar)
     """
-    data = []
-    for f in flujos:
-        data.append({
-            'Periodo': f['periodo'],
-            f'Flujo ({moneda})': f'{f["flujo"]:,.2f}',
-            f'Valor Presente ({moneda})': f'{f["vp_flujo"]:,.2f}',
-            'Tipo': 'Cupón + Principal' if f['es_ultimo'] else 'Cupón'
-        })
+    df = pd.DataFrame(flujos)
+    tipo = np.where(
+        df['principal'] > 0,
+        np.where(df['cupon'] > 0, 'Cupón + Principal', 'Principal'),
+        'Cupón'
+    )
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'Periodo': df['periodo'],
+        f'Saldo Inicial ({moneda})': df['saldo_inicial'],
+        f'Cupón ({moneda})': df['cupon'],
+        f'Principal ({moneda})': df['principal'],
+        f'Flujo ({moneda})': df['flujo'],
+        f'Valor Presente ({moneda})': df['vp_flujo'],
+        'Tipo': tipo
+    })
 
 
+@perfilar
+@cache_figura
 def crear_grafico_composicion_bono(
     vp_cupones: float,
     vp_principal: float,
@@ -147,3 +163,216 @@ def crear_grafico_composicion_bono(
     )
     
     return fig
+
+
+@perfilar
+@cache_figura
+def crear_grafico_precio_rendimiento(sensibilidad: dict, tea_base: float, moneda: str = "USD") -> go.Figure:
+    """
+    Crea la curva precio-rendimiento del bono con los choques de tasa marcados.
+    
+    Args:
+        sensibilidad: Resultado de calcular_sensibilidad_bono
+        tea_base: TEA de descuento base (en decimal)
+        moneda: Símbolo de la moneda
+    
+    Returns:
+        Figura de Plotly
+    """
+    curva = sensibilidad['curva']
+    choques = sensibilidad['choques']
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=curva['tea'] * 100,
+        y=curva['precio'],
+        mode='lines',
+        name='Precio',
+        line=dict(color='#4ECDC4', width=3),
+        hovertemplate=f'<b>TEA:</b> %{{x:.2f}}%<br><b>Precio:</b> {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=[c['tea'] * 100 for c in choques],
+        y=[c['precio'] for c in choques],
+        mode='markers+text',
+        name='Choques',
+        text=[f"{c['choque_pb']:+d} pb" for c in choques],
+        textposition='top right',
+        marker=dict(color='#FF6B6B', size=9),
+        hovertemplate=f'<b>%{{text}}</b><br>TEA: %{{x:.2f}}%<br>Precio: {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=[tea_base * 100],
+        y=[sensibilidad['precio_base']],
+        mode='markers',
+        name='Precio actual',
+        marker=dict(color='#333333', size=12, symbol='diamond'),
+        hovertemplate=f'<b>Precio actual</b><br>TEA: %{{x:.2f}}%<br>Precio: {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title='Curva Precio-Rendimiento',
+        xaxis_title='Tasa de descuento (% TEA)',
+        yaxis_title=f'Precio ({moneda})',
+        hovermode='closest',
+        legend=LEYENDA_HORIZONTAL,
+        height=500
+    )
+    
+    return fig
+
+
+def crear_tabla_choques(sensibilidad: dict, moneda: str = "USD") -> pd.DataFrame:
+    """
+    Crea la tabla de precios ante choques de tasa.
+    
+    Args:
+        sensibilidad: Resultado de calcular_sensibilidad_bono
+        moneda: Símbolo de la moneda
+    
+    Returns:
+        DataFrame con los choques formateados
+    """
+    df = pd.DataFrame(sensibilidad['choques'])
+    return pd.DataFrame({
+        'Choque': df['choque_pb'].map('{:+d} pb'.format),
+        'TEA (%)': (df['tea'] * 100).map('{:.2f}%'.format),
+        f'Precio ({moneda})': df['precio'].map('{:,.2f}'.format),
+        f'Cambio ({moneda})': df['cambio'].map('{:+,.2f}'.format),
+        'Cambio (%)': df['cambio_pct'].map('{:+.2f}%'.format)
+    })
+
+
+@perfilar
+@cache_figura
+def crear_grafico_distribucion_precios(simulacion: dict, precio_base: float, moneda: str = "USD") -> go.Figure:
+    """
+    Crea el histograma de precios del bono simulados por Monte Carlo.
+    
+    Args:
+        simulacion: Resultado de simular_precios_bono
+        precio_base: Precio descontando a tasa fija, como referencia
+        moneda: Símbolo de la moneda
+    
+    Returns:
+        Figura de Plotly
+    """
+    resumen = simulacion['resumen']
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Histogram(
+        x=simulacion['precios'],
+        nbinsx=60,
+        name='Trayectorias',
+        marker_color='#4ECDC4',
+        opacity=0.8,
+        hovertemplate=f'<b>Precio:</b> {moneda} %{{x:,.2f}}<br><b>Trayectorias:</b> %{{y}}<extra></extra>'
+    ))
+    
+    referencias = [
+        ('Precio esperado', simulacion['precio_esperado'], '#FF6B6B', 'solid'),
+        ('Precio a tasa fija', precio_base, '#333333', 'dash'),
+        ('P5', resumen['p5'], '#999999', 'dot'),
+        ('P95', resumen['p95'], '#999999', 'dot')
+    ]
+    for nombre, valor, color, estilo in referencias:
+        fig.add_vline(
+            x=valor,
+            line=dict(color=color, dash=estilo, width=2),
+            annotation_text=nombre,
+            annotation_position='top'
+        )
+    
+    fig.update_layout(
+        title='Distribución del Precio del Bono (Monte Carlo)',
+        xaxis_title=f'Precio ({moneda})',
+        yaxis_title='Trayectorias',
+        showlegend=False,
+        height=450
+    )
+    
+    return fig
+
+
+@perfilar
+@cache_figura
+def crear_grafico_trayectorias_tasas(simulacion: dict) -> go.Figure:
+    """
+    Crea el gráfico de una muestra de trayectorias simuladas de la tasa corta.
+    
+    Args:
+        simulacion: Resultado de simular_precios_bono
+    
+    Returns:
+        Figura de Plotly
+    """
+    muestra = simulacion['muestra_tasas'] * 100
+    años = np.arange(muestra.shape[1])
+    Traza = clase_traza(muestra.size)
+    
+    fig = go.Figure()
+    
+    for trayectoria in muestra:
+        fig.add_trace(Traza(
+            x=años,
+            y=trayectoria,
+            mode='lines',
+            line=dict(color='#4ECDC4', width=1),
+            opacity=0.35,
+            hoverinfo='skip',
+            showlegend=False
+        ))
+    
+    fig.add_trace(Traza(
+        x=años,
+        y=muestra.mean(axis=0),
+        mode='lines',
+        name='Promedio de la muestra',
+        line=dict(color='#FF6B6B', width=3),
+        hovertemplate='<b>Año:</b> %{x}<br><b>Tasa:</b> %{y:.2f}%<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title='Trayectorias Simuladas de la Tasa Corta',
+        xaxis_title='Año',
+        yaxis_title='Tasa corta (% anual continua)',
+        height=400
+    )
+    
+    return fig
+
+
+@cache_figura
+def crear_grafico_curva_cero(curva: dict) -> go.Figure:
+    """
+    Crea el gráfico de la curva cero construida por bootstrapping.
+    
+    Args:
+        curva: Diccionario con 'plazos' (años) y 'tasas' (TEA cero en decimal)
+    
+    Returns:
+        Figura de Plotly
+    """
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=curva['plazos'],
+        y=np.asarray(curva['tasas']) * 100,
+        mode='lines',
+        name='Tasa cero',
+        line=dict(color='#4ECDC4', width=3),
+        hovertemplate='<b>Plazo:</b> %{x:.2f} años<br><b>TEA cero:</b> %{y:.3f}%<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title='Curva Cero',
+        xaxis_title='Plazo (años)',
+        yaxis_title='TEA cero (%)',
+        height=300
+    )
+    
+    return fig
@@ -1,108 +1,202 @@
+import numpy as np
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import pandas as pd
-from src.calculations.financial_calcs import calcular_tasa_periodo
+from src.calculations.financial_calcs import (
+    calcular_tasa_periodo,
+    calcular_saldos_periodicos,
+    generar_aportes_crecientes,
+    calcular_deflactores
+)
+from src.visualization.reduccion import calcular_indices_lttb, reducir_puntos, clase_traza
+from src.visualization.figuras import cache_figura, LEYENDA_HORIZONTAL
+from src.utils.profiling import perfilar
+from config.constants import GRAFICO_MAX_PUNTOS
 
 
+@perfilar
 def generar_evolucion_inversion(
     vp: float,
-    aporte: float,
+    aporte,
     tea: float,
     frecuencia_anual: int,
     plazo_años: int,
-    aporte_al_inicio: bool = False
+    aporte_al_inicio: bool = False,
+    capitalizacion_continua: bool = False,
+    tasa_crecimiento: float = 0.0,
+    crecimiento_anual: bool = True,
+    inflacion: float = 0.0
 ) -> pd.DataFrame:
     """
     Genera un DataFrame con la evolución de la inversión periodo a periodo.
     
     Args:
         vp: Valor Presente inicial
-        aporte: Aporte periódico
+        aporte: Aporte periódico (float) o array de aportes por periodo
         tea: Tasa Efectiva Anual (en decimal)
         frecuencia_anual: Número de periodos por año
         plazo_años: Plazo en años
         aporte_al_inicio: True si el aporte es al inicio del periodo,
                           False si es al final del periodo
+        capitalizacion_continua: True si los aportes ingresan como flujo continuo
+        tasa_crecimiento: Tasa a la que crece el aporte (0 = aporte constante)
+        crecimiento_anual: True si el aporte sube una vez por año, False si sube cada periodo
+        inflacion: Inflación anual (en decimal); si es mayor a 0 se agrega valor_real
     
     Returns:
         DataFrame con las columnas: periodo, inversion_acumulada, valor_con_interes
+        (y valor_real si hay inflación)
     """
     tasa_periodo = calcular_tasa_periodo(tea, frecuencia_anual)
     num_periodos = plazo_años * frecuencia_anual
     
-    data = []
-    inversion_sin_interes = vp
-    valor_con_interes = vp
+    if tasa_crecimiento != 0 and np.ndim(aporte) == 0:
+        aporte = generar_aportes_crecientes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, crecimiento_anual)
     
-    for periodo in range(num_periodos + 1):
-        data.append({
-            'periodo': periodo,
-            'inversion_acumulada': inversion_sin_interes,
-            'valor_con_interes': valor_con_interes
-        })
-        
-        if periodo < num_periodos:
-            inversion_sin_interes += aporte
-            if aporte_al_inicio:
-                # Aporte al inicio: primero se aporta, luego se calcula interés
-                valor_con_interes = (valor_con_interes + aporte) * (1 + tasa_periodo)
-            else:
-                # Aporte al final: primero se calcula interés, luego se aporta
-                valor_con_interes = valor_con_interes * (1 + tasa_periodo) + aporte
+    saldos = calcular_saldos_periodicos(
+        vp, aporte, tasa_periodo, num_periodos, aporte_al_inicio, capitalizacion_continua
+    )
+    periodos = np.arange(num_periodos + 1)
+    
+    df = pd.DataFrame({
+        'periodo': periodos,
+        'inversion_acumulada': vp + np.concatenate(([0.0], np.cumsum(saldos['aporte']))),
+        'valor_con_interes': np.concatenate(([vp], saldos['saldo_final']))
+    })
+    
+    if inflacion > 0:
+        deflactores = np.concatenate(([1.0], calcular_deflactores(inflacion, num_periodos, frecuencia_anual)))
+        df['valor_real'] = df['valor_con_interes'].to_numpy() * deflactores
+    
+    return df
+
+
+def agregar_evolucion(df: pd.DataFrame, frecuencia_anual: int, vista: str) -> pd.DataFrame:
+    """
+    Reduce la evolución a un punto por mes o por año (cierre de cada grupo).
+    
+    Args:
+        df: DataFrame generado por generar_evolucion_inversion
+        frecuencia_anual: Número de periodos por año
+        vista: "Periodo" (sin cambios), "Mensual" o "Anual"
+    
+    Returns:
+        DataFrame con las mismas columnas, donde 'periodo' es el número de mes o año
+    """
+    if vista == "Periodo" or (vista == "Mensual" and frecuencia_anual <= 12):
+        return df
+    
+    grupos_por_año = 12 if vista == "Mensual" else 1
+    num_grupos = int(round((len(df) - 1) * grupos_por_año / frecuencia_anual))
+    cierres = np.floor(np.arange(num_grupos + 1) * frecuencia_anual / grupos_por_año + 1e-9).astype(int)
+    
+    df_agregado = df.iloc[cierres].reset_index(drop=True)
+    df_agregado['periodo'] = np.arange(num_grupos + 1)
+    
+    return df_agregado
+
+
+def generar_evolucion_desde_tabla(df: pd.DataFrame, vp: float) -> pd.DataFrame:
+    """
+    Arma la evolución para crear_grafico_comparativo a partir de una tabla de crecimiento.
+    
+    Sirve para tablas agregadas o ventanas (generar_ventana_vista), así el gráfico no
+    necesita recorrer todos los periodos del plazo.
     
-    return pd.DataFrame(data)
+    Args:
+        df: Tabla canónica de crecimiento completa (por periodo, mes o año)
+        vp: Valor Presente inicial (punto 0 del gráfico)
+    
+    Returns:
+        DataFrame con las columnas de generar_evolucion_inversion, donde 'periodo'
+        es el número de periodo, mes o año
+    """
+    evolucion = pd.DataFrame({
+        'periodo': np.concatenate(([0], df.index.to_numpy())),
+        'inversion_acumulada': vp + np.concatenate(([0.0], np.cumsum(df['aporte'].to_numpy()))),
+        'valor_con_interes': np.concatenate(([vp], df['saldo_final'].to_numpy()))
+    })
+    
+    if 'saldo_final_real' in df.columns:
+        evolucion['valor_real'] = np.concatenate(([vp], df['saldo_final_real'].to_numpy()))
+    
+    return evolucion
 
 
-def crear_grafico_comparativo(df: pd.DataFrame, moneda: str = "USD") -> go.Figure:
+@perfilar
+@cache_figura
+def crear_grafico_comparativo(
+    df: pd.DataFrame,
+    moneda: str = "USD",
+    etiqueta_periodo: str = "Periodo",
+    max_puntos: int = GRAFICO_MAX_PUNTOS,
+    metodo_reduccion: str = "lttb"
+) -> go.Figure:
     """
     Crea un gráfico comparativo de la evolución de la inversión.
     
+    Las series con más de max_puntos filas se reducen conservando su forma y, si la
+    figura sigue siendo grande, se dibujan con WebGL.
+    
     Args:
         df: DataFrame con la evolución de la inversión
         moneda: Símbolo de la moneda
+        etiqueta_periodo: Nombre del eje X ("Periodo", "Mes" o "Año")
+        max_puntos: Puntos máximos por traza (None = todos)
+        metodo_reduccion: "lttb" o "min_max"
     
     Returns:
         Figura de Plotly
     """
+    columnas = [c for c in ('inversion_acumulada', 'valor_con_interes', 'valor_real') if c in df.columns]
+    df = reducir_puntos(df, columnas, 'periodo', max_puntos, metodo_reduccion)
+    Traza = clase_traza(len(df) * len(columnas))
+    
     fig = go.Figure()
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(Traza(
         x=df['periodo'],
         y=df['inversion_acumulada'],
         mode='lines',
         name='Inversión sin interés',
         line=dict(color='#FF6B6B', width=2),
-        hovertemplate=f'<b>Periodo:</b> %{{x}}<br><b>Inversión:</b> {moneda} %{{y:,.2f}}<extra></extra>'
+        hovertemplate=f'<b>{etiqueta_periodo}:</b> %{{x}}<br><b>Inversión:</b> {moneda} %{{y:,.2f}}<extra></extra>'
     ))
     
-    fig.add_trace(go.Scatter(
+    fig.add_trace(Traza(
         x=df['periodo'],
         y=df['valor_con_interes'],
         mode='lines',
         name='Valor con interés',
         line=dict(color='#4ECDC4', width=2),
         fill='tonexty',
-        hovertemplate=f'<b>Periodo:</b> %{{x}}<br><b>Valor:</b> {moneda} %{{y:,.2f}}<extra></extra>'
+        hovertemplate=f'<b>{etiqueta_periodo}:</b> %{{x}}<br><b>Valor:</b> {moneda} %{{y:,.2f}}<extra></extra>'
     ))
     
+    if 'valor_real' in df.columns:
+        fig.add_trace(Traza(
+            x=df['periodo'],
+            y=df['valor_real'],
+            mode='lines',
+            name='Valor real (hoy)',
+            line=dict(color='#95A5A6', width=2, dash='dash'),
+            hovertemplate=f'<b>{etiqueta_periodo}:</b> %{{x}}<br><b>Valor real:</b> {moneda} %{{y:,.2f}}<extra></extra>'
+        ))
+    
     fig.update_layout(
         title='Evolución de la Inversión',
-        xaxis_title='Periodo',
+        xaxis_title=etiqueta_periodo,
         yaxis_title=f'Monto ({moneda})',
         hovermode='x unified',
-        template='plotly_white',
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1
-        ),
+        legend=LEYENDA_HORIZONTAL,
         height=500
     )
     
     return fig
 
 
+@perfilar
+@cache_figura
 def crear_grafico_composicion(
     vp: float,
     total_aportes: float,
@@ -161,3 +255,334 @@ def crear_grafico_composicion(
     )
     
     return fig
+
+
+@perfilar
+@cache_figura
+def crear_grafico_distribucion(
+    valores_historicos,
+    valores_bootstrap,
+    moneda: str = "USD",
+    titulo: str = "Distribución del Valor Futuro"
+) -> go.Figure:
+    """
+    Crea un histograma superpuesto de resultados históricos y remuestreados.
+    
+    Args:
+        valores_historicos: Array de resultados de las ventanas históricas
+        valores_bootstrap: Array de resultados de los remuestreos por bloques
+        moneda: Símbolo de la moneda
+        titulo: Título del gráfico
+    
+    Returns:
+        Figura de Plotly
+    """
+    fig = go.Figure()
+    
+    fig.add_trace(go.Histogram(
+        x=valores_bootstrap,
+        name='Remuestreo por bloques',
+        marker_color='#4ECDC4',
+        opacity=0.6,
+        histnorm='percent',
+        hovertemplate=f'{moneda} %{{x:,.0f}}<br>%{{y:.1f}}%<extra></extra>'
+    ))
+    
+    if len(valores_historicos) > 0:
+        fig.add_trace(go.Histogram(
+            x=valores_historicos,
+            name='Ventanas históricas',
+            marker_color='#FF6B6B',
+            opacity=0.6,
+            histnorm='percent',
+            hovertemplate=f'{moneda} %{{x:,.0f}}<br>%{{y:.1f}}%<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=titulo,
+        xaxis_title=f'Monto ({moneda})',
+        yaxis_title='% de escenarios',
+        barmode='overlay',
+        legend=LEYENDA_HORIZONTAL,
+        height=400
+    )
+    
+    return fig
+
+
+@perfilar
+@cache_figura
+def crear_grafico_ciclo_vida(
+    ciclo: dict,
+    nombres: list = None,
+    moneda: str = "USD",
+    max_puntos: int = GRAFICO_MAX_PUNTOS
+) -> go.Figure:
+    """
+    Crea un gráfico del saldo por edad, desde hoy hasta el último retiro.
+    
+    Args:
+        ciclo: Resultado de calcular_ciclo_vida
+        nombres: Nombre de cada escenario (opcional)
+        moneda: Símbolo de la moneda
+        max_puntos: Puntos máximos por escenario (se reducen con LTTB; None = todos)
+    
+    Returns:
+        Figura de Plotly
+    """
+    colores = ['#4ECDC4', '#FF6B6B', '#95E1D3', '#F38181', '#AA96DA', '#FCBAD3']
+    num_escenarios = ciclo['saldo'].shape[0]
+    nombres = nombres or [f"Escenario {i + 1}" for i in range(num_escenarios)]
+    
+    edad = np.asarray(ciclo['edad'], dtype=float)
+    indices = [calcular_indices_lttb(edad, ciclo['saldo'][i], max_puntos) for i in range(len(nombres))]
+    Traza = clase_traza(sum(len(idx) for idx in indices))
+    
+    fig = go.Figure()
+    
+    for i, nombre in enumerate(nombres):
+        color = colores[i % len(colores)]
+        
+        fig.add_trace(Traza(
+            x=edad[indices[i]],
+            y=ciclo['saldo'][i][indices[i]],
+            mode='lines',
+            name=nombre,
+            line=dict(color=color, width=2),
+            hovertemplate=f'<b>{nombre}</b><br>Edad: %{{x:.1f}}<br>Saldo: {moneda} %{{y:,.2f}}<extra></extra>'
+        ))
+        
+        # Marca el inicio de los retiros
+        mes_jubilacion = int(ciclo['meses_acumulacion'][i])
+        fig.add_trace(go.Scatter(
+            x=[ciclo['edad'][mes_jubilacion]],
+            y=[ciclo['saldo'][i, mes_jubilacion]],
+            mode='markers',
+            marker=dict(color=color, size=10, symbol='diamond'),
+            showlegend=False,
+            hovertemplate=f'<b>{nombre}</b><br>Jubilación a los %{{x:.0f}} años<br>VF: {moneda} %{{y:,.2f}}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title='Ciclo de Vida de la Inversión',
+        xaxis_title='Edad',
+        yaxis_title=f'Saldo ({moneda})',
+        hovermode='closest',
+        legend=LEYENDA_HORIZONTAL,
+        height=500
+    )
+    
+    return fig
+
+
+@perfilar
+@cache_figura
+def crear_grafico_barrido_edades(barrido: dict, escenarios: list = None, moneda: str = "USD") -> go.Figure:
+    """
+    Crea un gráfico del retiro total neto y del retiro mensual neto según la edad de jubilación.
+    
+    Args:
+        barrido: Resultado de calcular_barrido_edades
+        escenarios: Escenarios a marcar sobre las curvas (con 'nombre', 'edad_jubilacion',
+                    'monto_neto_total' y 'retiro_mensual_neto')
+        moneda: Símbolo de la moneda
+    
+    Returns:
+        Figura de Plotly con dos ejes Y (retiro total a la izquierda, mensual a la derecha)
+    """
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    
+    fig.add_trace(go.Scatter(
+        x=barrido['edad'],
+        y=barrido['monto_neto_total'],
+        mode='lines',
+        name='Retiro Total Neto',
+        line=dict(color='#4ECDC4', width=3),
+        hovertemplate=f'Jubilación a los %{{x}} años<br>Retiro total neto: {moneda} %{{y:,.2f}}<extra></extra>'
+    ), secondary_y=False)
+    
+    fig.add_trace(go.Scatter(
+        x=barrido['edad'],
+        y=barrido['retiro_mensual_neto'],
+        mode='lines',
+        name='Retiro Mensual Neto',
+        line=dict(color='#FF6B6B', width=3),
+        hovertemplate=f'Jubilación a los %{{x}} años<br>Retiro mensual neto: {moneda} %{{y:,.2f}}<extra></extra>'
+    ), secondary_y=True)
+    
+    # Marcar los escenarios seleccionados
+    for escenario in escenarios or []:
+        for clave, color, eje_secundario in (('monto_neto_total', '#4ECDC4', False), ('retiro_mensual_neto', '#FF6B6B', True)):
+            fig.add_trace(go.Scatter(
+                x=[escenario['edad_jubilacion']],
+                y=[escenario[clave]],
+                mode='markers+text',
+                text=[escenario['nombre']] if not eje_secundario else None,
+                textposition='top center',
+                marker=dict(color=color, size=12, symbol='diamond', line=dict(color='#333333', width=1)),
+                showlegend=False,
+                hovertemplate=f'<b>{escenario["nombre"]}</b><br>{moneda} %{{y:,.2f}}<extra></extra>'
+            ), secondary_y=eje_secundario)
+    
+    fig.update_layout(
+        title='Retiros según la Edad de Jubilación',
+        xaxis_title='Edad de jubilación',
+        hovermode='x unified',
+        legend=LEYENDA_HORIZONTAL,
+        height=500
+    )
+    fig.update_yaxes(title_text=f'Retiro Total Neto ({moneda})', secondary_y=False)
+    fig.update_yaxes(title_text=f'Retiro Mensual Neto ({moneda})', secondary_y=True)
+    
+    return fig
+
+
+@perfilar
+@cache_figura
+def crear_grafico_comparacion_vf(escenarios: list, moneda: str = "USD") -> go.Figure:
+    """
+    Crea el gráfico de barras del valor futuro de cada escenario.
+    
+    Args:
+        escenarios: Escenarios de calcular_escenarios (con 'nombre' y 'vf')
+        moneda: Símbolo de la moneda
+    
+    Returns:
+        Figura de Plotly
+    """
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=[e['nombre'] for e in escenarios],
+        y=[e['vf'] for e in escenarios],
+        text=[f"{moneda} {e['vf']:,.0f}" for e in escenarios],
+        textposition='outside',
+        marker_color='#4ECDC4',
+        hovertemplate='<b>%{x}</b><br>' + f'Valor Futuro: {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title='Comparación de Valor Futuro',
+        xaxis_title='Escenario',
+        yaxis_title=f'Valor Futuro ({moneda})',
+        height=500
+    )
+    
+    return fig
+
+
+@perfilar
+@cache_figura
+def crear_grafico_comparacion_retiro(escenarios: list, tipo_retiro: str, moneda: str = "USD") -> go.Figure:
+    """
+    Crea el gráfico de barras del retiro de cada escenario.
+    
+    Args:
+        escenarios: Escenarios de calcular_escenarios
+        tipo_retiro: "Retiro Total" (monto neto) o "Retiro Mensual" (bruto vs neto)
+        moneda: Símbolo de la moneda
+    
+    Returns:
+        Figura de Plotly
+    """
+    nombres = [e['nombre'] for e in escenarios]
+    fig = go.Figure()
+    
+    if tipo_retiro == "Retiro Total":
+        fig.add_trace(go.Bar(
+            x=nombres,
+            y=[e['monto_neto_total'] for e in escenarios],
+            text=[f"{moneda} {e['monto_neto_total']:,.0f}" for e in escenarios],
+            textposition='outside',
+            marker_color='#FF6B6B',
+            hovertemplate='<b>%{x}</b><br>' + f'Monto Neto: {moneda} %{{y:,.2f}}<extra></extra>'
+        ))
+        
+        fig.update_layout(
+            title='Comparación de Monto Neto (Retiro Total)',
+            xaxis_title='Escenario',
+            yaxis_title=f'Monto Neto ({moneda})',
+            height=500
+        )
+        return fig
+    
+    fig.add_trace(go.Bar(
+        x=nombres,
+        y=[e['retiro_mensual_bruto'] for e in escenarios],
+        text=[f"{moneda} {e['retiro_mensual_bruto']:,.0f}" for e in escenarios],
+        textposition='outside',
+        marker_color='#FF6B6B',
+        name='Retiro Bruto',
+        hovertemplate='<b>%{x}</b><br>' + f'Retiro Mensual Bruto: {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.add_trace(go.Bar(
+        x=nombres,
+        y=[e['retiro_mensual_neto'] for e in escenarios],
+        text=[f"{moneda} {e['retiro_mensual_neto']:,.0f}" for e in escenarios],
+        textposition='outside',
+        marker_color='#95E1D3',
+        name='Retiro Neto',
+        hovertemplate='<b>%{x}</b><br>' + f'Retiro Mensual Neto: {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title='Comparación de Retiro Mensual (Bruto vs Neto)',
+        xaxis_title='Escenario',
+        yaxis_title=f'Retiro Mensual ({moneda})',
+        height=500,
+        barmode='group'
+    )
+    
+    return fig
+
+
+@perfilar
+@cache_figura
+def crear_grafico_comparacion_composicion(escenarios: list, moneda: str = "USD") -> go.Figure:
+    """
+    Crea el gráfico de barras apiladas con la inversión, la ganancia neta y los impuestos de cada escenario.
+    
+    Args:
+        escenarios: Escenarios de calcular_escenarios
+        moneda: Símbolo de la moneda
+    
+    Returns:
+        Figura de Plotly
+    """
+    nombres = [e['nombre'] for e in escenarios]
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        name='Inversión',
+        x=nombres,
+        y=[e['inversion_total'] for e in escenarios],
+        marker_color='#95E1D3',
+        hovertemplate=f'Inversión: {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.add_trace(go.Bar(
+        name='Ganancia Neta',
+        x=nombres,
+        y=[e['beneficio_bruto'] - e['impuesto_total'] for e in escenarios],
+        marker_color='#4ECDC4',
+        hovertemplate=f'Ganancia Neta: {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.add_trace(go.Bar(
+        name='Impuestos',
+        x=nombres,
+        y=[e['impuesto_total'] for e in escenarios],
+        marker_color='#FF6B6B',
+        hovertemplate=f'Impuestos: {moneda} %{{y:,.2f}}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title='Composición del Valor Final',
+        xaxis_title='Escenario',
+        yaxis_title=f'Monto ({moneda})',
+        barmode='stack',
+        height=500
+    )
+    
+    return fig
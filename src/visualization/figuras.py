@@ -0,0 +1,104 @@
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+import numpy as np
+import plotly.io as pio
+from config.constants import PLANTILLA_GRAFICOS, FIGURAS_CACHE_MAX
+from src.utils.cache_sqlite import generar_clave
+
+
+# Plotly aplica la plantilla por defecto sin volver a validarla; una plantilla pasada
+# como argumento (template='plotly_white') se valida completa en cada figura
+pio.templates.default = PLANTILLA_GRAFICOS
+
+# Leyenda horizontal sobre el área del gráfico, compartida por los gráficos con varias series
+LEYENDA_HORIZONTAL = dict(
+    orientation="h",
+    yanchor="bottom",
+    y=1.02,
+    xanchor="right",
+    x=1
+)
+
+# Figuras ya construidas, de la menos a la más usada recientemente
+_figuras = OrderedDict()
+_candado = threading.Lock()
+
+
+def calcular_huella(valor):
+    """
+    Reemplaza los arrays de NumPy por un hash de su contenido, para generar la clave rápido.
+    
+    Los arrays de miles de valores (trayectorias, ciclos de vida) se resumen en su forma,
+    tipo y SHA-256 de sus bytes; el resto de los valores queda igual y se normaliza con
+    generar_clave.
+    
+    Args:
+        valor: Argumento de una función de gráfico
+    
+    Returns:
+        Valor equivalente para la clave de caché
+    """
+    if isinstance(valor, np.ndarray) and valor.dtype != object:
+        contiguo = np.ascontiguousarray(valor)
+        return {
+            'forma': list(contiguo.shape),
+            'tipo': str(contiguo.dtype),
+            'huella': hashlib.sha256(contiguo.tobytes()).hexdigest()
+        }
+    if isinstance(valor, dict):
+        return {k: calcular_huella(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [calcular_huella(v) for v in valor]
+    return valor
+
+
+def cache_figura(func):
+    """
+    Decorador que reutiliza la figura ya construida cuando los datos no cambiaron.
+    
+    La clave es la huella de todos los argumentos (DataFrames, arrays y parámetros de
+    formato). Se guardan en memoria las FIGURAS_CACHE_MAX figuras más recientes,
+    compartidas por todas las sesiones: la figura devuelta no debe modificarse.
+    
+    Args:
+        func: Función que construye una figura de Plotly a partir de sus argumentos
+    
+    Returns:
+        Función envuelta
+    """
+    espacio = f"{func.__module__}.{func.__qualname__}"
+    firma = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def envoltura(*args, **kwargs):
+        argumentos = firma.bind(*args, **kwargs)
+        argumentos.apply_defaults()
+        clave = generar_clave(espacio, calcular_huella(dict(argumentos.arguments)))
+        
+        with _candado:
+            figura = _figuras.get(clave)
+            if figura is not None:
+                _figuras.move_to_end(clave)
+                return figura
+        
+        figura = func(*args, **kwargs)
+        
+        with _candado:
+            _figuras[clave] = figura
+            while len(_figuras) > FIGURAS_CACHE_MAX:
+                _figuras.popitem(last=False)
+        
+        return figura
+    
+    return envoltura
+
+
+def limpiar_cache_figuras() -> None:
+    """
+    Descarta todas las figuras guardadas.
+    """
+    with _candado:
+        _figuras.clear()
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from config.constants import GRAFICO_MAX_PUNTOS, GRAFICO_UMBRAL_WEBGL
+
+
+def calcular_indices_lttb(x, y, max_puntos: int = GRAFICO_MAX_PUNTOS) -> np.ndarray:
+    """
+    Elige los puntos de una serie con Largest-Triangle-Three-Buckets (LTTB).
+    
+    Divide la serie en max_puntos - 2 tramos y de cada tramo conserva el punto que
+    forma el triángulo más grande con el punto elegido antes y el promedio del tramo
+    siguiente. Así se mantienen los picos, caídas y cambios de pendiente.
+    
+    Args:
+        x: Valores del eje X (crecientes)
+        y: Valores del eje Y
+        max_puntos: Número de puntos a conservar (incluye el primero y el último)
+    
+    Returns:
+        Array ordenado con los índices de los puntos conservados
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if max_puntos is None or n <= max_puntos or max_puntos < 3:
+        return np.arange(n)
+    
+    # Tramos [bordes[k], bordes[k + 1]) entre el primer y el último punto
+    bordes = np.linspace(1, n - 1, max_puntos - 1).astype(int)
+    tamaños = np.diff(bordes)
+    promedios_x = np.append(np.add.reduceat(x[:n - 1], bordes[:-1]) / tamaños, x[-1])
+    promedios_y = np.append(np.add.reduceat(y[:n - 1], bordes[:-1]) / tamaños, y[-1])
+    
+    indices = np.empty(max_puntos, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    anterior = 0
+    for k in range(max_puntos - 2):
+        inicio, fin = bordes[k], bordes[k + 1]
+        areas = np.abs(
+            (x[anterior] - promedios_x[k + 1]) * (y[inicio:fin] - y[anterior])
+            - (x[anterior] - x[inicio:fin]) * (promedios_y[k + 1] - y[anterior])
+        )
+        anterior = inicio + int(np.argmax(areas))
+        indices[k + 1] = anterior
+    
+    return indices
+
+
+def calcular_indices_min_max(y, max_puntos: int = GRAFICO_MAX_PUNTOS) -> np.ndarray:
+    """
+    Elige los puntos de una serie conservando el mínimo y el máximo de cada tramo.
+    
+    Es más simple que LTTB y no recorre los tramos en un bucle: ordena los puntos por
+    tramo y valor una sola vez. Garantiza que ningún extremo de la serie se pierda.
+    
+    Args:
+        y: Valores del eje Y
+        max_puntos: Número máximo de puntos a conservar (incluye el primero y el último)
+    
+    Returns:
+        Array ordenado con los índices de los puntos conservados
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if max_puntos is None or n <= max_puntos or max_puntos < 4:
+        return np.arange(n)
+    
+    num_tramos = (max_puntos - 2) // 2
+    bordes = np.linspace(1, n - 1, num_tramos + 1).astype(int)
+    tramos = np.repeat(np.arange(num_tramos), np.diff(bordes))
+    
+    # Dentro de cada tramo, el primero del orden es el mínimo y el último el máximo
+    orden = np.lexsort((y[1:n - 1], tramos)) + 1
+    minimos = orden[bordes[:-1] - 1]
+    maximos = orden[bordes[1:] - 2]
+    
+    return np.unique(np.concatenate(([0, n - 1], minimos, maximos)))
+
+
+def reducir_puntos(
+    df: pd.DataFrame,
+    columnas: list,
+    columna_x: str,
+    max_puntos: int = GRAFICO_MAX_PUNTOS,
+    metodo: str = "lttb"
+) -> pd.DataFrame:
+    """
+    Reduce las filas de un DataFrame que se va a graficar, conservando la forma de cada serie.
+    
+    El presupuesto se reparte entre las columnas y se conservan las filas elegidas en
+    cualquiera de ellas, así todas las trazas comparten el mismo eje X (necesario para
+    rellenos 'tonexty' y hover unificado).
+    
+    Args:
+        df: DataFrame con una fila por punto
+        columnas: Columnas que se grafican como series
+        columna_x: Columna del eje X
+        max_puntos: Filas máximas a conservar (None = sin reducir)
+        metodo: "lttb" o "min_max"
+    
+    Returns:
+        DataFrame con a lo sumo max_puntos filas (el mismo df si ya entra en el presupuesto)
+    
+    Raises:
+        ValueError: Si el método no existe
+    """
+    if metodo not in ("lttb", "min_max"):
+        raise ValueError(f"Método de reducción desconocido: {metodo}")
+    if max_puntos is None or len(df) <= max_puntos:
+        return df
+    
+    puntos_por_columna = max(max_puntos // max(len(columnas), 1), 4)
+    x = df[columna_x].to_numpy()
+    indices = [
+        calcular_indices_lttb(x, df[columna].to_numpy(), puntos_por_columna) if metodo == "lttb"
+        else calcular_indices_min_max(df[columna].to_numpy(), puntos_por_columna)
+        for columna in columnas
+    ]
+    
+    return df.iloc[np.unique(np.concatenate(indices))]
+
+
+def clase_traza(total_puntos: int, umbral: int = GRAFICO_UMBRAL_WEBGL):
+    """
+    Elige la clase de traza de líneas según cuántos puntos tendrá la figura.
+    
+    Args:
+        total_puntos: Puntos de todas las trazas de la figura
+        umbral: Puntos a partir de los cuales se dibuja con WebGL
+    
+    Returns:
+        go.Scattergl si se supera el umbral, go.Scatter en otro caso
+    """
+    return go.Scattergl if total_puntos > umbral else go.Scatter
+
@@ -0,0 +1,100 @@
+"""Script de prueba para aportes crecientes (anualidad creciente)"""
+import numpy as np
+from src.calculations.financial_calcs import (
+    calcular_tasa_periodo,
+    calcular_vf_combinado,
+    calcular_vf_aportes_crecientes,
+    calcular_total_aportes,
+    generar_aportes_crecientes
+)
+from src.utils.tables import generar_tabla_crecimiento
+
+# Parámetros de prueba
+vp = 10000
+aporte = 500
+tea = 0.08
+frecuencia_anual = 12
+plazo_años = 30
+tasa_crecimiento = 0.05
+
+print("=" * 70)
+print("PRUEBA DE APORTES CRECIENTES: FÓRMULA vs CRONOGRAMA")
+print("=" * 70)
+
+for crecimiento_anual in (True, False):
+    for aporte_al_inicio in (False, True):
+        g = tasa_crecimiento if crecimiento_anual else calcular_tasa_periodo(tasa_crecimiento, frecuencia_anual)
+        vf = calcular_vf_combinado(
+            vp, aporte, tea, frecuencia_anual, plazo_años, aporte_al_inicio,
+            tasa_crecimiento=g, crecimiento_anual=crecimiento_anual
+        )
+        tabla = generar_tabla_crecimiento(
+            vp, aporte, tea, frecuencia_anual, plazo_años, aporte_al_inicio,
+            tasa_crecimiento=g, crecimiento_anual=crecimiento_anual
+        )
+        saldo_final = tabla.iloc[-1]['saldo_final']
+        modo = "cada año" if crecimiento_anual else "cada periodo"
+        momento = "inicio" if aporte_al_inicio else "final"
+
+        print(f"\nCrecimiento {modo}, aporte al {momento}:")
+        print(f"  Valor Futuro (fórmula): ${vf:,.2f}")
+        print(f"  Saldo Final (tabla):    ${saldo_final:,.2f}")
+        if abs(vf - saldo_final) < 0.01:
+            print("  ✅ Coinciden al centavo")
+        else:
+            print(f"  ⚠️  Diferencia: ${abs(vf - saldo_final):,.4f}")
+
+print("\n" + "=" * 70)
+print("CASO LÍMITE: CRECIMIENTO IGUAL A LA TASA")
+print("=" * 70)
+
+tasa_periodo = calcular_tasa_periodo(tea, frecuencia_anual)
+num_periodos = frecuencia_anual * plazo_años
+vf_limite = calcular_vf_aportes_crecientes(aporte, tasa_periodo, num_periodos, tasa_periodo, frecuencia_anual, False)
+esperado = aporte * num_periodos * (1 + tasa_periodo) ** (num_periodos - 1)
+
+print(f"\nVF (fórmula): ${vf_limite:,.2f}")
+print(f"n·A·(1+i)^(n-1): ${esperado:,.2f}")
+if abs(vf_limite - esperado) < 0.01:
+    print("  ✅ El caso g = i usa el límite correcto")
+else:
+    print("  ⚠️  El caso g = i no coincide")
+
+print("\n" + "=" * 70)
+print("CÁLCULO EN LOTE")
+print("=" * 70)
+
+tasas = np.array([0.0, 0.02, 0.05, 0.08])
+vf_lote = calcular_vf_aportes_crecientes(aporte, tasa_periodo, num_periodos, tasas, frecuencia_anual, True)
+for g, vf in zip(tasas, vf_lote):
+    aportes = generar_aportes_crecientes(aporte, num_periodos, g, frecuencia_anual, True)
+    vf_cronograma = float(np.sum(aportes * (1 + tasa_periodo) ** np.arange(num_periodos - 1, -1, -1)))
+    estado = "✅" if abs(vf - vf_cronograma) < 0.01 else "⚠️ "
+    print(f"  {estado} g = {g:.0%}: lote ${vf:,.2f} | cronograma ${vf_cronograma:,.2f}")
+
+total = calcular_total_aportes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, True)
+total_cronograma = generar_aportes_crecientes(aporte, num_periodos, tasa_crecimiento, frecuencia_anual, True).sum()
+print(f"\nTotal aportado (fórmula): ${total:,.2f} | cronograma: ${total_cronograma:,.2f}")
+
+print("\n" + "=" * 70)
+print("TASA DE CRECIMIENTO CASI IGUAL A LA TASA")
+print("=" * 70)
+
+# Crecimiento anual con g ≈ TEA y crecimiento por periodo con g ≈ tasa del periodo
+casos = [
+    (0.05, 0.05 + 1e-11, True),
+    (0.05, 0.05 - 1e-9, True),
+    (0.05, 0.0500001, True),
+    (0.049, calcular_tasa_periodo(0.049, 12) + 1e-12, False),
+    (0.049, calcular_tasa_periodo(0.049, 12) - 1e-8, False)
+]
+for tea_caso, g, anual in casos:
+    vf = calcular_vf_combinado(0, 100, tea_caso, 12, 40, False, False, g, anual)
+    aportes = generar_aportes_crecientes(100, 480, g, 12, anual)
+    i = calcular_tasa_periodo(tea_caso, 12)
+    vf_cronograma = float(np.sum(aportes * (1 + i) ** np.arange(479, -1, -1)))
+    estado = "✅" if abs(vf - vf_cronograma) < 0.01 else "⚠️ "
+    print(f"  {estado} TEA {tea_caso:.1%}, g = {g:.12f} ({'anual' if anual else 'por periodo'}): "
+          f"fórmula ${vf:,.2f} | cronograma ${vf_cronograma:,.2f}")
+
+print("\n✅ Prueba completada!")
@@ -0,0 +1,91 @@
+"""Script de prueba para los aportes irregulares (CSV, ajuste al plazo y VF con cronograma)"""
+import io
+import numpy as np
+from src.utils.helpers import cargar_aportes_csv, expandir_aportes_anuales
+from src.calculations.financial_calcs import calcular_vf_combinado, calcular_tasa_periodo, ajustar_aportes
+from src.utils.tables import generar_tabla_crecimiento
+
+vp = 5000
+tea = 0.09
+frecuencia_anual = 12
+plazo_años = 3
+num_periodos = plazo_años * frecuencia_anual
+
+print("=" * 70)
+print("LECTURA DEL CSV")
+print("=" * 70)
+
+casos = {
+    "Columna 'aporte' en orden": ("aporte\n100\n200\n300\n", [100, 200, 300]),
+    "Encabezado con mayúsculas y espacios": (" Aporte ,nota\n50,a\n60,b\n", [50, 60]),
+    "Columna 'periodo' desordenada con huecos": ("periodo,aporte\n3,30\n1,10\n5,50\n", [10, 0, 30, 0, 50]),
+    "Periodo repetido se suma": ("periodo,aporte\n1,10\n1,5\n2,20\n", [15, 20]),
+    "Montos no numéricos cuentan como 0": ("aporte\n100\nabc\n300\n", [100, 0, 300])
+}
+for nombre, (texto, esperado) in casos.items():
+    aportes = cargar_aportes_csv(io.StringIO(texto))
+    estado = "✅" if np.array_equal(aportes, esperado) else "⚠️ "
+    print(f"  {estado} {nombre}: {aportes.tolist()}")
+
+for nombre, texto in (
+    ("Sin columna 'aporte'", "monto,periodo\n100,1\n200,2\n"),
+    ("CSV con solo 'periodo'", "periodo\n1\n2\n")
+):
+    try:
+        cargar_aportes_csv(io.StringIO(texto))
+        print(f"  ⚠️  {nombre}: no lanzó error")
+    except ValueError as error:
+        estado = "✅" if "'aporte'" in str(error) and "columnas encontradas" in str(error) else "⚠️ "
+        print(f"  {estado} {nombre}: {error}")
+
+print("\n" + "=" * 70)
+print("AJUSTE AL PLAZO")
+print("=" * 70)
+
+corto = np.arange(1, 11, dtype=float)
+largo = np.arange(1, 51, dtype=float)
+ajustado_corto = ajustar_aportes(corto, num_periodos)
+ajustado_largo = ajustar_aportes(largo, num_periodos)
+estado = "✅" if len(ajustado_corto) == num_periodos and ajustado_corto[10:].sum() == 0 and ajustado_corto[:10].sum() == corto.sum() else "⚠️ "
+print(f"  {estado} Historial corto (10 de {num_periodos}): se completa con ceros")
+estado = "✅" if np.array_equal(ajustado_largo, largo[:num_periodos]) else "⚠️ "
+print(f"  {estado} Historial largo (50 de {num_periodos}): se ignoran los sobrantes")
+
+vf_corto = calcular_vf_combinado(vp, corto, tea, frecuencia_anual, plazo_años)
+vf_rellenado = calcular_vf_combinado(vp, ajustado_corto, tea, frecuencia_anual, plazo_años)
+estado = "✅" if abs(vf_corto - vf_rellenado) < 1e-6 else "⚠️ "
+print(f"  {estado} VF con historial corto = VF con ceros explícitos: {vf_corto:,.2f}")
+
+print("\n" + "=" * 70)
+print("VF vs CRONOGRAMA Y SIMULACIÓN")
+print("=" * 70)
+
+aportes = np.random.default_rng(3).uniform(0, 800, num_periodos).round(2)
+tasa = calcular_tasa_periodo(tea, frecuencia_anual)
+for aporte_al_inicio in (False, True):
+    saldo = vp
+    for monto in aportes:
+        saldo = (saldo + monto) * (1 + tasa) if aporte_al_inicio else saldo * (1 + tasa) + monto
+    vf = calcular_vf_combinado(vp, aportes, tea, frecuencia_anual, plazo_años, aporte_al_inicio)
+    tabla = generar_tabla_crecimiento(vp, aportes, tea, frecuencia_anual, plazo_años, aporte_al_inicio)
+    correcto = abs(vf - saldo) < 0.01 and abs(tabla['saldo_final'].iloc[-1] - round(vf, 2)) < 0.011
+    correcto = correcto and np.allclose(tabla['aporte'], aportes)
+    estado = "✅" if correcto else "⚠️ "
+    print(f"  {estado} Aporte al {'inicio' if aporte_al_inicio else 'final '}: VF {vf:,.2f} | simulación {saldo:,.2f} | "
+          f"tabla {tabla['saldo_final'].iloc[-1]:,.2f}")
+
+print("\n" + "=" * 70)
+print("EDITOR POR AÑO (PLAZOS LARGOS)")
+print("=" * 70)
+
+por_año = [10.0, 20.0, 0.0]
+expandido = expandir_aportes_anuales(por_año, 365)
+estado = "✅" if len(expandido) == 3 * 365 and expandido[364] == 10 and expandido[365] == 20 and expandido[-1] == 0 else "⚠️ "
+print(f"  {estado} 3 años diarios: {len(expandido)} periodos, total {expandido.sum():,.2f}")
+
+vf_anual = calcular_vf_combinado(vp, expandir_aportes_anuales([5.0] * 50, 365), tea, 365, 50)
+vf_constante = calcular_vf_combinado(vp, 5.0, tea, 365, 50)
+estado = "✅" if abs(vf_anual - vf_constante) < 0.01 else "⚠️ "
+print(f"  {estado} Mismo aporte todos los años = aporte constante: {vf_anual:,.2f} vs {vf_constante:,.2f}")
+
+print("\n✅ Prueba completada!")
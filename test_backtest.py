@@ -0,0 +1,82 @@
+"""Script de prueba para el backtest histórico"""
+import time
+import numpy as np
+from src.calculations.backtest import ejecutar_backtest, generar_ventanas_moviles
+from src.calculations.financial_calcs import calcular_vf_combinado, calcular_tasa_periodo
+from src.calculations.tax_calcs import calcular_retiro_mensual_con_impuestos
+
+# Parámetros de prueba
+vp = 10000
+aporte = 300
+tea = 0.08
+plazo_años = 20
+meses_retiro = 240
+tasa_mensual_retiro = tea / 2 / 12
+
+print("=" * 70)
+print("SERIE CONSTANTE vs FÓRMULA")
+print("=" * 70)
+
+retornos_constantes = np.full(480, calcular_tasa_periodo(tea, 12))
+for frecuencia_anual in (12, 4, 1):
+    for aporte_al_inicio, capitalizacion_continua, modo in (
+        (False, False, "aporte al final "),
+        (True, False, "aporte al inicio"),
+        (False, True, "flujo continuo  ")
+    ):
+        resultado = ejecutar_backtest(
+            vp, aporte, retornos_constantes, frecuencia_anual, plazo_años, aporte_al_inicio,
+            capitalizacion_continua, num_muestras=100, semilla=1
+        )
+        vf = calcular_vf_combinado(vp, aporte, tea, frecuencia_anual, plazo_años, aporte_al_inicio, capitalizacion_continua)
+        diferencia = np.abs(resultado['historico']['vf'] - vf).max()
+        estado = "✅" if diferencia < 0.01 else "⚠️ "
+        print(f"  {estado} Frecuencia {frecuencia_anual:>2}, {modo}: VF ${vf:,.2f} | diferencia máxima ${diferencia:.6f}")
+
+print("\n" + "=" * 70)
+print("SERIE SIMULADA DE 100 AÑOS")
+print("=" * 70)
+
+retornos = np.random.default_rng(7).normal(0.007, 0.045, 1200)
+inicio = time.perf_counter()
+resultado = ejecutar_backtest(
+    vp, aporte, retornos, 12, plazo_años,
+    tasa_mensual_retiro=tasa_mensual_retiro, meses_retiro=meses_retiro, semilla=42
+)
+duracion = time.perf_counter() - inicio
+
+print(f"\nVentanas históricas: {resultado['num_ventanas']} | remuestreos: {len(resultado['bootstrap']['vf'])} en {duracion*1000:.1f} ms")
+for nombre in ('historico', 'bootstrap'):
+    resumen = resultado[nombre]['resumen_vf']
+    print(f"  {nombre}: p5 ${resumen['p5']:,.2f} | mediana ${resumen['p50']:,.2f} | p95 ${resumen['p95']:,.2f}")
+
+# La primera ventana debe coincidir con un cálculo directo mes a mes
+saldo = vp
+for r in generar_ventanas_moviles(retornos, plazo_años * 12)[0]:
+    saldo = saldo * (1 + r) + aporte
+if abs(saldo - resultado['historico']['vf'][0]) < 0.01:
+    print("  ✅ La primera ventana coincide con la simulación mes a mes")
+else:
+    print("  ⚠️  La primera ventana no coincide con la simulación mes a mes")
+
+repetido = ejecutar_backtest(vp, aporte, retornos, 12, plazo_años, semilla=42)
+if np.array_equal(repetido['bootstrap']['vf'], resultado['bootstrap']['vf']):
+    print("  ✅ La semilla hace reproducible el remuestreo")
+else:
+    print("  ⚠️  El remuestreo no es reproducible")
+
+print("\n" + "=" * 70)
+print("RETIROS ESCALADOS")
+print("=" * 70)
+
+vf_ventana = resultado['historico']['vf'][0]
+directo = calcular_retiro_mensual_con_impuestos(vf_ventana, 0, tasa_mensual_retiro, meses_retiro, "Nacional")
+escalado = resultado['historico']['retiro_mensual_neto'][0]
+print(f"\nRetiro neto directo:  ${directo['retiro_mensual_neto']:,.2f}")
+print(f"Retiro neto escalado: ${escalado:,.2f}")
+if abs(directo['retiro_mensual_neto'] - escalado) < 0.01:
+    print("  ✅ El retiro escala linealmente con el VF")
+else:
+    print("  ⚠️  El retiro escalado no coincide")
+
+print("\n✅ Prueba completada!")
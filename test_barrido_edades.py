@@ -0,0 +1,37 @@
+"""Script de prueba del barrido de edades de jubilación"""
+import time
+from src.calculations.lifecycle_calcs import calcular_barrido_edades
+from src.ui.comparacion import calcular_escenario
+
+# Parámetros de prueba
+vp = 5000
+aporte = 300
+tea = 0.09
+frecuencia_anual = 12
+edad_actual = 30
+meses_retiro = 240
+
+print("=" * 70)
+print("PRUEBA DEL BARRIDO DE EDADES: UNA PASADA vs ESCENARIO POR EDAD")
+print("=" * 70)
+
+for tipo_bolsa in ("Nacional", "Extranjera"):
+    inicio = time.perf_counter()
+    barrido = calcular_barrido_edades(vp, aporte, tea, frecuencia_anual, edad_actual, tipo_bolsa, meses_retiro)
+    duracion = time.perf_counter() - inicio
+    
+    print(f"\nBolsa {tipo_bolsa}: {len(barrido['edad'])} edades en {duracion * 1000:.2f} ms")
+    for edad in (31, 50, 65, 100):
+        escenario = calcular_escenario(
+            vp, aporte, tea, frecuencia_anual, edad - edad_actual, tipo_bolsa, edad_actual, meses_retiro
+        )
+        i = edad - edad_actual - 1
+        diferencia = max(
+            abs(escenario['monto_neto_total'] - barrido['monto_neto_total'][i]),
+            abs(escenario['retiro_mensual_neto'] - barrido['retiro_mensual_neto'][i])
+        )
+        estado = "✅" if diferencia < 0.01 else "⚠️ "
+        print(f"  {estado} {edad} años: total neto ${barrido['monto_neto_total'][i]:,.2f} | "
+              f"mensual neto ${barrido['retiro_mensual_neto'][i]:,.2f}")
+
+print("\n✅ Prueba completada!")
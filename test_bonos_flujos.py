@@ -0,0 +1,62 @@
+"""Script de prueba del motor de flujos de bonos"""
+from src.calculations.bond_calcs import (
+    calcular_valor_presente_bono,
+    calcular_tasa_descuento_periodo,
+    generar_flujos_bono
+)
+
+# Parámetros de prueba
+valor_nominal = 1000
+tasa_cupon = 0.05
+frecuencia_anual = 2
+años = 10
+tea_descuento = 0.06
+
+print("=" * 70)
+print("PRUEBA DEL MOTOR DE FLUJOS: PRODUCTO PUNTO vs SUMA FLUJO POR FLUJO")
+print("=" * 70)
+
+tasa_descuento = calcular_tasa_descuento_periodo(tea_descuento, frecuencia_anual)
+
+for tipo in ("bullet", "cupon_cero", "amortizable", "fondo_amortizacion"):
+    resultado = calcular_valor_presente_bono(
+        valor_nominal, tasa_cupon, frecuencia_anual, años, tea_descuento, tipo, años_gracia=4
+    )
+    calendario = resultado['calendario']
+    vp_bucle = sum(
+        flujo / (1 + tasa_descuento) ** periodo
+        for periodo, flujo in zip(calendario['periodo'], calendario['flujo'])
+    )
+    
+    print(f"\n{tipo}:")
+    print(f"  VP (motor): ${resultado['valor_presente_total']:,.4f} | VP (bucle): ${vp_bucle:,.4f}")
+    print(f"  Cupones: ${resultado['vp_cupones']:,.2f} | Principal: ${resultado['vp_principal']:,.2f}")
+    if abs(resultado['valor_presente_total'] - vp_bucle) < 1e-8:
+        print("  ✅ Coinciden")
+    else:
+        print("  ⚠️  No coinciden")
+    if abs(calendario['principal'].sum() - valor_nominal) < 1e-8:
+        print("  ✅ El principal devuelto suma el valor nominal")
+    else:
+        print(f"  ⚠️  Principal devuelto: ${calendario['principal'].sum():,.2f}")
+
+print("\n" + "=" * 70)
+print("BONOS A LA PAR: CUPÓN IGUAL A LA TASA DE DESCUENTO")
+print("=" * 70)
+
+for tipo in ("bullet", "amortizable", "fondo_amortizacion"):
+    resultado = calcular_valor_presente_bono(valor_nominal, 0.07, 4, 15, 0.07, tipo, años_gracia=5)
+    estado = "✅" if abs(resultado['valor_presente_total'] - valor_nominal) < 1e-8 else "⚠️ "
+    print(f"  {estado} {tipo}: VP ${resultado['valor_presente_total']:,.6f}")
+
+print("\n" + "=" * 70)
+print("CALENDARIO DEL FONDO DE AMORTIZACIÓN")
+print("=" * 70)
+
+calendario = generar_flujos_bono("fondo_amortizacion", valor_nominal, 0.03, 8, periodos_gracia=4)
+for periodo, saldo, cupon, principal in zip(
+    calendario['periodo'], calendario['saldo_inicial'], calendario['cupon'], calendario['principal']
+):
+    print(f"  Periodo {periodo}: saldo ${saldo:,.2f} | cupón ${cupon:,.2f} | principal ${principal:,.2f}")
+
+print("\n✅ Prueba completada!")
@@ -0,0 +1,81 @@
+"""Script de prueba para la valoración de bonos por Monte Carlo (Vasicek / CIR)"""
+import numpy as np
+from src.calculations.bond_calcs import calcular_valor_presente_bono
+from src.calculations.bond_simulation import simular_precios_bono
+
+valor_nominal = 1000
+tasa_cupon = 0.05
+frecuencia_anual = 2
+plazo_años = 10
+tea_descuento = 0.06
+
+bono = calcular_valor_presente_bono(valor_nominal, tasa_cupon, frecuencia_anual, plazo_años, tea_descuento)
+calendario = bono['calendario']
+precio_fijo = bono['valor_presente_total']
+
+print("=" * 70)
+print("PRUEBA DE MONTE CARLO: VOLATILIDAD CERO")
+print("=" * 70)
+
+for modelo in ("vasicek", "cir"):
+    simulacion = simular_precios_bono(calendario, tea_descuento, frecuencia_anual, modelo, 2000, volatilidad=0.0, semilla=1)
+    estado = "✅" if abs(simulacion['precio_esperado'] - precio_fijo) < 1e-8 else "⚠️ "
+    print(f"  {estado} {modelo}: Monte Carlo ${simulacion['precio_esperado']:,.6f} | tasa fija ${precio_fijo:,.6f}")
+
+print("\n" + "=" * 70)
+print("REPRODUCIBILIDAD CON SEMILLA")
+print("=" * 70)
+
+for modelo in ("vasicek", "cir"):
+    a = simular_precios_bono(calendario, tea_descuento, frecuencia_anual, modelo, semilla=42)
+    b = simular_precios_bono(calendario, tea_descuento, frecuencia_anual, modelo, semilla=42)
+    estado = "✅" if np.array_equal(a['precios'], b['precios']) else "⚠️ "
+    print(f"  {estado} {modelo}: precio esperado ${a['precio_esperado']:,.4f} ± {a['error_estandar']:.4f}")
+
+print("\n" + "=" * 70)
+print("BLOQUES: EL TAMAÑO DE BLOQUE NO SESGA EL RESULTADO")
+print("=" * 70)
+
+grande = simular_precios_bono(calendario, tea_descuento, frecuencia_anual, semilla=7, tamaño_bloque=20000)
+chico = simular_precios_bono(calendario, tea_descuento, frecuencia_anual, semilla=7, tamaño_bloque=500)
+diferencia = abs(grande['precio_esperado'] - chico['precio_esperado'])
+estado = "✅" if diferencia < 4 * max(grande['error_estandar'], chico['error_estandar']) else "⚠️ "
+print(f"  {estado} Un bloque: ${grande['precio_esperado']:,.4f} | bloques de 500: ${chico['precio_esperado']:,.4f}")
+
+print("\n" + "=" * 70)
+print("VASICEK: PRECIO ESPERADO vs FÓRMULA CERRADA")
+print("=" * 70)
+
+# Con media de largo plazo igual a la tasa inicial, el bono cupón cero de Vasicek
+# tiene precio cerrado P = exp(A - B r0), B = (1 - e^(-κT)) / κ
+kappa, sigma = 0.15, 0.01
+r0 = np.log1p(tea_descuento)
+cero = calcular_valor_presente_bono(valor_nominal, 0.0, frecuencia_anual, plazo_años, tea_descuento, tipo_bono="cupon_cero")
+T = plazo_años
+B = (1 - np.exp(-kappa * T)) / kappa
+A = (r0 - sigma ** 2 / (2 * kappa ** 2)) * (B - T) - sigma ** 2 * B ** 2 / (4 * kappa)
+precio_cerrado = valor_nominal * np.exp(A - B * r0)
+
+simulacion = simular_precios_bono(cero['calendario'], tea_descuento, frecuencia_anual, "vasicek", 40000, kappa, sigma, semilla=3)
+estado = "✅" if abs(simulacion['precio_esperado'] - precio_cerrado) < 4 * simulacion['error_estandar'] + 0.05 else "⚠️ "
+print(f"  {estado} Monte Carlo ${simulacion['precio_esperado']:,.4f} ± {simulacion['error_estandar']:.4f} | cerrada ${precio_cerrado:,.4f}")
+
+print("\n" + "=" * 70)
+print("VARIABLES ANTITÉTICAS: REDUCCIÓN DE VARIANZA")
+print("=" * 70)
+
+# Sin antitéticas el error sería el desvío de todas las trayectorias / √n
+precios = simulacion['precios']
+error_simple = precios.std(ddof=1) / np.sqrt(len(precios))
+estado = "✅" if simulacion['error_estandar'] < error_simple else "⚠️ "
+print(f"  {estado} Error con antitéticas: {simulacion['error_estandar']:.4f} | sin antitéticas (aprox.): {error_simple:.4f}")
+
+print("\n" + "=" * 70)
+print("CIR: TASAS NO NEGATIVAS")
+print("=" * 70)
+
+cir = simular_precios_bono(calendario, 0.005, frecuencia_anual, "cir", 4000, volatilidad=0.2, semilla=9)
+estado = "✅" if cir['muestra_tasas'].min() >= 0 else "⚠️ "
+print(f"  {estado} Tasa mínima de la muestra: {cir['muestra_tasas'].min():.6f}")
+
+print("\n✅ Prueba completada!")
@@ -0,0 +1,79 @@
+"""Script de prueba de bonos con opciones en el árbol Ho-Lee"""
+import time
+import numpy as np
+from src.calculations.bond_calcs import calcular_valor_presente_bono
+from src.calculations.bond_options import (
+    calibrar_ho_lee,
+    valorar_en_arbol,
+    calcular_bono_con_opciones,
+    generar_precios_ejercicio
+)
+
+print("=" * 70)
+print("CALIBRACIÓN: ÁRBOL SIN OPCIONES vs VALOR PRESENTE DEL BONO")
+print("=" * 70)
+
+casos = [
+    (1000, 0.05, 12, 50, 0.06, "bullet"),
+    (1000, 0.08, 2, 10, 0.05, "amortizable"),
+    (1000, 0.00, 1, 20, 0.07, "cupon_cero"),
+    (1000, 0.06, 4, 15, 0.09, "fondo_amortizacion")
+]
+
+for valor_nominal, cupon, frecuencia, años, tea, tipo in casos:
+    resultado = calcular_valor_presente_bono(valor_nominal, cupon, frecuencia, años, tea, tipo, años_gracia=5)
+    arbol = calibrar_ho_lee(tea, frecuencia, resultado['num_periodos'], volatilidad=0.015)
+    
+    inicio = time.perf_counter()
+    precio_arbol = valorar_en_arbol(resultado['calendario'], arbol)
+    duracion = time.perf_counter() - inicio
+    
+    diferencia = abs(precio_arbol - resultado['valor_presente_total'])
+    estado = "✅" if diferencia < 1e-8 else "⚠️ "
+    print(f"  {estado} {tipo} ({resultado['num_periodos']} pasos, {duracion * 1000:.1f} ms): "
+          f"árbol ${precio_arbol:,.4f} | VP ${resultado['valor_presente_total']:,.4f}")
+
+print("\n" + "=" * 70)
+print("OPCIONES: CALL Y PUT")
+print("=" * 70)
+
+resultado = calcular_valor_presente_bono(1000, 0.07, 2, 20, 0.06)
+calendario = resultado['calendario']
+
+for nombre, tramos_call, tramos_put in (
+    ("Call desde el año 5 al 102%, luego 100%", [(5, 102), (8, 100)], None),
+    ("Put desde el año 5 al 100%", None, [(5, 100)]),
+    ("Call y put", [(5, 102)], [(5, 98)])
+):
+    opciones = calcular_bono_con_opciones(calendario, 0.06, 2, tramos_call, tramos_put)
+    print(f"\n{nombre}:")
+    print(f"  Sin opciones: ${opciones['precio_sin_opciones']:,.2f} | Con opciones: ${opciones['precio_con_opciones']:,.2f}")
+    print(f"  Valor de las opciones: ${opciones['valor_opciones']:,.2f}")
+    if tramos_call and not tramos_put and opciones['valor_opciones'] <= 0:
+        print("  ⚠️  El call del emisor debería restar valor")
+    elif tramos_put and not tramos_call and opciones['valor_opciones'] >= 0:
+        print("  ⚠️  El put del tenedor debería sumar valor")
+    else:
+        print("  ✅ Signo del valor de las opciones correcto")
+
+# Sin volatilidad, un call al 100% en el primer pago se ejerce si el cupón supera la tasa
+resultado = calcular_valor_presente_bono(1000, 0.08, 1, 10, 0.05)
+opciones = calcular_bono_con_opciones(resultado['calendario'], 0.05, 1, [(1, 100)], None, volatilidad=1e-9)
+esperado = (80 + 1000) / 1.05
+estado = "✅" if abs(opciones['precio_con_opciones'] - esperado) < 1e-6 else "⚠️ "
+print(f"\n{estado} Sin volatilidad el emisor rescata al año 1: ${opciones['precio_con_opciones']:,.4f} (esperado ${esperado:,.4f})")
+
+print("\n" + "=" * 70)
+print("VARIOS DIFERENCIALES EN UNA PASADA")
+print("=" * 70)
+
+resultado = calcular_valor_presente_bono(1000, 0.05, 12, 50, 0.06)
+arbol = calibrar_ho_lee(0.06, 12, resultado['num_periodos'])
+precios_call = generar_precios_ejercicio([(5, 100)], resultado['calendario'], 12)
+spreads = np.linspace(-0.01, 0.01, 21)
+lote = valorar_en_arbol(resultado['calendario'], arbol, precios_call, spread=spreads)
+individual = np.array([valorar_en_arbol(resultado['calendario'], arbol, precios_call, spread=s) for s in spreads])
+estado = "✅" if np.max(np.abs(lote - individual)) < 1e-8 else "⚠️ "
+print(f"\n{estado} 21 diferenciales en lote coinciden con la valoración individual")
+
+print("\n✅ Prueba completada!")
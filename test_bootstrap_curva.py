@@ -0,0 +1,76 @@
+"""Script de prueba para la construcción de la curva cero por bootstrapping"""
+import numpy as np
+from src.calculations.bond_calcs import calcular_valor_presente_bono
+from src.calculations.curve_bootstrap import bootstrap_tasas_par, bootstrap_precios, obtener_curva_csv
+
+plazos = [0.5, 1, 2, 5, 10, 30]
+tasas_par = [0.045, 0.046, 0.047, 0.050, 0.052, 0.055]
+frecuencia_anual = 2
+
+print("=" * 70)
+print("PRUEBA DE BOOTSTRAPPING: BONOS A LA PAR VALEN 100")
+print("=" * 70)
+
+curva = bootstrap_tasas_par(plazos, tasas_par, frecuencia_anual)
+for plazo, tasa in zip(plazos, tasas_par):
+    if plazo != int(plazo):
+        continue
+    precio = calcular_valor_presente_bono(100, tasa, frecuencia_anual, int(plazo), 0.0, curva=curva)['valor_presente_total']
+    estado = "✅" if abs(precio - 100) < 1e-9 else "⚠️ "
+    print(f"  {estado} {plazo:>4g} años al {tasa:.2%}: precio {precio:,.10f}")
+
+print("\n" + "=" * 70)
+print("SUMA PARCIAL ACUMULADA vs RESOLVER CADA PLAZO DESDE CERO")
+print("=" * 70)
+
+# Referencia O(n²): vuelve a sumar todos los descuentos anteriores en cada plazo
+periodos = np.arange(1, 61)
+cupones = (1 + np.interp(periodos, np.array(plazos) * frecuencia_anual, tasas_par)) ** (1 / frecuencia_anual) - 1
+referencia = []
+for cupon in cupones:
+    referencia.append((1 - cupon * sum(referencia)) / (1 + cupon))
+estado = "✅" if np.allclose(curva['descuentos'], referencia, rtol=0, atol=1e-14) else "⚠️ "
+print(f"  {estado} {len(referencia)} factores de descuento coinciden")
+
+print("\n" + "=" * 70)
+print("BOOTSTRAPPING DESDE PRECIOS")
+print("=" * 70)
+
+# Precios de bonos bullet de cupón 6% en cada fecha de pago, valorados con la curva anterior
+plazos_bonos = periodos[:20] / frecuencia_anual
+cupon_periodo = 1.06 ** (1 / frecuencia_anual) - 1
+precios = [
+    100 * cupon_periodo * curva['descuentos'][:n].sum() + 100 * curva['descuentos'][n - 1]
+    for n in periodos[:20]
+]
+curva_precios = bootstrap_precios(plazos_bonos, precios, np.full(20, 0.06), frecuencia_anual)
+estado = "✅" if np.allclose(curva_precios['tasas'], curva['tasas'][:20], atol=1e-12) else "⚠️ "
+print(f"  {estado} Curva desde precios = curva desde tasas par (20 plazos)")
+
+try:
+    bootstrap_precios([0.5, 1.5], [99, 98], [0.05, 0.05], frecuencia_anual)
+    print("  ⚠️  No detectó el plazo faltante")
+except ValueError as error:
+    print(f"  ✅ Plazo faltante detectado: {error}")
+
+try:
+    bootstrap_tasas_par([0.25, 1], [0.04, 0.05], frecuencia_anual)
+    print("  ⚠️  No detectó el plazo fuera de la frecuencia")
+except ValueError as error:
+    print(f"  ✅ Plazo fuera de la frecuencia detectado: {error}")
+
+print("\n" + "=" * 70)
+print("CACHÉ POR HASH DEL ARCHIVO")
+print("=" * 70)
+
+contenido = "plazo_años,tasa_par\n" + "\n".join(f"{p},{t * 100}" for p, t in zip(plazos, tasas_par))
+curva_csv = obtener_curva_csv(contenido.encode('utf-8'), frecuencia_anual)
+otra_vez = obtener_curva_csv(contenido.encode('utf-8'), frecuencia_anual)
+anual = obtener_curva_csv(contenido.replace("0.5,4.5\n", "").encode('utf-8'), 1)
+
+estado = "✅" if otra_vez is curva_csv and np.allclose(curva_csv['tasas'], curva['tasas']) else "⚠️ "
+print(f"  {estado} El mismo archivo devuelve la curva ya construida")
+estado = "✅" if anual is not curva_csv and len(anual['plazos']) == 30 else "⚠️ "
+print(f"  {estado} Otro archivo y frecuencia construyen una curva nueva ({len(anual['plazos'])} plazos)")
+
+print("\n✅ Prueba completada!")
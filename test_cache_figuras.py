@@ -0,0 +1,66 @@
+"""Script de prueba para la caché de figuras y la plantilla compartida de los gráficos"""
+import time
+import numpy as np
+import plotly.io as pio
+from src.visualization.figuras import calcular_huella, limpiar_cache_figuras
+from src.visualization.charts import (
+    generar_evolucion_inversion,
+    crear_grafico_comparativo,
+    crear_grafico_comparacion_vf,
+    crear_grafico_comparacion_retiro
+)
+
+limpiar_cache_figuras()
+df = generar_evolucion_inversion(10000, 500, 0.08, 12, 50, inflacion=0.03)
+
+print("=" * 70)
+print("FIGURAS REUTILIZADAS")
+print("=" * 70)
+
+inicio = time.perf_counter()
+fig = crear_grafico_comparativo(df, "USD", "Periodo")
+construccion = (time.perf_counter() - inicio) * 1000
+
+inicio = time.perf_counter()
+fig_repetida = crear_grafico_comparativo(df.copy(), "USD", etiqueta_periodo="Periodo")
+reutilizacion = (time.perf_counter() - inicio) * 1000
+
+estado = "✅" if fig_repetida is fig else "⚠️ "
+print(f"  {estado} Mismos datos (otra copia del DataFrame): misma figura")
+print(f"     Construcción: {construccion:.1f} ms | reutilización: {reutilizacion:.1f} ms")
+
+df_modificado = df.copy()
+df_modificado.loc[100, 'valor_con_interes'] += 0.01
+casos = {
+    "Un valor distinto": crear_grafico_comparativo(df_modificado, "USD", "Periodo"),
+    "Otra moneda": crear_grafico_comparativo(df, "PEN", "Periodo"),
+    "Otro eje": crear_grafico_comparativo(df, "USD", "Año")
+}
+for nombre, figura in casos.items():
+    estado = "✅" if figura is not fig else "⚠️ "
+    print(f"  {estado} {nombre}: figura nueva")
+
+escenarios = [
+    {'nombre': 'A', 'vf': 1000.0, 'monto_neto_total': 900.0, 'retiro_mensual_bruto': 10.0, 'retiro_mensual_neto': 9.5},
+    {'nombre': 'B', 'vf': 2000.0, 'monto_neto_total': 1800.0, 'retiro_mensual_bruto': 20.0, 'retiro_mensual_neto': 19.0}
+]
+total = crear_grafico_comparacion_retiro(escenarios, "Retiro Total")
+mensual = crear_grafico_comparacion_retiro(escenarios, "Retiro Mensual")
+estado = "✅" if len(total.data) == 1 and len(mensual.data) == 2 else "⚠️ "
+print(f"  {estado} Retiro total: {len(total.data)} serie | retiro mensual: {len(mensual.data)} series")
+
+estado = "✅" if crear_grafico_comparacion_vf(escenarios) is crear_grafico_comparacion_vf(escenarios) else "⚠️ "
+print(f"  {estado} Barras de comparación reutilizadas")
+
+print("\n" + "=" * 70)
+print("HUELLA DE LOS DATOS Y PLANTILLA")
+print("=" * 70)
+
+a = np.arange(12.0).reshape(3, 4)
+estado = "✅" if calcular_huella({'x': a}) == calcular_huella({'x': a.copy()}) != calcular_huella({'x': a.T}) else "⚠️ "
+print(f"  {estado} Arrays: igual contenido → misma huella; otra forma → otra huella")
+
+plantilla = fig.to_dict()['layout']['template']
+esperada = pio.templates['plotly_white'].to_plotly_json()
+estado = "✅" if plantilla == esperada else "⚠️ "
+print(f"  {estado} Las figuras usan la plantilla {pio.templates.default}")
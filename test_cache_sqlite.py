@@ -0,0 +1,109 @@
+"""Script de prueba para la caché SQLite (claves, expulsión LRU y entradas dañadas)"""
+import os
+import pickle
+import sqlite3
+import tempfile
+import time
+import numpy as np
+from src.utils.cache_sqlite import generar_clave, obtener, guardar
+
+archivo = os.path.join(tempfile.mkdtemp(), "cache_prueba.sqlite3")
+
+
+def leer_acceso(clave: str) -> float:
+    with sqlite3.connect(archivo) as conexion:
+        fila = conexion.execute("SELECT ultimo_acceso FROM resultados WHERE clave = ?", (clave,)).fetchone()
+    return None if fila is None else fila[0]
+
+
+def guardar_bytes(clave: str, datos: bytes) -> None:
+    with sqlite3.connect(archivo) as conexion:
+        conexion.execute(
+            "INSERT OR REPLACE INTO resultados (clave, espacio, valor, tamaño, ultimo_acceso) VALUES (?, 'prueba', ?, ?, ?)",
+            (clave, datos, len(datos), time.time())
+        )
+
+
+print("=" * 70)
+print("NORMALIZACIÓN DE FLOATS EN LAS CLAVES")
+print("=" * 70)
+
+casos = [
+    ("0.1 + 0.2 y 0.3", 0.1 + 0.2, 0.3, True),
+    ("-0.0 y 0.0", -0.0, 0.0, True),
+    ("np.float64 y float", np.float64(0.08), 0.08, True),
+    ("Array y lista", np.array([0.05, 0.1 + 0.2]), [0.05, 0.3], True),
+    ("0.3 y 0.30001", 0.3, 0.30001, False),
+    ("1 y 1.0000001", 1.0, 1.0000001, False)
+]
+for nombre, a, b, iguales in casos:
+    resultado = generar_clave("prueba", {'tea': a}) == generar_clave("prueba", {'tea': b})
+    estado = "✅" if resultado == iguales else "⚠️ "
+    print(f"  {estado} {nombre}: {'misma clave' if resultado else 'claves distintas'}")
+
+estado = "✅" if generar_clave("a", {'x': 1}) != generar_clave("b", {'x': 1}) else "⚠️ "
+print(f"  {estado} Otro espacio: otra clave")
+
+print("\n" + "=" * 70)
+print("EXPULSIÓN LRU BAJO EL LÍMITE DE TAMAÑO")
+print("=" * 70)
+
+# Cada resultado ocupa ~4 KB; con un límite de 10 KB caben dos
+limite_mb = 10 / 1024
+for clave in ("a", "b"):
+    guardar(clave, "prueba", bytes(4000), archivo, limite_mb)
+    time.sleep(0.01)
+
+obtener("a", archivo, intervalo_acceso=0)
+time.sleep(0.01)
+guardar("c", "prueba", bytes(4000), archivo, limite_mb)
+
+presentes = {clave: obtener(clave, archivo)[0] for clave in ("a", "b", "c")}
+estado = "✅" if presentes == {'a': True, 'b': False, 'c': True} else "⚠️ "
+print(f"  {estado} Se expulsa el menos usado recientemente: {presentes}")
+
+guardar("grande", "prueba", bytes(20000), archivo, limite_mb)
+estado = "✅" if not obtener("grande", archivo)[0] and obtener("a", archivo)[0] else "⚠️ "
+print(f"  {estado} Un resultado mayor que el límite no se guarda ni expulsa a los demás")
+
+print("\n" + "=" * 70)
+print("ACTUALIZACIÓN ESPACIADA DEL ÚLTIMO ACCESO")
+print("=" * 70)
+
+guardar("d", "prueba", [1, 2, 3], archivo)
+antes = leer_acceso("d")
+time.sleep(0.01)
+encontrado, valor = obtener("d", archivo)
+estado = "✅" if encontrado and valor == [1, 2, 3] and leer_acceso("d") == antes else "⚠️ "
+print(f"  {estado} Un acierto reciente no reescribe la marca (sin bloqueo de escritura)")
+
+obtener("d", archivo, intervalo_acceso=0)
+estado = "✅" if leer_acceso("d") > antes else "⚠️ "
+print(f"  {estado} Pasado el intervalo la marca se actualiza")
+
+print("\n" + "=" * 70)
+print("ENTRADAS DAÑADAS")
+print("=" * 70)
+
+
+class ResultadoTemporal:
+    pass
+
+
+guardar_bytes("basura", b"esto no es un pickle")
+datos_clase = pickle.dumps(ResultadoTemporal())
+del ResultadoTemporal
+guardar_bytes("clase_borrada", datos_clase)
+guardar_bytes("modulo_borrado", datos_clase.replace(b"__main__", b"modulo_x"))
+guardar_bytes("truncado", pickle.dumps(list(range(100)))[:20])
+
+for clave in ("basura", "clase_borrada", "modulo_borrado", "truncado"):
+    encontrado, valor = obtener(clave, archivo)
+    estado = "✅" if not encontrado and valor is None and leer_acceso(clave) is None else "⚠️ "
+    print(f"  {estado} {clave}: tratado como fallo y eliminado")
+
+guardar("basura", "prueba", {'ok': True}, archivo)
+estado = "✅" if obtener("basura", archivo) == (True, {'ok': True}) else "⚠️ "
+print(f"  {estado} La clave se vuelve a guardar normalmente")
+
+print("\n✅ Prueba completada!")
@@ -0,0 +1,67 @@
+"""Script de prueba para capitalización diaria/continua y la vista agregada"""
+import time
+from src.calculations.financial_calcs import calcular_vf_combinado
+from src.utils.tables import generar_tabla_crecimiento, seleccionar_vista, agregar_tabla_crecimiento
+from src.visualization.charts import generar_evolucion_inversion, agregar_evolucion
+
+# Parámetros de prueba
+vp = 10000
+aporte = 10
+tea = 0.10
+plazo_años = 50
+
+print("=" * 70)
+print("PRUEBA DE CAPITALIZACIÓN DIARIA (50 AÑOS)")
+print("=" * 70)
+
+inicio = time.perf_counter()
+tabla = generar_tabla_crecimiento(vp, aporte, tea, 365, plazo_años, False)
+duracion = time.perf_counter() - inicio
+
+vf = calcular_vf_combinado(vp, aporte, tea, 365, plazo_años, False)
+saldo_final = tabla.iloc[-1]['saldo_final']
+
+print(f"\nPeriodos generados: {len(tabla):,} en {duracion*1000:.1f} ms")
+print(f"Valor Futuro (fórmula): ${vf:,.2f}")
+print(f"Saldo Final (tabla): ${saldo_final:,.2f}")
+if abs(vf - saldo_final) < 0.01:
+    print("  ✅ La tabla diaria coincide con la fórmula")
+else:
+    print(f"  ⚠️  Diferencia: ${abs(vf - saldo_final):,.2f}")
+
+print("\n" + "=" * 70)
+print("VISTA AGREGADA")
+print("=" * 70)
+
+vista = seleccionar_vista(len(tabla), 365)
+tabla_vista = agregar_tabla_crecimiento(tabla, 365, vista)
+evolucion_vista = agregar_evolucion(generar_evolucion_inversion(vp, aporte, tea, 365, plazo_años), 365, vista)
+
+print(f"\nVista seleccionada: {vista}")
+print(f"Filas de la tabla: {len(tabla_vista)} | Puntos del gráfico: {len(evolucion_vista)}")
+print(f"Saldo Final (vista): ${tabla_vista.iloc[-1]['saldo_final']:,.2f}")
+print(f"Total aportes (vista): ${tabla_vista['aporte'].sum():,.2f} | esperado: ${aporte * 365 * plazo_años:,.2f}")
+if abs(tabla_vista.iloc[-1]['saldo_final'] - saldo_final) < 0.01:
+    print("  ✅ La vista agregada conserva el saldo final")
+else:
+    print("  ⚠️  La vista agregada no conserva el saldo final")
+
+print("\n" + "=" * 70)
+print("CAPITALIZACIÓN CONTINUA")
+print("=" * 70)
+
+vf_mensual = calcular_vf_combinado(0, 100, tea, 12, 10, False)
+vf_anticipada = calcular_vf_combinado(0, 100, tea, 12, 10, True)
+vf_continua = calcular_vf_combinado(0, 100, tea, 12, 10, capitalizacion_continua=True)
+tabla_continua = generar_tabla_crecimiento(0, 100, tea, 12, 10, capitalizacion_continua=True)
+
+print(f"\nVF vencida:   ${vf_mensual:,.2f}")
+print(f"VF continua:  ${vf_continua:,.2f}")
+print(f"VF anticipada: ${vf_anticipada:,.2f}")
+print(f"Saldo Final (tabla continua): ${tabla_continua.iloc[-1]['saldo_final']:,.2f}")
+if vf_mensual < vf_continua < vf_anticipada:
+    print("  ✅ El flujo continuo queda entre la anualidad vencida y la anticipada")
+else:
+    print("  ⚠️  El flujo continuo debería quedar entre vencida y anticipada")
+
+print("\n✅ Prueba completada!")
@@ -0,0 +1,100 @@
+"""Script de prueba del ciclo de vida completo (acumulación + retiros)"""
+import numpy as np
+from src.calculations.financial_calcs import calcular_vf_combinado
+from src.calculations.tax_calcs import calcular_tasa_mensual_retiro, calcular_retiro_mensual_con_impuestos
+from src.calculations.lifecycle_calcs import calcular_ciclo_vida, resumir_retiro_ciclo
+from src.utils.tables import (
+    generar_tabla_ciclo_vida,
+    generar_cronograma_ciclo,
+    generar_cronograma_retiros,
+    generar_resumen_cronograma_retiros
+)
+from src.ui.comparacion import calcular_escenarios
+
+# Parámetros de prueba
+vp = 10000
+aporte = 500
+tea = 0.10
+frecuencia_anual = 12
+plazo_años = 30
+meses_retiro = 240
+edad_actual = 35
+
+print("=" * 70)
+print("PRUEBA DEL CICLO DE VIDA: MOTOR ÚNICO vs CÁLCULOS SEPARADOS")
+print("=" * 70)
+
+for frecuencia in (12, 4, 1):
+    ciclo = calcular_ciclo_vida(vp, aporte, tea, frecuencia, plazo_años, meses_retiro, edad_actual)
+    vf = calcular_vf_combinado(vp, aporte, tea, frecuencia, plazo_años)
+    retiro = calcular_retiro_mensual_con_impuestos(vf, 0, calcular_tasa_mensual_retiro(tea), meses_retiro, "Nacional")
+    resumen = resumir_retiro_ciclo(ciclo)
+    
+    print(f"\nFrecuencia {frecuencia} aportes por año:")
+    print(f"  VF (ciclo):    ${ciclo['vf'][0]:,.2f} | VF (fórmula): ${vf:,.2f}")
+    print(f"  Retiro neto (ciclo): ${resumen['retiro_mensual']:,.2f} | (simulación): ${retiro['retiro_mensual']:,.2f}")
+    if abs(ciclo['vf'][0] - vf) < 0.01 and abs(resumen['total_retirado'] - retiro['total_retirado']) < 0.01:
+        print("  ✅ Coinciden al centavo")
+    else:
+        print("  ⚠️  Los resultados no coinciden")
+    
+    saldo_final = ciclo['saldo'][0, plazo_años * 12 + meses_retiro]
+    if abs(saldo_final) < 0.01:
+        print("  ✅ El saldo se agota en el último retiro")
+    else:
+        print(f"  ⚠️  Saldo final: ${saldo_final:,.2f}")
+
+print("\n" + "=" * 70)
+print("TABLA MES A MES")
+print("=" * 70)
+
+ciclo = calcular_ciclo_vida(vp, aporte, tea, frecuencia_anual, plazo_años, meses_retiro, edad_actual, inflacion=0.03)
+df = generar_tabla_ciclo_vida(ciclo)
+print(f"\nFilas: {len(df)} (esperado {plazo_años * 12 + meses_retiro + 1})")
+print(df.iloc[[0, 12, 360, 361, -1]].to_string(index=False))
+impuestos = df['impuesto'].sum()
+if abs(impuestos - ciclo['impuesto_retiro'][0]) < 1:
+    print(f"\n✅ Impuestos mes a mes (${impuestos:,.2f}) suman el total del retiro")
+else:
+    print(f"\n⚠️  Impuestos mes a mes: ${impuestos:,.2f} vs ${ciclo['impuesto_retiro'][0]:,.2f}")
+
+print("\n" + "=" * 70)
+print("CRONOGRAMA DE RETIROS DESDE EL CICLO")
+print("=" * 70)
+
+for frecuencia, inflacion in ((12, 0.0), (365, 0.03), (4, 0.02)):
+    ciclo_caso = calcular_ciclo_vida(vp, aporte, tea, frecuencia, plazo_años, meses_retiro, edad_actual, inflacion=inflacion)
+    cronograma = generar_cronograma_ciclo(ciclo_caso)
+    referencia = generar_cronograma_retiros(
+        float(ciclo_caso['vf'][0]), calcular_tasa_mensual_retiro(tea), meses_retiro, inflacion, plazo_años
+    )
+    ventana = generar_cronograma_ciclo(ciclo_caso, 100, 120)
+    resumen = generar_resumen_cronograma_retiros(cronograma)
+    mismas = list(cronograma.columns) == list(referencia.columns) and cronograma.index.equals(referencia.index)
+    diferencia = float(np.abs(cronograma.to_numpy() - referencia.to_numpy()).max())
+    correcto = (
+        mismas and diferencia < 0.011 and ventana.equals(cronograma.iloc[100:120])
+        and abs(resumen['saldo_inicial'] - ciclo_caso['vf'][0]) < 0.01
+        and abs(resumen['total_impuestos'] - ciclo_caso['impuesto_retiro'][0]) < 1
+    )
+    estado = "✅" if correcto else "⚠️ "
+    print(f"  {estado} {frecuencia} aportes/año, inflación {inflacion:.0%}: diferencia máxima {diferencia:.4f}, "
+          f"columnas {len(cronograma.columns)}")
+
+print("\n" + "=" * 70)
+print("ESCENARIOS EN LOTE")
+print("=" * 70)
+
+plazos = [25, 30, 35]
+teas = [0.07, 0.10, 0.13]
+meses = [300, 240, 180]
+resultado = calcular_escenarios(vp, aporte, teas, frecuencia_anual, plazos, "Nacional", edad_actual, meses)
+print(f"\nForma del camino: {resultado['ciclo_vida']['saldo'].shape}")
+for escenario, plazo, t, m in zip(resultado['escenarios'], plazos, teas, meses):
+    vf = calcular_vf_combinado(vp, aporte, t, frecuencia_anual, plazo)
+    retiro = calcular_retiro_mensual_con_impuestos(vf, 0, calcular_tasa_mensual_retiro(t), m, "Nacional")
+    estado = "✅" if abs(escenario['total_retiro_mensual'] - retiro['total_retirado']) < 0.01 else "⚠️ "
+    print(f"  {estado} {plazo} años al {t:.0%}, {m} meses: VF ${escenario['vf']:,.2f} | "
+          f"retiro neto ${escenario['retiro_mensual_neto']:,.2f}/mes")
+
+print("\n✅ Prueba completada!")
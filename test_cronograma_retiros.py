@@ -20,8 +20,8 @@ tasa_mensual = calcular_tasa_mensual_retiro(tea)
 print(f"  Tasa mensual de retiro: {tasa_mensual*100:.4f}% (50% de TEA)")
 
 # Generar cronograma
-df = generar_cronograma_retiros(vf, tasa_mensual, meses, "USD")
-resumen = generar_resumen_cronograma_retiros(df, "USD")
+df = generar_cronograma_retiros(vf, tasa_mensual, meses)
+resumen = generar_resumen_cronograma_retiros(df)
 
 print("\n" + "=" * 90)
 print("RESUMEN DEL CRONOGRAMA")
@@ -43,7 +43,7 @@ print("VALIDACIÓN")
 print("=" * 90)
 
 # Verificar que el saldo final sea cercano a 0
-saldo_final = df.iloc[-1]['Saldo Final (USD)']
+saldo_final = df.iloc[-1]['saldo_final']
 print(f"  Saldo final: ${saldo_final:,.2f}")
 if abs(saldo_final) < 1:
     print("  ✅ El saldo final es aproximadamente 0 (correcto)")
@@ -30,8 +30,8 @@ for i, escenario in enumerate(escenarios, 1):
     print(f"  Periodo: {meses} meses ({meses/12:.1f} años)")
     
     # Generar cronograma
-    df = generar_cronograma_retiros(vf, tasa_mensual, meses, "USD")
-    resumen = generar_resumen_cronograma_retiros(df, "USD")
+    df = generar_cronograma_retiros(vf, tasa_mensual, meses)
+    resumen = generar_resumen_cronograma_retiros(df)
     
     print(f"\nResumen:")
     print(f"  Saldo Inicial: ${resumen['saldo_inicial']:,.2f}")
@@ -44,10 +44,10 @@ for i, escenario in enumerate(escenarios, 1):
     print(f"\n  Primeros 3 meses:")
     for idx in range(min(3, len(df))):
         row = df.iloc[idx]
-        print(f"    Mes {int(row['Mes']):3d}: Saldo ${row['Saldo Inicial (USD)']:10,.2f} | "
-              f"Interés ${row['Interés Generado (USD)']:8,.2f} | "
-              f"Impuesto ${row['Impuesto 5% (USD)']:7,.2f} | "
-              f"Retiro Neto ${row['Retiro Neto (USD)']:8,.2f}")
+        print(f"    Mes {int(row.name):3d}: Saldo ${row['saldo_inicial']:10,.2f} | "
+              f"Interés ${row['interes']:8,.2f} | "
+              f"Impuesto ${row['impuesto']:7,.2f} | "
+              f"Retiro Neto ${row['retiro_neto']:8,.2f}")
     
     if len(df) > 6:
         print(f"    ... ({len(df) - 6} meses omitidos) ...")
@@ -55,13 +55,13 @@ for i, escenario in enumerate(escenarios, 1):
     print(f"\n  Últimos 3 meses:")
     for idx in range(max(0, len(df) - 3), len(df)):
         row = df.iloc[idx]
-        print(f"    Mes {int(row['Mes']):3d}: Saldo ${row['Saldo Inicial (USD)']:10,.2f} | "
-              f"Interés ${row['Interés Generado (USD)']:8,.2f} | "
-              f"Impuesto ${row['Impuesto 5% (USD)']:7,.2f} | "
-              f"Retiro Neto ${row['Retiro Neto (USD)']:8,.2f}")
+        print(f"    Mes {int(row.name):3d}: Saldo ${row['saldo_inicial']:10,.2f} | "
+              f"Interés ${row['interes']:8,.2f} | "
+              f"Impuesto ${row['impuesto']:7,.2f} | "
+              f"Retiro Neto ${row['retiro_neto']:8,.2f}")
     
     # Validaciones
-    saldo_final = df.iloc[-1]['Saldo Final (USD)']
+    saldo_final = df.iloc[-1]['saldo_final']
     if abs(saldo_final) < 1:
         print(f"\n  ✅ Saldo final: ${saldo_final:.2f} (correcto)")
     else:
@@ -84,8 +84,8 @@ for escenario in escenarios:
     meses = escenario['meses']
     tasa_mensual = calcular_tasa_mensual_retiro(tea)
     
-    df = generar_cronograma_retiros(vf, tasa_mensual, meses, "USD")
-    resumen = generar_resumen_cronograma_retiros(df, "USD")
+    df = generar_cronograma_retiros(vf, tasa_mensual, meses)
+    resumen = generar_resumen_cronograma_retiros(df)
     
     ganancia = resumen['total_retiro_neto'] - vf
     
@@ -0,0 +1,61 @@
+"""Script de prueba para el esquema canónico de los cronogramas y su etiquetado"""
+import numpy as np
+import pandas as pd
+from src.calculations.lifecycle_calcs import calcular_ciclo_vida
+from src.utils.tables import (
+    generar_tabla_crecimiento,
+    generar_cronograma_retiros,
+    generar_tabla_ciclo_vida,
+    agregar_tabla_crecimiento,
+    generar_resumen_tabla,
+    etiquetar_tabla
+)
+
+
+def revisar_esquema(nombre, df, indice, columnas):
+    numericas = all(pd.api.types.is_numeric_dtype(df[col]) for col in columnas)
+    correcto = (
+        df.index.name == indice
+        and pd.api.types.is_integer_dtype(df.index)
+        and list(df.columns[:len(columnas)]) == columnas
+        and numericas
+    )
+    estado = "✅" if correcto else "⚠️ "
+    print(f"  {estado} {nombre}: índice '{df.index.name}' ({df.index.dtype}), columnas {list(df.columns)}")
+
+
+print("=" * 70)
+print("TABLAS CANÓNICAS")
+print("=" * 70)
+
+tabla = generar_tabla_crecimiento(10000, 500, 0.08, 12, 30, inflacion=0.03)
+revisar_esquema("Crecimiento", tabla, 'periodo', ['saldo_inicial', 'aporte', 'interes', 'saldo_final', 'aporte_real', 'saldo_final_real'])
+
+anual = agregar_tabla_crecimiento(generar_tabla_crecimiento(1000, 5, 0.08, 365, 10), 365, "Anual")
+revisar_esquema("Crecimiento anual (agregada)", anual, 'periodo', ['saldo_inicial', 'aporte', 'interes', 'saldo_final'])
+
+cronograma = generar_cronograma_retiros(500000, 0.004, 240)
+revisar_esquema("Retiros", cronograma, 'mes', ['saldo_inicial', 'interes', 'impuesto', 'retiro_bruto', 'retiro_neto', 'saldo_final'])
+
+ciclo = calcular_ciclo_vida(10000, 500, 0.08, 12, 30, 240, 35)
+df_ciclo = generar_tabla_ciclo_vida(ciclo)
+revisar_esquema("Ciclo de vida", df_ciclo, 'mes', ['edad'])
+
+print("\n" + "=" * 70)
+print("ETIQUETADO AL MOSTRAR")
+print("=" * 70)
+
+for moneda in ("USD", "PEN"):
+    etiquetada = etiquetar_tabla(tabla, moneda)
+    esperadas = ['Periodo', f'Saldo Inicial ({moneda})', f'Aporte ({moneda})', f'Interés Ganado ({moneda})', f'Saldo Final ({moneda})']
+    estado = "✅" if list(etiquetada.columns[:5]) == esperadas and etiquetada['Periodo'].iloc[-1] == 360 else "⚠️ "
+    print(f"  {estado} {moneda}: {list(etiquetada.columns)}")
+
+estado = "✅" if tabla.columns[0] == 'saldo_inicial' else "⚠️ "
+print(f"  {estado} La tabla canónica no se modifica al etiquetarla")
+
+resumen = generar_resumen_tabla(tabla)
+estado = "✅" if abs(resumen['saldo_final'] - tabla['saldo_final'].iloc[-1]) < 1e-9 and 'saldo_final_real' in resumen else "⚠️ "
+print(f"  {estado} Resumen con claves fijas: saldo final ${resumen['saldo_final']:,.2f} | real ${resumen['saldo_final_real']:,.2f}")
+
+print("\n✅ Prueba completada!")
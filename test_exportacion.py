@@ -0,0 +1,76 @@
+"""Script de prueba para la exportación de tablas (CSV por bloques, Parquet y Arrow)"""
+import io
+import tempfile
+import numpy as np
+import pandas as pd
+from src.utils.exportacion import (
+    hay_soporte_columnar,
+    dividir_en_bloques,
+    escribir_csv_por_bloques,
+    exportar_tabla,
+    leer_tabla_exportada
+)
+from src.utils.tables import (
+    generar_tabla_crecimiento,
+    generar_ventana_crecimiento,
+    etiquetar_tabla
+)
+
+tabla = etiquetar_tabla(generar_tabla_crecimiento(10000, 500, 0.08, 12, 30, inflacion=0.03), "USD")
+
+print("=" * 70)
+print("CSV POR BLOQUES vs to_csv")
+print("=" * 70)
+
+for filas_por_bloque in (7, 100, 50000):
+    buffer = io.BytesIO()
+    filas = escribir_csv_por_bloques(dividir_en_bloques(tabla, filas_por_bloque), buffer)
+    igual = buffer.getvalue() == tabla.to_csv(index=False).encode('utf-8')
+    estado = "✅" if igual and filas == len(tabla) else "⚠️ "
+    print(f"  {estado} Bloques de {filas_por_bloque:,} filas: {filas} filas, idéntico a to_csv: {igual}")
+
+vacia = exportar_tabla(tabla.iloc[:0], "CSV").decode('utf-8')
+estado = "✅" if vacia == tabla.iloc[:0].to_csv(index=False) else "⚠️ "
+print(f"  {estado} Tabla vacía: solo encabezado")
+
+print("\n" + "=" * 70)
+print("CSV DE UN CRONOGRAMA LARGO GENERADO POR TRAMOS")
+print("=" * 70)
+
+# 50 años de periodos diarios: cada tramo sale de la forma cerrada, sin armar la tabla completa
+num_periodos = 50 * 365
+tramos = (
+    etiquetar_tabla(generar_ventana_crecimiento(1000, 5, 0.08, 365, 50, inicio, inicio + 5000), "USD")
+    for inicio in range(0, num_periodos, 5000)
+)
+with tempfile.TemporaryFile() as archivo:
+    filas = escribir_csv_por_bloques(tramos, archivo)
+    archivo.seek(0)
+    leida = pd.read_csv(archivo)
+completa = etiquetar_tabla(generar_tabla_crecimiento(1000, 5, 0.08, 365, 50), "USD")
+diferencia = float(np.abs(leida.to_numpy(float) - completa.to_numpy(float)).max())
+estado = "✅" if filas == num_periodos and diferencia < 0.011 else "⚠️ "
+print(f"  {estado} {filas:,} filas escritas por tramos | diferencia con la tabla completa: {diferencia:.4f}")
+
+print("\n" + "=" * 70)
+print("FORMATOS COLUMNARES")
+print("=" * 70)
+
+if not hay_soporte_columnar():
+    print("  ⚠️  pyarrow no está instalado: solo se ofrece CSV")
+else:
+    for formato in ("Parquet", "Arrow"):
+        contenido = exportar_tabla(tabla, formato)
+        leida = leer_tabla_exportada(contenido, formato)
+        igual = leida.equals(tabla) and list(leida.dtypes) == list(tabla.dtypes)
+        estado = "✅" if igual else "⚠️ "
+        print(f"  {estado} {formato}: {len(contenido):,} bytes, ida y vuelta sin pérdida: {igual}")
+    print(f"  CSV: {len(exportar_tabla(tabla, 'CSV')):,} bytes")
+
+try:
+    exportar_tabla(tabla, "XLSX")
+    print("  ⚠️  Formato desconocido aceptado")
+except ValueError as error:
+    print(f"  ✅ Formato desconocido rechazado: {error}")
+
+print("\n✅ Prueba completada!")
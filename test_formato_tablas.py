@@ -0,0 +1,84 @@
+"""Script de prueba para el formateo vectorizado de tablas"""
+import numpy as np
+import pandas as pd
+from src.utils.helpers import formatear_numeros
+from src.utils.tables import generar_tabla_crecimiento, formatear_tabla_crecimiento, declarar_formatos, etiquetar_tabla
+from src.visualization.bond_charts import crear_tabla_flujos
+from src.calculations.bond_calcs import calcular_valor_presente_bono
+
+print("=" * 70)
+print("FORMATEO VECTORIZADO vs f-string")
+print("=" * 70)
+
+generador = np.random.default_rng(0)
+valores = np.concatenate([
+    generador.normal(0, 1e6, 100000),
+    generador.uniform(-1, 1, 100000),
+    [0.0, 999.995, 1000.0, 1e12, -1234567.891]
+])
+vectorizado = formatear_numeros(valores, 2)
+# Python escribe "-0.00" para negativos que redondean a cero; el formateo vectorizado no
+esperado = np.array([f"{x:,.2f}".replace("-0.00", "0.00") for x in valores])
+diferencias = int(np.sum(vectorizado != esperado))
+estado = "✅" if diferencias == 0 else "⚠️ "
+print(f"  {estado} {len(valores):,} valores, {diferencias} diferencias con f\"{{x:,.2f}}\"")
+
+sin_miles = formatear_numeros(valores[:1000], 4, separador_miles=False)
+estado = "✅" if np.array_equal(sin_miles, [f"{x:.4f}" for x in valores[:1000]]) else "⚠️ "
+print(f"  {estado} Sin separador de miles y 4 decimales")
+
+extras = formatear_numeros([1234.5, -0.25, np.nan], 1, prefijo="$", sufijo="%", con_signo=True)
+print(f"  Prefijo, sufijo y signo: {extras.tolist()}")
+
+print("\n" + "=" * 70)
+print("CASOS BORDE DEL REDONDEO")
+print("=" * 70)
+
+casos = {
+    "Mitades que el float guarda por debajo (2.675, 1.005, 1.115)": ([2.675, 1.005, 1.115], 2),
+    "Mitades exactas al par (0.125, 0.375)": ([0.125, 0.375], 2),
+    "Sin decimales (0.5, 1.5, 2.5, -2.5)": ([0.5, 1.5, 2.5, -2.5], 0),
+    "Magnitudes fuera de int64 (1e17, -1e19, 1e22)": ([1e17, -1e19, 1e22], 2),
+    "Mitades de centavo en serie (k + 0.005)": (np.arange(0, 10000) / 100 + 0.005, 2)
+}
+for nombre, (numeros, decimales) in casos.items():
+    vectorizado = formatear_numeros(numeros, decimales)
+    esperado = [f"{x:,.{decimales}f}" for x in numeros]
+    estado = "✅" if vectorizado.tolist() == esperado else "⚠️ "
+    print(f"  {estado} {nombre}: {vectorizado[:4].tolist()}")
+
+# Python escribe "-0" para -0.5 sin decimales; aquí los negativos que redondean a cero van sin signo
+ceros = formatear_numeros([-0.5, -0.4, -1e-300], 0)
+estado = "✅" if ceros.tolist() == ["0", "0", "0"] else "⚠️ "
+print(f"  {estado} Negativos que redondean a cero: {ceros.tolist()}")
+
+grandes = formatear_numeros([1e20, -3.5, 0.0, np.nan], 0, separador_miles=False, con_signo=True)
+estado = "✅" if grandes.tolist() == ["+100000000000000000000", "-4", "+0", ""] else "⚠️ "
+print(f"  {estado} Sin separador y con signo: {grandes.tolist()}")
+
+print("\n" + "=" * 70)
+print("TABLA DE CRECIMIENTO")
+print("=" * 70)
+
+tabla = generar_tabla_crecimiento(10000, 500, 0.08, 12, 30, False)
+formateada = formatear_tabla_crecimiento(tabla, "USD")
+anterior = etiquetar_tabla(tabla, "USD")
+for col in anterior.columns:
+    if col != 'Periodo':
+        anterior[col] = anterior[col].apply(lambda x: f"{x:,.2f}")
+estado = "✅" if formateada.astype(str).equals(anterior.astype(str)) else "⚠️ "
+print(f"  {estado} Igual al formateo celda por celda ({len(tabla)} filas)")
+print(f"  Formatos declarados: {declarar_formatos(etiquetar_tabla(tabla, 'USD'))}")
+
+print("\n" + "=" * 70)
+print("TABLA DE FLUJOS DEL BONO (NUMÉRICA)")
+print("=" * 70)
+
+resultado = calcular_valor_presente_bono(1000, 0.05, 2, 10, 0.06)
+df_flujos = crear_tabla_flujos(resultado['flujos'], "USD")
+montos = [col for col in df_flujos.columns if "(USD)" in col]
+numericas = [col for col in montos if pd.api.types.is_numeric_dtype(df_flujos[col])]
+estado = "✅" if len(numericas) == len(montos) else "⚠️ "
+print(f"  {estado} Columnas de montos numéricas: {len(numericas)} de {len(montos)}")
+
+print("\n✅ Prueba completada!")
@@ -0,0 +1,94 @@
+"""Script de prueba para valores reales (ajustados por inflación)"""
+from src.calculations.financial_calcs import calcular_vf_combinado, deflactar
+from src.utils.tables import (
+    generar_tabla_crecimiento,
+    generar_resumen_tabla,
+    generar_cronograma_retiros,
+    generar_resumen_cronograma_retiros
+)
+from src.calculations.tax_calcs import calcular_tasa_mensual_retiro
+from src.ui.comparacion import calcular_escenarios
+
+# Parámetros de prueba
+vp = 10000
+aporte = 500
+tea = 0.08
+frecuencia_anual = 12
+plazo_años = 25
+inflacion = 0.03
+
+print("=" * 70)
+print("VALOR FUTURO REAL")
+print("=" * 70)
+
+vf = calcular_vf_combinado(vp, aporte, tea, frecuencia_anual, plazo_años)
+vf_real = deflactar(vf, inflacion, plazo_años)
+tabla = generar_tabla_crecimiento(vp, aporte, tea, frecuencia_anual, plazo_años, inflacion=inflacion)
+resumen = generar_resumen_tabla(tabla)
+
+print(f"\nVF nominal: ${vf:,.2f}")
+print(f"VF real (fórmula): ${vf_real:,.2f}")
+print(f"VF real (tabla):   ${resumen['saldo_final_real']:,.2f}")
+print(f"Aportes en valores de hoy: ${resumen['total_aportes_real']:,.2f} de ${resumen['total_aportes']:,.2f} nominales")
+if abs(vf_real - resumen['saldo_final_real']) < 0.01:
+    print("  ✅ La columna real coincide con la fórmula")
+else:
+    print("  ⚠️  La columna real no coincide con la fórmula")
+
+tabla_nominal = generar_tabla_crecimiento(vp, aporte, tea, frecuencia_anual, plazo_años)
+if tabla_nominal.equals(tabla[tabla_nominal.columns]):
+    print("  ✅ Las columnas nominales no cambian al agregar inflación")
+else:
+    print("  ⚠️  Las columnas nominales cambiaron")
+
+print("\n" + "=" * 70)
+print("CRONOGRAMA DE RETIROS REAL")
+print("=" * 70)
+
+meses = 240
+cronograma = generar_cronograma_retiros(vf, tea / 2 / 12, meses, inflacion=inflacion, desfase_años=plazo_años)
+resumen_cronograma = generar_resumen_cronograma_retiros(cronograma)
+retiro_neto_final = cronograma.iloc[-1]['retiro_neto']
+esperado_final = deflactar(retiro_neto_final, inflacion, plazo_años + meses / 12)
+
+print(f"\nPrimer retiro neto real: ${resumen_cronograma['retiro_real_inicial']:,.2f}")
+print(f"Último retiro neto real: ${resumen_cronograma['retiro_real_final']:,.2f} (esperado ${esperado_final:,.2f})")
+print(f"Total neto real: ${resumen_cronograma['total_retiro_neto_real']:,.2f} de ${resumen_cronograma['total_retiro_neto']:,.2f} nominales")
+if abs(resumen_cronograma['retiro_real_final'] - esperado_final) < 0.01:
+    print("  ✅ El deflactor del cronograma parte al final del plazo de acumulación")
+else:
+    print("  ⚠️  El deflactor del cronograma no coincide")
+
+print("\n" + "=" * 70)
+print("COMPARACIÓN DE ESCENARIOS EN VALORES REALES")
+print("=" * 70)
+
+plazos = [20, 25, 30]
+resultado = calcular_escenarios(vp, aporte, tea, frecuencia_anual, plazos, "Nacional", 35, meses, inflacion=inflacion)
+for escenario, plazo in zip(resultado['escenarios'], plazos):
+    tabla = generar_tabla_crecimiento(vp, aporte, tea, frecuencia_anual, plazo, inflacion=inflacion)
+    resumen_plazo = generar_resumen_tabla(tabla)
+    cronograma_plazo = generar_cronograma_retiros(escenario['vf'], calcular_tasa_mensual_retiro(tea), meses, inflacion, plazo)
+    resumen_retiros = generar_resumen_cronograma_retiros(cronograma_plazo)
+    correcto = (
+        abs(escenario['vf_real'] - resumen_plazo['saldo_final_real']) < 0.01
+        and abs(escenario['inversion_total_real'] - vp - resumen_plazo['total_aportes_real']) < 1
+        and abs(escenario['retiro_mensual_neto_real'] - resumen_retiros['retiro_real_inicial']) < 0.01
+        and abs(escenario['total_retiro_mensual_real'] - resumen_retiros['total_retiro_neto_real']) < 1
+    )
+    estado = "✅" if correcto else "⚠️ "
+    print(f"  {estado} {plazo} años: VF real ${escenario['vf_real']:,.2f} | inversión real ${escenario['inversion_total_real']:,.2f} | "
+          f"total retirado real ${escenario['total_retiro_mensual_real']:,.2f}")
+
+sin_inflacion = calcular_escenarios(vp, aporte, tea, frecuencia_anual, plazos, "Nacional", 35, meses)['escenarios'][0]
+estado = "✅" if 'vf_real' not in sin_inflacion else "⚠️ "
+print(f"  {estado} Sin inflación no se agregan montos reales")
+
+# La rentabilidad real compara el VF real con los aportes deflactados, no con la inversión nominal
+escenario = resultado['escenarios'][1]
+rentabilidad_real = escenario['vf_real'] / escenario['inversion_total_real'] - 1
+estado = "✅" if escenario['inversion_total_real'] < escenario['inversion_total'] and rentabilidad_real > escenario['vf_real'] / escenario['inversion_total'] - 1 else "⚠️ "
+print(f"  {estado} Rentabilidad real sobre aportes deflactados: {rentabilidad_real:.2%} "
+      f"(sobre la inversión nominal sería {escenario['vf_real'] / escenario['inversion_total'] - 1:.2%})")
+
+print("\n✅ Prueba completada!")
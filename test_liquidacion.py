@@ -0,0 +1,110 @@
+"""Script de prueba para precio limpio/sucio y cupón corrido con fechas de liquidación"""
+import numpy as np
+from src.calculations.bond_calcs import calcular_valor_presente_bono, generar_flujos_bono, calcular_tasa_cupon_periodo
+from src.calculations.bond_dates import (
+    sumar_meses,
+    generar_fechas_cupon,
+    fraccion_año,
+    generar_calendario_fechas,
+    calcular_precio_sucio,
+    valorar_bono_en_fecha
+)
+
+valor_nominal = 1000
+tasa_cupon = 0.05
+frecuencia_anual = 2
+plazo_años = 10
+tea = 0.06
+emision = '2024-01-15'
+
+print("=" * 70)
+print("PRUEBA DE FECHAS DE CUPÓN")
+print("=" * 70)
+
+fechas = generar_fechas_cupon('2024-01-31', 4, 4)
+esperadas = np.array(['2024-04-30', '2024-07-31', '2024-10-31', '2025-01-31'], dtype='datetime64[D]')
+estado = "✅" if np.array_equal(fechas, esperadas) else "⚠️ "
+print(f"  {estado} Fin de mes trimestral: {fechas}")
+
+bisiesto = sumar_meses('2023-08-31', [6, 18])
+estado = "✅" if bisiesto.tolist() == [np.datetime64('2024-02-29').item(), np.datetime64('2025-02-28').item()] else "⚠️ "
+print(f"  {estado} Febrero ajustado: {bisiesto}")
+
+print("\n" + "=" * 70)
+print("CONTEO DE DÍAS")
+print("=" * 70)
+
+casos = [
+    ('2024-01-31', '2024-03-31', "30/360", 60 / 360),
+    ('2024-02-28', '2024-03-31', "30/360", 33 / 360),
+    ('2025-02-28', '2025-08-30', "30/360", 180 / 360),
+    ('2024-02-29', '2025-02-28', "30/360", 360 / 360),
+    ('2025-01-31', '2025-02-28', "30/360", 28 / 360),
+    ('2024-01-15', '2024-07-15', "act/365", 182 / 365)
+]
+for inicio, fin, convencion, esperado in casos:
+    fraccion = float(fraccion_año(np.datetime64(inicio), np.datetime64(fin), convencion))
+    estado = "✅" if abs(fraccion - esperado) < 1e-12 else "⚠️ "
+    print(f"  {estado} {convencion}: {inicio} → {fin} = {fraccion:.6f}")
+
+print("\n" + "=" * 70)
+print("LIQUIDACIÓN EN LA EMISIÓN = VALOR PRESENTE POR PERIODOS")
+print("=" * 70)
+
+vp = calcular_valor_presente_bono(valor_nominal, tasa_cupon, frecuencia_anual, plazo_años, tea)['valor_presente_total']
+for convencion in ("act/act", "30/360"):
+    resultado = valorar_bono_en_fecha(valor_nominal, tasa_cupon, frecuencia_anual, plazo_años, tea, emision, emision, convencion)
+    estado = "✅" if abs(resultado['precio_sucio'] - vp) < 1e-8 and resultado['cupon_corrido'] == 0 else "⚠️ "
+    print(f"  {estado} {convencion}: precio sucio ${resultado['precio_sucio']:,.6f} | VP ${vp:,.6f}")
+
+print("\n" + "=" * 70)
+print("ENTRE FECHAS DE CUPÓN: LIMPIO + CORRIDO = SUCIO")
+print("=" * 70)
+
+for convencion in ("act/act", "30/360", "act/365"):
+    resultado = valorar_bono_en_fecha(valor_nominal, tasa_cupon, frecuencia_anual, plazo_años, tea, emision, '2024-04-20', convencion)
+    cuadra = abs(resultado['precio_limpio'] + resultado['cupon_corrido'] - resultado['precio_sucio']) < 1e-9
+    estado = "✅" if cuadra and resultado['dias_devengados'] == 96 and resultado['pagos_pendientes'] == 20 else "⚠️ "
+    print(f"  {estado} {convencion}: sucio ${resultado['precio_sucio']:,.2f} = limpio ${resultado['precio_limpio']:,.2f} + corrido ${resultado['cupon_corrido']:,.2f}")
+
+# ACT/ACT: el precio sucio crece a la tasa de descuento entre cupones (sin pagos intermedios)
+antes = valorar_bono_en_fecha(valor_nominal, tasa_cupon, frecuencia_anual, plazo_años, tea, emision, emision)
+despues = valorar_bono_en_fecha(valor_nominal, tasa_cupon, frecuencia_anual, plazo_años, tea, emision, '2024-04-20')
+fraccion = despues['calendario_fechas']['fraccion_devengada']
+esperado = antes['precio_sucio'] * (1 + tea) ** (fraccion / frecuencia_anual)
+estado = "✅" if abs(despues['precio_sucio'] - esperado) < 1e-8 else "⚠️ "
+print(f"  {estado} ACT/ACT: el precio sucio capitaliza a la TEA ({fraccion:.4f} del periodo)")
+
+# En la fecha de un cupón ese cupón ya no se cobra y el corrido vuelve a cero
+en_cupon = valorar_bono_en_fecha(valor_nominal, tasa_cupon, frecuencia_anual, plazo_años, tea, emision, '2024-07-15')
+estado = "✅" if en_cupon['cupon_corrido'] == 0 and en_cupon['pagos_pendientes'] == 19 else "⚠️ "
+print(f"  {estado} En fecha de cupón: corrido ${en_cupon['cupon_corrido']:,.2f}, {en_cupon['pagos_pendientes']} pagos pendientes")
+
+# Calendario de fin de mes: el cupón anterior cae el último día de febrero
+fin_de_mes = valorar_bono_en_fecha(valor_nominal, tasa_cupon, frecuencia_anual, plazo_años, tea, '2024-08-31', '2025-08-30', "30/360")
+cupon = valor_nominal * calcular_tasa_cupon_periodo(tasa_cupon, frecuencia_anual)
+correcto = fin_de_mes['cupon_corrido'] <= cupon + 1e-9 and fin_de_mes['calendario_fechas']['plazos'].min() >= 0
+correcto = correcto and fin_de_mes['calendario_fechas']['fraccion_devengada'] <= 1
+estado = "✅" if correcto else "⚠️ "
+print(f"  {estado} 30/360 desde el 28 de febrero: corrido ${fin_de_mes['cupon_corrido']:,.2f} de un cupón de ${cupon:,.2f} "
+      f"({fin_de_mes['calendario_fechas']['fraccion_devengada']:.4f} del periodo)")
+
+print("\n" + "=" * 70)
+print("PLAZOS PRECALCULADOS REUTILIZADOS EN REVALORACIONES")
+print("=" * 70)
+
+calendario = generar_flujos_bono("bullet", valor_nominal, calcular_tasa_cupon_periodo(tasa_cupon, frecuencia_anual), 20)
+calendario_fechas = generar_calendario_fechas(calendario, emision, frecuencia_anual, '2024-04-20', "30/360")
+teas = np.linspace(0.01, 0.15, 1000)
+precios = calcular_precio_sucio(calendario_fechas, teas)
+uno_a_uno = [calcular_precio_sucio(calendario_fechas, t) for t in teas[::100]]
+estado = "✅" if np.allclose(precios[::100], uno_a_uno) else "⚠️ "
+print(f"  {estado} {len(teas)} tasas valoradas en una llamada con el mismo calendario")
+
+try:
+    valorar_bono_en_fecha(valor_nominal, tasa_cupon, frecuencia_anual, plazo_años, tea, emision, '2035-01-01')
+    print("  ⚠️  No detectó la liquidación posterior al vencimiento")
+except ValueError as error:
+    print(f"  ✅ Liquidación fuera de rango: {error}")
+
+print("\n✅ Prueba completada!")
@@ -0,0 +1,96 @@
+"""Script de prueba para los PDFs en segundo plano (progreso, cancelación y límite por sesión)"""
+import io
+import threading
+import time
+from config.constants import PDF_MAX_TRABAJOS_SESION
+from src.utils.pdf_worker import iniciar_trabajo_pdf, cancelar_trabajo_pdf, estado_trabajo_pdf
+
+
+def crear_pdf_prueba(progreso=None, paginas: int = 5, pausa: float = 0.02, continuar=None) -> io.BytesIO:
+    for pagina in range(paginas):
+        if continuar is not None:
+            continuar.wait(5)
+        time.sleep(pausa)
+        progreso((pagina + 1) / paginas)
+    return io.BytesIO(b"%PDF-prueba")
+
+
+def crear_pdf_con_error(progreso=None) -> io.BytesIO:
+    progreso(0.5)
+    raise RuntimeError("fuente no encontrada")
+
+
+def esperar(trabajo: dict, limite: float = 5.0) -> tuple:
+    """Consulta el estado hasta que el trabajo termina; devuelve (estado final, progresos vistos)."""
+    progresos = []
+    fin = time.perf_counter() + limite
+    estado = estado_trabajo_pdf(trabajo)
+    while not estado['listo'] and time.perf_counter() < fin:
+        progresos.append(estado['progreso'])
+        time.sleep(0.005)
+        estado = estado_trabajo_pdf(trabajo)
+    return estado, progresos
+
+
+print("=" * 70)
+print("PROGRESO Y RESULTADO")
+print("=" * 70)
+
+trabajo = iniciar_trabajo_pdf("a", crear_pdf_prueba, sesion="s1", paginas=10)
+estado, progresos = esperar(trabajo)
+monotono = all(b >= a for a, b in zip(progresos, progresos[1:]))
+estado_ok = "✅" if estado['pdf'] == b"%PDF-prueba" and estado['error'] is None and estado['progreso'] == 1.0 else "⚠️ "
+print(f"  {estado_ok} PDF generado: {estado['pdf']!r}")
+estado_ok = "✅" if monotono and len(set(progresos)) > 2 else "⚠️ "
+print(f"  {estado_ok} Progreso creciente con {len(set(progresos))} valores distintos")
+
+estado, _ = esperar(iniciar_trabajo_pdf("b", crear_pdf_con_error, sesion="s1"))
+estado_ok = "✅" if estado['listo'] and estado['pdf'] is None and "fuente" in estado['error'] else "⚠️ "
+print(f"  {estado_ok} Error de la función generadora: {estado['error']}")
+
+print("\n" + "=" * 70)
+print("CANCELACIÓN")
+print("=" * 70)
+
+continuar = threading.Event()
+trabajo = iniciar_trabajo_pdf("c", crear_pdf_prueba, sesion="s2", paginas=5, continuar=continuar)
+cancelar_trabajo_pdf(trabajo)
+continuar.set()
+estado, _ = esperar(trabajo)
+estado_ok = "✅" if estado['error'] == "Generación cancelada" and estado['pdf'] is None else "⚠️ "
+print(f"  {estado_ok} Cancelado en curso: {estado['error']} con progreso {estado['progreso']:.0%}")
+
+cancelar_trabajo_pdf(None)
+print("  ✅ Cancelar sin trabajo no falla")
+
+print("\n" + "=" * 70)
+print(f"LÍMITE POR SESIÓN ({PDF_MAX_TRABAJOS_SESION} trabajo a la vez)")
+print("=" * 70)
+
+continuar = threading.Event()
+primero = iniciar_trabajo_pdf("d", crear_pdf_prueba, sesion="s3", paginas=2, continuar=continuar)
+segundo = iniciar_trabajo_pdf("e", crear_pdf_prueba, sesion="s3", paginas=2)
+tercero = iniciar_trabajo_pdf("f", crear_pdf_prueba, sesion="s3", paginas=2)
+otra_sesion = iniciar_trabajo_pdf("g", crear_pdf_prueba, sesion="s4", paginas=2)
+
+estado_ok = "✅" if estado_trabajo_pdf(segundo)['en_espera'] and segundo['futuro'] is None else "⚠️ "
+print(f"  {estado_ok} El segundo PDF de la sesión espera sin ocupar un hilo")
+estado, _ = esperar(otra_sesion)
+estado_ok = "✅" if estado['pdf'] is not None and not primero['futuro'].done() else "⚠️ "
+print(f"  {estado_ok} Otra sesión no espera a la primera")
+
+cancelar_trabajo_pdf(tercero)
+continuar.set()
+estados = [esperar(trabajo)[0] for trabajo in (primero, segundo, tercero)]
+estado_ok = "✅" if estados[0]['pdf'] is not None and estados[1]['pdf'] is not None else "⚠️ "
+print(f"  {estado_ok} Al terminar el primero se lanza el que esperaba")
+estado_ok = "✅" if estados[2]['error'] == "Generación cancelada" and tercero['futuro'] is None else "⚠️ "
+print(f"  {estado_ok} Un PDF cancelado mientras esperaba nunca se lanza")
+
+sin_limite = [iniciar_trabajo_pdf(str(i), crear_pdf_prueba, paginas=2) for i in range(3)]
+estado_ok = "✅" if all(trabajo['futuro'] is not None for trabajo in sin_limite) else "⚠️ "
+print(f"  {estado_ok} Sin sesión (fuera de Streamlit) no hay límite")
+for trabajo in sin_limite:
+    esperar(trabajo)
+
+print("\n✅ Prueba completada!")
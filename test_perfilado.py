@@ -0,0 +1,127 @@
+"""Script de prueba para el perfilado por etapas (sesiones simultáneas y PDF en segundo plano)"""
+import io
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from src.utils.profiling import (
+    iniciar_ejecucion,
+    finalizar_ejecucion,
+    medir_etapa,
+    ejecucion_activa,
+    perfilar
+)
+from src.utils.pdf_worker import iniciar_trabajo_pdf, estado_trabajo_pdf
+from config.constants import ARCHIVO_PERFIL
+
+# El hilo del PDF exporta a ARCHIVO_PERFIL (ruta relativa): se trabaja en un directorio temporal
+os.chdir(tempfile.mkdtemp())
+archivo = ARCHIVO_PERFIL
+modulo = __name__.rsplit('.', 1)[-1]
+
+
+@perfilar
+def reservar(kb: int) -> bytes:
+    return bytes(kb * 1024)
+
+
+@perfilar
+def crear_pdf_prueba(progreso=None, paginas: int = 3) -> io.BytesIO:
+    for pagina in range(paginas):
+        reservar(64)
+        progreso((pagina + 1) / paginas)
+    return io.BytesIO(b"%PDF-prueba")
+
+
+print("=" * 70)
+print("UN RERUN PERFILADO")
+print("=" * 70)
+
+iniciar_ejecucion(True, "prueba")
+with medir_etapa("externa"):
+    retenido = reservar(256)
+    reservar(512)
+resumen = finalizar_ejecucion(archivo)
+
+etapas = {e['etapa']: e for e in resumen['etapas']}
+estado = "✅" if etapas[f'{modulo}.reservar']['llamadas'] == 2 and 'externa' in etapas else "⚠️ "
+print(f"  {estado} Etapas: {sorted(etapas)}")
+estado = "✅" if etapas['externa']['memoria_retenida_kb'] >= 256 else "⚠️ "
+print(f"  {estado} Memoria retenida por la etapa externa: {etapas['externa']['memoria_retenida_kb']:,.1f} KB")
+estado = "✅" if resumen['memoria_pico_kb'] >= 768 else "⚠️ "
+print(f"  {estado} Pico del rerun: {resumen['memoria_pico_kb']:,.1f} KB")
+estado = "✅" if not tracemalloc.is_tracing() else "⚠️ "
+print(f"  {estado} tracemalloc apagado al terminar")
+
+estado = "✅" if finalizar_ejecucion(archivo) is None and ejecucion_activa() is None else "⚠️ "
+print(f"  {estado} Sin rerun activo no se registra nada")
+
+print("\n" + "=" * 70)
+print("DOS SESIONES SIMULTÁNEAS")
+print("=" * 70)
+
+# La sesión corta termina mientras la larga sigue dentro de una etapa
+dentro = threading.Event()
+corta_terminada = threading.Event()
+observado = {}
+
+
+def sesion_larga():
+    iniciar_ejecucion(True, "larga")
+    with medir_etapa("etapa_larga"):
+        dentro.set()
+        corta_terminada.wait(5)
+        observado['trazando'] = tracemalloc.is_tracing()
+        reservar(128)
+    observado['larga'] = finalizar_ejecucion(archivo)
+
+
+def sesion_corta():
+    dentro.wait(5)
+    iniciar_ejecucion(True, "corta")
+    reservar(16)
+    observado['corta'] = finalizar_ejecucion(archivo)
+    corta_terminada.set()
+
+
+hilos = [threading.Thread(target=sesion_larga), threading.Thread(target=sesion_corta)]
+for hilo in hilos:
+    hilo.start()
+for hilo in hilos:
+    hilo.join()
+
+estado = "✅" if observado['trazando'] else "⚠️ "
+print(f"  {estado} tracemalloc sigue activo para la sesión larga tras cerrar la corta: {observado['trazando']}")
+etapas = {e['etapa'] for e in observado['larga']['etapas']}
+estado = "✅" if {'etapa_larga', f'{modulo}.reservar'} <= etapas else "⚠️ "
+print(f"  {estado} Etapas de la sesión larga: {sorted(etapas)}")
+estado = "✅" if not tracemalloc.is_tracing() else "⚠️ "
+print(f"  {estado} tracemalloc apagado cuando terminan ambas")
+
+print("\n" + "=" * 70)
+print("PDF EN SEGUNDO PLANO")
+print("=" * 70)
+
+for activo in (True, False):
+    iniciar_ejecucion(activo, "acciones")
+    trabajo = iniciar_trabajo_pdf("clave", crear_pdf_prueba, paginas=4)
+    finalizar_ejecucion(archivo)
+
+    while not estado_trabajo_pdf(trabajo)['listo']:
+        time.sleep(0.01)
+    perfil = trabajo['perfil']
+
+    if activo:
+        etapas = {e['etapa']: e['llamadas'] for e in perfil['etapas']}
+        correcto = perfil['pagina'] == "acciones (PDF)" and etapas.get(f'{modulo}.crear_pdf_prueba') == 1 and etapas.get(f'{modulo}.reservar') == 4
+        estado = "✅" if correcto else "⚠️ "
+        print(f"  {estado} Rerun perfilado: el hilo del PDF registra {etapas}")
+    else:
+        estado = "✅" if perfil is None else "⚠️ "
+        print(f"  {estado} Rerun sin perfilar: el PDF no registra nada")
+
+with open(archivo, encoding='utf-8') as f:
+    lineas = f.readlines()
+estado = "✅" if len(lineas) == 5 else "⚠️ "
+print(f"  {estado} Líneas exportadas al JSONL: {len(lineas)}")
@@ -0,0 +1,77 @@
+"""Script de prueba para la reducción de puntos de los gráficos (LTTB, min/max y WebGL)"""
+import time
+import json
+import numpy as np
+import plotly.graph_objects as go
+from src.visualization.reduccion import (
+    calcular_indices_lttb,
+    calcular_indices_min_max,
+    reducir_puntos,
+    clase_traza
+)
+from src.visualization.charts import generar_evolucion_inversion, crear_grafico_comparativo
+
+print("=" * 70)
+print("LTTB Y MIN/MAX SOBRE UNA SERIE CON PICOS")
+print("=" * 70)
+
+n = 200000
+x = np.arange(n, dtype=float)
+y = np.sin(x / 5000) + np.random.default_rng(1).normal(0, 0.01, n)
+y[123457] = 5.0
+y[98765] = -5.0
+
+for nombre, indices in (
+    ("LTTB", calcular_indices_lttb(x, y, 1000)),
+    ("Min/Max", calcular_indices_min_max(y, 1000))
+):
+    ordenados = np.all(np.diff(indices) > 0)
+    extremos = indices[0] == 0 and indices[-1] == n - 1
+    picos = 123457 in indices and 98765 in indices
+    estado = "✅" if len(indices) <= 1000 and ordenados and extremos and picos else "⚠️ "
+    print(f"  {estado} {nombre}: {len(indices)} puntos, ordenados: {ordenados}, extremos: {extremos}, picos conservados: {picos}")
+
+estado = "✅" if np.array_equal(calcular_indices_lttb(x[:500], y[:500], 1000), np.arange(500)) else "⚠️ "
+print(f"  {estado} Serie más corta que el presupuesto: sin cambios")
+
+print("\n" + "=" * 70)
+print("EVOLUCIÓN DIARIA A 50 AÑOS")
+print("=" * 70)
+
+df = generar_evolucion_inversion(10000, 10, 0.08, 365, 50, inflacion=0.03)
+columnas = ['inversion_acumulada', 'valor_con_interes', 'valor_real']
+
+for metodo in ("lttb", "min_max"):
+    reducido = reducir_puntos(df, columnas, 'periodo', 2000, metodo)
+    max_error = 0.0
+    for columna in columnas:
+        interpolado = np.interp(df['periodo'], reducido['periodo'], reducido[columna])
+        max_error = max(max_error, np.max(np.abs(interpolado - df[columna]) / df[columna].max()))
+    estado = "✅" if len(reducido) <= 2000 and max_error < 0.005 else "⚠️ "
+    print(f"  {estado} {metodo}: {len(df):,} → {len(reducido):,} filas, error máximo {max_error:.4%} del rango")
+
+inicio = time.perf_counter()
+fig_completa = crear_grafico_comparativo(df, "USD", max_puntos=None)
+fig_reducida = crear_grafico_comparativo(df, "USD")
+duracion = (time.perf_counter() - inicio) * 1000
+
+tamaño_completo = len(json.dumps(fig_completa.to_plotly_json(), default=str))
+tamaño_reducido = len(json.dumps(fig_reducida.to_plotly_json(), default=str))
+print(f"  Payload completo: {tamaño_completo / 1e6:.1f} MB | reducido: {tamaño_reducido / 1e3:.0f} KB ({duracion:.0f} ms)")
+
+tipos = {type(traza).__name__ for traza in fig_completa.data}
+estado = "✅" if tipos == {"Scattergl"} else "⚠️ "
+print(f"  {estado} Figura sin reducir usa WebGL: {tipos}")
+
+tipos = {type(traza).__name__ for traza in fig_reducida.data}
+estado = "✅" if tipos == {"Scatter"} and len(fig_reducida.data[0].x) <= 2000 else "⚠️ "
+print(f"  {estado} Figura reducida usa SVG: {tipos}, {len(fig_reducida.data[0].x)} puntos por traza")
+
+estado = "✅" if clase_traza(6000) is go.Scattergl and clase_traza(100) is go.Scatter else "⚠️ "
+print(f"  {estado} Umbral de WebGL")
+
+try:
+    reducir_puntos(df, columnas, 'periodo', 2000, "otro")
+    print("  ⚠️  Método desconocido no lanzó error")
+except ValueError:
+    print("  ✅ Método desconocido lanza ValueError")
@@ -0,0 +1,56 @@
+"""Script de prueba de la sensibilidad del precio de bonos a la tasa"""
+import time
+import numpy as np
+from src.calculations.bond_calcs import calcular_valor_presente_bono
+from src.calculations.bond_sensitivity import calcular_precios_bono, calcular_sensibilidad_bono
+
+# Parámetros de prueba
+valor_nominal = 1000
+tasa_cupon = 0.05
+frecuencia_anual = 12
+años = 50
+tea_descuento = 0.06
+
+print("=" * 70)
+print("PRUEBA DE SENSIBILIDAD: MATRIZ TASAS × PERIODOS vs VALORACIÓN UNA A UNA")
+print("=" * 70)
+
+for tipo in ("bullet", "cupon_cero", "amortizable"):
+    resultado = calcular_valor_presente_bono(valor_nominal, tasa_cupon, frecuencia_anual, años, tea_descuento, tipo)
+    sensibilidad = calcular_sensibilidad_bono(resultado['calendario'], tea_descuento, frecuencia_anual)
+    
+    print(f"\n{tipo}: precio base ${sensibilidad['precio_base']:,.2f}")
+    diferencia = 0.0
+    for choque in sensibilidad['choques']:
+        individual = calcular_valor_presente_bono(
+            valor_nominal, tasa_cupon, frecuencia_anual, años, choque['tea'], tipo
+        )['valor_presente_total']
+        diferencia = max(diferencia, abs(individual - choque['precio']))
+        print(f"  {choque['choque_pb']:+5d} pb: ${choque['precio']:>10,.2f} ({choque['cambio_pct']:+.2f}%)")
+    print(f"  {'✅' if diferencia < 1e-8 else '⚠️ '} Diferencia máxima con la valoración individual: {diferencia:.1e}")
+    
+    # Convexidad: la subida de precio ante -100 pb supera la caída ante +100 pb
+    cambios = {c['choque_pb']: c['cambio'] for c in sensibilidad['choques']}
+    if cambios[-100] > -cambios[100]:
+        print("  ✅ La curva es convexa")
+    else:
+        print("  ⚠️  La curva no es convexa")
+
+print("\n" + "=" * 70)
+print("ESCALA: 1,000 TASAS")
+print("=" * 70)
+
+resultado = calcular_valor_presente_bono(valor_nominal, tasa_cupon, frecuencia_anual, años, tea_descuento)
+teas = np.linspace(0.0, 0.20, 1000)
+
+inicio = time.perf_counter()
+precios = calcular_precios_bono(resultado['calendario'], teas, frecuencia_anual)
+duracion = time.perf_counter() - inicio
+
+print(f"\n1,000 tasas × {resultado['num_periodos']} periodos en {duracion * 1000:.1f} ms")
+if np.all(np.diff(precios) < 0):
+    print("✅ El precio baja en forma monótona con la tasa")
+else:
+    print("⚠️  El precio no es monótono")
+
+print("\n✅ Prueba completada!")
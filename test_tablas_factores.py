@@ -0,0 +1,80 @@
+"""Script de prueba de las tablas precalculadas de factores financieros"""
+import time
+import numpy as np
+from config.constants import FRECUENCIAS_BONOS
+from src.calculations.factor_tables import (
+    obtener_tabla,
+    factor_capitalizacion,
+    factor_descuento,
+    factor_anualidad,
+    factor_anualidad_vp,
+    _calcular_exacto
+)
+from src.calculations.financial_calcs import calcular_tasa_periodo
+from src.calculations.tax_calcs import calcular_tasa_mensual_retiro
+
+print("=" * 70)
+print("PRUEBA DE TABLAS DE FACTORES: TABLA vs FÓRMULA")
+print("=" * 70)
+
+inicio = time.perf_counter()
+tabla = obtener_tabla()
+print(f"\nTabla construida en {(time.perf_counter() - inicio) * 1000:.1f} ms: "
+      f"{len(tabla['tasas'])} tasas × {tabla['capitalizacion'].shape[1]} periodos")
+
+# Todas las tasas que produce la interfaz deben estar en la grilla
+teas = np.arange(101) * 0.5 / 100
+tasas_ui = [calcular_tasa_periodo(float(tea), f) for tea in teas for f in FRECUENCIAS_BONOS.values()]
+tasas_ui += [calcular_tasa_mensual_retiro(float(tea)) for tea in teas]
+cercania = np.min(np.abs(tabla['tasas'][None, :] - np.array(tasas_ui)[:, None]), axis=1)
+if cercania.max() <= 1e-13:
+    print(f"✅ Las {len(tasas_ui)} tasas de la interfaz están en la grilla")
+else:
+    print(f"⚠️  {np.sum(cercania > 1e-13)} tasas de la interfaz quedan fuera de la grilla")
+
+formulas = {
+    'capitalizacion': (factor_capitalizacion, lambda i, n: (1 + i) ** n),
+    'descuento': (factor_descuento, lambda i, n: (1 + i) ** -n),
+    'anualidad': (factor_anualidad, lambda i, n: n if i == 0 else ((1 + i) ** n - 1) / i),
+    'anualidad_vp': (factor_anualidad_vp, lambda i, n: n if i == 0 else (1 - (1 + i) ** -n) / i)
+}
+
+casos = [
+    (calcular_tasa_periodo(0.10, 12), 360),   # en la grilla
+    (calcular_tasa_mensual_retiro(0.08), 240),  # tasa de retiro en la grilla
+    (0.0, 12),                                  # tasa cero
+    (0.01234, 100),                             # tasa fuera de la grilla
+    (calcular_tasa_periodo(0.10, 12), 900),   # periodos fuera de la tabla
+    (calcular_tasa_periodo(0.75, 4), 12)      # TEA mayor al 50% (bonos)
+]
+
+for nombre, (funcion, formula) in formulas.items():
+    errores = [abs(funcion(i, n) / formula(i, n) - 1) for i, n in casos]
+    estado = "✅" if max(errores) < 1e-12 else "⚠️ "
+    print(f"  {estado} {nombre}: error relativo máximo {max(errores):.1e}")
+
+print("\n" + "=" * 70)
+print("CONSULTA EN LOTE")
+print("=" * 70)
+
+# Caso típico en lote: varias tasas (escenarios) por todos los periodos
+tasas = np.array([calcular_tasa_periodo(tea, 12) for tea in (0.05, 0.08, 0.10, 0.12, 0.15)])[:, None]
+periodos = np.arange(1, 601)[None, :]
+
+for nombre, (funcion, _) in formulas.items():
+    inicio = time.perf_counter()
+    for _ in range(100):
+        desde_tabla = funcion(tasas, periodos)
+    duracion_tabla = (time.perf_counter() - inicio) / 100
+    
+    inicio = time.perf_counter()
+    for _ in range(100):
+        exacto = _calcular_exacto(nombre, *np.broadcast_arrays(tasas, periodos.astype(float)))
+    duracion_exacta = (time.perf_counter() - inicio) / 100
+    
+    error = np.max(np.abs(desde_tabla / exacto - 1))
+    estado = "✅" if error < 1e-12 else "⚠️ "
+    print(f"  {estado} {nombre}: tabla {duracion_tabla * 1e6:.0f} µs | fórmula {duracion_exacta * 1e6:.0f} µs "
+          f"| error {error:.1e}")
+
+print("\n✅ Prueba completada!")
@@ -24,22 +24,22 @@ print("APORTE AL FINAL DEL PERIODO (Anualidad Vencida)")
 print("=" * 60)
 
 vf_vencida = calcular_vf_combinado(vp, aporte, tea, frecuencia_anual, plazo_años, False)
-tabla_vencida = generar_tabla_crecimiento(vp, aporte, tea, frecuencia_anual, plazo_años, "USD", False)
+tabla_vencida = generar_tabla_crecimiento(vp, aporte, tea, frecuencia_anual, plazo_años, False)
 
 print(f"\nValor Futuro (fórmula): ${vf_vencida:,.2f}")
-print(f"Saldo Final (tabla): ${tabla_vencida.iloc[-1]['Saldo Final (USD)']:,.2f}")
-print(f"Diferencia: ${abs(vf_vencida - tabla_vencida.iloc[-1]['Saldo Final (USD)']):,.2f}")
+print(f"Saldo Final (tabla): ${tabla_vencida.iloc[-1]['saldo_final']:,.2f}")
+print(f"Diferencia: ${abs(vf_vencida - tabla_vencida.iloc[-1]['saldo_final']):,.2f}")
 
 print("\n" + "=" * 60)
 print("APORTE AL INICIO DEL PERIODO (Anualidad Anticipada)")
 print("=" * 60)
 
 vf_anticipada = calcular_vf_combinado(vp, aporte, tea, frecuencia_anual, plazo_años, True)
-tabla_anticipada = generar_tabla_crecimiento(vp, aporte, tea, frecuencia_anual, plazo_años, "USD", True)
+tabla_anticipada = generar_tabla_crecimiento(vp, aporte, tea, frecuencia_anual, plazo_años, True)
 
 print(f"\nValor Futuro (fórmula): ${vf_anticipada:,.2f}")
-print(f"Saldo Final (tabla): ${tabla_anticipada.iloc[-1]['Saldo Final (USD)']:,.2f}")
-print(f"Diferencia: ${abs(vf_anticipada - tabla_anticipada.iloc[-1]['Saldo Final (USD)']):,.2f}")
+print(f"Saldo Final (tabla): ${tabla_anticipada.iloc[-1]['saldo_final']:,.2f}")
+print(f"Diferencia: ${abs(vf_anticipada - tabla_anticipada.iloc[-1]['saldo_final']):,.2f}")
 
 print("\n" + "=" * 60)
 print("COMPARACIÓN")
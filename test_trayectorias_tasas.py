@@ -0,0 +1,77 @@
+"""Script de prueba para trayectorias de TEA variables (pruebas de estrés)"""
+import time
+import numpy as np
+from src.calculations.financial_calcs import calcular_vf_combinado, generar_trayectorias_estres
+from src.utils.tables import generar_tabla_crecimiento, generar_cronograma_retiros
+
+# Parámetros de prueba
+vp = 5000
+aporte = 300
+tea = 0.09
+frecuencia_anual = 12
+plazo_años = 30
+
+print("=" * 70)
+print("TRAYECTORIA CONSTANTE vs TEA FIJA")
+print("=" * 70)
+
+vf_fijo = calcular_vf_combinado(vp, aporte, tea, frecuencia_anual, plazo_años)
+vf_anual = calcular_vf_combinado(vp, aporte, np.full(plazo_años, tea), frecuencia_anual, plazo_años)
+vf_periodo = calcular_vf_combinado(vp, aporte, np.full(plazo_años * frecuencia_anual, tea), frecuencia_anual, plazo_años)
+
+print(f"\nVF con TEA fija:            ${vf_fijo:,.2f}")
+print(f"VF con una TEA por año:     ${vf_anual:,.2f}")
+print(f"VF con una TEA por periodo: ${vf_periodo:,.2f}")
+if abs(vf_fijo - vf_anual) < 0.01 and abs(vf_fijo - vf_periodo) < 0.01:
+    print("  ✅ Una trayectoria constante reproduce la fórmula")
+else:
+    print("  ⚠️  La trayectoria constante no coincide con la fórmula")
+
+print("\n" + "=" * 70)
+print("RIESGO DE SECUENCIA")
+print("=" * 70)
+
+estres = generar_trayectorias_estres(tea, -0.20, 3, plazo_años)
+vf_estres = calcular_vf_combinado(vp, aporte, estres['trayectorias'], frecuencia_anual, plazo_años)
+for nombre, trayectoria, vf in zip(estres['nombres'], estres['trayectorias'], vf_estres):
+    tabla = generar_tabla_crecimiento(vp, aporte, trayectoria, frecuencia_anual, plazo_años)
+    saldo_final = tabla.iloc[-1]['saldo_final']
+    estado = "✅" if abs(vf - saldo_final) < 0.01 else "⚠️ "
+    print(f"  {estado} {nombre}: VF ${vf:,.2f} | tabla ${saldo_final:,.2f}")
+
+if vf_estres[2] < vf_estres[1] < vf_estres[0]:
+    print("  ✅ Los años malos al final pesan más que al inicio")
+else:
+    print("  ⚠️  Orden de resultados inesperado")
+
+print("\n" + "=" * 70)
+print("1.000 TRAYECTORIAS EN UNA LLAMADA")
+print("=" * 70)
+
+trayectorias = np.random.default_rng(42).normal(tea, 0.15, size=(1000, plazo_años))
+inicio = time.perf_counter()
+vf_lote = calcular_vf_combinado(vp, aporte, trayectorias, frecuencia_anual, plazo_años)
+duracion = time.perf_counter() - inicio
+vf_individual = [calcular_vf_combinado(vp, aporte, t, frecuencia_anual, plazo_años) for t in trayectorias[:10]]
+
+print(f"\n{len(vf_lote):,} trayectorias en {duracion*1000:.1f} ms")
+print(f"VF mediano: ${np.median(vf_lote):,.2f} | percentil 5: ${np.percentile(vf_lote, 5):,.2f}")
+if np.allclose(vf_lote[:10], vf_individual):
+    print("  ✅ El lote coincide con el cálculo individual")
+else:
+    print("  ⚠️  El lote no coincide con el cálculo individual")
+
+print("\n" + "=" * 70)
+print("CRONOGRAMA DE RETIROS CON TASAS VARIABLES")
+print("=" * 70)
+
+tasas_retiro = np.array([0.0] * 3 + [0.04] * 17)
+cronograma = generar_cronograma_retiros(500000, tasas_retiro, 240)
+print(f"\nRetiro bruto constante: ${cronograma.iloc[0]['retiro_bruto']:,.2f}")
+print(f"Saldo final: ${cronograma.iloc[-1]['saldo_final']:,.2f}")
+if abs(cronograma.iloc[-1]['saldo_final']) < 1:
+    print("  ✅ El retiro nivelado agota el saldo")
+else:
+    print("  ⚠️  Queda saldo al final del cronograma")
+
+print("\n✅ Prueba completada!")
@@ -0,0 +1,98 @@
+"""Script de prueba para la generación por ventanas de las tablas (paginación)"""
+import time
+import numpy as np
+from src.utils.tables import (
+    generar_tabla_crecimiento,
+    generar_ventana_crecimiento,
+    calcular_rango_pagina,
+    agregar_tabla_crecimiento,
+    contar_filas_vista,
+    generar_ventana_vista,
+    generar_resumen_crecimiento,
+    generar_resumen_tabla
+)
+
+vp = 10000
+aporte = 500
+tea = 0.08
+frecuencia_anual = 12
+plazo_años = 30
+
+print("=" * 70)
+print("VENTANAS DE LA TABLA DE CRECIMIENTO vs TABLA COMPLETA")
+print("=" * 70)
+
+casos = {
+    "Aporte constante": {},
+    "Crecimiento anual 5%": {'tasa_crecimiento': 0.05},
+    "Crecimiento por periodo, aporte al inicio": {'tasa_crecimiento': 0.004, 'crecimiento_anual': False, 'aporte_al_inicio': True},
+    "Capitalización continua con inflación": {'capitalizacion_continua': True, 'inflacion': 0.03},
+    "Aportes irregulares": {'aporte': np.linspace(100, 900, 360)},
+    "Trayectoria de TEA": {'tea': np.r_[np.full(5, 0.02), np.full(25, 0.08)]}
+}
+
+for nombre, opciones in casos.items():
+    opciones = dict(opciones)
+    aporte_caso = opciones.pop('aporte', aporte)
+    tea_caso = opciones.pop('tea', tea)
+    completa = generar_tabla_crecimiento(vp, aporte_caso, tea_caso, frecuencia_anual, plazo_años, **opciones)
+    diferencia = 0.0
+    for inicio, fin in [(0, 20), (140, 160), (340, 360)]:
+        ventana = generar_ventana_crecimiento(
+            vp, aporte_caso, tea_caso, frecuencia_anual, plazo_años, inicio, fin, **opciones
+        )
+        referencia = completa.iloc[inicio:fin].reset_index(drop=True)
+        diferencia = max(diferencia, float(np.abs(ventana.to_numpy(float) - referencia.to_numpy(float)).max()))
+    estado = "✅" if diferencia < 0.011 else "⚠️ "
+    print(f"  {estado} {nombre}: diferencia máxima {diferencia:.4f}")
+
+print("\n" + "=" * 70)
+print("RANGOS DE PÁGINA Y COSTO POR PÁGINA")
+print("=" * 70)
+
+for pagina in (1, 6, 99):
+    print(f"  Página {pagina} de 120 filas (20 por página): {calcular_rango_pagina(120, pagina, 20)}")
+
+for plazo in (10, 50):
+    inicio = time.perf_counter()
+    for _ in range(20):
+        generar_ventana_crecimiento(vp, 5, tea, 365, plazo, 3000, 3020)
+    tiempo = (time.perf_counter() - inicio) / 20
+    print(f"  Página de 20 filas con {plazo * 365:,} periodos diarios: {tiempo * 1000:.2f} ms")
+
+print("\n" + "=" * 70)
+print("VISTAS MENSUAL Y ANUAL SIN LA TABLA COMPLETA")
+print("=" * 70)
+
+# Las sumas de la tabla completa acumulan el redondeo a centavos de cada periodo
+for frecuencia, plazo, opciones in [
+    (365, 20, {'inflacion': 0.03}),
+    (52, 30, {'tasa_crecimiento': 0.05, 'aporte_al_inicio': True}),
+    (365, 10, {'tasa_crecimiento': 0.0002, 'crecimiento_anual': False, 'inflacion': 0.02}),
+    (12, 25, {'capitalizacion_continua': True})
+]:
+    completa = generar_tabla_crecimiento(vp, 20, tea, frecuencia, plazo, **opciones)
+    for vista in ("Mensual", "Anual"):
+        agregada = agregar_tabla_crecimiento(completa, frecuencia, vista)
+        filas = contar_filas_vista(frecuencia * plazo, frecuencia, vista)
+        primera = max(filas - 15, 0)
+        ventana = generar_ventana_vista(vp, 20, tea, frecuencia, plazo, vista, primera, filas, **opciones)
+        referencia = agregada.iloc[primera:]
+        mismas = list(ventana.columns) == list(referencia.columns) and np.array_equal(ventana.index, referencia.index)
+        diferencia = float(np.abs(ventana.to_numpy(float) - referencia.to_numpy(float)).max())
+        estado = "✅" if filas == len(agregada) and mismas and diferencia < 0.5 else "⚠️ "
+        print(f"  {estado} {frecuencia}/año, {plazo} años, vista {vista}: {filas} filas, diferencia máxima {diferencia:.4f}")
+
+    resumen = generar_resumen_crecimiento(vp, 20, tea, frecuencia, plazo, **opciones)
+    referencia = generar_resumen_tabla(completa)
+    diferencia = max(abs(resumen[clave] - referencia[clave]) for clave in referencia)
+    estado = "✅" if set(resumen) == set(referencia) and diferencia < 1.0 else "⚠️ "
+    print(f"  {estado} Resumen por forma cerrada: diferencia máxima {diferencia:.4f}")
+
+inicio = time.perf_counter()
+generar_ventana_vista(vp, 5, tea, 365, 50, "Mensual", 580, 600, inflacion=0.03)
+generar_resumen_crecimiento(vp, 5, tea, 365, 50, inflacion=0.03)
+tiempo = (time.perf_counter() - inicio) * 1000
+print(f"  Página mensual y resumen con 18,250 periodos diarios: {tiempo:.2f} ms")
+
+print("\n✅ Prueba completada!")
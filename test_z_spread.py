@@ -0,0 +1,125 @@
+"""Script de prueba para Z-spread (cartera vectorizada) y OAS contra una curva cero"""
+import io
+import time
+import numpy as np
+from config.constants import CURVA_REFERENCIA_DEFECTO
+from src.calculations.bond_calcs import (
+    calcular_valor_presente_bono,
+    calcular_descuentos_curva,
+    generar_flujos_cartera,
+    calcular_z_spread_bono,
+    calcular_z_spread_cartera
+)
+from src.calculations.bond_options import calcular_oas
+from src.utils.helpers import cargar_cartera_bonos_csv
+
+curva = CURVA_REFERENCIA_DEFECTO
+
+print("=" * 70)
+print("PRUEBA DE FLUJOS DE CARTERA vs BONO INDIVIDUAL")
+print("=" * 70)
+
+bonos = [
+    (1000, 0.05, 2, 10, "bullet", 0),
+    (500, 0.00, 1, 7, "cupon_cero", 0),
+    (1000, 0.08, 4, 5, "amortizable", 0),
+    (2000, 0.06, 12, 15, "fondo_amortizacion", 5)
+]
+matrices = generar_flujos_cartera(*[np.array(columna) for columna in zip(*bonos)])
+for fila, (vn, cupon, frecuencia, años, tipo, gracia) in enumerate(bonos):
+    calendario = calcular_valor_presente_bono(vn, cupon, frecuencia, años, 0.05, tipo, gracia)['calendario']
+    n = len(calendario['flujo'])
+    coincide = np.allclose(matrices['flujo'][fila, :n], calendario['flujo']) and not matrices['flujo'][fila, n:].any()
+    estado = "✅" if coincide else "⚠️ "
+    print(f"  {estado} {tipo}: {n} periodos")
+
+print("\n" + "=" * 70)
+print("Z-SPREAD DE UN BONO: REPRODUCE EL PRECIO")
+print("=" * 70)
+
+bono = calcular_valor_presente_bono(1000, 0.05, 2, 10, 0.06)
+calendario = bono['calendario']
+precio_mercado = 950.0
+z_spread = calcular_z_spread_bono(calendario, 2, precio_mercado, curva)
+plazos = calendario['periodo'] / 2
+precio = float(calendario['flujo'] @ (calcular_descuentos_curva(curva, plazos) * np.exp(-z_spread * plazos)))
+estado = "✅" if abs(precio - precio_mercado) < 1e-8 else "⚠️ "
+print(f"  {estado} Z-spread {z_spread * 10000:,.2f} pb → precio ${precio:,.6f}")
+
+print("\n" + "=" * 70)
+print("OAS: SIN OPCIONES = Z-SPREAD; CALL LO BAJA, PUT LO SUBE")
+print("=" * 70)
+
+oas = calcular_oas(calendario, 0.06, 2, precio_mercado, curva=curva)
+estado = "✅" if oas['convergido'] and abs(oas['oas'] - z_spread) < 1e-9 else "⚠️ "
+print(f"  {estado} OAS sin opciones: {oas['oas'] * 10000:,.4f} pb | Z-spread: {z_spread * 10000:,.4f} pb")
+
+oas_call = calcular_oas(calendario, 0.06, 2, precio_mercado, tramos_call=[(3, 100)], curva=curva)['oas']
+oas_put = calcular_oas(calendario, 0.06, 2, precio_mercado, tramos_put=[(3, 100)], curva=curva)['oas']
+estado = "✅" if oas_call < z_spread < oas_put else "⚠️ "
+print(f"  {estado} OAS con call: {oas_call * 10000:,.2f} pb | con put: {oas_put * 10000:,.2f} pb")
+
+print("\n" + "=" * 70)
+print("CARTERA DE 50,000 BONOS EN UNA LLAMADA")
+print("=" * 70)
+
+generador = np.random.default_rng(0)
+num_bonos = 50000
+cartera = {
+    'valor_nominal': generador.choice([100.0, 1000.0], num_bonos),
+    'tasa_cupon': generador.uniform(0, 0.10, num_bonos),
+    'frecuencia': generador.choice([1, 2, 4, 12], num_bonos),
+    'plazo_años': generador.integers(1, 31, num_bonos),
+    'tipo_bono': generador.choice(["bullet", "cupon_cero", "amortizable"], num_bonos)
+}
+spreads_reales = generador.uniform(-0.01, 0.05, num_bonos)
+matrices = generar_flujos_cartera(
+    cartera['valor_nominal'], cartera['tasa_cupon'], cartera['frecuencia'], cartera['plazo_años'], cartera['tipo_bono']
+)
+descuentos = calcular_descuentos_curva(curva, matrices['plazo']) * np.exp(-spreads_reales[:, None] * matrices['plazo'])
+cartera['precio'] = (matrices['flujo'] * descuentos).sum(axis=1)
+
+inicio = time.perf_counter()
+resultado = calcular_z_spread_cartera(cartera, curva)
+duracion = time.perf_counter() - inicio
+
+error = np.abs(resultado['z_spread'] - spreads_reales).max()
+estado = "✅" if resultado['convergido'].all() and error < 1e-9 else "⚠️ "
+print(f"  {estado} {num_bonos:,} bonos en {duracion:.2f} s | error máximo {error:.2e} | iteraciones máx. {resultado['iteraciones'].max()}")
+
+print("\n" + "=" * 70)
+print("CARGA DE CARTERA DESDE CSV")
+print("=" * 70)
+
+csv = io.StringIO(
+    "id,valor_nominal,tasa_cupon,frecuencia,plazo_años,precio,tipo_bono\n"
+    "A,1000,5,Semestral,10,950,Bullet (cupón fijo)\n"
+    "B,100,0,1,5,80,cupon_cero\n"
+    "C,1000,4,4,8,-1,amortizable\n"
+)
+cartera_csv = cargar_cartera_bonos_csv(csv)
+resultado_csv = calcular_z_spread_cartera(cartera_csv, curva)
+estado = "✅" if resultado_csv['convergido'].tolist() == [True, True, False] and np.isnan(resultado_csv['z_spread'][2]) else "⚠️ "
+print(f"  {estado} Z-spreads (pb): {np.round(resultado_csv['z_spread'] * 10000, 2).tolist()}")
+
+print("\n" + "=" * 70)
+print("BONOS QUE NO CONVERGEN")
+print("=" * 70)
+
+# Un precio ínfimo exige un spread que Newton no alcanza en ZSPREAD_MAX_ITERACIONES
+sin_convergencia = {
+    'valor_nominal': [1000.0, 1000.0],
+    'tasa_cupon': [0.05, 0.05],
+    'frecuencia': [2, 2],
+    'plazo_años': [10, 10],
+    'precio': [950.0, 1e-30]
+}
+resultado_nc = calcular_z_spread_cartera(sin_convergencia, curva)
+unitario = calcular_z_spread_bono(calendario, 2, 1e-30, curva)
+correcto = resultado_nc['convergido'].tolist() == [True, False] and np.isnan(resultado_nc['z_spread'][1])
+correcto = correcto and np.isfinite(resultado_nc['z_spread'][0]) and np.isnan(unitario)
+estado = "✅" if correcto else "⚠️ "
+print(f"  {estado} Sin convergencia queda NaN, igual que el bono individual: "
+      f"{np.round(resultado_nc['z_spread'] * 10000, 2).tolist()} pb ({resultado_nc['iteraciones'].tolist()} iteraciones)")
+
+print("\n✅ Prueba completada!")